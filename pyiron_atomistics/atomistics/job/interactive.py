@@ -3,13 +3,18 @@
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
 import numpy as np
+import posixpath
 from pyiron_base import state, InteractiveBase
 from pyiron_atomistics.atomistics.structure.periodic_table import PeriodicTable
 from pyiron_atomistics.atomistics.job.atomistic import (
     AtomisticGenericJob,
     GenericOutput,
 )
-from collections import defaultdict
+from pyiron_atomistics.atomistics.job.interactive_cache import (
+    CacheBuffer,
+    InteractiveCache,
+    InteractiveHDFWriter,
+)
 
 __author__ = "Osamu Waseda, Jan Janssen"
 __copyright__ = (
@@ -58,7 +63,36 @@ class GenericInteractive(AtomisticGenericJob, InteractiveBase):
             "magnetic_forces": self.interactive_magnetic_forces_getter,
             "volume": self.interactive_volume_getter,
         }
-        self.interactive_cache = defaultdict(list)
+        self.interactive_cache = InteractiveCache()
+        self._interactive_hdf_writer = InteractiveHDFWriter()
+
+    @property
+    def interactive_asynchronous_flush(self):
+        """
+        bool: write the flushed steps to the HDF5 file in a background thread while the simulation continues, with
+            False every flush is written before the simulation continues
+        """
+        return self._interactive_hdf_writer.asynchronous
+
+    @interactive_asynchronous_flush.setter
+    def interactive_asynchronous_flush(self, asynchronous):
+        self._interactive_hdf_writer.wait()
+        self._interactive_hdf_writer.asynchronous = bool(asynchronous)
+
+    @property
+    def project_hdf5(self):
+        """
+        ProjectHDFio: HDF5 file of the job, the pending flushes are written before it is returned, so the job file is
+            never accessed by the writer and the main thread at the same time
+        """
+        writer = getattr(self, "_interactive_hdf_writer", None)
+        if writer is not None:
+            writer.wait()
+        return AtomisticGenericJob.project_hdf5.fget(self)
+
+    @project_hdf5.setter
+    def project_hdf5(self, project):
+        AtomisticGenericJob.project_hdf5.fset(self, project)
 
     @property
     def interactive_enforce_structure_reset(self):
@@ -231,20 +265,120 @@ class GenericInteractive(AtomisticGenericJob, InteractiveBase):
 
     def interactive_flush(self, path="interactive", include_last_step=False):
         """
+        Hand the cached steps over to the writer, which appends them to the datasets in 'output/<path>' of the HDF5
+        file, and clear the cache. Unless interactive_asynchronous_flush is disabled the simulation continues while
+        the steps are written in a background thread, use :meth:`interactive_flush_wait` to block until they are
+        stored. All other HDF5 access of the job goes through project_hdf5, which waits for the pending flushes.
 
         Args:
-            path:
-            include_last_step:
+            path (str): name of the group in the output group of the HDF5 file
+            include_last_step (bool): store the last step even if it is not selected by interactive_write_frequency
+        """
+        data, data_lst = {}, {}
+        for key in self.interactive_cache.keys():
+            buffer = self.interactive_cache[key]
+            if not isinstance(buffer, (CacheBuffer, list)) or len(buffer) == 0:
+                continue
+            index = _get_write_index(
+                n_steps=len(buffer),
+                step=self.interactive_write_frequency,
+                include_last=include_last_step,
+            )
+            if len(index) > 0:
+                if isinstance(buffer, CacheBuffer) and buffer.is_array:
+                    data[key] = buffer.to_array()[index]
+                else:
+                    data_lst[key] = [buffer[i] for i in index]
+            self.interactive_cache[key] = []
+        self._interactive_hdf_writer.submit(
+            self._interactive_flush_lists,
+            path=path,
+            species=self._interactive_species_lst.tolist(),
+            data=data_lst,
+        )
+        # the HDF5 file is accessed through _hdf5, as project_hdf5 waits for the pending flushes
+        self._interactive_hdf_writer.append(
+            file_name=self._hdf5.file_name,
+            h5_path=posixpath.join(self._hdf5.h5_path, "output", path),
+            data=data,
+        )
 
-        Returns:
+    def _interactive_flush_lists(self, path, species, data):
+        """
+        Store the species and the quantities which are not stored as arrays in the cache, like ragged per atom
+        quantities of grand canonical runs, by extending the datasets of the previous flushes. Called by the writer, so
+        the HDF5 file is accessed through _hdf5 rather than project_hdf5, which waits for the writer.
 
+        Args:
+            path (str): name of the group in the output group of the HDF5 file
+            species (list): chemical symbols of the species
+            data (dict): flushed steps for each quantity as list
         """
-        with self.project_hdf5.open("output") as hdf_output:
+        with self._hdf5.open("output") as hdf_output:
             with hdf_output.open(path) as hdf:
-                hdf["species"] = self._interactive_species_lst.tolist()
-        super(GenericInteractive, self).interactive_flush(
-            path=path, include_last_step=include_last_step
-        )
+                hdf["species"] = species
+            for key, values in data.items():
+                if isinstance(values[0], list) and len(np.shape(values)) == 1:
+                    self._extend_hdf(h5=hdf_output, path=path, key=key, data=values)
+                elif np.array(values).dtype == np.dtype("O"):
+                    self._extend_hdf(h5=hdf_output, path=path, key=key, data=values)
+                else:
+                    self._extend_hdf(
+                        h5=hdf_output, path=path, key=key, data=np.array(values)
+                    )
+
+    def interactive_flush_wait(self):
+        """
+        Block until all flushed steps are stored in the HDF5 file.
+        """
+        self._interactive_hdf_writer.wait()
+
+    def interactive_close(self):
+        if (
+            len(list(self.interactive_cache.keys())) > 0
+            and len(self.interactive_cache[list(self.interactive_cache.keys())[0]]) != 0
+        ):
+            self.interactive_flush(path="interactive", include_last_step=True)
+        self._interactive_hdf_writer.close()
+        super(GenericInteractive, self).interactive_close()
+
+    def to_hdf(self, hdf=None, group_name=None):
+        """
+        Store the GenericInteractive object in the HDF5 file, after the pending flushes are written.
+
+        Args:
+            hdf (ProjectHDFio): HDF5 group object - optional
+            group_name (str): HDF5 subgroup name - optional
+        """
+        self.interactive_flush_wait()
+        super(GenericInteractive, self).to_hdf(hdf=hdf, group_name=group_name)
+        with self.project_hdf5.open("input") as hdf5_input:
+            if "interactive" in hdf5_input.list_nodes():
+                interactive_dict = hdf5_input["interactive"]
+                interactive_dict[
+                    "interactive_asynchronous_flush"
+                ] = self.interactive_asynchronous_flush
+                hdf5_input["interactive"] = interactive_dict
+
+    def from_hdf(self, hdf=None, group_name=None):
+        """
+        Restore the GenericInteractive object from the HDF5 file, after the pending flushes are written.
+
+        Args:
+            hdf (ProjectHDFio): HDF5 group object - optional
+            group_name (str): HDF5 subgroup name - optional
+        """
+        self.interactive_flush_wait()
+        super(GenericInteractive, self).from_hdf(hdf=hdf, group_name=group_name)
+        with self.project_hdf5.open("input") as hdf5_input:
+            if "interactive" in hdf5_input.list_nodes():
+                self._interactive_hdf_writer.asynchronous = hdf5_input[
+                    "interactive"
+                ].get("interactive_asynchronous_flush", True)
+
+    def __getitem__(self, item):
+        self.interactive_flush_wait()
+        return super(GenericInteractive, self).__getitem__(item)
 
     def interactive_indices_getter(self):
         species_symbols = np.array(
@@ -360,6 +494,30 @@ class GenericInteractive(AtomisticGenericJob, InteractiveBase):
         )
 
 
+def _get_write_index(n_steps, step=1, include_last=False):
+    """
+    Indices of the cached steps which are stored, every step-th step and optionally the last step.
+
+    Args:
+        n_steps (int): number of cached steps
+        step (int): interactive_write_frequency
+        include_last (bool): include the last step even if it is not a multiple of step
+
+    Returns:
+        numpy.ndarray: indices of the steps to store
+    """
+    if step == 1:
+        return np.arange(n_steps)
+    if n_steps > step:
+        index = np.arange(0, n_steps, step)
+        if include_last and index[-1] != n_steps - 1:
+            index = np.append(index, n_steps - 1)
+        return index
+    if n_steps > 0 and include_last:
+        return np.array([n_steps - 1])
+    return np.array([], dtype=int)
+
+
 class GenericInteractiveOutput(GenericOutput):
     def __init__(self, job):
         super(GenericInteractiveOutput, self).__init__(job=job)
@@ -410,6 +568,7 @@ class GenericInteractiveOutput(GenericOutput):
         Returns:
 
         """
+        self._job.interactive_flush_wait()
         fetched = self._job["output/interactive/" + key]
         if fetched is None or len(fetched) == 0:
             fetched = getattr(super(), key)
@@ -0,0 +1,343 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+import atexit
+from collections.abc import MutableMapping
+import queue
+import threading
+import weakref
+
+import numpy as np
+from pyiron_base.storage.hdfio import open_hdf5
+
+_active_writers = weakref.WeakSet()
+
+
+class CacheBuffer(object):
+    """
+    List-like buffer for the values of a single quantity of an interactive job, one value per step.
+
+    The values are stored in a preallocated typed numpy block, which is allocated for the first value and doubled
+    when it is full. Clearing the buffer keeps the block, so after the first flush the buffer is reused without any
+    further allocation. Values which cannot be stored in a common block, like strings or arrays which change their
+    shape, switch the buffer to a plain list.
+
+    Args:
+        capacity (int): number of steps the block is allocated for
+    """
+
+    def __init__(self, capacity=256):
+        self._capacity = max(1, int(capacity))
+        self._block = None
+        self._length = 0
+        self._values = None
+
+    @property
+    def is_array(self):
+        """
+        bool: True if the values are stored in a numpy block
+        """
+        return self._values is None
+
+    def append(self, value):
+        """
+        Append the value of the next step.
+
+        Args:
+            value: value of a single step
+        """
+        if self._values is not None:
+            self._values.append(value)
+            return
+        array = np.asarray(value)
+        if self._block is None:
+            if array.dtype.kind not in "biufc":
+                self._values = [value]
+                return
+            self._block = np.empty((self._capacity,) + array.shape, dtype=array.dtype)
+        elif array.shape != self._block.shape[1:] or array.dtype.kind not in "biufc":
+            self._values = self.tolist() + [value]
+            self._block = None
+            self._length = 0
+            return
+        elif not np.can_cast(array.dtype, self._block.dtype):
+            self._block = self._block.astype(
+                np.promote_types(self._block.dtype, array.dtype)
+            )
+        if self._length == len(self._block):
+            block = np.empty(
+                (2 * len(self._block),) + self._block.shape[1:], dtype=self._block.dtype
+            )
+            block[: self._length] = self._block
+            self._block = block
+        self._block[self._length] = array
+        self._length += 1
+
+    def extend(self, values):
+        for value in values:
+            self.append(value)
+
+    def clear(self):
+        """
+        Remove all values but keep the preallocated block.
+        """
+        self._length = 0
+        if self._values is not None:
+            self._values = None
+            self._block = None
+
+    def to_array(self):
+        """
+        All values as a single array, a view on the block if the values are stored in a numpy block.
+
+        Returns:
+            numpy.ndarray: values of shape (n_steps, ...)
+        """
+        if self._values is not None:
+            return np.array(self._values)
+        if self._block is None:
+            return np.array([])
+        return self._block[: self._length]
+
+    def tolist(self):
+        if self._values is not None:
+            return list(self._values)
+        return list(self.to_array())
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self.to_array(), dtype=dtype)
+
+    def __len__(self):
+        if self._values is not None:
+            return len(self._values)
+        return self._length
+
+    def __getitem__(self, item):
+        if self._values is not None:
+            return self._values[item]
+        return self.to_array()[item]
+
+    def __iter__(self):
+        if self._values is not None:
+            return iter(self._values)
+        return iter(self.to_array())
+
+    def __eq__(self, other):
+        return self.tolist() == list(other)
+
+    def __repr__(self):
+        return self.__class__.__name__ + "(" + repr(self.tolist()) + ")"
+
+
+class InteractiveCache(MutableMapping):
+    """
+    Cache of the values collected by an interactive job, a mapping from the name of a quantity to a
+    :class:`CacheBuffer`. Like a `defaultdict(list)` an empty buffer is created the first time a quantity is accessed,
+    and assigning a list replaces the content of the buffer.
+
+    Args:
+        capacity (int): number of steps the buffers are preallocated for
+    """
+
+    def __init__(self, capacity=256):
+        self._capacity = capacity
+        self._buffers = {}
+
+    def __getitem__(self, key):
+        if key not in self._buffers:
+            self._buffers[key] = CacheBuffer(capacity=self._capacity)
+        return self._buffers[key]
+
+    def __setitem__(self, key, value):
+        if isinstance(value, CacheBuffer):
+            self._buffers[key] = value
+        elif isinstance(value, list):
+            buffer = self[key]
+            buffer.clear()
+            buffer.extend(value)
+        else:
+            self._buffers[key] = value
+
+    def __delitem__(self, key):
+        del self._buffers[key]
+
+    def __contains__(self, key):
+        return key in self._buffers
+
+    def __iter__(self):
+        return iter(self._buffers)
+
+    def __len__(self):
+        return len(self._buffers)
+
+    def __repr__(self):
+        return self.__class__.__name__ + "(" + repr(self._buffers) + ")"
+
+
+class InteractiveHDFWriter(object):
+    """
+    Writer which appends the flushed steps of an interactive job to resizable, chunked HDF5 datasets. By default the
+    steps are written in a background thread, so the simulation continues while the data is written, with
+    asynchronous=False every flush is written before :meth:`append` returns.
+
+    The background thread is started for the first flush and stops as soon as all pending flushes are written, so an
+    idle writer does not hold a thread. The number of pending flushes is limited by max_pending, so the memory of the
+    flushed but not yet written steps stays bounded. Pending flushes are written before the interpreter exits. Errors
+    raised in the background thread are raised again by the next call to :meth:`append`, :meth:`submit`,
+    :meth:`wait` or :meth:`close`.
+
+    Args:
+        asynchronous (bool): write the flushed steps in a background thread
+        max_pending (int): maximum number of flushes waiting to be written
+    """
+
+    def __init__(self, asynchronous=True, max_pending=2):
+        self.asynchronous = asynchronous
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._thread = None
+        self._error = None
+        _active_writers.add(self)
+
+    def append(self, file_name, h5_path, data):
+        """
+        Append steps to the datasets in the group h5_path, the datasets are created if they do not exist.
+
+        Args:
+            file_name (str): path of the HDF5 file
+            h5_path (str): path of the group in the HDF5 file
+            data (dict): steps to append for each dataset, arrays of shape (n_steps, ...)
+        """
+        self.submit(_append_to_hdf, file_name, h5_path, data)
+
+    def submit(self, function, *args, **kwargs):
+        """
+        Call a function in the writer after all previously submitted writes, used for HDF5 access which has to be
+        ordered with the appended steps.
+
+        Args:
+            function (callable): function to call
+            *args: positional arguments of the function
+            **kwargs: keyword arguments of the function
+        """
+        self._raise_error()
+        if not self.asynchronous:
+            self.wait()
+            function(*args, **kwargs)
+            return
+        with self._lock:
+            self._pending += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        self._queue.put((function, args, kwargs))
+
+    def wait(self):
+        """
+        Block until all submitted writes are completed. Called by a write in the background thread it returns
+        immediately, as the previously submitted writes are already completed.
+        """
+        if threading.current_thread() is self._thread:
+            return
+        self._queue.join()
+        self._raise_error()
+
+    def close(self):
+        """
+        Block until all submitted writes are completed and the background thread stopped.
+        """
+        self._queue.join()
+        thread = self._thread
+        if thread is not None:
+            thread.join()
+        self._raise_error()
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _run(self):
+        while True:
+            function, args, kwargs = self._queue.get()
+            try:
+                if self._error is None:
+                    function(*args, **kwargs)
+            except Exception as e:
+                self._error = e
+            finally:
+                with self._lock:
+                    self._pending -= 1
+                    stop = self._pending == 0
+                    if stop:
+                        self._thread = None
+                self._queue.task_done()
+            if stop:
+                return
+
+
+@atexit.register
+def _close_active_writers():
+    """
+    Write the pending flushes of all writers before the interpreter exits.
+    """
+    errors = []
+    for writer in list(_active_writers):
+        try:
+            writer.close()
+        except Exception as e:
+            errors.append(e)
+    if len(errors) > 0:
+        raise errors[0]
+
+
+def _append_to_hdf(file_name, h5_path, data):
+    """
+    Append steps to resizable, chunked datasets in a HDF5 file.
+
+    Args:
+        file_name (str): path of the HDF5 file
+        h5_path (str): path of the group in the HDF5 file
+        data (dict): steps to append for each dataset, arrays of shape (n_steps, ...)
+    """
+    with open_hdf5(file_name, mode="a") as f:
+        group = f.require_group(h5_path)
+        for key, values in data.items():
+            _append_to_dataset(group=group, key=key, values=values)
+
+
+def _append_to_dataset(group, key, values, chunk_bytes=2**16):
+    """
+    Append steps to a dataset, which is resized along the first axis. Datasets with a fixed size, for example
+    written by a previous version, are converted to a resizable dataset.
+
+    Args:
+        group (h5py.Group): group of the dataset
+        key (str): name of the dataset
+        values (numpy.ndarray): steps to append, array of shape (n_steps, ...)
+        chunk_bytes (int): targeted size of a chunk in bytes, chunks hold at most the steps of the first append
+    """
+    if key in group:
+        dataset = group[key]
+        if (
+            dataset.maxshape[0] is None
+            and dataset.shape[1:] == values.shape[1:]
+            and np.can_cast(values.dtype, dataset.dtype, casting="same_kind")
+        ):
+            n_steps = dataset.shape[0]
+            dataset.resize(n_steps + len(values), axis=0)
+            dataset[n_steps:] = values
+            return
+        values = np.concatenate([dataset[()], values])
+        del group[key]
+    step_bytes = max(1, int(np.prod(values.shape[1:])) * values.dtype.itemsize)
+    dataset = group.create_dataset(
+        key,
+        data=values,
+        maxshape=(None,) + values.shape[1:],
+        chunks=(min(len(values), max(1, chunk_bytes // step_bytes)),)
+        + values.shape[1:],
+    )
+    dataset.attrs["TITLE"] = "ndarray"
@@ -0,0 +1,214 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+"""
+Content addressed cache for the potential files, like EAM tables or POTCAR files, which are staged in the working
+directories of the jobs. Every file is copied to the cache once and then hardlinked into the working directories.
+
+The cache is disabled by default. It is enabled by setting the "potential_cache" entry of the pyiron configuration
+(state.settings.configuration) or the PYIRONPOTENTIALCACHE environment variable to a directory, an empty string or
+"none" disables it again. As the files can only be hardlinked within a file system, the cache should be located on the
+file system of the working directories, like a node local scratch directory. Otherwise the files are staged without
+the cache.
+"""
+
+from collections import OrderedDict
+import hashlib
+import os
+import shutil
+import stat
+from pyiron_base import state
+
+_checksum_cache = OrderedDict()
+_checksum_cache_size = 1024
+_validated_cache = {}
+
+
+def stage_potential_file(path_lst, destination):
+    """
+    Stage a potential file in the working directory of a job. The concatenation of the files in path_lst is stored
+    once in the cache, addressed by its SHA-256 checksum, and hardlinked to the destination. The files are concatenated
+    directly in the destination if the cache is disabled, on a different file system than the working directory or
+    not writable.
+
+    Args:
+        path_lst (list/str): path of the potential file or paths of the files to concatenate, like the POTCAR files of
+                             the individual elements
+        destination (str): path of the staged file
+
+    Returns:
+        str: path of the staged file
+    """
+    if isinstance(path_lst, str):
+        path_lst = [path_lst]
+    if os.path.lexists(destination):
+        os.remove(destination)
+    cache_directory = _get_cache_directory(name="potential_files")
+    if cache_directory is None or not _is_same_file_system(
+        cache_directory=cache_directory, destination=destination
+    ):
+        _concatenate(path_lst=path_lst, destination=destination)
+        return destination
+    try:
+        cache_file_name = _add_to_cache(
+            path_lst=path_lst,
+            file_name=os.path.basename(destination),
+            cache_directory=cache_directory,
+        )
+    except OSError:
+        _concatenate(path_lst=path_lst, destination=destination)
+        return destination
+    try:
+        os.link(cache_file_name, destination)
+    except OSError:
+        shutil.copyfile(cache_file_name, destination)
+    return destination
+
+
+def _get_cache_directory(name):
+    """
+    Directory of a cache for the potential files, the "potential_cache" entry of the pyiron configuration takes
+    precedence over the PYIRONPOTENTIALCACHE environment variable. The cache is disabled if neither is set.
+
+    Args:
+        name (str): name of the cache, like "potential_files" for the staged files or "potentials" for the parsed
+                    potential databases
+
+    Returns:
+        str/None: path of the cache directory, None if the cache is disabled
+    """
+    configuration = state.settings.configuration
+    if configuration is not None and "potential_cache" in configuration:
+        root = configuration["potential_cache"]
+    else:
+        root = os.environ.get("PYIRONPOTENTIALCACHE")
+    if root is None or root.strip().lower() in ["", "none"]:
+        return None
+    return os.path.join(os.path.abspath(os.path.expanduser(root)), name)
+
+
+def _is_same_file_system(cache_directory, destination):
+    """
+    Check if the cache directory is on the same file system as the destination, so the cached files can be hardlinked.
+    The cache directory is created if it does not exist.
+
+    Args:
+        cache_directory (str): path of the cache directory
+        destination (str): path of the staged file
+
+    Returns:
+        bool: True if the cache directory is on the file system of the destination
+    """
+    try:
+        os.makedirs(cache_directory, exist_ok=True)
+        return (
+            os.stat(cache_directory).st_dev
+            == os.stat(os.path.dirname(os.path.abspath(destination))).st_dev
+        )
+    except OSError:
+        return False
+
+
+def _get_checksum(path_lst):
+    """
+    SHA-256 checksum of the concatenation of files, the checksum is computed once per process as long as the
+    modification time and the size of the files do not change. Only the checksums of the most recently used
+    _checksum_cache_size sets of files are kept.
+
+    Args:
+        path_lst (list): paths of the files
+
+    Returns:
+        str: hexadecimal checksum
+    """
+    key = tuple(_get_stat(path) for path in path_lst)
+    if key in _checksum_cache:
+        _checksum_cache.move_to_end(key)
+    else:
+        _checksum_cache[key] = _compute_checksum(path_lst=path_lst)
+        if len(_checksum_cache) > _checksum_cache_size:
+            _checksum_cache.popitem(last=False)
+    return _checksum_cache[key]
+
+
+def _compute_checksum(path_lst):
+    """
+    SHA-256 checksum of the concatenation of files, without storing it in the _checksum_cache.
+
+    Args:
+        path_lst (list): paths of the files
+
+    Returns:
+        str: hexadecimal checksum
+    """
+    checksum = hashlib.sha256()
+    for path in path_lst:
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(2**20), b""):
+                checksum.update(block)
+    return checksum.hexdigest()
+
+
+def _get_stat(path):
+    stat_result = os.stat(path)
+    return os.path.abspath(path), stat_result.st_mtime_ns, stat_result.st_size
+
+
+def _add_to_cache(path_lst, file_name, cache_directory):
+    """
+    Store the concatenation of files in the cache, unless the cache already contains a valid copy.
+
+    Args:
+        path_lst (list): paths of the files to concatenate
+        file_name (str): name of the file in the cache
+        cache_directory (str): path of the cache directory
+
+    Returns:
+        str: path of the file in the cache
+    """
+    checksum = _get_checksum(path_lst=path_lst)
+    cache_file_name = os.path.join(cache_directory, checksum, file_name)
+    if _is_valid(cache_file_name=cache_file_name, checksum=checksum):
+        return cache_file_name
+    os.makedirs(os.path.dirname(cache_file_name), exist_ok=True)
+    tmp_file_name = cache_file_name + "." + str(os.getpid())
+    _concatenate(path_lst=path_lst, destination=tmp_file_name)
+    os.chmod(tmp_file_name, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+    if _compute_checksum(path_lst=[tmp_file_name]) != checksum:
+        os.remove(tmp_file_name)
+        raise OSError("The potential files changed while they were cached.")
+    os.replace(tmp_file_name, cache_file_name)
+    _validated_cache[cache_file_name] = _get_stat(cache_file_name)
+    return cache_file_name
+
+
+def _is_valid(cache_file_name, checksum):
+    """
+    Check the checksum of a file in the cache, the check is repeated only if the modification time or the size of the
+    file changed, for example as a hardlinked copy was modified.
+
+    Args:
+        cache_file_name (str): path of the file in the cache
+        checksum (str): expected checksum
+
+    Returns:
+        bool: True if the file exists and matches the checksum
+    """
+    if not os.path.exists(cache_file_name):
+        return False
+    stat_result = _get_stat(cache_file_name)
+    if _validated_cache.get(cache_file_name) == stat_result:
+        return True
+    if _compute_checksum(path_lst=[cache_file_name]) == checksum:
+        _validated_cache[cache_file_name] = stat_result
+        return True
+    os.remove(cache_file_name)
+    return False
+
+
+def _concatenate(path_lst, destination):
+    with open(destination, "wb") as f:
+        for path in path_lst:
+            with open(path, "rb") as source:
+                shutil.copyfileobj(source, f)
@@ -6,9 +6,15 @@
 An abstract Potential class to provide an easy access for the available potentials. Currently implemented for the
 OpenKim https://openkim.org database.
 """
-import pandas
+from functools import reduce
+import hashlib
+import io
+import json
 import os
+import numpy as np
+import pandas
 from pyiron_base import state
+from pyiron_atomistics.atomistics.job.potential_cache import _get_cache_directory
 
 __author__ = "Martin Boeckmann, Jan Janssen"
 __copyright__ = (
@@ -21,6 +27,8 @@ __email__ = "janssen@mpie.de"
 __status__ = "development"
 __date__ = "Sep 1, 2017"
 
+_potential_df_cache = {}
+
 
 class PotentialAbstract(object):
     """
@@ -42,6 +50,26 @@ class PotentialAbstract(object):
         else:
             self._selected_atoms = []
 
+    @property
+    def _potential_df(self):
+        return self._potential_df_value
+
+    @_potential_df.setter
+    def _potential_df(self, potential_df):
+        self._potential_df_value = potential_df
+        self._species_index = None
+
+    def _get_species_index(self):
+        """
+        Inverted index of the potential database, built on the first lookup and reset when the database is replaced.
+
+        Returns:
+            dict: positions of the potentials in the database, which include the element, for each element
+        """
+        if self._species_index is None:
+            self._species_index = _get_species_index(self._potential_df)
+        return self._species_index
+
     def find(self, element):
         """
         Find the potentials
@@ -61,11 +89,12 @@ class PotentialAbstract(object):
             element = set([element])
         else:
             raise TypeError("Only, str, list and set supported!")
-        return self._potential_df[
-            [
-                True if set(element).issubset(species) else False
-                for species in self._potential_df["Species"].values
-            ]
+        if len(element) == 0:
+            return self._potential_df.copy()
+        species_index = self._get_species_index()
+        empty = np.array([], dtype=int)
+        return self._potential_df.iloc[
+            reduce(np.intersect1d, [species_index.get(el, empty) for el in element])
         ]
 
     def find_by_name(self, potential_name):
@@ -103,6 +132,10 @@ class PotentialAbstract(object):
     @staticmethod
     def _get_potential_df(plugin_name, file_name_lst, backward_compatibility_name):
         """
+        The parsed database is cached in memory and as a JSON file in the cache directory for every CSV file. The
+        cache in memory is validated by the modification time and the size of the CSV files and of the directories
+        searched for them, the JSON files are addressed by the content of the CSV files. The returned database is a
+        copy, including the lists it contains, so it can be modified without modifying the cache.
 
         Args:
             plugin_name (str):
@@ -119,37 +152,33 @@ class PotentialAbstract(object):
                 path_to_add = os.path.join(env[conda_var], "share", "iprpy")
                 if path_to_add not in resource_path_lst:
                     resource_path_lst += [path_to_add]
-        df_lst = []
+        key = (plugin_name, tuple(sorted(file_name_lst)), tuple(resource_path_lst))
+        if key in _potential_df_cache:
+            directory_stats, csv_stats, df = _potential_df_cache[key]
+            if _get_stats(directory_stats) == directory_stats and (
+                _get_stats(csv_stats) == csv_stats
+            ):
+                return _copy_potential_df(df=df)
+        directory_lst, csv_lst = [], []
         for resource_path in resource_path_lst:
             if os.path.exists(os.path.join(resource_path, plugin_name, "potentials")):
                 resource_path = os.path.join(resource_path, plugin_name, "potentials")
             if "potentials" in resource_path or "iprpy" in resource_path:
                 for path, folder_lst, file_lst in os.walk(resource_path):
+                    directory_lst.append(path)
                     for periodic_table_file_name in file_name_lst:
                         if (
                             periodic_table_file_name in file_lst
                             and periodic_table_file_name.endswith(".csv")
                         ):
-                            df_lst.append(
-                                pandas.read_csv(
-                                    os.path.join(path, periodic_table_file_name),
-                                    index_col=0,
-                                    converters={
-                                        "Species": lambda x: x.replace("'", "")
-                                        .strip("[]")
-                                        .split(", "),
-                                        "Config": lambda x: x.replace("'", "")
-                                        .replace("\\n", "\n")
-                                        .strip("[]")
-                                        .split(", "),
-                                        "Filename": lambda x: x.replace("'", "")
-                                        .strip("[]")
-                                        .split(", "),
-                                    },
-                                )
-                            )
-        if len(df_lst) > 0:
-            return pandas.concat(df_lst)
+                            csv_lst.append(os.path.join(path, periodic_table_file_name))
+        if len(csv_lst) > 0:
+            csv_stats = _get_stats(csv_lst)
+            df = pandas.concat(
+                [_read_potential_csv(file_name=file_name) for file_name in csv_lst]
+            )
+            _potential_df_cache[key] = (_get_stats(directory_lst), csv_stats, df)
+            return _copy_potential_df(df=df)
         else:
             raise ValueError("Was not able to locate the potential files.")
 
@@ -194,6 +223,137 @@ class PotentialAbstract(object):
         raise ValueError("Was not able to locate the potential files.")
 
 
+def _get_stats(path_lst):
+    """
+    Modification time and size of files or directories, used to validate the cached potential databases.
+
+    Args:
+        path_lst (list/tuple): paths or (path, modification time, size) tuples
+
+    Returns:
+        tuple: (path, modification time, size) for every path, None for the paths which do not exist anymore
+    """
+    stat_lst = []
+    for path in path_lst:
+        if isinstance(path, tuple):
+            path = path[0]
+        try:
+            stat = os.stat(path)
+            stat_lst.append((path, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            stat_lst.append((path, None, None))
+    return tuple(stat_lst)
+
+
+def _read_potential_csv(file_name):
+    """
+    Parse a CSV file of a potential database. The parsed database is stored in a JSON cache file, which is addressed
+    by the SHA-256 checksum of the CSV file and the pandas version, so it is only loaded for an identical CSV file
+    parsed with the same pandas version. The cache file is skipped if the potential cache is disabled, see
+    pyiron_atomistics.atomistics.job.potential_cache. As the cache directory might be writable by other users, the
+    cache is stored as JSON rather than pickle, so loading a cache file can not execute code.
+
+    Args:
+        file_name (str): path of the CSV file
+
+    Returns:
+        pandas.DataFrame: potential database
+    """
+    with open(file_name, "rb") as f:
+        content = f.read()
+    cache_key = hashlib.sha256(
+        content + b"\0" + pandas.__version__.encode()
+    ).hexdigest()
+    cache_directory = _get_cache_directory(name="potentials")
+    if cache_directory is not None:
+        cache_file_name = os.path.join(cache_directory, cache_key + ".json")
+        try:
+            with open(cache_file_name) as f:
+                cache = json.load(f)
+            if cache["key"] == cache_key:
+                return pandas.DataFrame(
+                    cache["columns"],
+                    index=pandas.Index(
+                        cache["index"],
+                        dtype=cache["index_dtype"],
+                        name=cache["index_name"],
+                    ),
+                ).astype(cache["dtypes"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+    df = pandas.read_csv(
+        io.BytesIO(content),
+        index_col=0,
+        converters={
+            "Species": lambda x: x.replace("'", "").strip("[]").split(", "),
+            "Config": lambda x: x.replace("'", "")
+            .replace("\\n", "\n")
+            .strip("[]")
+            .split(", "),
+            "Filename": lambda x: x.replace("'", "").strip("[]").split(", "),
+        },
+    )
+    if cache_directory is None:
+        return df
+    try:
+        os.makedirs(cache_directory, exist_ok=True)
+        with open(cache_file_name + "." + str(os.getpid()), "w") as f:
+            json.dump(
+                {
+                    "key": cache_key,
+                    "index": df.index.tolist(),
+                    "index_dtype": str(df.index.dtype),
+                    "index_name": df.index.name,
+                    "columns": {column: df[column].tolist() for column in df.columns},
+                    "dtypes": {
+                        column: str(dtype) for column, dtype in df.dtypes.items()
+                    },
+                },
+                f,
+            )
+        os.replace(cache_file_name + "." + str(os.getpid()), cache_file_name)
+    except (OSError, TypeError, ValueError):
+        pass
+    return df
+
+
+def _get_species_index(potential_df):
+    """
+    Build the inverted index of a potential database.
+
+    Args:
+        potential_df (pandas.DataFrame): potential database
+
+    Returns:
+        dict: positions of the potentials in the database, which include the element, for each element
+    """
+    species_index = {}
+    for position, species in enumerate(potential_df["Species"].values):
+        for el in set(species):
+            species_index.setdefault(el, []).append(position)
+    return {el: np.array(positions) for el, positions in species_index.items()}
+
+
+def _copy_potential_df(df):
+    """
+    Copy a cached potential database, including the lists in the Species, Config and Filename columns.
+
+    Args:
+        df (pandas.DataFrame): potential database
+
+    Returns:
+        pandas.DataFrame: copy of the potential database
+    """
+    df = df.copy()
+    for column in ["Species", "Config", "Filename"]:
+        if column in df.columns:
+            df[column] = [
+                list(value) if isinstance(value, list) else value
+                for value in df[column].values
+            ]
+    return df
+
+
 def find_potential_file_base(path, resource_path_lst, rel_path):
     if path is not None:
         for resource_path in resource_path_lst:
@@ -2,6 +2,7 @@
 # Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
+import warnings
 import numpy as np
 from pyiron_base import DataContainer, FlattenedStorage
 from pyiron_base import deprecate
@@ -22,6 +23,11 @@ class NeighborsTrajectory(DataContainer):
     """
     This class generates the neighbors for a given atomistic trajectory. The resulting indices, distances, and vectors
     are stored as numpy arrays.
+
+    If a skin is given, the neighbors are not searched from scratch for every frame. Instead a Verlet list of neighbor
+    candidates is built, which stays valid until an atom has moved by more than half of the skin, see
+    :class:`VerletNeighborList`. The neighbors are searched from scratch anyway if `get_neighbors()` arguments are given
+    which the Verlet list does not support, e.g. `id_list` or a `norm_order` other than 2.
     """
 
     def __new__(cls, *args, **kwargs):
@@ -36,6 +42,7 @@ class NeighborsTrajectory(DataContainer):
         num_neighbors=12,
         table_name="neighbors_traj",
         store=None,
+        skin=None,
         **kwargs,
     ):
         """
@@ -48,6 +55,8 @@ class NeighborsTrajectory(DataContainer):
             store (FlattenedStorage): internal storage that should be used to store the neighborhood information,
                                       creates a new one if not provided; if provided and not empty it must be compatible
                                       with the lengths of the structures in `has_structure`, but this is *not* checked
+            skin (float/None): Skin of the Verlet list which is reused across the frames, None to search the neighbors
+                               of every frame from scratch
             **kwargs (dict): Additional arguments to be passed to the `get_neighbors()` routine
                              (eg. cutoff_radius, norm_order , etc.)
         """
@@ -67,6 +76,7 @@ class NeighborsTrajectory(DataContainer):
         )
         self._num_neighbors = num_neighbors
         self._get_neighbors_kwargs = kwargs
+        self._skin = skin
         self.has_structure = has_structure
 
     @property
@@ -138,7 +148,29 @@ class NeighborsTrajectory(DataContainer):
         """
         return self._num_neighbors
 
+    def _get_verlet_list(self):
+        """
+        Verlet list for the search of the neighbors across the frames.
+
+        Returns:
+            :class:`VerletNeighborList`/None: None if no skin is given or if the `get_neighbors()` arguments are not
+                supported by the Verlet list
+        """
+        if self._skin is None:
+            return None
+        if (
+            not set(self._get_neighbors_kwargs).issubset(_VERLET_NEIGHBORS_KWARGS)
+            or self._get_neighbors_kwargs.get("norm_order", 2) != 2
+        ):
+            return None
+        return VerletNeighborList(
+            num_neighbors=self._num_neighbors,
+            skin=self._skin,
+            **self._get_neighbors_kwargs,
+        )
+
     def _compute_neighbors(self):
+        verlet_list = self._get_verlet_list()
         for i, struct in enumerate(self._has_structure.iter_structures()):
             if (
                 i < len(self._flat_store)
@@ -146,12 +178,15 @@ class NeighborsTrajectory(DataContainer):
             ):
                 # store already has valid entries for this structure, so skip it
                 continue
-            # Change the `allow_ragged` based on the changes in get_neighbors()
-            neigh = struct.get_neighbors(
-                num_neighbors=self._num_neighbors,
-                allow_ragged=False,
-                **self._get_neighbors_kwargs,
-            )
+            if verlet_list is not None:
+                neigh = verlet_list.get_neighbors(structure=struct)
+            else:
+                # Change the `allow_ragged` based on the changes in get_neighbors()
+                neigh = struct.get_neighbors(
+                    num_neighbors=self._num_neighbors,
+                    allow_ragged=False,
+                    **self._get_neighbors_kwargs,
+                )
             if i >= len(self._flat_store):
                 self._flat_store.add_chunk(
                     len(struct),
@@ -179,3 +214,196 @@ class NeighborsTrajectory(DataContainer):
         Compute the neighbors across the trajectory
         """
         pass
+
+
+_VERLET_NEIGHBORS_KWARGS = ("cutoff_radius", "tolerance", "width_buffer", "norm_order")
+
+
+class VerletNeighborList:
+    """
+    Neighbor search for consecutive frames of a trajectory with small displacements between the frames.
+
+    For a reference frame the neighbors are computed with `get_neighbors()` and additionally all atoms in a sphere
+    enlarged by a skin are stored as candidates, together with the lattice translation of the periodic image. For the
+    following frames only the distances to the candidates are computed. The candidate list is rebuilt when an atom has
+    moved by more than half of the skin with respect to the reference frame, or when the cell, the periodic boundary
+    conditions or the number of atoms change. Atoms which are wrapped back into the cell between the frames are tracked
+    by the minimum image convention.
+
+    For a given cutoff radius r_c, the candidates within r_c + skin are sufficient as long as no atom moved by more than
+    skin / 2. The k-th nearest neighbor of an atom at distance r_k can move away by less than skin and other atoms can
+    come closer by less than skin, so for a search by the number of neighbors the candidates within r_k + 2 * skin are
+    stored.
+    """
+
+    def __init__(
+        self,
+        num_neighbors=12,
+        skin=0.5,
+        cutoff_radius=np.inf,
+        tolerance=2,
+        width_buffer=1.2,
+        norm_order=2,
+    ):
+        """
+
+        Args:
+            num_neighbors (int): The number of neighbors
+            skin (float): Width of the shell added to the search radius of the candidates
+            cutoff_radius (float): Upper bound of the distance to which the search must be done
+            tolerance (int): tolerance (round decimal points) used for computing neighbor shells
+            width_buffer (float): width of the layer to be added to account for pbc.
+            norm_order (int): Norm to use for the neighborhood search, only the euclidean norm (2) is supported
+        """
+        if skin <= 0:
+            raise ValueError("The skin must be a positive float")
+        if norm_order != 2:
+            raise ValueError("The Verlet list is only implemented for norm_order=2")
+        self._num_neighbors = num_neighbors
+        self._skin = skin
+        self._cutoff_radius = cutoff_radius
+        self._tolerance = tolerance
+        self._width_buffer = width_buffer
+        self._reference_positions = None
+        self._reference_cell = None
+        self._reference_pbc = None
+        self._candidate_indices = None
+        self._candidate_translations = None
+        self.n_builds = 0
+
+    def get_neighbors(self, structure):
+        """
+        Get the neighbors of a frame, the candidate list is rebuilt if necessary.
+
+        Args:
+            structure (:class:`pyiron_atomistics.atomistics.structure.atoms.Atoms`): Frame of the trajectory
+
+        Returns:
+            :class:`VerletNeighbors`/structuretoolkit.analyse.neighbors.Neighbors: The neighbors with the attributes
+                indices, distances, vecs and shells in the filled mode
+        """
+        positions = self._get_unwrapped_positions(structure=structure)
+        if positions is None or (
+            np.linalg.norm(positions - self._reference_positions, axis=-1).max()
+            > 0.5 * self._skin
+        ):
+            return self._build(structure=structure)
+        vecs = (
+            positions[self._candidate_indices]
+            + self._candidate_translations
+            - positions[:, np.newaxis]
+        )
+        distances = np.linalg.norm(vecs, axis=-1)
+        distances[distances > self._cutoff_radius] = np.inf
+        order = np.argsort(distances, axis=-1, kind="stable")[:, : self._num_neighbors]
+        distances = np.take_along_axis(distances, order, axis=-1)
+        max_column = np.sum(distances < np.inf, axis=-1).max()
+        order, distances = order[:, :max_column], distances[:, :max_column]
+        indices = np.take_along_axis(self._candidate_indices, order, axis=-1)
+        indices[distances == np.inf] = np.iinfo(np.int32).max
+        vecs = np.take_along_axis(vecs, order[..., np.newaxis], axis=1)
+        vecs[distances == np.inf] = np.inf
+        return VerletNeighbors(
+            indices=indices,
+            distances=distances,
+            vecs=vecs,
+            shells=self._get_shells(distances=distances),
+        )
+
+    def _get_unwrapped_positions(self, structure):
+        """
+        Positions of the structure shifted by lattice vectors to the periodic images closest to the reference positions,
+        None if the candidate list has to be rebuilt because the cell, pbc or number of atoms changed.
+        """
+        if (
+            self._reference_positions is None
+            or len(structure) != len(self._reference_positions)
+            or not np.array_equal(structure.pbc, self._reference_pbc)
+            or not np.allclose(structure.cell, self._reference_cell, rtol=0, atol=1e-8)
+        ):
+            return None
+        positions = np.array(structure.positions)
+        if any(structure.pbc):
+            cell = np.array(structure.cell)
+            jumps = np.round(
+                (positions - self._reference_positions) @ np.linalg.inv(cell)
+            )
+            jumps[:, ~np.asarray(structure.pbc)] = 0
+            positions -= jumps @ cell
+        return positions
+
+    def _build(self, structure):
+        """
+        Compute the neighbors of the reference frame and store the candidates within the enlarged search radius.
+        """
+        neigh = structure.get_neighbors(
+            num_neighbors=self._num_neighbors,
+            cutoff_radius=self._cutoff_radius,
+            tolerance=self._tolerance,
+            width_buffer=self._width_buffer,
+            mode="filled",
+        )
+        r_k = np.full(len(structure), np.inf)
+        if neigh.distances.shape[-1] == self._num_neighbors:
+            r_k = neigh.distances[:, -1]
+        radius = np.minimum(
+            self._cutoff_radius + self._skin, r_k + 2 * self._skin
+        ).max()
+        num_candidates = 2 * self._num_neighbors
+        while True:
+            with warnings.catch_warnings():
+                # a full candidate list is detected below and the search is repeated with more candidates
+                warnings.simplefilter("ignore")
+                candidates = structure.get_neighbors(
+                    num_neighbors=num_candidates,
+                    cutoff_radius=radius,
+                    width_buffer=self._width_buffer,
+                    mode="filled",
+                )
+            if (
+                candidates.distances.shape[-1] < num_candidates
+                or np.all(candidates.distances[:, -1] == np.inf)
+                or num_candidates >= candidates._get_extended_positions().shape[0]
+            ):
+                break
+            num_candidates *= 2
+        positions = np.array(structure.positions)
+        valid = candidates.distances < np.inf
+        indices = np.where(valid, candidates.indices, 0)
+        translations = candidates.vecs - (positions[indices] - positions[:, np.newaxis])
+        translations[~valid] = np.inf
+        self._candidate_indices = indices
+        self._candidate_translations = translations
+        self._reference_positions = positions
+        self._reference_cell = np.array(structure.cell)
+        self._reference_pbc = np.array(structure.pbc)
+        self.n_builds += 1
+        return neigh
+
+    def _get_shells(self, distances):
+        """
+        Shell indices of the neighbors, equivalent to `Neighbors.shells` for distances sorted in ascending order.
+        """
+        rounded = np.round(distances, decimals=self._tolerance)
+        shells = np.ones(distances.shape, dtype=int)
+        shells[:, 1:] += np.cumsum(rounded[:, 1:] != rounded[:, :-1], axis=-1)
+        shells[distances == np.inf] = -1
+        return shells
+
+
+class VerletNeighbors:
+    """
+    Neighbors of a single frame computed by the :class:`VerletNeighborList`.
+
+    Attributes:
+        indices (numpy.ndarray): Indices of the neighbors
+        distances (numpy.ndarray): Distances to the neighbors
+        vecs (numpy.ndarray): Vectors to the neighbors
+        shells (numpy.ndarray): Shell indices of the neighbors
+    """
+
+    def __init__(self, indices, distances, vecs, shells):
+        self.indices = indices
+        self.distances = distances
+        self.vecs = vecs
+        self.shells = shells
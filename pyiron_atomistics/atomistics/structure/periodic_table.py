@@ -29,19 +29,58 @@ def element(*args):
     return mendeleev.element(*args)
 
 
+@lru_cache(maxsize=118)
+def _mendeleev_property_names(*args):
+    return frozenset(s for s in dir(element(*args)) if not s.startswith("_"))
+
+
 class ChemicalElement(object):
     """
     An Object which contains the element specific parameters
+
+    Elements of an unmodified :class:`.PeriodicTable` are backed by a shared, read-only row of the periodic table;
+    their pandas series :attr:`.sub` is only created when it is accessed.
+
+    Elements use `__slots__`. Setting any other attribute, like `element.MeltingPoint = 1900`, stores the value as
+    parameter in the own pandas series :attr:`.sub` of the element, so it never changes other elements or periodic
+    tables, and the parameter takes precedence over the value provided by mendeleev.
     """
 
+    __slots__ = (
+        "_sub",
+        "_properties",
+        "_overrides",
+        "_dataset",
+        "_mendeleev_element",
+        "_mendeleev_property_lst",
+        "el",
+    )
+
+    _mendeleev_translation_dict = {
+        "AtomicNumber": "atomic_number",
+        "AtomicRadius": "covalent_radius_cordero",
+        "AtomicMass": "mass",
+        "Color": "cpk_color",
+        "CovalentRadius": "covalent_radius",
+        "CrystalStructure": "lattice_structure",
+        "Density": "density",
+        "DiscoveryYear": "discovery_year",
+        "ElectronAffinity": "electron_affinity",
+        "Electronegativity": "electronegativity",
+        "Group": "group_id",
+        "Name": "name",
+        "Period": "period",
+        "StandardName": "name",
+        "VanDerWaalsRadius": "vdw_radius",
+        "MeltingPoint": "melting_point",
+    }
+
     def __init__(self, sub):
         """
         Constructor: assign PSE dictionary to object
         """
-        self._dataset = None
-        self.sub = sub
-        self._mendeleev_element = None
-        self._mendeleev_property_lst = None
+        self._init_slots()
+        self._sub = sub
         stringtypes = str
         if isinstance(self.sub, stringtypes):
             self._init_mendeleev(self.sub)
@@ -50,64 +89,131 @@ class ChemicalElement(object):
         elif len(self.sub) > 0:
             self._init_mendeleev(self.sub.Abbreviation)
 
-        self._mendeleev_translation_dict = {
-            "AtomicNumber": "atomic_number",
-            "AtomicRadius": "covalent_radius_cordero",
-            "AtomicMass": "mass",
-            "Color": "cpk_color",
-            "CovalentRadius": "covalent_radius",
-            "CrystalStructure": "lattice_structure",
-            "Density": "density",
-            "DiscoveryYear": "discovery_year",
-            "ElectronAffinity": "electron_affinity",
-            "Electronegativity": "electronegativity",
-            "Group": "group_id",
-            "Name": "name",
-            "Period": "period",
-            "StandardName": "name",
-            "VanDerWaalsRadius": "vdw_radius",
-            "MeltingPoint": "melting_point",
-        }
+    @classmethod
+    def _from_properties(cls, properties):
+        """
+        Create an element backed by a read-only dictionary of its properties instead of a pandas series.
+
+        Args:
+            properties (dict): properties of the element, the same as the series of the element in the periodic table
+
+        Returns:
+            :class:`.ChemicalElement`: the new element
+        """
+        self = cls.__new__(cls)
+        self._init_slots()
+        self._properties = properties
+        self._init_mendeleev(properties["Abbreviation"])
+        return self
+
+    def _init_slots(self):
+        self._sub = None
+        self._properties = None
+        self._overrides = frozenset()
+        self._dataset = None
+        self._mendeleev_element = None
+        self._mendeleev_property_lst = frozenset()
         self.el = None
 
     def _init_mendeleev(self, element_str):
         self._mendeleev_element = element(str(element_str))
-        self._mendeleev_property_lst = [
-            s for s in dir(self._mendeleev_element) if not s.startswith("_")
-        ]
+        self._mendeleev_property_lst = _mendeleev_property_names(str(element_str))
+
+    @property
+    def sub(self):
+        """
+        pandas.Series: parameters of the element as stored in the periodic table
+        """
+        if self._sub is None and self._properties is not None:
+            self._sub = pandas.Series(
+                self._properties, name=self._properties["Abbreviation"], dtype=object
+            )
+            self._properties = None
+        return self._sub
+
+    @sub.setter
+    def sub(self, value):
+        self._sub = value
+        self._properties = None
+
+    def _to_properties(self):
+        if self._properties is not None:
+            return self._properties
+        return self.sub.to_dict()
 
     def __getattr__(self, item):
-        if item in ["__array_struct__", "__array_interface__", "__array__"]:
-            raise AttributeError
+        if item.startswith("_"):
+            raise AttributeError(item)
         return self[item]
 
+    def __setattr__(self, key, value):
+        if key in ChemicalElement.__slots__ or hasattr(type(self), key):
+            object.__setattr__(self, key, value)
+        else:
+            self.sub[key] = value
+            self._overrides = self._overrides | {key}
+
     def __getitem__(self, item):
+        """
+        Get a parameter of the element. Parameters set as attributes take precedence over the parameters provided by
+        mendeleev, which take precedence over the ones in the periodic table.
+
+        The values of an element of an unmodified periodic table are the values of the shared periodic table and must
+        not be modified in place, modify :attr:`.sub` instead, which is the own copy of the parameters of the element.
+
+        Args:
+            item (str): name of the parameter
+
+        Returns:
+            object: value of the parameter, None if the element has no such parameter
+        """
+        if item in self._overrides:
+            return self.sub[item]
         if item in self._mendeleev_translation_dict.keys():
             item = self._mendeleev_translation_dict[item]
         if item in self._mendeleev_property_lst:
             return getattr(self._mendeleev_element, item)
+        if self._properties is not None:
+            return self._properties.get(item)
         if item in self.sub.index:
             return self.sub[item]
 
     def __setstate__(self, state):
-        self.__dict__.update(state)
+        self._init_slots()
+        if isinstance(state, tuple):
+            # default state of objects with __slots__
+            state = state[1]
+        state = dict(state)
+        if "sub" in state:
+            state["_sub"] = state.pop("sub")
+        state.pop("_mendeleev_translation_dict", None)
+        state.update(state.pop("_attributes", None) or {})
+        # parameters set as attributes are stored in sub, so sub is restored first
+        for key in sorted(
+            state.keys(), key=lambda k: k not in ChemicalElement.__slots__
+        ):
+            setattr(self, key, state[key])
+        if isinstance(self._mendeleev_property_lst, list):
+            self._mendeleev_property_lst = frozenset(self._mendeleev_property_lst)
+        if isinstance(self._overrides, (list, set)):
+            self._overrides = frozenset(self._overrides)
 
     def __getstate__(self):
         # Only necessary to support pickling in python <3.11
         # https://docs.python.org/release/3.11.2/library/pickle.html#object.__getstate__
-        return self.__dict__
+        return {key: getattr(self, key) for key in ChemicalElement.__slots__}
 
     def __eq__(self, other):
         if self is other:
             return True
         elif isinstance(other, self.__class__):
             conditions = list()
-            conditions.append(self.sub.to_dict() == other.sub.to_dict())
+            conditions.append(self._to_properties() == other._to_properties())
             return all(conditions)
         elif isinstance(other, (np.ndarray, list)):
             conditions = list()
             for sp in other:
-                conditions.append(self.sub.to_dict() == sp.sub.to_dict())
+                conditions.append(self._to_properties() == sp._to_properties())
             return any(conditions)
 
     def __ne__(self, other):
@@ -133,12 +239,15 @@ class ChemicalElement(object):
 
     @property
     def tags(self):
+        if self._properties is not None:
+            tags = self._properties.get("tags")
+            return tags if tags is not None else dict()
         if "tags" not in self.sub.keys() or self.sub["tags"] is None:
             return dict()
         return self.sub["tags"]
 
     def __dir__(self):
-        return list(self.sub.index) + super(ChemicalElement, self).__dir__()
+        return list(self._to_properties()) + super(ChemicalElement, self).__dir__()
 
     def __str__(self):
         return str([self._dataset, self.sub])
@@ -204,9 +313,75 @@ class ChemicalElement(object):
                         self.sub["tags"] = tag_dic
 
 
+class _ElementTable:
+    """
+    Shared, read-only periodic table loaded from a file.
+
+    The data is stored in a structured numpy array with one row per element together with a dictionary from the
+    element symbols to the rows.  The element properties are only converted once into the dictionaries backing the
+    :class:`.ChemicalElement` objects, so creating elements does not touch pandas.
+    """
+
+    def __init__(self, dataframe):
+        """
+        Args:
+            dataframe (pandas.DataFrame): periodic table as read from the file, is not modified
+        """
+        self.source = dataframe
+        dataframe = dataframe.copy()
+        if "Abbreviation" not in dataframe.columns.values:
+            dataframe["Abbreviation"] = None
+        abbreviation = dataframe["Abbreviation"].to_numpy(dtype=object, copy=True)
+        missing = np.array([a is None for a in abbreviation], dtype=bool)
+        abbreviation[missing] = dataframe.index.values[missing]
+        dataframe["Abbreviation"] = abbreviation
+        self.dataframe = dataframe
+        self.data = dataframe.to_records(index=False)
+        self.data.flags.writeable = False
+        self.index = {symbol: i for i, symbol in enumerate(dataframe.index.values)}
+        self.atomic_numbers = {}
+        for symbol, number in zip(dataframe.index.values, self.data["AtomicNumber"]):
+            self.atomic_numbers.setdefault(int(number), symbol)
+        self._properties = {}
+
+    def properties(self, symbol):
+        """
+        Read-only dictionary of the properties of an element, equal to the row of the element in the dataframe.
+
+        Args:
+            symbol (str): chemical symbol of the element
+
+        Returns:
+            dict: properties of the element
+        """
+        try:
+            return self._properties[symbol]
+        except KeyError:
+            row = self.data[self.index[symbol]]
+            properties = dict(zip(self.data.dtype.names, row.tolist()))
+            self._properties[symbol] = properties
+            return properties
+
+
+_element_tables = {}
+
+
+def _get_element_table(file_name=None):
+    dataframe = PeriodicTable._get_periodic_table_df(file_name)
+    table = _element_tables.get(file_name)
+    # rebuild when the cached dataframe was cleared and read again
+    if table is None or table.source is not dataframe:
+        table = _ElementTable(dataframe)
+        _element_tables[file_name] = table
+    return table
+
+
 class PeriodicTable:
     """
     An Object which stores an elementary table which can be modified for the current session
+
+    All tables read from the same file share the same read-only data until they are modified, e.g. by
+    :meth:`.add_element()`, or :attr:`.dataframe` is accessed, so creating them is cheap.
     """
 
     def __init__(self, file_name=None):  # PSE_dat_file = None):
@@ -215,20 +390,38 @@ class PeriodicTable:
         Args:
             file_name (str): Possibility to choose an source hdf5 file
         """
-        self.dataframe = self._get_periodic_table_df(file_name)
-        if "Abbreviation" not in self.dataframe.columns.values:
-            self.dataframe["Abbreviation"] = None
-        if not all(self.dataframe["Abbreviation"].values):
-            for item in self.dataframe.index.values:
-                if self.dataframe["Abbreviation"][item] is None:
-                    self.dataframe["Abbreviation"][item] = item
+        self._file_name = file_name
+        self._table = _get_element_table(file_name)
+        self._dataframe = None
         self._parent_element = None
         self.el = None
 
+    @property
+    def dataframe(self):
+        """
+        pandas.DataFrame: the periodic table of this session, modifications do not affect other periodic tables
+        """
+        if self._dataframe is None:
+            self._dataframe = self._table.dataframe.copy()
+        return self._dataframe
+
+    @dataframe.setter
+    def dataframe(self, value):
+        self._dataframe = value
+
     def __getattr__(self, item):
+        if item.startswith("_"):
+            raise AttributeError(item)
         return self[item]
 
     def __getitem__(self, item):
+        if self._dataframe is None:
+            dataframe = self._table.dataframe
+            if item in dataframe.columns.values:
+                return dataframe[item].copy()
+            if item in self._table.index:
+                return dataframe.loc[item].copy()
+            return None
         if item in self.dataframe.columns.values:
             return self.dataframe[item]
         if item in self.dataframe.index.values:
@@ -238,12 +431,20 @@ class PeriodicTable:
         """
         Used by (cloud)pickle; force the state update to avoid recursion pickling Atoms
         """
+        state = dict(state)
+        if "dataframe" in state:
+            state["_dataframe"] = state.pop("dataframe")
+        state.setdefault("_file_name", None)
+        state["_table"] = _get_element_table(state["_file_name"])
         self.__dict__.update(state)
 
     def __getstate__(self):
         # Only necessary to support pickling in python <3.11
         # https://docs.python.org/release/3.11.2/library/pickle.html#object.__getstate__
-        return self.__dict__
+        state = self.__dict__.copy()
+        # the shared table is restored from the file name
+        del state["_table"]
+        return state
 
     def from_hdf(self, hdf):
         """
@@ -301,6 +502,18 @@ class PeriodicTable:
 
         """
         stringtypes = str
+        if self._dataframe is None and len(qwargs.values()) == 0:
+            if isinstance(arg, stringtypes):
+                if arg in self._table.index:
+                    self.el = arg
+                else:
+                    raise KeyError(arg)
+            elif isinstance(arg, int):
+                if arg in self._table.atomic_numbers:
+                    self.el = self._table.atomic_numbers[arg]
+            else:
+                raise ValueError("type not defined: " + str(type(arg)))
+            return ChemicalElement._from_properties(self._table.properties(self.el))
         if isinstance(arg, stringtypes):
             if arg in self.dataframe.index.values:
                 self.el = arg
@@ -329,6 +542,8 @@ class PeriodicTable:
         Returns boolean: true for the same element, false otherwise
 
         """
+        if self._dataframe is None:
+            return symbol in self._table.index
         return symbol in self.dataframe["Abbreviation"]
 
     def atomic_number_to_abbreviation(self, atom_no):
@@ -343,6 +558,11 @@ class PeriodicTable:
         if not isinstance(atom_no, int):
             raise ValueError("type not defined: " + str(type(atom_no)))
 
+        if self._dataframe is None:
+            data = self._table.data
+            return data["Abbreviation"][
+                np.nonzero(data["AtomicNumber"] == atom_no)[0][0]
+            ]
         return self.Abbreviation[
             np.nonzero(self.AtomicNumber.to_numpy() == atom_no)[0][0]
         ]
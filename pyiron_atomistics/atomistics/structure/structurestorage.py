@@ -6,7 +6,11 @@
 Alternative structure container that stores them in flattened arrays.
 """
 
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing import shared_memory
+from typing import Callable, Dict, List, Optional
+import numbers
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -231,28 +235,123 @@ class StructureStorage(FlattenedStorage, pa_has_structure.HasStructure):
             raise KeyError(f"No structure named {frame}.") from None
 
     def _get_structure(self, frame=-1, wrap_atoms=True):
-        symbols = self.get_array("symbols", frame)
-        elements = [e for e in self.get_elements() if e in symbols]
-        index_map = {e: i for i, e in enumerate(elements)}
         try:
             magmoms = self.get_array("spins", frame)
         except KeyError:
             # not all structures have spins saved on them
             magmoms = None
-        structure = Atoms(
-            species=[Atom(e).element for e in elements],
-            indices=[index_map[e] for e in symbols],
+        if self.has_array("selective_dynamics"):
+            selective_dynamics = self.get_array("selective_dynamics", frame)
+        else:
+            selective_dynamics = None
+        return _structure_from_arrays(
+            symbols=self.get_array("symbols", frame),
             positions=self.get_array("positions", frame),
             cell=self.get_array("cell", frame),
             pbc=self.get_array("pbc", frame),
             magmoms=magmoms,
+            selective_dynamics=selective_dynamics,
         )
-        if self.has_array("selective_dynamics"):
-            structure.add_tag(selective_dynamics=[True, True, True])
-            selective_dynamics = self.get_array("selective_dynamics", frame)
-            for i, d in enumerate(selective_dynamics):
-                structure.selective_dynamics[i] = d.tolist()
-        return structure
+
+    def get_structure_view(self, frame=-1) -> "StructureView":
+        """
+        Return a read-only view of a stored structure.
+
+        Contrary to :meth:`.get_structure()` no :class:`.Atoms` is created, the positions, cell and symbols of the view
+        point directly into the flattened arrays of the storage, see :class:`.StructureView`.
+
+        Args:
+            frame (int, str): selects structure to fetch, as in :meth:`.get_structure()`
+
+        Returns:
+            :class:`.StructureView`: view of the requested structure
+
+        Raises:
+            IndexError: if not -len(self) <= frame < len(self)
+        """
+        if not isinstance(frame, numbers.Integral):
+            frame = self._translate_frame(frame)
+        if frame < 0:
+            frame += len(self)
+        if not (0 <= frame < len(self)):
+            raise IndexError(
+                f"argument frame {frame} out of range [-{len(self)}, {len(self)})."
+            )
+        return StructureView(self, frame)
+
+    def iter_structure_views(self):
+        """
+        Iterate over read-only views of all structures, see :meth:`.get_structure_view()`.
+
+        Yields:
+            :class:`.StructureView`: every structure in the storage
+        """
+        for i in range(len(self)):
+            yield StructureView(self, i)
+
+    def map_structures(
+        self,
+        function: Callable[[Atoms], Dict[str, np.ndarray]],
+        n_processes: int = 1,
+        chunk_size: Optional[int] = None,
+        store: Optional[FlattenedStorage] = None,
+    ) -> FlattenedStorage:
+        """
+        Apply a function to every structure and collect the results in a :class:`.FlattenedStorage`.
+
+        The function is called with the structure and must return a dictionary of arrays.  Each dictionary is added as
+        a chunk to the returned storage with the same identifier as the structure, so arrays whose first axis matches
+        the number of atoms are stored per atom and all others per structure, see :meth:`.FlattenedStorage.add_chunk`.
+
+        With `n_processes` larger than one, the flattened arrays of the storage are copied once into shared memory and
+        the structures are distributed in chunks of `chunk_size` to a pool of processes, which rebuild them from the
+        shared arrays.  The function must be picklable in this case, i.e. defined on module level or a
+        :func:`functools.partial` of such a function.
+
+        >>> def get_volume(structure):
+        ...     return {"volume": structure.get_volume()}
+        >>> container.map_structures(get_volume, n_processes=4)["volume"]
+
+        Args:
+            function (callable): called with every structure, returns a dict of arrays
+            n_processes (int): number of processes to use
+            chunk_size (int, optional): number of structures sent to a process at once, by default the structures are
+                split evenly into four chunks per process
+            store (:class:`.FlattenedStorage`, optional): storage to add the results to, a new one is created if not
+                given; arrays may be added to it beforehand to fix their shape, dtype and fill value
+
+        Returns:
+            :class:`.FlattenedStorage`: results of the function for every structure in the same order as the structures
+        """
+        if store is None:
+            store = FlattenedStorage()
+        identifiers = self.get_array("identifier")
+        if n_processes == 1 or len(self) <= 1:
+            results = map(function, self.iter_structures())
+        else:
+            if chunk_size is None:
+                chunk_size = max(1, int(np.ceil(len(self) / (4 * n_processes))))
+            chunks = [
+                (start, min(start + chunk_size, len(self)))
+                for start in range(0, len(self), chunk_size)
+            ]
+            shared = _SharedStructureArrays(self)
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=n_processes,
+                    initializer=_init_map_worker,
+                    initargs=(shared.specs, function),
+                ) as executor:
+                    results = [
+                        r
+                        for chunk_results in executor.map(_map_chunk, chunks)
+                        for r in chunk_results
+                    ]
+            finally:
+                shared.close()
+        for length, identifier, result in zip(self.length, identifiers, results):
+            store.add_chunk(length, identifier=identifier, **result)
+        return store
 
     def _number_of_structures(self):
         return len(self)
@@ -270,6 +369,277 @@ class StructureStorage(FlattenedStorage, pa_has_structure.HasStructure):
         return self._plots
 
 
+class StructureView:
+    """
+    Lightweight read-only view of a structure in a :class:`.StructureStorage`.
+
+    The positions, cell, periodic boundary conditions and chemical symbols are read-only numpy views into the flattened
+    arrays of the storage, so creating and iterating over views does not copy any data.
+
+    >>> view = container.get_structure_view(0)
+    >>> view.positions.base is not None
+    True
+
+    Any other attribute is looked up on a full :class:`.Atoms` object, which is created from the storage on first
+    access.  Setting an attribute creates it as well, so the view turns into a copy of the structure that is detached
+    from the storage and all properties are then taken from it.
+
+    >>> view.positions += 1
+    Traceback (most recent call last):
+    ...
+    ValueError: output array is read-only
+    >>> view.positions = view.positions + 1
+    >>> np.array_equal(view.positions, container.get_array("positions", 0))
+    False
+
+    Use :meth:`.to_atoms()` to get an independent :class:`.Atoms` object.
+    """
+
+    def __init__(self, store: StructureStorage, frame: int):
+        """
+        Args:
+            store (:class:`.StructureStorage`): storage that holds the structure
+            frame (int): index of the structure in the storage
+        """
+        self._store = store
+        self._frame = frame
+        self._atoms = None
+
+    def _get_view(self, name):
+        view = self._store.get_array(name, self._frame).view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def frame(self) -> int:
+        """
+        int: index of the structure in the storage
+        """
+        return self._frame
+
+    @property
+    def identifier(self) -> str:
+        """
+        str: identifier of the structure in the storage
+        """
+        return self._store.get_array("identifier", self._frame)
+
+    @property
+    def positions(self) -> np.ndarray:
+        """
+        numpy.ndarray: read-only cartesian positions of the atoms
+        """
+        if self._atoms is not None:
+            return self._atoms.positions
+        return self._get_view("positions")
+
+    @property
+    def cell(self) -> np.ndarray:
+        """
+        numpy.ndarray: read-only cell vectors as rows of a 3x3 matrix
+        """
+        if self._atoms is not None:
+            return self._atoms.cell.array
+        return self._get_view("cell")
+
+    @property
+    def pbc(self) -> np.ndarray:
+        """
+        numpy.ndarray: read-only periodic boundary conditions along the cell vectors
+        """
+        if self._atoms is not None:
+            return self._atoms.pbc
+        return self._get_view("pbc")
+
+    @property
+    def symbols(self) -> np.ndarray:
+        """
+        numpy.ndarray: read-only chemical symbols of the atoms
+        """
+        if self._atoms is not None:
+            return self._atoms.get_chemical_symbols()
+        return self._get_view("symbols")
+
+    def get_chemical_symbols(self) -> np.ndarray:
+        """
+        Returns the chemical symbols for all the atoms in the structure
+
+        Returns:
+            numpy.ndarray: A list of chemical symbols
+        """
+        return np.array(self.symbols)
+
+    def get_volume(self, per_atom=False) -> float:
+        """
+        Args:
+            per_atom (bool): True if volume per atom is to be returned
+
+        Returns:
+            volume (float): Volume in A**3
+        """
+        volume = np.abs(np.linalg.det(self.cell))
+        if per_atom:
+            return volume / len(self)
+        return volume
+
+    def to_atoms(self) -> Atoms:
+        """
+        Create a new :class:`.Atoms` object of the structure.
+
+        Returns:
+            :class:`.Atoms`: copy of the structure
+        """
+        if self._atoms is not None:
+            return self._atoms.copy()
+        return self._store._get_structure(frame=self._frame)
+
+    def __len__(self):
+        if self._atoms is not None:
+            return len(self._atoms)
+        return int(self._store.get_array("length", self._frame))
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if self._atoms is None:
+            self._atoms = self.to_atoms()
+        return getattr(self._atoms, name)
+
+    def __setattr__(self, name, value):
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+            return
+        if self._atoms is None:
+            self._atoms = self.to_atoms()
+        setattr(self._atoms, name, value)
+
+    def __repr__(self):
+        return f"StructureView({self.identifier!r}, frame={self._frame}, {len(self)} atoms)"
+
+
+def _structure_from_arrays(
+    symbols, positions, cell, pbc, magmoms=None, selective_dynamics=None
+):
+    elements, indices = np.unique(symbols, return_inverse=True)
+    structure = Atoms(
+        species=[Atom(e).element for e in elements],
+        indices=indices,
+        positions=positions,
+        cell=cell,
+        pbc=pbc,
+        magmoms=magmoms,
+    )
+    if selective_dynamics is not None:
+        structure.add_tag(selective_dynamics=[True, True, True])
+        for i, d in enumerate(selective_dynamics):
+            structure.selective_dynamics[i] = d.tolist()
+    return structure
+
+
+class _SharedStructureArrays:
+    """
+    Copies of the arrays of a :class:`.StructureStorage` in shared memory, so that worker processes can rebuild the
+    structures without pickling them.
+    """
+
+    _PER_ELEMENT = ("symbols", "positions", "spins", "selective_dynamics")
+    _PER_CHUNK = ("start_index", "length", "cell", "pbc")
+
+    def __init__(self, store: StructureStorage):
+        self._memory = []
+        self.specs = {}
+        for name in self._PER_ELEMENT + self._PER_CHUNK:
+            if not store.has_array(name):
+                continue
+            if name in self._PER_ELEMENT:
+                array = store._per_element_arrays[name][: store.num_elements]
+            else:
+                array = store._per_chunk_arrays[name][: store.num_chunks]
+            array = np.ascontiguousarray(array)
+            memory = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+            np.ndarray(array.shape, dtype=array.dtype, buffer=memory.buf)[...] = array
+            self._memory.append(memory)
+            self.specs[name] = (memory.name, array.shape, array.dtype)
+
+    def close(self):
+        for memory in self._memory:
+            memory.close()
+            memory.unlink()
+        self._memory = []
+
+
+_map_worker_state = {}
+
+
+def _init_map_worker(specs, function):
+    _map_worker_state["memory"] = [
+        shared_memory.SharedMemory(name=name) for name, _, _ in specs.values()
+    ]
+    _map_worker_state["arrays"] = {
+        key: np.ndarray(shape, dtype=dtype, buffer=memory.buf)
+        for (key, (_, shape, dtype)), memory in zip(
+            specs.items(), _map_worker_state["memory"]
+        )
+    }
+    _map_worker_state["function"] = function
+
+
+def _map_chunk(chunk):
+    arrays = _map_worker_state["arrays"]
+    function = _map_worker_state["function"]
+    results = []
+    for frame in range(*chunk):
+        start = arrays["start_index"][frame]
+        atoms = slice(start, start + arrays["length"][frame])
+        structure = _structure_from_arrays(
+            symbols=arrays["symbols"][atoms],
+            positions=arrays["positions"][atoms].copy(),
+            cell=arrays["cell"][frame].copy(),
+            pbc=arrays["pbc"][frame].copy(),
+            magmoms=arrays["spins"][atoms].copy() if "spins" in arrays else None,
+            selective_dynamics=arrays["selective_dynamics"][atoms]
+            if "selective_dynamics" in arrays
+            else None,
+        )
+        results.append(function(structure))
+    return results
+
+
+def _get_crystal_system(num):
+    if num in range(1, 3):
+        return "triclinic"
+    elif num in range(3, 16):
+        return "monoclinic"
+    elif num in range(16, 75):
+        return "orthorhombic"
+    elif num in range(75, 143):
+        return "tetragonal"
+    elif num in range(143, 168):
+        return "trigonal"
+    elif num in range(168, 195):
+        return "hexagonal"
+    elif num in range(195, 231):
+        return "cubic"
+
+
+def _get_spacegroup(structure, symprec):
+    try:
+        spg = structure.get_symmetry(symprec=symprec).spacegroup["Number"]
+    except SymmetryError:
+        spg = 1
+    return {"space_group": spg}
+
+
+def _get_neighbors(structure, num_neighbors):
+    neigh = structure.get_neighbors(num_neighbors=num_neighbors, allow_ragged=False)
+    return {
+        "indices": neigh.indices,
+        "distances": neigh.distances,
+        "vecs": neigh.vecs,
+        "shells": neigh.shells,
+    }
+
+
 class StructurePlots:
     """
     Simple interface to plot various properties of structures.
@@ -367,43 +737,32 @@ class StructurePlots:
 
         return df
 
-    def _calc_spacegroups(self, symprec=1e-3):
+    def _calc_spacegroups(self, symprec=1e-3, n_processes=1):
         """
         Calculate space groups of all structures.
 
         Args:
             symprec (float): symmetry precision given to spglib
+            n_processes (int): number of processes to use, see :meth:`.StructureStorage.map_structures`
 
         Returns:
             DataFrame: contains columns 'crystal_system' (str) and 'space_group' (int) for each structure
         """
+        store = FlattenedStorage()
+        store.add_array("space_group", dtype=np.int64, per="chunk")
+        space_group = self._store.map_structures(
+            partial(_get_spacegroup, symprec=symprec),
+            n_processes=n_processes,
+            store=store,
+        )["space_group"]
+        return pd.DataFrame(
+            {
+                "space_group": space_group,
+                "crystal_system": [_get_crystal_system(spg) for spg in space_group],
+            }
+        )
 
-        def get_crystal_system(num):
-            if num in range(1, 3):
-                return "triclinic"
-            elif num in range(3, 16):
-                return "monoclinic"
-            elif num in range(16, 75):
-                return "orthorhombic"
-            elif num in range(75, 143):
-                return "tetragonal"
-            elif num in range(143, 168):
-                return "trigonal"
-            elif num in range(168, 195):
-                return "hexagonal"
-            elif num in range(195, 231):
-                return "cubic"
-
-        def extract(s):
-            try:
-                spg = s.get_symmetry(symprec=symprec).spacegroup["Number"]
-            except SymmetryError:
-                spg = 1
-            return {"space_group": spg, "crystal_system": get_crystal_system(spg)}
-
-        return pd.DataFrame(map(extract, self._store.iter_structures()))
-
-    def spacegroups(self, symprec=1e-3):
+    def spacegroups(self, symprec=1e-3, n_processes=1):
         """
         Plot histograms of space groups and crystal systems.
 
@@ -411,13 +770,14 @@ class StructurePlots:
 
         Args:
             symprec (float): precision of the symmetry search (passed to spglib)
+            n_processes (int): number of processes to use for the symmetry search
 
         Returns:
             DataFrame: contains two columns "space_group", "crystal_system"
                        for each structure
         """
 
-        df = self._calc_spacegroups(symprec=symprec)
+        df = self._calc_spacegroups(symprec=symprec, n_processes=n_processes)
         plt.subplot(1, 2, 1)
         plt.hist(df.space_group, bins=230)
         plt.xlabel("Space Group")
@@ -439,7 +799,7 @@ class StructurePlots:
         plt.xticks(rotation=35)
         return df
 
-    def _calc_neighbors(self, num_neighbors):
+    def _calc_neighbors(self, num_neighbors, n_processes=1):
         """
         Calculate the neighbor information with additional caching.
 
@@ -452,6 +812,10 @@ class StructurePlots:
 
         If `num_neighbors` is `None` on the first call, the default is 36.
 
+        Args:
+            num_neighbors (int): number of neighbors to calculate
+            n_processes (int): number of processes to use, see :meth:`.StructureStorage.map_structures`
+
         Returns:
             dict: with keys 'distances' and 'shells' containing the respective flattened arrays from
             :meth:`.Atoms.get_neighbors`.
@@ -473,17 +837,26 @@ class StructurePlots:
             if num_neighbors is None:
                 num_neighbors = 36
             self._neigh = FlattenedStorage()
-            neigh_traj = NeighborsTrajectory(
-                has_structure=self._store,
-                num_neighbors=num_neighbors,
-                store=self._neigh,
-            )
+            if n_processes == 1:
+                NeighborsTrajectory(
+                    has_structure=self._store,
+                    num_neighbors=num_neighbors,
+                    store=self._neigh,
+                )
+            else:
+                # same arrays as NeighborsTrajectory would add to the store
+                NeighborsTrajectory(num_neighbors=num_neighbors, store=self._neigh)
+                self._store.map_structures(
+                    partial(_get_neighbors, num_neighbors=num_neighbors),
+                    n_processes=n_processes,
+                    store=self._neigh,
+                )
         return {
             "distances": self._neigh["distances"],
             "shells": self._neigh["shells"],
         }
 
-    def coordination(self, num_shells=4, log=True, num_neighbors=None):
+    def coordination(self, num_shells=4, log=True, num_neighbors=None, n_processes=1):
         """
         Plot histogram of coordination in neighbor shells.
 
@@ -498,8 +871,12 @@ class StructurePlots:
             num_neighbors (int): maximum number of neighbors to calculate, when 'shells' is not defined in storage,
                                  default is the value from the previous call or 36
             log (float): plot histogram values on a log scale
+            n_processes (int): number of processes to use for the neighbor search, when 'shells' is not defined in
+                               storage
         """
-        neigh = self._calc_neighbors(num_neighbors=num_neighbors)
+        neigh = self._calc_neighbors(
+            num_neighbors=num_neighbors, n_processes=n_processes
+        )
         shells = neigh["shells"]
 
         shell_index = (
@@ -524,6 +901,7 @@ class StructurePlots:
         bins: int = 50,
         num_neighbors: int = None,
         normalize: bool = False,
+        n_processes: int = 1,
     ):
         """
         Plot a histogram of the neighbor distances.
@@ -536,8 +914,12 @@ class StructurePlots:
                                  default is the value from the previous call or 36
             normalize (bool): normalize the distribution by the surface area of
                               the radial bin, 4pi r^2
+            n_processes (int): number of processes to use for the neighbor search, when 'shells' or 'distances' are
+                               not defined in storage
         """
-        neigh = self._calc_neighbors(num_neighbors=num_neighbors)
+        neigh = self._calc_neighbors(
+            num_neighbors=num_neighbors, n_processes=n_processes
+        )
         distances = neigh["distances"].flatten()
 
         if normalize:
@@ -552,7 +934,7 @@ class StructurePlots:
             plt.ylabel("Neighbor count")
         plt.xlabel(r"Distance [$\mathrm{\AA}$]")
 
-    def shell_distances(self, num_shells=4, num_neighbors=None):
+    def shell_distances(self, num_shells=4, num_neighbors=None, n_processes=1):
         """
         Plot a violin plot of the neighbor distances in shells up to `num_shells`.
 
@@ -560,8 +942,12 @@ class StructurePlots:
             num_shells (int): maximum shell to plot
             num_neighbors (int): maximum number of neighbors to calculate, when 'shells' or 'distances' are not defined in storage
                                  default is the value from the previous call or 36
+            n_processes (int): number of processes to use for the neighbor search, when 'shells' or 'distances' are
+                               not defined in storage
         """
-        neigh = self._calc_neighbors(num_neighbors=num_neighbors)
+        neigh = self._calc_neighbors(
+            num_neighbors=num_neighbors, n_processes=n_processes
+        )
         shells = neigh["shells"]
         distances = neigh["distances"]
 
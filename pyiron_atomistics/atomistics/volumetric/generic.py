@@ -132,50 +132,102 @@ class VolumetricData(object):
             float: Spherical average at the target center
 
         """
-        grid_shape = self._total_data.shape
+        return self.spherical_average_potentials(
+            structure=structure,
+            spherical_centers=[spherical_center],
+            rad=rad,
+            fwhm=fwhm,
+        )[0]
+
+    def spherical_average_potentials(
+        self, structure, spherical_centers, rad=2, fwhm=0.529177
+    ):
+        """
+        Calculates the spherical averages about many points in space at once
 
-        # Position of center of sphere at grid coordinates
-        n_grid_at_center = [
-            int(np.ceil(spherical_center[0] * grid_shape[0])),
-            int(np.ceil(spherical_center[1] * grid_shape[1])),
-            int(np.ceil(spherical_center[2] * grid_shape[2])),
-        ]
+        The grid points within the sphere and their gaussian weights are the same for all centers, so they are computed
+        once as a stencil of grid offsets, which is then applied to all centers with periodic wrapping of the grid.
 
+        Args:
+            structure (pyiron_atomistics.atomistics.structure.Atoms): Input structure
+            spherical_centers (list/numpy.ndarray): Nx3 positions of the spherical centers in direct coordinates
+            rad (float): radius of sphere to be considered in Angstrom (recommended value: 2)
+            fwhm (float): Full width half maximum of gaussian function in Angstrom (recommended value: 0.529177)
+
+        Returns:
+            numpy.ndarray: Spherical averages at the target centers
+
+        """
+        grid_shape = np.array(self._total_data.shape)
+        offsets, weights = self._get_grid_stencil(
+            structure=structure, grid_shape=grid_shape, rad=rad, fwhm=fwhm
+        )
+        return self._apply_grid_stencil(
+            data=self._total_data,
+            centers=self._get_grid_centers(spherical_centers, grid_shape),
+            offsets=offsets,
+            weights=weights,
+        )
+
+    def _get_grid_stencil(self, structure, grid_shape, rad, fwhm, axis_of_cyl=None):
+        """
+        Grid offsets and gaussian weights of all grid points within a sphere, or within a circle in the plane
+        perpendicular to the cylinder axis.
+
+        Args:
+            structure (pyiron_atomistics.atomistics.structure.Atoms): Input structure
+            grid_shape (numpy.ndarray): size of grid
+            rad (float): radius of sphere/cylinder in Angstrom
+            fwhm (float): Full width half maximum of gaussian function in Angstrom
+            axis_of_cyl (int/None): Axis of cylinder (0 (x) or 1 (y) or 2 (z)), None for a sphere
+
+        Returns:
+            numpy.ndarray: Mx3 grid offsets, the offset along the cylinder axis is always 0
+            numpy.ndarray: M gaussian weights
+        """
         # Unit distance between grids
-        dist_in_grid = [
-            np.linalg.norm(structure.cell[0]) / grid_shape[0],
-            np.linalg.norm(structure.cell[1]) / grid_shape[1],
-            np.linalg.norm(structure.cell[2]) / grid_shape[2],
-        ]
+        dist_in_grid = np.linalg.norm(structure.cell, axis=-1) / grid_shape
+        n_max = np.ceil(rad / dist_in_grid).astype(int)
+        ranges = [np.arange(-n, n) for n in n_max]
+        if axis_of_cyl is not None:
+            ranges[axis_of_cyl] = np.zeros(1, dtype=int)
+        offsets = np.stack(np.meshgrid(*ranges, indexing="ij"), axis=-1).reshape(-1, 3)
+        dist = np.linalg.norm(offsets * dist_in_grid, axis=-1)
+        within = dist <= rad
+        return offsets[within], self.gauss_f(dist[within], fwhm)
+
+    @staticmethod
+    def _get_grid_centers(centers, grid_shape):
+        # Position of the centers at grid coordinates
+        return np.ceil(np.atleast_2d(centers) * grid_shape).astype(int)
+
+    @staticmethod
+    def _apply_grid_stencil(data, centers, offsets, weights, chunk_size=2**22):
+        """
+        Weighted averages of the data around many grid centers.
 
-        # Range of grids to be considered within the provided radius w.r.t. center of sphere
-        num_grid_in_sph = [[], []]
-        for i, dist in enumerate(dist_in_grid):
-            num_grid_in_sph[0].append(n_grid_at_center[i] - int(np.ceil(rad / dist)))
-            num_grid_in_sph[1].append(n_grid_at_center[i] + int(np.ceil(rad / dist)))
-
-        sph_avg_tmp = []
-        weight = 0
-        for k in range(num_grid_in_sph[0][0], num_grid_in_sph[1][0]):
-            for l in range(num_grid_in_sph[0][1], num_grid_in_sph[1][1]):
-                for m in range(num_grid_in_sph[0][2], num_grid_in_sph[1][2]):
-                    target_grid_point = [k, l, m]
-                    dist = self.dist_between_two_grid_points(
-                        target_grid_point, n_grid_at_center, structure.cell, grid_shape
-                    )
-                    if dist <= rad:
-                        sph_avg_tmp.append(
-                            self._total_data[
-                                k % grid_shape[0], l % grid_shape[1], m % grid_shape[2]
-                            ]
-                            * self.gauss_f(dist, fwhm)
-                        )
-                        weight += self.gauss_f(dist, fwhm)
-                    else:
-                        pass
-        sum_list = np.sum(sph_avg_tmp)
-        sph_avg = sum_list / weight
-        return sph_avg
+        Args:
+            data (numpy.ndarray): 3D grid data
+            centers (numpy.ndarray): Nx3 integer grid coordinates of the centers
+            offsets (numpy.ndarray): Mx3 grid offsets of the stencil
+            weights (numpy.ndarray): M weights of the stencil
+            chunk_size (int): maximum number of grid values gathered at once
+
+        Returns:
+            numpy.ndarray: N weighted averages
+        """
+        flat_data = data.ravel()
+        averages = np.empty(len(centers))
+        n_centers = max(1, chunk_size // max(1, len(offsets)))
+        for i in range(0, len(centers), n_centers):
+            grid_points = (
+                centers[i : i + n_centers, np.newaxis, :] + offsets[np.newaxis, :, :]
+            )
+            indices = np.ravel_multi_index(
+                np.moveaxis(grid_points, -1, 0), data.shape, mode="wrap"
+            )
+            averages[i : i + n_centers] = flat_data[indices] @ weights
+        return averages / np.sum(weights)
 
     @staticmethod
     def dist_between_two_grid_points_cyl(
@@ -231,64 +283,56 @@ class VolumetricData(object):
             float: Cylindrical average at the target center
 
         """
-        grid_shape = self._total_data.shape
+        return self.cylindrical_average_potentials(
+            structure=structure,
+            spherical_centers=[spherical_center],
+            axis_of_cyl=axis_of_cyl,
+            rad=rad,
+            fwhm=fwhm,
+        )[0]
+
+    def cylindrical_average_potentials(
+        self, structure, spherical_centers, axis_of_cyl, rad=2, fwhm=0.529177
+    ):
+        """
+        Calculates the cylindrical averages about many points in space at once
 
-        # Position of center of sphere at grid coordinates
-        n_grid_at_center = [
-            int(np.ceil(spherical_center[0] * grid_shape[0])),
-            int(np.ceil(spherical_center[1] * grid_shape[1])),
-            int(np.ceil(spherical_center[2] * grid_shape[2])),
-        ]
+        The cylinders run through the whole cell along their axis, so the data is first summed along the axis and the
+        in-plane grid offsets and gaussian weights are applied to all centers at once, see
+        :meth:`.spherical_average_potentials`.
 
-        # Unit distance between grids
-        dist_in_grid = [
-            np.linalg.norm(structure.cell[0]) / grid_shape[0],
-            np.linalg.norm(structure.cell[1]) / grid_shape[1],
-            np.linalg.norm(structure.cell[2]) / grid_shape[2],
-        ]
-
-        # Range of grids to be considered within the provided radius w.r.t. center of sphere
-        num_grid_in_cyl = [[], []]
+        Args:
+            structure (pyiron_atomistics.atomistics.structure.Atoms): Input structure
+            spherical_centers (list/numpy.ndarray): Nx3 positions of the centers in direct coordinates
+            axis_of_cyl (int): Axis of cylinder (0 (x) or 1 (y) or 2 (z))
+            rad (float): radius of cylinder to be considered in Angstrom (recommended value: 2)
+            fwhm (float): Full width half maximum of gaussian function in Angstrom (recommended value: 0.529177)
 
-        for i, dist in enumerate(dist_in_grid):
-            if i == axis_of_cyl:
-                num_grid_in_cyl[0].append(0)
-                num_grid_in_cyl[1].append(grid_shape[i])
-            else:
-                num_grid_in_cyl[0].append(
-                    n_grid_at_center[i] - int(np.ceil(rad / dist))
-                )
-                num_grid_in_cyl[1].append(
-                    n_grid_at_center[i] + int(np.ceil(rad / dist))
-                )
+        Returns:
+            numpy.ndarray: Cylindrical averages at the target centers
 
-        cyl_avg_tmp = []
-        weight = 0
-        for k in range(num_grid_in_cyl[0][0], num_grid_in_cyl[1][0]):
-            for l in range(num_grid_in_cyl[0][1], num_grid_in_cyl[1][1]):
-                for m in range(num_grid_in_cyl[0][2], num_grid_in_cyl[1][2]):
-                    target_grid_point = [k, l, m]
-                    dist = self.dist_between_two_grid_points_cyl(
-                        target_grid_point,
-                        n_grid_at_center,
-                        structure.cell,
-                        grid_shape,
-                        axis_of_cyl,
-                    )
-                    if dist <= rad:
-                        cyl_avg_tmp.append(
-                            self._total_data[
-                                k % grid_shape[0], l % grid_shape[1], m % grid_shape[2]
-                            ]
-                            * self.gauss_f(dist, fwhm)
-                        )
-                        weight += self.gauss_f(dist, fwhm)
-                    else:
-                        pass
-        sum_list = np.sum(cyl_avg_tmp)
-        cyl_avg = sum_list / weight
-
-        return cyl_avg
+        """
+        if axis_of_cyl not in (0, 1, 2):
+            raise ValueError("check the direction of cylindrical axis")
+        grid_shape = np.array(self._total_data.shape)
+        offsets, weights = self._get_grid_stencil(
+            structure=structure,
+            grid_shape=grid_shape,
+            rad=rad,
+            fwhm=fwhm,
+            axis_of_cyl=axis_of_cyl,
+        )
+        centers = self._get_grid_centers(spherical_centers, grid_shape)
+        centers[:, axis_of_cyl] = 0
+        return (
+            self._apply_grid_stencil(
+                data=np.sum(self._total_data, axis=axis_of_cyl, keepdims=True),
+                centers=centers,
+                offsets=offsets,
+                weights=weights,
+            )
+            / grid_shape[axis_of_cyl]
+        )
 
     def get_average_along_axis(self, ind=2):
         """
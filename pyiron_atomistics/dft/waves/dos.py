@@ -95,7 +95,7 @@ class Dos(object):
             import matplotlib.pylab as plt
         except ImportError:
             import matplotlib.pyplot as plt
-        if not (self.es_obj.grand_dos_matrix is not None):
+        if not self.es_obj.has_grand_dos_matrix:
             raise NoResolvedDosError(
                 "Can not plot the orbital resolved dos since resolved dos values are not"
                 " available"
@@ -122,41 +122,14 @@ class Dos(object):
             numpy.ndarray: The required dos
 
         """
-        if not (self.es_obj.grand_dos_matrix is not None):
+        if not self.es_obj.has_grand_dos_matrix:
             raise NoResolvedDosError(
                 "Can not get the spin resolved dos since resolved dos values are not"
                 " available"
             )
-
-        grand_sum = np.sum(self.es_obj.grand_dos_matrix)
-        tot_val = self.es_obj.grand_dos_matrix.copy() / grand_sum
-        n_spin, n_kpts, n_bands, _, _ = np.shape(tot_val)
-        k = 0
-        b = 0
-        r_dos = np.zeros_like(self.t_dos[spin_indices])
-        w_dos = np.zeros_like(self.t_dos[spin_indices])
-        eigenvalues = self.es_obj.eigenvalues[spin_indices]
-        for e in eigenvalues:
-            weight = np.sum(tot_val[spin_indices, k, b, :, :])
-            weight_sum = np.sum(tot_val[:, k, b, :, :])
-            if b < n_bands - 1:
-                b += 1
-            else:
-                b = 0
-                k += 1
-            index = (
-                len(self.energies[spin_indices][self.energies[spin_indices] < e]) - 1
-            )
-            if index >= 0:
-                r_dos[index] = r_dos[index] + weight
-                w_dos[index] = w_dos[index] + weight_sum
-            else:
-                r_dos[0] = r_dos[0] + weight
-                w_dos[0] = w_dos[0] + weight_sum
-        ind_0 = np.argwhere(w_dos < 1e-8).flatten()
-        ind_1 = np.argwhere(w_dos >= 1e-8).flatten()
-        r_dos[ind_1] /= w_dos[ind_1]
-        r_dos[ind_0] = 0.0
+        r_dos = self._get_resolved_dos_fraction(
+            spin_indices=spin_indices, sum_over_spins=True
+        )
         return r_dos * self.t_dos[spin_indices]
 
     def get_spatially_resolved_dos(self, atom_indices, spin_indices=0):
@@ -172,40 +145,14 @@ class Dos(object):
             numpy.ndarray: The required dos
 
         """
-        if not (self.es_obj.grand_dos_matrix is not None):
+        if not self.es_obj.has_grand_dos_matrix:
             raise NoResolvedDosError(
                 "Can not get the spatially resolved dos since resolved dos values are not"
                 " available"
             )
-        grand_sum = np.sum(self.es_obj.grand_dos_matrix)
-        tot_val = self.es_obj.grand_dos_matrix.copy() / grand_sum
-        _, n_kpts, n_bands, _, _ = np.shape(tot_val)
-        k = 0
-        b = 0
-        r_dos = np.zeros_like(self.t_dos[spin_indices])
-        w_dos = np.zeros_like(self.t_dos[spin_indices])
-        eigenvalues = self.es_obj.eigenvalues[spin_indices]
-        for e in eigenvalues:
-            weight = np.sum(tot_val[spin_indices, k, b, atom_indices, :])
-            weight_sum = np.sum(tot_val[spin_indices, k, b, :, :])
-            if b < n_bands - 1:
-                b += 1
-            else:
-                b = 0
-                k += 1
-            index = (
-                len(self.energies[spin_indices][self.energies[spin_indices] < e]) - 1
-            )
-            if index >= 0:
-                r_dos[index] = r_dos[index] + weight
-                w_dos[index] = w_dos[index] + weight_sum
-            else:
-                r_dos[0] = r_dos[0] + weight
-                w_dos[0] = w_dos[0] + weight_sum
-        ind_0 = np.argwhere(w_dos < 1e-8).flatten()
-        ind_1 = np.argwhere(w_dos >= 1e-8).flatten()
-        r_dos[ind_1] /= w_dos[ind_1]
-        r_dos[ind_0] = 0.0
+        r_dos = self._get_resolved_dos_fraction(
+            spin_indices=spin_indices, atom_indices=atom_indices
+        )
         return r_dos * self.t_dos[spin_indices]
 
     def get_orbital_resolved_dos(self, orbital_indices, spin_indices=0):
@@ -221,40 +168,14 @@ class Dos(object):
             numpy.ndaray: The required dos
 
         """
-        if not (self.es_obj.grand_dos_matrix is not None):
+        if not self.es_obj.has_grand_dos_matrix:
             raise NoResolvedDosError(
                 "Can not get the orbital resolved dos since resolved dos values are not"
                 " available"
             )
-        grand_sum = np.sum(self.es_obj.grand_dos_matrix)
-        tot_val = self.es_obj.grand_dos_matrix.copy() / grand_sum
-        _, n_kpts, n_bands, _, _ = np.shape(tot_val)
-        k = 0
-        b = 0
-        r_dos = np.zeros_like(self.t_dos)[spin_indices]
-        w_dos = np.zeros_like(self.t_dos)[spin_indices]
-        eigenvalues = self.es_obj.eigenvalues[spin_indices]
-        for e in eigenvalues:
-            weight = np.sum(tot_val[spin_indices, k, b, :, orbital_indices])
-            weight_sum = np.sum(tot_val[spin_indices, k, b, :, :])
-            if b < n_bands - 1:
-                b += 1
-            else:
-                b = 0
-                k += 1
-            index = (
-                len(self.energies[spin_indices][self.energies[spin_indices] < e]) - 1
-            )
-            if index >= 0:
-                r_dos[index] = r_dos[index] + weight
-                w_dos[index] = w_dos[index] + weight_sum
-            else:
-                r_dos[0] = r_dos[0] + weight
-                w_dos[0] = w_dos[0] + weight_sum
-        ind_0 = np.argwhere(w_dos < 1e-8).flatten()
-        ind_1 = np.argwhere(w_dos >= 1e-8).flatten()
-        r_dos[ind_1] /= w_dos[ind_1]
-        r_dos[ind_0] = 0.0
+        r_dos = self._get_resolved_dos_fraction(
+            spin_indices=spin_indices, orbital_indices=orbital_indices
+        )
         return r_dos * self.t_dos[spin_indices]
 
     def get_spatial_orbital_resolved_dos(
@@ -272,47 +193,74 @@ class Dos(object):
         Returns:
             numpy.ndaray: The required dos
         """
-        if not (self.es_obj.grand_dos_matrix is not None):
+        if not self.es_obj.has_grand_dos_matrix:
             raise NoResolvedDosError(
                 "Can not get the resolved dos since resolved dos values are not"
                 " available"
             )
-        grand_sum = np.sum(self.es_obj.grand_dos_matrix)
-        tot_val = self.es_obj.grand_dos_matrix.copy() / grand_sum
-        _, n_kpts, n_bands, _, _ = np.shape(tot_val)
-        k = 0
-        b = 0
-        r_dos = np.zeros_like(self.t_dos)[spin_indices]
-        w_dos = np.zeros_like(self.t_dos)[spin_indices]
+        r_dos = self._get_resolved_dos_fraction(
+            spin_indices=spin_indices,
+            atom_indices=atom_indices,
+            orbital_indices=orbital_indices,
+        )
+        return r_dos * self.t_dos
+
+    def _get_resolved_dos_fraction(
+        self,
+        spin_indices,
+        atom_indices=None,
+        orbital_indices=None,
+        sum_over_spins=False,
+    ):
+        """
+        Fraction of the dos in every energy bin which originates from the given spin, atom and orbital indices. The
+        reductions are accumulated over blocks of k-points of the grand_dos_matrix, so the matrix is never loaded into
+        memory as a whole if it is stored in an HDF5 file.
+
+        Args:
+            spin_indices (int): The index of the spin
+            atom_indices (int/list/numpy.ndarray): The index/indices of the atoms, all atoms if None
+            orbital_indices (int/list/numpy.ndarray): The index/indices of the orbitals, all orbitals if None
+            sum_over_spins (bool): Normalize by the contribution of all spins instead of the given spin only
 
+        Returns:
+            numpy.ndarray: The fraction of the dos for every energy bin
+        """
+        energies = self.energies[spin_indices]
         eigenvalues = self.es_obj.eigenvalues[spin_indices]
-        for e in eigenvalues:
-            weight = np.sum(
-                [
-                    np.sum(tot_val[spin_indices, k, b, atom_indices, o])
-                    for o in orbital_indices
-                ]
-            )
-            weight_sum = np.sum(tot_val[spin_indices, k, b, :, :])
-            if b < n_bands - 1:
-                b += 1
+        bin_indices = np.maximum(np.searchsorted(energies, eigenvalues) - 1, 0)
+        r_dos = np.zeros(len(energies))
+        w_dos = np.zeros(len(energies))
+        grand_sum = 0.0
+        for kpt_slice, block in self.es_obj.iter_grand_dos_matrix():
+            _, n_kpts, n_bands, _, _ = block.shape
+            grand_sum += np.sum(block)
+            values = block[spin_indices]
+            if sum_over_spins:
+                weight_sum = np.sum(block, axis=(0, 3, 4))
             else:
-                b = 0
-                k += 1
-            index = (
-                len(self.energies[spin_indices][self.energies[spin_indices] < e]) - 1
+                weight_sum = np.sum(values, axis=(2, 3))
+            if atom_indices is not None:
+                values = values[:, :, atom_indices]
+            if orbital_indices is not None:
+                values = values[..., orbital_indices]
+            weight = np.sum(values.reshape(n_kpts, n_bands, -1), axis=-1)
+            block_indices = bin_indices[
+                kpt_slice.start * n_bands : kpt_slice.stop * n_bands
+            ]
+            r_dos += np.bincount(
+                block_indices, weights=weight.ravel(), minlength=len(energies)
             )
-            if index >= 0:
-                r_dos[index] = r_dos[index] + weight
-                w_dos[index] = w_dos[index] + weight_sum
-            else:
-                r_dos[0] = r_dos[0] + weight
-                w_dos[0] = w_dos[0] + weight_sum
+            w_dos += np.bincount(
+                block_indices, weights=weight_sum.ravel(), minlength=len(energies)
+            )
+        r_dos /= grand_sum
+        w_dos /= grand_sum
         ind_0 = np.argwhere(w_dos < 1e-8).flatten()
         ind_1 = np.argwhere(w_dos >= 1e-8).flatten()
         r_dos[ind_1] /= w_dos[ind_1]
         r_dos[ind_0] = 0.0
-        return r_dos * self.t_dos
+        return r_dos
 
 
 class NoResolvedDosError(Exception):
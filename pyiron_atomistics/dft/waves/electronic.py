@@ -4,12 +4,15 @@
 
 from __future__ import print_function
 
+import os
+import posixpath
+
 import numpy as np
+from pyiron_base.storage.hdfio import open_hdf5
 
 from pyiron_atomistics.atomistics.structure.atoms import (
     Atoms,
     structure_dict_to_hdf,
-    dict_group_to_hdf,
 )
 from pyiron_atomistics.dft.waves.dos import Dos
 
@@ -32,11 +35,15 @@ class ElectronicStructure(object):
     every k-point has a set of bands associated with it. This is loosely adapted from the `pymatgen electronic_structure
     modules`_. Many of the functions have been substantially modified for pyiron
 
+    The band edges, the band gap and the metallicity are computed directly from the eigenvalue and occupancy matrices.
+    When the object is generated from matrices, the Kpoint and Band instances are only built once the `kpoints`
+    attribute is accessed.
+
     .. _pymatgen electronic_structure modules: http://pymatgen.org/pymatgen.electronic_structure.bandstructure.html
     """
 
     def __init__(self):
-        self.kpoints = list()
+        self._kpoints = list()
         self._eigenvalues = list()
         self._occupancies = list()
         self._dos_energies = list()
@@ -49,6 +56,7 @@ class ElectronicStructure(object):
         self._eigenvalue_matrix = None
         self._occupancy_matrix = None
         self._grand_dos_matrix = None
+        self._grand_dos_hdf = None
         self._resolved_densities = None
         self._kpoint_list = list()
         self._kpoint_weights = list()
@@ -71,6 +79,20 @@ class ElectronicStructure(object):
         kpt_obj.weight = weight
         self.kpoints.append(kpt_obj)
 
+    @property
+    def kpoints(self):
+        """
+        list: List of pyiron_atomistics.dft.waves.electronic.Kpoint instances, built from the eigenvalue, occupancy
+              and grand_dos matrices on first access
+        """
+        if self._kpoints is None:
+            self._kpoints = self._get_kpoints_from_matrices()
+        return self._kpoints
+
+    @kpoints.setter
+    def kpoints(self, val):
+        self._kpoints = val
+
     def get_dos(self, n_bins=100):
         """
         Gives a pyiron_atomistics.objects.waves.dos.Dos instance
@@ -177,11 +199,15 @@ class ElectronicStructure(object):
                        band index j is given by eigenvalue_matrix[i][j]
 
         """
-        if self._eigenvalue_matrix is None and len(self.kpoints) > 0:
+        if (
+            self._eigenvalue_matrix is None
+            and self._kpoints is not None
+            and len(self._kpoints) > 0
+        ):
             self._eigenvalue_matrix = np.zeros(
-                (len(self.kpoints), len(self.kpoints[0].bands))
+                (len(self._kpoints), len(self._kpoints[0].bands))
             )
-            for i, k in enumerate(self.kpoints):
+            for i, k in enumerate(self._kpoints):
                 self._eigenvalue_matrix[i, :] = k.eig_occ_matrix[:, 0]
         return self._eigenvalue_matrix
 
@@ -195,11 +221,15 @@ class ElectronicStructure(object):
         numpy.ndarray: A getter function to return the occupancy_matrix. The occupancy for a given kpoint index i and
                        band index j is given by occupancy_matrix[i][j]
         """
-        if self._occupancy_matrix is None and len(self.kpoints) > 0:
+        if (
+            self._occupancy_matrix is None
+            and self._kpoints is not None
+            and len(self._kpoints) > 0
+        ):
             self._occupancy_matrix = np.zeros(
-                (len(self.kpoints), len(self.kpoints[0].bands))
+                (len(self._kpoints), len(self._kpoints[0].bands))
             )
-            for i, k in enumerate(self.kpoints):
+            for i, k in enumerate(self._kpoints):
                 self._occupancy_matrix[i, :] = k.eig_occ_matrix[:, 1]
         return self._occupancy_matrix
 
@@ -212,7 +242,7 @@ class ElectronicStructure(object):
         """
         list: The list of kpoints in cartesian coordinates
         """
-        if len(self._kpoint_list) == 0:
+        if len(self._kpoint_list) == 0 and self._kpoints is not None:
             kpt_lst = list()
             for k in self.kpoints:
                 kpt_lst.append(k.value)
@@ -228,7 +258,7 @@ class ElectronicStructure(object):
         """
         list: The weights of the kpoints of the electronic structure in cartesian coordinates
         """
-        if len(self._kpoint_weights) == 0:
+        if len(self._kpoint_weights) == 0 and self._kpoints is not None:
             kpt_lst = list()
             for k in self.kpoints:
                 kpt_lst.append(k.weight)
@@ -250,6 +280,56 @@ class ElectronicStructure(object):
     def structure(self, val):
         self._structure = val
 
+    def _get_band_edges(self, resolution=1e-6, valence=True):
+        """
+        Locates the valence band maximum or the conduction band minimum of every spin channel using vectorized
+        reductions over the eigenvalue and occupancy matrices
+
+        Args:
+            resolution (float): An occupancy below this value is considered unoccupied
+            valence (bool): True for the valence band maximum, False for the conduction band minimum
+
+        Returns:
+            list: (value, kpoint index, band index) for each spin channel or None if there are no bands matching
+                  the occupancy criterion in this spin channel
+        """
+        eigenvalue_matrix = np.asarray(self.eigenvalue_matrix)
+        occupancy_matrix = np.asarray(self.occupancy_matrix)
+        edge_lst = list()
+        for eig, occ in zip(eigenvalue_matrix, occupancy_matrix):
+            if valence:
+                mask = occ > resolution
+            else:
+                mask = occ <= resolution
+            if not np.any(mask):
+                edge_lst.append(None)
+                continue
+            if valence:
+                index = np.argmax(np.where(mask, eig, -np.inf))
+            else:
+                index = np.argmin(np.where(mask, eig, np.inf))
+            kpt_index, band_index = np.unravel_index(index, eig.shape)
+            edge_lst.append((eig[kpt_index, band_index], kpt_index, band_index))
+        return edge_lst
+
+    def _get_band_edge_dict(self, resolution=1e-6, valence=True):
+        edge_spin_dict = dict()
+        for spin, edge in enumerate(
+            self._get_band_edges(resolution=resolution, valence=valence)
+        ):
+            edge_spin_dict[spin] = dict()
+            if edge is not None:
+                value, kpt_index, band_index = edge
+                kpt = self._get_kpoint(kpt_index=kpt_index)
+                edge_spin_dict[spin] = {
+                    "value": value,
+                    "kpoint": kpt,
+                    "band": kpt.bands[spin][band_index],
+                    "kpoint_index": kpt_index,
+                    "band_index": band_index,
+                }
+        return edge_spin_dict
+
     def get_vbm(self, resolution=1e-6):
         """
         Gets the valence band maximum (VBM) of the system for each spin value
@@ -262,29 +342,10 @@ class ElectronicStructure(object):
                 "value" (float): Absolute energy value of the VBM (eV)
                 "kpoint": The Kpoint instance associated with the VBM
                 "band": The Band instance associated with the VBM
+                "kpoint_index" (int): Index of the k-point associated with the VBM
+                "band_index" (int): Index of the band associated with the VBM
         """
-        vbm_spin_dict = dict()
-        n_spins = len(self._eigenvalue_matrix)
-        for spin in range(n_spins):
-            vbm = None
-            vbm_spin_dict[spin] = dict()
-            vbm_dict = dict()
-            for kpt in self.kpoints:
-                for band in kpt.bands[spin]:
-                    if band.occupancy > resolution:
-                        if vbm is None:
-                            vbm = band.eigenvalue
-                            vbm_dict["value"] = vbm
-                            vbm_dict["kpoint"] = kpt
-                            vbm_dict["band"] = band
-                        else:
-                            if band.eigenvalue > vbm:
-                                vbm = band.eigenvalue
-                                vbm_dict["value"] = vbm
-                                vbm_dict["kpoint"] = kpt
-                                vbm_dict["band"] = band
-                vbm_spin_dict[spin] = vbm_dict
-        return vbm_spin_dict
+        return self._get_band_edge_dict(resolution=resolution, valence=True)
 
     def get_cbm(self, resolution=1e-6):
         """
@@ -298,29 +359,10 @@ class ElectronicStructure(object):
                 "value" (float): Absolute energy value of the CBM (eV)
                  "kpoint": The Kpoint instance associated with the CBM
                  "band": The Band instance associated with the CBM
+                 "kpoint_index" (int): Index of the k-point associated with the CBM
+                 "band_index" (int): Index of the band associated with the CBM
         """
-        cbm_spin_dict = dict()
-        n_spins = len(self._eigenvalue_matrix)
-        for spin in range(n_spins):
-            cbm = None
-            cbm_spin_dict[spin] = dict()
-            cbm_dict = dict()
-            for kpt in self.kpoints:
-                for band in kpt.bands[spin]:
-                    if band.occupancy <= resolution:
-                        if cbm is None:
-                            cbm = band.eigenvalue
-                            cbm_dict["value"] = cbm
-                            cbm_dict["kpoint"] = kpt
-                            cbm_dict["band"] = band
-                        else:
-                            if band.eigenvalue < cbm:
-                                cbm = band.eigenvalue
-                                cbm_dict["value"] = cbm
-                                cbm_dict["kpoint"] = kpt
-                                cbm_dict["band"] = band
-                cbm_spin_dict[spin] = cbm_dict
-        return cbm_spin_dict
+        return self._get_band_edge_dict(resolution=resolution, valence=False)
 
     def get_band_gap(self, resolution=1e-6):
         """
@@ -355,7 +397,12 @@ class ElectronicStructure(object):
         Returns:
             list: list of band gap values for each spin channel
         """
-        self._eg = [val["band_gap"] for val in self.get_band_gap().values()]
+        self._eg = [
+            max(0.0, cbm[0] - vbm[0])
+            for vbm, cbm in zip(
+                self._get_band_edges(valence=True), self._get_band_edges(valence=False)
+            )
+        ]
         return self._eg
 
     @eg.setter
@@ -370,7 +417,7 @@ class ElectronicStructure(object):
         Returns:
             list: list of valence band maximum values for each spin channel
         """
-        self._vbm = [val["value"] for val in self.get_vbm().values()]
+        self._vbm = [val[0] for val in self._get_band_edges(valence=True)]
         return self._vbm
 
     @vbm.setter
@@ -385,7 +432,7 @@ class ElectronicStructure(object):
         Returns:
             list: list of conduction band minimum values for each spin channel
         """
-        self._cbm = [val["value"] for val in self.get_cbm().values()]
+        self._cbm = [val[0] for val in self._get_band_edges(valence=False)]
         return self._cbm
 
     @cbm.setter
@@ -419,14 +466,11 @@ class ElectronicStructure(object):
             raise ValueError(
                 "e_fermi has to be set before you can determine if the system is metallic or not"
             )
-        n_spin, _, n_bands = np.shape(self.eigenvalue_matrix)
-        fermi_crossed = [False] * n_spin
-        for spin in range(n_spin):
-            for i in range(n_bands):
-                values = self.eigenvalue_matrix[spin, :, i]
-                if (self.efermi < np.max(values)) and (self.efermi >= np.min(values)):
-                    fermi_crossed[spin] = True
-        return fermi_crossed
+        eigenvalue_matrix = np.asarray(self.eigenvalue_matrix)
+        fermi_crossed = (self.efermi < np.max(eigenvalue_matrix, axis=1)) & (
+            self.efermi >= np.min(eigenvalue_matrix, axis=1)
+        )
+        return np.any(fermi_crossed, axis=1).tolist()
 
     @property
     def grand_dos_matrix(self):
@@ -440,27 +484,32 @@ class ElectronicStructure(object):
         The grand sum of this matrix would equal 1.0. The spatial, spin, and orbital resolved DOS can be computed using
         this matrix
 
+        If the object was loaded from an HDF5 file, the matrix is only read from the file on first access.
+
         Returns:
             numpy.ndarray (5 dimensional)
 
         """
-        if self._grand_dos_matrix is None:
+        if self._grand_dos_matrix is None and self._grand_dos_hdf is not None:
+            self._grand_dos_matrix = self._grand_dos_hdf[()]
+            self._grand_dos_hdf = None
+        if self._grand_dos_matrix is None and self._kpoints is not None:
             try:
                 n_atoms, n_orbitals = np.shape(
-                    self.kpoints[0].bands[0][0].resolved_dos_matrix
+                    self._kpoints[0].bands[0][0].resolved_dos_matrix
                 )
             except ValueError:
                 return self._grand_dos_matrix
             dimension = (
                 self.n_spins,
-                len(self.kpoints),
-                len(self.kpoints[0].bands),
+                len(self._kpoints),
+                len(self._kpoints[0].bands),
                 n_atoms,
                 n_orbitals,
             )
             self._grand_dos_matrix = np.zeros(dimension)
             for spin in range(self.n_spins):
-                for i, kpt in enumerate(self.kpoints):
+                for i, kpt in enumerate(self._kpoints):
                     for j, band in enumerate(kpt.bands):
                         self._grand_dos_matrix[
                             spin, i, j, :, :
@@ -473,6 +522,36 @@ class ElectronicStructure(object):
         Setter for grand_dos_matrix
         """
         self._grand_dos_matrix = val
+        self._grand_dos_hdf = None
+
+    @property
+    def has_grand_dos_matrix(self):
+        """
+        bool: True if the grand_dos_matrix is available, without reading it from the HDF5 file
+        """
+        return self._grand_dos_hdf is not None or self.grand_dos_matrix is not None
+
+    def iter_grand_dos_matrix(self):
+        """
+        Iterate over blocks of k-points of the grand_dos_matrix. If the matrix is stored in an HDF5 file, only one
+        block is read into memory at a time.
+
+        Yields:
+            slice: The k-point indices of the block
+            numpy.ndarray: The block grand_dos_matrix[:, slice, :, :, :]
+        """
+        if self._grand_dos_matrix is None and self._grand_dos_hdf is not None:
+            for kpt_slice, block in self._grand_dos_hdf.iter_kpoint_blocks():
+                yield kpt_slice, block
+        elif self.grand_dos_matrix is not None:
+            grand_dos_matrix = np.asarray(self.grand_dos_matrix)
+            n_kpoints_block = _get_n_kpoints_block(
+                shape=grand_dos_matrix.shape, itemsize=grand_dos_matrix.itemsize
+            )
+            for kpt_slice in _get_kpoint_blocks(
+                n_kpoints=grand_dos_matrix.shape[1], n_kpoints_block=n_kpoints_block
+            ):
+                yield kpt_slice, grand_dos_matrix[:, kpt_slice]
 
     def __getitem__(self, item):
         return self._output_dict[item]
@@ -507,7 +586,9 @@ class ElectronicStructure(object):
             "tot_densities": self.dos_densities,
             "int_densities": self.dos_idensities,
         }
-        if self.grand_dos_matrix is not None:
+        if self._grand_dos_matrix is None and self._grand_dos_hdf is not None:
+            h_es["dos"]["grand_dos_matrix"] = self._grand_dos_hdf
+        elif self.grand_dos_matrix is not None:
             h_es["dos"]["grand_dos_matrix"] = self.grand_dos_matrix
         if self.resolved_densities is not None:
             h_es["dos"]["resolved_densities"] = self.resolved_densities
@@ -547,7 +628,11 @@ class ElectronicStructure(object):
                     self.dos_densities = h_dos["tot_densities"]
                     self.dos_idensities = h_dos["int_densities"]
                     if "grand_dos_matrix" in nodes:
-                        self.grand_dos_matrix = h_dos["grand_dos_matrix"]
+                        self._grand_dos_matrix = None
+                        self._grand_dos_hdf = _GrandDosMatrixHDF(
+                            file_name=h_dos.file_name,
+                            h5_path=posixpath.join(h_dos.h5_path, "grand_dos_matrix"),
+                        )
                     if "resolved_densities" in nodes:
                         self.resolved_densities = h_dos["resolved_densities"]
                 self._output_dict = h_es.copy()
@@ -575,7 +660,11 @@ class ElectronicStructure(object):
             if self.efermi is not None:
                 h_es["fermi_level"] = self.efermi
             if self.grand_dos_matrix is not None:
-                h_es["grand_dos_matrix"] = self.grand_dos_matrix
+                grand_dos_matrix_to_hdf(
+                    grand_dos_matrix=self.grand_dos_matrix,
+                    hdf=h_es,
+                    key="grand_dos_matrix",
+                )
             if self.resolved_densities is not None:
                 h_es["resolved_densities"] = self.resolved_densities
 
@@ -604,7 +693,11 @@ class ElectronicStructure(object):
             if "fermi_level" in nodes:
                 self.efermi = h_es["fermi_level"]
             if "grand_dos_matrix" in nodes:
-                self.grand_dos_matrix = h_es["grand_dos_matrix"]
+                self._grand_dos_matrix = None
+                self._grand_dos_hdf = _GrandDosMatrixHDF(
+                    file_name=h_es.file_name,
+                    h5_path=posixpath.join(h_es.h5_path, "grand_dos_matrix"),
+                )
             if "resolved_densities" in nodes:
                 self.resolved_densities = h_es["resolved_densities"]
             self._output_dict = h_es.copy()
@@ -612,21 +705,82 @@ class ElectronicStructure(object):
 
     def generate_from_matrices(self):
         """
-        Generate the Kpoints and Bands from the kpoint lists and sometimes grand_dos_matrix
+        Generate the Kpoints and Bands from the kpoint lists and sometimes grand_dos_matrix. The Kpoint and Band
+        instances are only created once the `kpoints` attribute is accessed.
+
+        """
+        self._kpoints = None
+
+    def _get_kpoints_from_matrices(self):
+        """
+        Build the Kpoint and Band instances from the kpoint lists, the eigenvalue and occupancy matrices and sometimes
+        the grand_dos_matrix
+
+        Returns:
+            list: List of pyiron_atomistics.dft.waves.electronic.Kpoint instances
+        """
+        if self._eigenvalue_matrix is None:
+            return list()
+        grand_dos_matrix = self.grand_dos_matrix
+        return [
+            self._get_kpoint_from_matrices(
+                kpt_index=i,
+                kpoint_dos_matrix=(
+                    grand_dos_matrix[:, i] if grand_dos_matrix is not None else None
+                ),
+            )
+            for i in range(len(self._kpoint_list))
+        ]
+
+    def _get_kpoint_from_matrices(self, kpt_index, kpoint_dos_matrix=None):
+        """
+        Build the Kpoint and Band instances of a single k-point
+
+        Args:
+            kpt_index (int): Index of the k-point
+            kpoint_dos_matrix (numpy.ndarray/None): The grand_dos_matrix of the k-point with the shape (spin, band,
+                                                    atom, orbital)
+
+        Returns:
+            pyiron_atomistics.dft.waves.electronic.Kpoint: Kpoint instance
+        """
+        kpt_obj = Kpoint()
+        kpt_obj.value = self._kpoint_list[kpt_index]
+        kpt_obj.weight = self._kpoint_weights[kpt_index]
+        n_spin, _, length = np.shape(self._eigenvalue_matrix)
+        for spin in range(n_spin):
+            for j in range(length):
+                val = self._eigenvalue_matrix[spin][kpt_index][j]
+                occ = self._occupancy_matrix[spin][kpt_index][j]
+                kpt_obj.add_band(eigenvalue=val, occupancy=occ, spin=spin)
+                if kpoint_dos_matrix is not None:
+                    kpt_obj.bands[spin][-1].resolved_dos_matrix = kpoint_dos_matrix[
+                        spin, j, :, :
+                    ]
+        return kpt_obj
 
+    def _get_kpoint(self, kpt_index):
         """
-        for i in range(len(self.kpoint_list)):
-            self.add_kpoint(self.kpoint_list[i], self.kpoint_weights[i])
-            n_spin, _, length = np.shape(self._eigenvalue_matrix)
-            for spin in range(n_spin):
-                for j in range(length):
-                    val = self.eigenvalue_matrix[spin][i][j]
-                    occ = self.occupancy_matrix[spin][i][j]
-                    self.kpoints[-1].add_band(eigenvalue=val, occupancy=occ, spin=spin)
-                    if self._grand_dos_matrix is not None:
-                        self.kpoints[-1].bands[spin][
-                            -1
-                        ].resolved_dos_matrix = self.grand_dos_matrix[spin, i, j, :, :]
+        Kpoint instance of a single k-point. As long as the kpoints attribute was not accessed, only this k-point is
+        built and only its part of the grand_dos_matrix is read, so the instance is not part of the kpoints list.
+
+        Args:
+            kpt_index (int): Index of the k-point
+
+        Returns:
+            pyiron_atomistics.dft.waves.electronic.Kpoint: Kpoint instance
+        """
+        if self._kpoints is not None or self._eigenvalue_matrix is None:
+            return self.kpoints[kpt_index]
+        if self._grand_dos_matrix is not None:
+            kpoint_dos_matrix = self._grand_dos_matrix[:, kpt_index]
+        elif self._grand_dos_hdf is not None:
+            kpoint_dos_matrix = self._grand_dos_hdf[:, kpt_index]
+        else:
+            kpoint_dos_matrix = None
+        return self._get_kpoint_from_matrices(
+            kpt_index=kpt_index, kpoint_dos_matrix=kpoint_dos_matrix
+        )
 
     def get_spin_resolved_dos(self, spin_indices=0):
         """
@@ -705,7 +859,7 @@ class ElectronicStructure(object):
         return plt
 
     def __del__(self):
-        del self.kpoints
+        del self._kpoints
         del self._eigenvalues
         del self._occupancies
         del self._eg
@@ -715,6 +869,7 @@ class ElectronicStructure(object):
         del self._eigenvalue_matrix
         del self._occupancy_matrix
         del self._grand_dos_matrix
+        del self._grand_dos_hdf
         del self._kpoint_list
         del self._kpoint_weights
         del self.n_spins
@@ -726,10 +881,12 @@ class ElectronicStructure(object):
         output_string.append(
             "Number of spin channels: {}".format(len(self.eigenvalue_matrix))
         )
-        output_string.append("Number of k-points: {}".format(len(self.kpoints)))
-        output_string.append(
-            "Number of bands: {}".format(len(self.kpoints[0].bands[0]))
-        )
+        if self._kpoints is None:
+            _, n_kpoints, n_bands = np.shape(self._eigenvalue_matrix)
+        else:
+            n_kpoints, n_bands = len(self._kpoints), len(self._kpoints[0].bands[0])
+        output_string.append("Number of k-points: {}".format(n_kpoints))
+        output_string.append("Number of bands: {}".format(n_bands))
         try:
             for spin, is_metal in enumerate(self.is_metal):
                 if is_metal:
@@ -865,4 +1022,120 @@ def electronic_structure_dict_to_hdf(data_dict, hdf, group_name):
         if "structure" in data_dict.keys():
             structure_dict_to_hdf(data_dict=data_dict["structure"], hdf=h_es)
 
-        dict_group_to_hdf(data_dict=data_dict, hdf=h_es, group="dos")
+        if "dos" in data_dict.keys():
+            with h_es.open("dos") as h_dos:
+                for k, v in data_dict["dos"].items():
+                    if k == "grand_dos_matrix":
+                        grand_dos_matrix_to_hdf(grand_dos_matrix=v, hdf=h_dos, key=k)
+                    else:
+                        h_dos[k] = v
+
+
+def grand_dos_matrix_to_hdf(grand_dos_matrix, hdf, key="grand_dos_matrix"):
+    """
+    Store the grand_dos_matrix. A matrix in memory is written through the HDF5 interface of pyiron. A matrix which is
+    still stored in an HDF5 file is copied by HDF5 dataset to dataset, so it is never loaded into memory, and it is
+    not written at all if it is already stored at the target.
+
+    Args:
+        grand_dos_matrix (numpy.ndarray/_GrandDosMatrixHDF): The 5 dimensional grand_dos_matrix
+        hdf: Path to the hdf5 file/group in the file
+        key (str): Name of the dataset
+    """
+    if not isinstance(grand_dos_matrix, _GrandDosMatrixHDF):
+        hdf[key] = np.asarray(grand_dos_matrix)
+        return
+    h5_path = posixpath.join(hdf.h5_path, key)
+    same_file = os.path.exists(hdf.file_name) and os.path.samefile(
+        grand_dos_matrix.file_name, hdf.file_name
+    )
+    if same_file and posixpath.normpath(grand_dos_matrix.h5_path) == (
+        posixpath.normpath(h5_path)
+    ):
+        return
+    del hdf[key]
+    if same_file:
+        with open_hdf5(hdf.file_name, mode="a") as f:
+            f.copy(f[grand_dos_matrix.h5_path], h5_path)
+    else:
+        with open_hdf5(grand_dos_matrix.file_name, mode="r") as f_source:
+            with open_hdf5(hdf.file_name, mode="a") as f:
+                f_source.copy(f_source[grand_dos_matrix.h5_path], f, name=h5_path)
+
+
+def _get_n_kpoints_block(shape, itemsize, block_bytes=2**20):
+    """
+    Number of k-points in a block of the grand_dos_matrix: all spins, bands, atoms and orbitals of as many k-points
+    as fit in block_bytes, but at least a single k-point.
+
+    Args:
+        shape (tuple): Shape of the grand_dos_matrix
+        itemsize (int): Size of a single element in bytes
+        block_bytes (int): Targeted size of a block in bytes
+
+    Returns:
+        int: Number of k-points in a block
+    """
+    n_spins, n_kpoints, n_bands, n_atoms, n_orbitals = shape
+    kpoint_bytes = n_spins * n_bands * n_atoms * n_orbitals * itemsize
+    return int(min(n_kpoints, max(1, block_bytes // max(1, kpoint_bytes))))
+
+
+def _get_kpoint_blocks(n_kpoints, n_kpoints_block):
+    return [
+        slice(start, min(start + n_kpoints_block, n_kpoints))
+        for start in range(0, n_kpoints, n_kpoints_block)
+    ]
+
+
+class _GrandDosMatrixHDF(object):
+    """
+    Read-only reference to a grand_dos_matrix stored in an HDF5 file
+
+    Args:
+        file_name (str): Absolute path to the HDF5 file
+        h5_path (str): Path of the dataset inside the HDF5 file
+    """
+
+    def __init__(self, file_name, h5_path):
+        self.file_name = file_name
+        self.h5_path = h5_path
+        with open_hdf5(self.file_name, mode="r") as f:
+            dataset = f[self.h5_path]
+            self.shape = dataset.shape
+            self.dtype = dataset.dtype
+            self.chunks = dataset.chunks
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, item):
+        with open_hdf5(self.file_name, mode="r") as f:
+            return f[self.h5_path][item]
+
+    def __array__(self, dtype=None):
+        return np.asarray(self[()], dtype=dtype)
+
+    def iter_kpoint_blocks(self):
+        """
+        Iterate over the matrix in blocks of k-points, rounded up to whole chunks if the dataset is chunked
+
+        Yields:
+            slice: The k-point indices of the block
+            numpy.ndarray: The block grand_dos_matrix[:, slice, :, :, :]
+        """
+        n_kpoints_block = _get_n_kpoints_block(
+            shape=self.shape, itemsize=self.dtype.itemsize
+        )
+        if self.chunks is not None:
+            # read whole chunks of the dataset
+            n_kpoints_block = min(
+                self.shape[1],
+                -(-n_kpoints_block // self.chunks[1]) * self.chunks[1],
+            )
+        with open_hdf5(self.file_name, mode="r") as f:
+            dataset = f[self.h5_path]
+            for kpt_slice in _get_kpoint_blocks(
+                n_kpoints=self.shape[1], n_kpoints_block=n_kpoints_block
+            ):
+                yield kpt_slice, dataset[:, kpt_slice]
@@ -425,6 +425,7 @@ class LammpsBase(AtomisticGenericJob):
         dump_h5_file_name="dump.h5",
         dump_out_file_name="dump.out",
         log_lammps_file_name="log.lammps",
+        n_processes=1,
     ):
         # Parse output files
         return parse_lammps_output(
@@ -441,6 +442,7 @@ class LammpsBase(AtomisticGenericJob):
             structure=self.structure,
             potential_elements=self.input.potential.get_element_lst(),
             units=self.units,
+            n_processes=n_processes,
         )
 
     def collect_output(self):
@@ -455,6 +457,7 @@ class LammpsBase(AtomisticGenericJob):
             dump_h5_file_name="dump.h5",
             dump_out_file_name="dump.out",
             log_lammps_file_name="log.lammps",
+            n_processes=self.server.cores,
         )
 
         # Write to hdf
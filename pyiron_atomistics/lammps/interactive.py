@@ -2,7 +2,6 @@
 # Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
-from ctypes import c_double, c_int
 import importlib
 import numpy as np
 import os
@@ -10,6 +9,9 @@ import pandas as pd
 import warnings
 from scipy import constants
 
+from pyiron_base import FlattenedStorage
+from pyiron_atomistics.atomistics.structure.periodic_table import PeriodicTable
+from pyiron_atomistics.atomistics.structure.structurestorage import StructureStorage
 from pyiron_atomistics.lammps.base import LammpsBase
 from pyiron_atomistics.lammps.output import _check_ortho_prism
 from pyiron_atomistics.lammps.structure import UnfoldingPrism
@@ -45,6 +47,8 @@ class LammpsInteractive(LammpsBase, GenericInteractive):
         self._interactive_mpi_communicator = None
         self._user_fix_external = None
         self._log_file = None
+        self._interactive_structure_loaded = None
+        self._interactive_input_loaded = None
         if "stress" in self.interactive_output_functions.keys():
             del self.interactive_output_functions["stress"]
 
@@ -79,28 +83,77 @@ class LammpsInteractive(LammpsBase, GenericInteractive):
         self._logger.debug("Lammps library: " + command)
         self._interactive_library.command(command)
 
+    def _interactive_library_is_serial(self):
+        return self.server.run_mode.interactive and self.server.cores == 1
+
+    def _interactive_gather_atoms(self, name, data_type, count):
+        """
+        Per atom quantity ordered by the LAMMPS atom ids, as numpy array.
+
+        In serial mode the per atom arrays are read through the numpy interface of the LAMMPS library, which returns
+        views on the LAMMPS memory of the local atoms, and are sorted by the atom ids in a single copy. Otherwise the
+        atoms are gathered by the library and the returned buffer is wrapped without copying.
+
+        Args:
+            name (str): name of the per atom quantity, e.g. "x", "f" or "type"
+            data_type (int): 0 for integer and 1 for floating point quantities
+            count (int): number of values per atom
+
+        Returns:
+            numpy.ndarray: per atom quantity of shape (n_atoms, count) or (n_atoms,) for count 1
+        """
+        if self._interactive_library_is_serial() and hasattr(
+            self._interactive_library, "numpy"
+        ):
+            atom_ids = self._interactive_library.numpy.extract_atom("id")
+            values = self._interactive_library.numpy.extract_atom(name)
+            ordered = np.empty(
+                (len(atom_ids),) + np.shape(values)[1:], dtype=values.dtype
+            )
+            ordered[atom_ids - 1] = values[: len(atom_ids)]
+            return ordered
+        values = np.ctypeslib.as_array(
+            self._interactive_library.gather_atoms(name, data_type, count)
+        )
+        if count == 1:
+            return values
+        return values.reshape(-1, count)
+
+    def _interactive_scatter_atoms(self, name, data_type, count, values):
+        """
+        Set a per atom quantity ordered by the LAMMPS atom ids from a numpy array.
+
+        In serial mode the LAMMPS library expects a ctypes buffer, which is created as view on the numpy array instead
+        of converting every value to a Python object.
+
+        Args:
+            name (str): name of the per atom quantity, e.g. "x" or "type"
+            data_type (int): 0 for integer and 1 for floating point quantities
+            count (int): number of values per atom
+            values (numpy.ndarray): per atom quantity
+        """
+        values = np.require(
+            values, dtype=np.float64 if data_type == 1 else np.int32, requirements="CW"
+        ).reshape(-1)
+        if self._interactive_library_is_serial():
+            self._interactive_library.scatter_atoms(
+                name, data_type, count, np.ctypeslib.as_ctypes(values)
+            )
+        else:
+            self._interactive_library.scatter_atoms(name, values)
+
     def interactive_positions_getter(self):
         uc = UnitConverter(units=self.units)
-        positions = np.reshape(
-            np.array(self._interactive_library.gather_atoms("x", 1, 3)),
-            (len(self.structure), 3),
-        )
+        positions = self._interactive_gather_atoms("x", 1, 3)
         if _check_ortho_prism(prism=self._prism):
             positions = np.matmul(positions, self._prism.R.T)
-        positions = uc.convert_array_to_pyiron_units(positions, label="positions")
-        return positions.tolist()
+        return uc.convert_array_to_pyiron_units(positions, label="positions")
 
     def interactive_positions_setter(self, positions):
+        positions = np.reshape(positions, (-1, 3))
         if _check_ortho_prism(prism=self._prism):
-            positions = np.array(positions).reshape(-1, 3)
             positions = np.matmul(positions, self._prism.R)
-        positions = np.array(positions).flatten()
-        if self.server.run_mode.interactive and self.server.cores == 1:
-            self._interactive_library.scatter_atoms(
-                "x", 1, 3, (len(positions) * c_double)(*positions)
-            )
-        else:
-            self._interactive_library.scatter_atoms("x", positions)
+        self._interactive_scatter_atoms("x", 1, 3, positions)
         self._interactive_lib_command("change_box all remap")
 
     def interactive_cells_getter(self):
@@ -126,15 +179,24 @@ class LammpsInteractive(LammpsBase, GenericInteractive):
 
     def interactive_cells_setter(self, cell):
         self._prism = UnfoldingPrism(cell)
-        lx, ly, lz, xy, xz, yz = self._prism.get_lammps_prism()
         if _check_ortho_prism(prism=self._prism):
             warnings.warn(
                 "Warning: setting upper trangular matrix might slow down the calculation"
             )
+        self._interactive_change_box(
+            is_skewed=self._structure_current.is_skewed(tolerance=1.0e-8),
+            was_skewed=self._structure_previous.is_skewed(tolerance=1.0e-8),
+        )
 
-        is_skewed = self._structure_current.is_skewed(tolerance=1.0e-8)
-        was_skewed = self._structure_previous.is_skewed(tolerance=1.0e-8)
+    def _interactive_change_box(self, is_skewed, was_skewed):
+        """
+        Change the LAMMPS box to the current prism and remap the atoms.
 
+        Args:
+            is_skewed (bool): the new box is triclinic
+            was_skewed (bool): the box in LAMMPS is triclinic
+        """
+        lx, ly, lz, xy, xz, yz = self._prism.get_lammps_prism()
         if is_skewed:
             if not was_skewed:
                 self._interactive_lib_command("change_box all triclinic")
@@ -164,14 +226,10 @@ class LammpsInteractive(LammpsBase, GenericInteractive):
 
     def interactive_forces_getter(self):
         uc = UnitConverter(units=self.units)
-        ff = np.reshape(
-            np.array(self._interactive_library.gather_atoms("f", 1, 3)),
-            (len(self.structure), 3),
-        )
+        ff = self._interactive_gather_atoms("f", 1, 3)
         if _check_ortho_prism(prism=self._prism):
             ff = np.matmul(ff, self._prism.R.T)
-        ff = uc.convert_array_to_pyiron_units(ff, label="forces")
-        return ff.tolist()
+        return uc.convert_array_to_pyiron_units(ff, label="forces")
 
     def interactive_execute(self):
         self._interactive_lib_command(self._interactive_run_command)
@@ -179,6 +237,18 @@ class LammpsInteractive(LammpsBase, GenericInteractive):
     def _interactive_lammps_input(self):
         del self.input.control["dump___1"]
         del self.input.control["dump_modify___1"]
+        for command in self._get_interactive_input_commands():
+            self._interactive_lib_command(command)
+
+    def _get_interactive_input_commands(self):
+        """
+        Commands of the control input which are executed after the atoms are created, the commands which define the
+        simulation box and the run commands are skipped.
+
+        Returns:
+            list: LAMMPS commands
+        """
+        commands = []
         for key, value in zip(
             self.input.control.dataset["Parameter"], self.input.control.dataset["Value"]
         ):
@@ -192,36 +262,52 @@ class LammpsInteractive(LammpsBase, GenericInteractive):
                 "include",
                 "run",
                 "minimize",
+                "dump___1",
+                "dump_modify___1",
             ]:
                 continue
             else:
-                self._interactive_lib_command(
+                commands.append(
                     " ".join(key.split(self.input.control.multi_word_separator))
                     + " "
                     + str(value)
                 )
+        return commands
 
     def _interactive_set_potential(self):
+        style_full = self.input.control["atom_style"] == "full"
+        potential_commands, has_files = self._get_interactive_potential_commands()
+        for line in potential_commands:
+            # Don't write the kspace_style or pair style commands if the atom style is "full"
+            if not (style_full and ("kspace" in line or "pair" in line)):
+                self._interactive_lib_command(line)
+            if not has_files:
+                self._interactive_lib_command(line)
+        if style_full and self._interactive_water_bonds:
+            # Currently supports only water molecules. Please feel free to expand this
+            self._interactive_water_setter()
+
+    def _get_interactive_potential_commands(self):
+        """
+        Commands of the potential with the file names replaced by the absolute paths of the potential files.
+
+        Returns:
+            list: LAMMPS commands
+            bool: True if the potential has potential files
+        """
         potential_lst = []
         if self.input.potential.files is not None:
             for potential in self.input.potential.files:
                 if not os.path.exists(potential):
                     raise ValueError("Potential not found: ", potential)
                 potential_lst.append([potential.split("/")[-1], potential])
-
-        style_full = self.input.control["atom_style"] == "full"
+        commands = []
         for line in self.input.potential.get_string_lst():
             for potential in potential_lst:
                 if " " + potential[0] in line:
                     line = line.replace(" " + potential[0], " " + potential[1])
-            # Don't write the kspace_style or pair style commands if the atom style is "full"
-            if not (style_full and ("kspace" in line or "pair" in line)):
-                self._interactive_lib_command(line.split("\n")[0])
-            if len(potential_lst) == 0:
-                self._interactive_lib_command(line.split("\n")[0])
-        if style_full and self._interactive_water_bonds:
-            # Currently supports only water molecules. Please feel free to expand this
-            self._interactive_water_setter()
+            commands.append(line.split("\n")[0])
+        return commands, len(potential_lst) > 0
 
     def _executable_activate_mpi(self):
         if (
@@ -250,6 +336,7 @@ class LammpsInteractive(LammpsBase, GenericInteractive):
             self._interactive_library = LammpsLibrary(
                 cores=self.server.cores, working_directory=self.working_directory
             )
+        self._interactive_structure_loaded = None
         if not all(self.structure.pbc):
             self.input.control["boundary"] = " ".join(
                 ["p" if coord else "f" for coord in self.structure.pbc]
@@ -487,8 +574,122 @@ class LammpsInteractive(LammpsBase, GenericInteractive):
             raise ValueError(
                 f"structure has different chemical symbols than old one: {new_symbols} != {old_symbols}"
             )
-        self._interactive_lib_command("clear")
         self._set_selective_dynamics()
+        if not self._interactive_structure_update(structure):
+            self._interactive_structure_reset(structure)
+            self._interactive_structure_loaded = structure.copy()
+            self._interactive_input_loaded = self._get_interactive_input_state()
+
+    def _interactive_structure_update(self, structure):
+        """
+        Update the structure in LAMMPS to the given structure without resetting LAMMPS. The box is changed with
+        change_box, atoms added or removed at the end of the structure are created with create_atoms or deleted with
+        delete_atoms and the types and positions of all atoms are scattered.
+
+        LAMMPS has to be reset when the control input or the potential changed since the last reset, when the set
+        of species or the boundary conditions change and when atoms are added or removed for the atom style full.
+        Apart from static calculations and minimizations, the atoms carry velocities, so atoms can only be added or
+        removed without a reset when the remaining atoms are the same atoms as in LAMMPS, i.e. at the end of the
+        structure.
+
+        Args:
+            structure (pyiron_atomistics.atomistics.structure.atoms.Atoms): new structure
+
+        Returns:
+            bool: True if the structure was updated, False if LAMMPS has to be reset
+        """
+        structure_loaded = self._interactive_structure_loaded
+        if (
+            structure_loaded is None
+            or self._interactive_input_loaded != self._get_interactive_input_state()
+            or set(structure_loaded.get_chemical_symbols())
+            != set(structure.get_chemical_symbols())
+            or not np.array_equal(structure_loaded.pbc, structure.pbc)
+            or (
+                len(structure_loaded) != len(structure)
+                and (
+                    self.input.control["atom_style"] == "full"
+                    or not self._interactive_atoms_kept(structure)
+                )
+            )
+        ):
+            return False
+        was_skewed = self._prism.is_skewed()
+        self._prism = UnfoldingPrism(structure.cell)
+        if _check_ortho_prism(prism=self._prism):
+            warnings.warn(
+                "Warning: setting upper trangular matrix might slow down the calculation"
+            )
+        if self._generic_input["calc_mode"] != "static" or not np.allclose(
+            structure_loaded.cell, structure.cell, rtol=1e-15, atol=1e-15
+        ):
+            self._interactive_change_box(
+                is_skewed=self._prism.is_skewed(), was_skewed=was_skewed
+            )
+        elem_all = self._get_interactive_types(structure)
+        positions = structure.positions
+        if _check_ortho_prism(prism=self._prism):
+            positions = np.matmul(positions, self._prism.R)
+        if len(structure) < len(structure_loaded):
+            self._interactive_lib_command(
+                "group pyiron_delete id > {}".format(len(structure))
+            )
+            self._interactive_lib_command(
+                "delete_atoms group pyiron_delete compress no"
+            )
+            self._interactive_lib_command("group pyiron_delete delete")
+        elif len(structure) > len(structure_loaded):
+            self._interactive_create_atoms(
+                elem_all=elem_all[len(structure_loaded) :],
+                positions=positions[len(structure_loaded) :],
+            )
+        if (
+            self._generic_input["calc_mode"] != "static"
+            or len(structure) != len(structure_loaded)
+            or not np.array_equal(structure_loaded.indices, structure.indices)
+        ):
+            self._interactive_scatter_atoms("type", 0, 1, elem_all)
+        self._interactive_scatter_atoms("x", 1, 3, positions)
+        self._interactive_lib_command("change_box all remap")
+        self._interactive_structure_loaded = structure.copy()
+        return True
+
+    def _interactive_atoms_kept(self, structure):
+        """
+        Check if the atoms the given structure shares with the structure loaded in LAMMPS are the same atoms, so atoms
+        are only added or removed at the end. For static calculations and minimizations the velocities are not used,
+        so any atom can be reused. Otherwise the shared atoms have to have the same species and the same positions as
+        the atoms in LAMMPS, up to periodic images.
+
+        Args:
+            structure (pyiron_atomistics.atomistics.structure.atoms.Atoms): new structure
+
+        Returns:
+            bool: True if the shared atoms are the same atoms
+        """
+        if self._generic_input["calc_mode"] in ["static", "minimize"]:
+            return True
+        n_atoms = min(len(structure), len(self._interactive_structure_loaded))
+        if not np.array_equal(
+            self._interactive_structure_loaded.get_chemical_symbols()[:n_atoms],
+            structure.get_chemical_symbols()[:n_atoms],
+        ):
+            return False
+        positions = self.interactive_positions_getter()[:n_atoms]
+        return np.allclose(
+            structure.find_mic(structure.positions[:n_atoms] - positions),
+            0.0,
+            atol=1e-6,
+        )
+
+    def _interactive_structure_reset(self, structure):
+        """
+        Clear LAMMPS and set up the box, the atoms, the control input and the potential for the given structure.
+
+        Args:
+            structure (pyiron_atomistics.atomistics.structure.atoms.Atoms): new structure
+        """
+        self._interactive_lib_command("clear")
         self._interactive_lib_command("units " + self.input.control["units"])
         self._interactive_lib_command(
             "dimension " + str(self.input.control["dimension"])
@@ -546,12 +747,10 @@ class LammpsInteractive(LammpsBase, GenericInteractive):
             )
         else:
             self._interactive_lib_command("create_box " + str(len(el_eam_lst)) + " 1")
-        el_dict = {}
         for id_eam, el_eam in enumerate(el_eam_lst):
             if el_eam in el_struct_lst:
                 id_el = list(el_struct_lst).index(el_eam)
                 el = el_obj_lst[id_el]
-                el_dict[el] = id_eam + 1
                 self._interactive_lib_command(
                     "mass {0:3d} {1:f}".format(id_eam + 1, el.AtomicMass)
                 )
@@ -559,14 +758,37 @@ class LammpsInteractive(LammpsBase, GenericInteractive):
                 self._interactive_lib_command(
                     "mass {0:3d} {1:f}".format(id_eam + 1, 1.00)
                 )
-        positions = structure.positions.flatten()
+        positions = structure.positions
         if _check_ortho_prism(prism=self._prism):
-            positions = np.array(positions).reshape(-1, 3)
             positions = np.matmul(positions, self._prism.R)
-        positions = positions.flatten()
+        self._interactive_create_atoms(
+            elem_all=self._get_interactive_types(structure), positions=positions
+        )
+        self._interactive_lib_command("change_box all remap")
+        self._interactive_lammps_input()
+        self._interactive_set_potential()
+
+    def _get_interactive_types(self, structure):
+        """
+        LAMMPS atom types of the atoms in the structure, defined by the order of the elements in the potential.
+
+        Args:
+            structure (pyiron_atomistics.atomistics.structure.atoms.Atoms): structure
+
+        Returns:
+            numpy.ndarray: LAMMPS atom type of each atom
+        """
+        el_struct_lst = structure.get_species_symbols()
+        el_obj_lst = structure.get_species_objects()
+        el_dict = {}
+        for id_eam, el_eam in enumerate(self.input.potential.get_element_lst()):
+            if el_eam in el_struct_lst:
+                id_el = list(el_struct_lst).index(el_eam)
+                el_dict[el_obj_lst[id_el]] = id_eam + 1
         try:
-            elem_all = np.array(
-                [el_dict[el] for el in structure.get_chemical_elements()]
+            return np.array(
+                [el_dict[el] for el in structure.get_chemical_elements()],
+                dtype=np.int32,
             )
         except KeyError:
             missing = set(structure.get_chemical_elements()).difference(el_dict.keys())
@@ -574,19 +796,32 @@ class LammpsInteractive(LammpsBase, GenericInteractive):
             raise ValueError(
                 f"Structure contains elements [{missing}], that are not present in the potential!"
             )
+
+    def _interactive_create_atoms(self, elem_all, positions):
+        """
+        Create atoms in LAMMPS, the ids of the new atoms follow the ids of the existing atoms.
+
+        Args:
+            elem_all (numpy.ndarray): LAMMPS atom type of each atom
+            positions (numpy.ndarray): positions in the LAMMPS coordinate frame
+        """
+        elem_all = np.require(elem_all, dtype=np.int32, requirements="CW")
+        positions = np.require(positions, dtype=np.float64, requirements="CW").reshape(
+            -1
+        )
         if self.server.run_mode.interactive and self.server.cores == 1:
             self._interactive_library.create_atoms(
-                n=len(structure),
+                n=len(elem_all),
                 id=None,
-                type=(len(elem_all) * c_int)(*elem_all),
-                x=(len(positions) * c_double)(*positions),
+                type=np.ctypeslib.as_ctypes(elem_all),
+                x=np.ctypeslib.as_ctypes(positions),
                 v=None,
                 image=None,
                 shrinkexceed=False,
             )
         else:
             self._interactive_library.create_atoms(
-                n=len(structure),
+                n=len(elem_all),
                 id=None,
                 type=elem_all,
                 x=positions,
@@ -594,9 +829,20 @@ class LammpsInteractive(LammpsBase, GenericInteractive):
                 image=None,
                 shrinkexceed=False,
             )
-        self._interactive_lib_command("change_box all remap")
-        self._interactive_lammps_input()
-        self._interactive_set_potential()
+
+    def _get_interactive_input_state(self):
+        """
+        State of the control input and the potential which is applied to LAMMPS when it is reset.
+
+        Returns:
+            tuple: hashable state of the input
+        """
+        return (
+            tuple(self.input.control.dataset["Parameter"]),
+            tuple(str(value) for value in self.input.control.dataset["Value"]),
+            tuple(self.input.potential.get_string_lst()),
+            self._interactive_water_bonds,
+        )
 
     def _interactive_water_setter(self):
         """
@@ -681,11 +927,10 @@ class LammpsInteractive(LammpsBase, GenericInteractive):
 
     def interactive_indices_getter(self):
         uc = UnitConverter(units=self.units)
-        lammps_indices = np.array(self._interactive_library.gather_atoms("type", 0, 1))
-        indices = uc.convert_array_to_pyiron_units(
+        lammps_indices = self._interactive_gather_atoms("type", 0, 1)
+        return uc.convert_array_to_pyiron_units(
             self.remap_indices(lammps_indices), label="indices"
         )
-        return indices.tolist()
 
     def interactive_indices_setter(self, indices):
         el_struct_lst = self._structure_current.get_species_symbols()
@@ -700,12 +945,7 @@ class LammpsInteractive(LammpsBase, GenericInteractive):
         elem_all = np.array(
             [el_dict[self._structure_current.species[el]] for el in indices]
         )
-        if self.server.run_mode.interactive and self.server.cores == 1:
-            self._interactive_library.scatter_atoms(
-                "type", 0, 1, (len(elem_all) * c_int)(*elem_all)
-            )
-        else:
-            self._interactive_library.scatter_atoms("type", elem_all)
+        self._interactive_scatter_atoms("type", 0, 1, elem_all)
 
     def interactive_energy_pot_getter(self):
         uc = UnitConverter(units=self.units)
@@ -743,14 +983,23 @@ class LammpsInteractive(LammpsBase, GenericInteractive):
             self._interactive_lib_command("compute st all stress/atom NULL")
             self._interactive_lib_command("run 0")
             self.interactive_cache["stress"] = []
-        id_lst = self._interactive_library.extract_atom("id", 0)
-        id_lst = np.array([id_lst[i] for i in range(len(self.structure))]) - 1
-        id_lst = np.arange(len(id_lst))[np.argsort(id_lst)]
         ind = np.array([0, 3, 4, 3, 1, 5, 4, 5, 2])
-        ss = self._interactive_library.extract_compute("st", 1, 2)
-        ss = np.array(
-            [ss[i][j] for i in range(len(self.structure)) for j in range(6)]
-        ).reshape(-1, 6)[id_lst]
+        if self._interactive_library_is_serial() and hasattr(
+            self._interactive_library, "numpy"
+        ):
+            atom_ids = self._interactive_library.numpy.extract_atom("id")
+            ss = np.empty((len(atom_ids), 6))
+            ss[atom_ids - 1] = self._interactive_library.numpy.extract_compute(
+                "st", 1, 2
+            )[: len(atom_ids)]
+        else:
+            id_lst = self._interactive_library.extract_atom("id", 0)
+            id_lst = np.array([id_lst[i] for i in range(len(self.structure))]) - 1
+            id_lst = np.arange(len(id_lst))[np.argsort(id_lst)]
+            ss = self._interactive_library.extract_compute("st", 1, 2)
+            ss = np.array(
+                [ss[i][j] for i in range(len(self.structure)) for j in range(6)]
+            ).reshape(-1, 6)[id_lst]
         ss = (
             ss[:, ind].reshape(len(self.structure), 3, 3)
             / constants.eV
@@ -788,9 +1037,73 @@ class LammpsInteractive(LammpsBase, GenericInteractive):
             pp = rotation_matrix.T @ pp @ rotation_matrix
         return uc.convert_array_to_pyiron_units(pp, label="pressure")
 
+    def interactive_evaluate_structures(
+        self, structures, n_processes=1, chunk_size=None
+    ):
+        """
+        Compute the potential energy, the forces and the pressure of many structures with the potential of this job.
+
+        Instead of writing an input and starting LAMMPS for every structure, each process creates a single LAMMPS
+        library instance, loads the potential once and then only replaces the box and the atoms for every structure
+        followed by a run of zero steps. This is independent of the interactive session of the job itself.
+
+        >>> results = job.interactive_evaluate_structures(container, n_processes=4)
+        >>> results.get_array("energy_pot"), results.get_array("forces", 0)
+
+        Args:
+            structures (StructureStorage/list): structures to evaluate
+            n_processes (int): number of local processes the structures are distributed to
+            chunk_size (int, optional): number of structures sent to a process at once, see
+                :meth:`.StructureStorage.map_structures`
+
+        Returns:
+            :class:`.FlattenedStorage`: energy_pot and pressures per structure and forces per atom, in the order of
+                the structures
+        """
+        if not isinstance(structures, StructureStorage):
+            container = StructureStorage()
+            for structure in structures:
+                container.add_structure(structure)
+            structures = container
+        store = FlattenedStorage()
+        store.add_array("energy_pot", per="chunk")
+        store.add_array("forces", shape=(3,), per="element")
+        store.add_array("pressures", shape=(3, 3), per="chunk")
+        evaluator = self._get_structure_evaluator()
+        try:
+            return structures.map_structures(
+                evaluator, n_processes=n_processes, chunk_size=chunk_size, store=store
+            )
+        finally:
+            evaluator.close()
+
+    def _get_structure_evaluator(self):
+        """
+        Evaluator for single structures with the control input and the potential of this job.
+
+        Returns:
+            _LammpsStructureEvaluator: picklable evaluator
+        """
+        if self.input.control["atom_style"] == "full":
+            raise ValueError(
+                "Evaluating structures is not supported for the atom style full!"
+            )
+        elements = list(self.input.potential.get_element_lst())
+        pse = PeriodicTable()
+        return _LammpsStructureEvaluator(
+            units=self.input.control["units"],
+            dimension=self.input.control["dimension"],
+            atom_style=self.input.control["atom_style"],
+            elements=elements,
+            masses=[pse.element(el).AtomicMass for el in elements],
+            input_commands=self._get_interactive_input_commands(),
+            potential_commands=self._get_interactive_potential_commands()[0],
+        )
+
     def interactive_close(self):
         if self.interactive_is_activated():
             self._interactive_library.close()
+            self._interactive_structure_loaded = None
             super(LammpsInteractive, self).interactive_close()
             with self.project_hdf5.open("output") as h5:
                 if "interactive" in h5.list_groups():
@@ -798,6 +1111,149 @@ class LammpsInteractive(LammpsBase, GenericInteractive):
                         h5["generic/" + key] = h5["interactive/" + key]
 
 
+class _LammpsStructureEvaluator(object):
+    """
+    Picklable callable, which computes the potential energy, the forces and the pressure of a structure. The LAMMPS
+    library instance is created on the first call in each process and reused for all following structures, between
+    the structures all atoms are deleted and the triclinic box is changed to the cell of the next structure.
+
+    Args:
+        units (str): LAMMPS units
+        dimension (int): dimension of the simulation
+        atom_style (str): LAMMPS atom style
+        elements (list): chemical symbols of the LAMMPS atom types
+        masses (list): masses of the LAMMPS atom types
+        input_commands (list): control commands executed after the box is created
+        potential_commands (list): commands defining the potential
+    """
+
+    def __init__(
+        self,
+        units,
+        dimension,
+        atom_style,
+        elements,
+        masses,
+        input_commands,
+        potential_commands,
+    ):
+        self._units = units
+        self._dimension = dimension
+        self._atom_style = atom_style
+        self._elements = elements
+        self._masses = masses
+        self._input_commands = input_commands
+        self._potential_commands = potential_commands
+        self._library = None
+        self._pbc = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_library"] = None
+        state["_pbc"] = None
+        return state
+
+    def _create_library(self):
+        lammps = getattr(importlib.import_module("lammps"), "lammps")
+        return lammps(cmdargs=["-screen", "none", "-log", "none"])
+
+    def _initialize(self, pbc):
+        self._library = self._create_library()
+        self._pbc = np.array(pbc, dtype=bool)
+        self._library.command("units " + self._units)
+        self._library.command("dimension " + str(self._dimension))
+        self._library.command("boundary " + _get_boundary(self._pbc))
+        self._library.command("atom_style " + self._atom_style)
+        self._library.command("atom_modify map array")
+        self._library.command(
+            "region 1 prism 0.0 1.0 0.0 1.0 0.0 1.0 0.0 0.0 0.0 units box"
+        )
+        self._library.command("create_box " + str(len(self._elements)) + " 1")
+        for id_type, mass in enumerate(self._masses):
+            self._library.command("mass {0:3d} {1:f}".format(id_type + 1, mass))
+        for command in self._input_commands + self._potential_commands:
+            self._library.command(command)
+
+    def __call__(self, structure):
+        """
+        Compute the potential energy, the forces and the pressure of the structure.
+
+        Args:
+            structure (pyiron_atomistics.atomistics.structure.atoms.Atoms): structure
+
+        Returns:
+            dict: energy_pot, forces and pressures in pyiron units
+        """
+        species_types = []
+        for el in structure.species:
+            if el.Abbreviation not in self._elements:
+                raise ValueError(
+                    f"Structure contains elements [{el.Abbreviation}], that are not present in the potential!"
+                )
+            species_types.append(self._elements.index(el.Abbreviation) + 1)
+        types = np.array(species_types, dtype=np.int32)[structure.indices]
+        if self._library is None:
+            self._initialize(pbc=structure.pbc)
+        uc = UnitConverter(units=self._units)
+        prism = UnfoldingPrism(structure.cell)
+        self._library.command("delete_atoms group all")
+        if not np.array_equal(self._pbc, structure.pbc):
+            self._pbc = np.array(structure.pbc, dtype=bool)
+            self._library.command("change_box all boundary " + _get_boundary(self._pbc))
+        self._library.command(
+            "change_box all x final 0 {} y final 0 {} z final 0 {} xy final {} xz final {} yz final {} "
+            "units box".format(*prism.get_lammps_prism())
+        )
+        positions = structure.positions
+        if _check_ortho_prism(prism=prism):
+            positions = np.matmul(positions, prism.R)
+        positions = np.require(positions, dtype=np.float64, requirements="CW").reshape(
+            -1
+        )
+        self._library.create_atoms(
+            n=len(structure),
+            id=None,
+            type=np.ctypeslib.as_ctypes(np.require(types, requirements="CW")),
+            x=np.ctypeslib.as_ctypes(positions),
+            v=None,
+            image=None,
+            shrinkexceed=False,
+        )
+        if self._library.get_natoms() != len(structure):
+            raise ValueError("Atoms were lost while creating the structure in LAMMPS!")
+        self._library.command("run 0")
+        atom_ids = self._library.numpy.extract_atom("id")
+        forces = np.empty((len(structure), 3))
+        forces[atom_ids - 1] = self._library.numpy.extract_atom("f")[: len(atom_ids)]
+        pxx, pyy, pzz, pxy, pxz, pyz = [
+            self._library.get_thermo(key)
+            for key in ["pxx", "pyy", "pzz", "pxy", "pxz", "pyz"]
+        ]
+        pressures = np.array([[pxx, pxy, pxz], [pxy, pyy, pyz], [pxz, pyz, pzz]])
+        if _check_ortho_prism(prism=prism):
+            forces = np.matmul(forces, prism.R.T)
+            pressures = prism.R @ pressures @ prism.R.T
+        return {
+            "energy_pot": uc.convert_array_to_pyiron_units(
+                self._library.get_thermo("pe"), label="energy_pot"
+            ),
+            "forces": uc.convert_array_to_pyiron_units(forces, label="forces"),
+            "pressures": uc.convert_array_to_pyiron_units(pressures, label="pressure"),
+        }
+
+    def close(self):
+        """
+        Close the LAMMPS library instance of this process.
+        """
+        if self._library is not None:
+            self._library.close()
+            self._library = None
+
+
+def _get_boundary(pbc):
+    return " ".join(["p" if periodic else "f" for periodic in pbc])
+
+
 class _FixExternal:
     """
     Helper class to exploit `fix external`, which is one of the features of LAMMPS to modify
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
 from typing import Dict, List, Tuple, TYPE_CHECKING, Union
 import h5py
-from io import StringIO
+from io import BytesIO
+import mmap
 import numpy as np
 import os
 import pandas as pd
@@ -41,6 +43,7 @@ def parse_lammps_output(
     structure: Atoms,
     potential_elements: Union[np.ndarray, List],
     units: str,
+    n_processes: int = 1,
 ) -> Dict:
     dump_dict = _parse_dump(
         dump_h5_full_file_name,
@@ -48,6 +51,7 @@ def parse_lammps_output(
         prism,
         structure,
         potential_elements,
+        n_processes=n_processes,
     )
 
     generic_keys_lst, pressure_dict, df = _parse_log(log_lammps_full_file_name, prism)
@@ -60,7 +64,7 @@ def parse_lammps_output(
 
     if "computes" in dump_dict.keys():
         for k, v in dump_dict.pop("computes").items():
-            hdf_generic[k] = convert_units(np.array(v), label=k)
+            hdf_generic[k] = convert_units(np.asarray(v), label=k)
 
     hdf_generic["steps"] = convert_units(
         np.array(dump_dict.pop("steps"), dtype=int), label="steps"
@@ -68,7 +72,7 @@ def parse_lammps_output(
 
     for k, v in dump_dict.items():
         if len(v) > 0:
-            hdf_generic[k] = convert_units(np.array(v), label=k)
+            hdf_generic[k] = convert_units(np.asarray(v), label=k)
 
     if df is not None and pressure_dict is not None and generic_keys_lst is not None:
         for k, v in df.items():
@@ -93,6 +97,7 @@ def _parse_dump(
     prism: UnfoldingPrism,
     structure: Atoms,
     potential_elements: Union[np.ndarray, List],
+    n_processes: int = 1,
 ) -> Dict:
     if os.path.isfile(dump_h5_full_file_name):
         return _collect_dump_from_h5md(
@@ -105,6 +110,7 @@ def _parse_dump(
             prism=prism,
             structure=structure,
             potential_elements=potential_elements,
+            n_processes=n_processes,
         )
     else:
         return {}
@@ -137,141 +143,602 @@ def _collect_dump_from_text(
     prism: UnfoldingPrism,
     structure: Atoms,
     potential_elements: Union[np.ndarray, List],
+    n_processes: int = 1,
 ) -> Dict:
     """
     general purpose routine to extract static from a lammps dump file
+
+    The file is scanned once to locate the snapshots, afterwards the ATOMS blocks are decoded in bulk into preallocated
+    arrays of the shape (n_frames, n_atoms, n_columns) and all coordinate transformations are applied to all frames at
+    once. Consecutive snapshots with the same number of atoms and the same columns are processed together. An incomplete
+    last snapshot, e.g. of a running simulation, is ignored.
     """
-    rotation_lammps2orig = prism.R.T
-    with open(file_name, "r") as f:
-        dump = DumpData()
+    return DumpReader(
+        file_name=file_name,
+        prism=prism,
+        structure=structure,
+        potential_elements=potential_elements,
+        cache_index=False,
+    ).read(n_processes=n_processes)
 
-        for line in f:
-            if "ITEM: TIMESTEP" in line:
-                dump.steps.append(int(f.readline()))
 
-            elif "ITEM: BOX BOUNDS" in line:
-                c1 = np.fromstring(f.readline(), dtype=float, sep=" ")
-                c2 = np.fromstring(f.readline(), dtype=float, sep=" ")
-                c3 = np.fromstring(f.readline(), dtype=float, sep=" ")
-                cell = np.concatenate([c1, c2, c3])
-                lammps_cell = to_amat(cell)
-                unfolded_cell = prism.unfold_cell(lammps_cell)
-                dump.cells.append(unfolded_cell)
+_DUMP_KEYS = [k.name for k in fields(DumpData)]
 
-            elif "ITEM: NUMBER OF ATOMS" in line:
-                n = int(f.readline())
-                dump.natoms.append(n)
 
-            elif "ITEM: ATOMS" in line:
-                # get column names from line
-                columns = line.lstrip("ITEM: ATOMS").split()
-
-                # Read line by line of snapshot into a string buffer
-                # Than parse using pandas for speed and column acces
-                buf = StringIO()
-                for _ in range(n):
-                    buf.write(f.readline())
-                buf.seek(0)
-                df = pd.read_csv(
-                    buf,
-                    nrows=n,
-                    sep="\s+",
-                    header=None,
-                    names=columns,
-                    engine="c",
-                )
-                df.sort_values(by="id", ignore_index=True, inplace=True)
-                # Coordinate transform lammps->pyiron
-                dump.indices.append(
-                    remap_indices(
-                        lammps_indices=df["type"].array.astype(int),
-                        potential_elements=potential_elements,
-                        structure=structure,
+@dataclass
+class DumpFrame:
+    """
+    Header and location of a single snapshot in a LAMMPS text dump file, the atom lines of the snapshot are stored
+    between the byte offsets start and end.
+    """
+
+    step: int
+    natoms: int
+    box: np.ndarray
+    columns: List[str]
+    start: int
+    end: int
+
+
+class DumpReader:
+    """
+    Lazy access to the snapshots of a LAMMPS text dump file. The byte offsets of the snapshots are located once and
+    cached in an index file next to the dump file, afterwards only the requested snapshots are decoded. The index file
+    is only used if the size and the modification time of the dump file match. When the dump file grows, e.g. while
+    the simulation is still running, only the new part of the file is indexed.
+
+    The quantities of the DumpData dataclass are available as attributes, which can be indexed and sliced like arrays
+    with the snapshots on the first axis.
+
+    Args:
+        file_name (str): Path to the dump file
+        prism (pyiron_atomistics.lammps.structure.UnfoldingPrism): For mapping between lammps and pyiron structures
+        structure (pyiron_atomistics.atomistics.structure.Atoms): The structure of the job
+        potential_elements (numpy.ndarray/list): Elements of the potential
+        cache_index (bool): Store the index of the snapshots in the file <file_name>.index.npz
+
+    Example:
+
+    >>> dump = DumpReader(
+    ...     file_name=job.job_file_name(file_name="dump.out"),
+    ...     prism=job._prism,
+    ...     structure=job.structure,
+    ...     potential_elements=job.input.potential.get_element_lst(),
+    ... )
+    >>> final_positions = dump.positions[-1]
+    >>> every_tenth_forces = dump.forces[::10]
+    """
+
+    def __init__(
+        self,
+        file_name: str,
+        prism: UnfoldingPrism,
+        structure: Atoms,
+        potential_elements: Union[np.ndarray, List],
+        cache_index: bool = True,
+    ):
+        self._file_name = file_name
+        self._prism = prism
+        self._structure = structure
+        self._potential_elements = potential_elements
+        self._cache_index = cache_index
+        self._frames = None
+        self._file_stat = None
+
+    @property
+    def index_file_name(self) -> str:
+        return self._file_name + ".index.npz"
+
+    @property
+    def frames(self) -> List[DumpFrame]:
+        """
+        list: DumpFrame objects of all complete snapshots, the index is updated if the dump file changed
+        """
+        stat = os.stat(self._file_name)
+        if self._frames is None or self._file_stat != (stat.st_size, stat.st_mtime_ns):
+            self._frames = self._get_index(stat=stat)
+            self._file_stat = (stat.st_size, stat.st_mtime_ns)
+        return self._frames
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def __getattr__(self, item):
+        if item in _DUMP_KEYS:
+            return _DumpQuantity(reader=self, key=item)
+        raise AttributeError(item)
+
+    def read(
+        self,
+        frames: Union[int, slice, List[int], np.ndarray, None] = None,
+        n_processes: int = 1,
+    ) -> Dict:
+        """
+        Decode the requested snapshots.
+
+        Args:
+            frames (int/slice/list/numpy.ndarray/None): Indices of the snapshots, all snapshots by default
+            n_processes (int): Number of processes used to decode the snapshots
+
+        Returns:
+            dict: The quantities of the DumpData dataclass for the requested snapshots
+        """
+        dump = DumpData()
+        all_frames = self.frames
+        if frames is None:
+            frames = all_frames
+        elif isinstance(frames, slice):
+            frames = all_frames[frames]
+        elif isinstance(frames, (int, np.integer)):
+            frames = [all_frames[frames]]
+        else:
+            frames = [all_frames[i] for i in frames]
+        if len(frames) == 0:
+            return vars(dump)
+        groups = _group_dump_frames(frames=frames)
+        n_processes = min(n_processes, len(frames))
+        if n_processes > 1:
+            with ProcessPoolExecutor(max_workers=n_processes) as executor:
+                values_lst = [
+                    _read_dump_values_parallel(
+                        file_name=self._file_name,
+                        frames=group,
+                        executor=executor,
+                        n_chunks=n_processes,
                     )
+                    for group in groups
+                ]
+        else:
+            with open(self._file_name, "rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as buffer:
+                values_lst = [
+                    _read_dump_values(buffer=buffer, frames=group) for group in groups
+                ]
+        for group, (values, integer_columns) in zip(groups, values_lst):
+            if len(values) == 0:
+                break
+            group_dict = _process_dump_values(
+                values=values,
+                frames=group[: len(values)],
+                integer_columns=integer_columns,
+                prism=self._prism,
+                structure=self._structure,
+                potential_elements=self._potential_elements,
+            )
+            if len(groups) == 1:
+                for k, v in group_dict.items():
+                    setattr(dump, k, v)
+            else:
+                for k, v in group_dict.items():
+                    if k == "computes":
+                        for kk, vv in v.items():
+                            dump.computes.setdefault(kk, []).extend(vv)
+                    else:
+                        getattr(dump, k).extend(v)
+            if len(values) < len(group):
+                break
+        return vars(dump)
+
+    def _get_index(self, stat: os.stat_result) -> List[DumpFrame]:
+        """
+        Load the index from the index file and index the part of the dump file which was appended since the last
+        call or since the index file was written, or the whole file if it was replaced.
+        """
+        if stat.st_size == 0:
+            return []
+        frames, file_size = [], 0
+        if self._frames is not None:
+            frames, file_size = self._frames, self._file_stat[0]
+        elif self._cache_index and os.path.exists(self.index_file_name):
+            try:
+                frames, file_size, mtime = _read_dump_index(
+                    file_name=self.index_file_name
                 )
-
-                force = np.stack(
-                    [df["fx"].array, df["fy"].array, df["fz"].array], axis=1
+            except (OSError, ValueError, KeyError):
+                frames, file_size, mtime = [], 0, None
+            if (file_size, mtime) == (stat.st_size, stat.st_mtime_ns):
+                return frames
+        with open(self._file_name, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as buffer:
+            position = 0
+            if 0 < len(frames) and file_size < stat.st_size:
+                position = frames[-1].end
+                if buffer.find(b"ITEM: TIMESTEP", position) != position:
+                    position = 0
+            if position == 0:
+                frames = []
+            frames = frames + _index_dump_frames(buffer=buffer, position=position)
+        if self._cache_index:
+            try:
+                _write_dump_index(
+                    file_name=self.index_file_name,
+                    frames=frames,
+                    file_size=stat.st_size,
+                    mtime=stat.st_mtime_ns,
                 )
-                dump.forces.append(np.matmul(force, rotation_lammps2orig))
-                if "f_mean_forces[1]" in columns:
-                    force = np.stack(
-                        [
-                            df["f_mean_forces[1]"].array,
-                            df["f_mean_forces[2]"].array,
-                            df["f_mean_forces[3]"].array,
-                        ],
-                        axis=1,
-                    )
-                    dump.mean_forces.append(np.matmul(force, rotation_lammps2orig))
-                if "vx" in columns and "vy" in columns and "vz" in columns:
-                    v = np.stack(
-                        [
-                            df["vx"].array,
-                            df["vy"].array,
-                            df["vz"].array,
-                        ],
-                        axis=1,
-                    )
-                    dump.velocities.append(np.matmul(v, rotation_lammps2orig))
-
-                if "f_mean_velocities[1]" in columns:
-                    v = np.stack(
-                        [
-                            df["f_mean_velocities[1]"].array,
-                            df["f_mean_velocities[2]"].array,
-                            df["f_mean_velocities[3]"].array,
-                        ],
-                        axis=1,
-                    )
-                    dump.mean_velocities.append(np.matmul(v, rotation_lammps2orig))
-
-                if "xsu" in columns:
-                    direct_unwrapped_positions = np.stack(
-                        [
-                            df["xsu"].array,
-                            df["ysu"].array,
-                            df["zsu"].array,
-                        ],
-                        axis=1,
-                    )
-                    dump.unwrapped_positions.append(
-                        np.matmul(
-                            np.matmul(direct_unwrapped_positions, lammps_cell),
-                            rotation_lammps2orig,
-                        )
-                    )
+            except OSError:
+                warnings.warn(
+                    "The index of the LAMMPS dump file could not be written to "
+                    + self.index_file_name
+                )
+        return frames
 
-                    direct_positions = direct_unwrapped_positions - np.floor(
-                        direct_unwrapped_positions
-                    )
-                    dump.positions.append(
-                        np.matmul(
-                            np.matmul(direct_positions, lammps_cell),
-                            rotation_lammps2orig,
-                        )
-                    )
 
-                if "f_mean_positions[1]" in columns:
-                    pos = np.stack(
-                        [
-                            df["f_mean_positions[1]"].array,
-                            df["f_mean_positions[2]"].array,
-                            df["f_mean_positions[3]"].array,
-                        ],
-                        axis=1,
-                    )
-                    dump.mean_unwrapped_positions.append(
-                        np.matmul(pos, rotation_lammps2orig)
-                    )
-                for k in columns:
-                    if k.startswith("c_"):
-                        kk = k.replace("c_", "")
-                        if kk not in dump.computes.keys():
-                            dump.computes[kk] = []
-                        dump.computes[kk].append(df[k].array)
+class _DumpQuantity:
+    """
+    A single quantity of the DumpReader, indexing or slicing it decodes only the requested snapshots. The computes are
+    a dictionary of quantities, so indexing them returns a dictionary with the requested snapshots of every compute.
+    """
 
-        return asdict(dump)
+    def __init__(self, reader: DumpReader, key: str):
+        self._reader = reader
+        self._key = key
+
+    def __len__(self) -> int:
+        return len(self._reader)
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, np.integer)):
+            values = self._reader.read(frames=[item])[self._key]
+            if self._key == "computes":
+                return {k: np.asarray(v)[0] for k, v in values.items()}
+            return np.asarray(values)[0]
+        values = self._reader.read(frames=item)[self._key]
+        if self._key == "computes":
+            return {k: np.asarray(v) for k, v in values.items()}
+        return np.asarray(values)
+
+    def __array__(self, dtype=None):
+        if self._key == "computes":
+            raise TypeError(
+                "The computes are a dictionary and can not be converted to an array"
+            )
+        return np.asarray(self[:], dtype=dtype)
+
+
+def _write_dump_index(
+    file_name: str, frames: List[DumpFrame], file_size: int, mtime: int
+) -> None:
+    """
+    Store the DumpFrame objects of the snapshots as numpy arrays, together with the size and the modification time of
+    the indexed dump file. The index is written to a temporary file first, so it is never read partially written.
+    """
+    columns = sorted(set([" ".join(frame.columns) for frame in frames]))
+    boxes = np.full((len(frames), 9), np.nan)
+    for i, frame in enumerate(frames):
+        boxes[i, : len(frame.box)] = frame.box
+    tmp_file_name = file_name + "." + str(os.getpid())
+    with open(tmp_file_name, "wb") as f:
+        np.savez(
+            f,
+            steps=np.array([frame.step for frame in frames], dtype=int),
+            natoms=np.array([frame.natoms for frame in frames], dtype=int),
+            boxes=boxes,
+            box_lengths=np.array([len(frame.box) for frame in frames], dtype=int),
+            columns=np.array(columns, dtype=str),
+            column_indices=np.array(
+                [columns.index(" ".join(frame.columns)) for frame in frames],
+                dtype=int,
+            ),
+            starts=np.array([frame.start for frame in frames], dtype=int),
+            ends=np.array([frame.end for frame in frames], dtype=int),
+            file_stat=np.array([file_size, mtime], dtype=int),
+        )
+    os.replace(tmp_file_name, file_name)
+
+
+def _read_dump_index(file_name: str) -> Tuple[List[DumpFrame], int, int]:
+    """
+    Load the DumpFrame objects of the snapshots stored by _write_dump_index().
+
+    Returns:
+        (list): DumpFrame objects
+        (int): Size of the dump file when it was indexed
+        (int): Modification time of the dump file when it was indexed
+    """
+    with np.load(file_name) as data:
+        columns = [c.split() for c in data["columns"]]
+        frames = [
+            DumpFrame(
+                step=int(step),
+                natoms=int(natoms),
+                box=box[:box_length],
+                columns=columns[column_index],
+                start=int(start),
+                end=int(end),
+            )
+            for step, natoms, box, box_length, column_index, start, end in zip(
+                data["steps"],
+                data["natoms"],
+                data["boxes"],
+                data["box_lengths"],
+                data["column_indices"],
+                data["starts"],
+                data["ends"],
+            )
+        ]
+        file_size, mtime = data["file_stat"]
+    return frames, int(file_size), int(mtime)
+
+
+def _index_dump_frames(
+    buffer: Union[bytes, mmap.mmap], position: int = 0
+) -> List[DumpFrame]:
+    """
+    Locate the snapshots in a LAMMPS text dump file, only the header lines are read.
+
+    Args:
+        buffer (bytes/mmap.mmap): Content of the dump file
+        position (int): Byte offset to start from
+
+    Returns:
+        list: DumpFrame objects for all complete snapshots
+    """
+    frames = []
+    position = buffer.find(b"ITEM: TIMESTEP", position)
+    while position >= 0:
+        step, natoms, box = None, None, None
+        while True:
+            line, position = _read_dump_line(buffer=buffer, position=position)
+            if line is None:
+                return frames
+            elif "ITEM: TIMESTEP" in line:
+                line, position = _read_dump_line(buffer=buffer, position=position)
+                step = int(line)
+            elif "ITEM: NUMBER OF ATOMS" in line:
+                line, position = _read_dump_line(buffer=buffer, position=position)
+                natoms = int(line)
+            elif "ITEM: BOX BOUNDS" in line:
+                box_lines = []
+                for _ in range(3):
+                    line, position = _read_dump_line(buffer=buffer, position=position)
+                    box_lines.append(line)
+                box = np.fromstring(" ".join(box_lines), dtype=float, sep=" ")
+            elif "ITEM: ATOMS" in line:
+                break
+            if line is None:
+                return frames
+        end = buffer.find(b"ITEM: TIMESTEP", position)
+        if end < 0:
+            # the last snapshot might still be written
+            end = max(buffer.rfind(b"\n", position) + 1, position)
+            if buffer[position:end].count(b"\n") < natoms:
+                return frames
+        frames.append(
+            DumpFrame(
+                step=step,
+                natoms=natoms,
+                box=box,
+                columns=line.split()[2:],
+                start=position,
+                end=end,
+            )
+        )
+        position = buffer.find(b"ITEM: TIMESTEP", end)
+    return frames
+
+
+def _read_dump_line(
+    buffer: Union[bytes, mmap.mmap], position: int
+) -> Tuple[Union[str, None], int]:
+    """
+    Read a single complete line of the dump file starting at the given byte offset.
+
+    Returns:
+        (str/None): The line or None if no complete line is left
+        (int): Offset of the next line
+    """
+    end = buffer.find(b"\n", position)
+    if end < 0:
+        return None, position
+    return buffer[position:end].decode(), end + 1
+
+
+def _group_dump_frames(frames: List[DumpFrame]) -> List[List[DumpFrame]]:
+    """
+    Split the snapshots into groups of consecutive snapshots with the same number of atoms and the same columns.
+    """
+    groups = []
+    for frame in frames:
+        if (
+            len(groups) > 0
+            and groups[-1][-1].natoms == frame.natoms
+            and groups[-1][-1].columns == frame.columns
+        ):
+            groups[-1].append(frame)
+        else:
+            groups.append([frame])
+    return groups
+
+
+def _read_dump_values(
+    buffer: Union[bytes, mmap.mmap],
+    frames: List[DumpFrame],
+    chunk_size: int = 2**26,
+) -> Tuple[np.ndarray, List[str]]:
+    """
+    Decode the atom lines of consecutive snapshots with the same number of atoms and the same columns in bulk. The
+    atom lines of multiple snapshots are parsed with a single pandas call, the chunk size limits the number of bytes
+    which are parsed at once.
+
+    Args:
+        buffer (bytes/mmap.mmap): Content of the dump file
+        frames (list): DumpFrame objects of the snapshots
+        chunk_size (int): Maximum number of bytes parsed in one call
+
+    Returns:
+        (numpy.ndarray): Values of the shape (n_frames, n_atoms, n_columns), an incomplete last snapshot is skipped
+        (list): Columns which only contain integers
+    """
+    natoms, columns = frames[0].natoms, frames[0].columns
+    values = np.empty((len(frames), natoms, len(columns)), dtype=float)
+    integer_columns = list(columns)
+    n_frames, start = 0, 0
+    while start < len(frames):
+        stop = start + 1
+        while (
+            stop < len(frames) and frames[stop].end - frames[start].start <= chunk_size
+        ):
+            stop += 1
+        text = b"".join(
+            [buffer[frame.start : frame.end] for frame in frames[start:stop]]
+        )
+        try:
+            df = pd.read_csv(
+                BytesIO(text),
+                sep=r"\s+",
+                header=None,
+                names=columns,
+                engine="c",
+            )
+        except pd.errors.EmptyDataError:
+            break
+        integer_columns = [
+            k for k in integer_columns if pd.api.types.is_integer_dtype(df[k])
+        ]
+        for k in columns:
+            if df[k].dtype == object:
+                df[k] = pd.to_numeric(df[k], errors="coerce")
+        n_complete = min(len(df) // max(natoms, 1), stop - start)
+        values[n_frames : n_frames + n_complete] = df.to_numpy(dtype=float)[
+            : n_complete * natoms
+        ].reshape(n_complete, natoms, len(columns))
+        n_frames += n_complete
+        if n_complete < stop - start:
+            break
+        start = stop
+    return values[:n_frames], integer_columns
+
+
+def _read_dump_values_from_file(
+    file_name: str, frames: List[DumpFrame]
+) -> Tuple[np.ndarray, List[str]]:
+    """
+    Decode the atom lines of consecutive snapshots, see _read_dump_values(), in a separate process.
+    """
+    with open(file_name, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as buffer:
+        return _read_dump_values(buffer=buffer, frames=frames)
+
+
+def _read_dump_values_parallel(
+    file_name: str,
+    frames: List[DumpFrame],
+    executor: ProcessPoolExecutor,
+    n_chunks: int,
+) -> Tuple[np.ndarray, List[str]]:
+    """
+    Decode the atom lines of consecutive snapshots, see _read_dump_values(), by splitting them in ranges of snapshots
+    which are decoded in parallel.
+    """
+    chunks = [
+        frames[indices[0] : indices[-1] + 1]
+        for indices in np.array_split(np.arange(len(frames)), n_chunks)
+        if len(indices) > 0
+    ]
+    values = np.empty(
+        (len(frames), frames[0].natoms, len(frames[0].columns)), dtype=float
+    )
+    integer_columns = list(frames[0].columns)
+    n_frames = 0
+    for chunk, (chunk_values, chunk_integer_columns) in zip(
+        chunks,
+        executor.map(_read_dump_values_from_file, [file_name] * len(chunks), chunks),
+    ):
+        values[n_frames : n_frames + len(chunk_values)] = chunk_values
+        n_frames += len(chunk_values)
+        integer_columns = [k for k in integer_columns if k in chunk_integer_columns]
+        if len(chunk_values) < len(chunk):
+            break
+    return values[:n_frames], integer_columns
+
+
+def _process_dump_values(
+    values: np.ndarray,
+    frames: List[DumpFrame],
+    integer_columns: List[str],
+    prism: UnfoldingPrism,
+    structure: Atoms,
+    potential_elements: Union[np.ndarray, List],
+) -> Dict:
+    """
+    Convert the decoded values of multiple snapshots with the same number of atoms and the same columns from the
+    LAMMPS frame to the pyiron frame.
+
+    Args:
+        values (numpy.ndarray): Values of the shape (n_frames, n_atoms, n_columns)
+        frames (list): DumpFrame objects of the snapshots
+        integer_columns (list): Columns which are stored as integers
+        prism (pyiron_atomistics.lammps.structure.UnfoldingPrism): For mapping between lammps and pyiron structures
+        structure (pyiron_atomistics.atomistics.structure.Atoms): The structure of the job
+        potential_elements (numpy.ndarray/list): Elements of the potential
+
+    Returns:
+        dict: Arrays with the first axis running over the snapshots
+    """
+    columns = frames[0].columns
+    rotation_lammps2orig = prism.R.T
+
+    def get_vectors(keys):
+        return values[..., [columns.index(k) for k in keys]]
+
+    order = np.argsort(values[..., columns.index("id")], axis=1)
+    values = np.take_along_axis(values, order[..., np.newaxis], axis=1)
+    lammps_cells = np.array([to_amat(frame.box) for frame in frames])
+    output = {
+        "steps": np.array([frame.step for frame in frames]),
+        "natoms": np.array([frame.natoms for frame in frames]),
+        "cells": np.array([prism.unfold_cell(cell) for cell in lammps_cells]),
+        # Coordinate transform lammps->pyiron
+        "indices": remap_indices(
+            lammps_indices=values[..., columns.index("type")].astype(int),
+            potential_elements=potential_elements,
+            structure=structure,
+        ),
+        "forces": np.matmul(get_vectors(["fx", "fy", "fz"]), rotation_lammps2orig),
+    }
+    if "f_mean_forces[1]" in columns:
+        output["mean_forces"] = np.matmul(
+            get_vectors([f"f_mean_forces[{i}]" for i in range(1, 4)]),
+            rotation_lammps2orig,
+        )
+    if "vx" in columns and "vy" in columns and "vz" in columns:
+        output["velocities"] = np.matmul(
+            get_vectors(["vx", "vy", "vz"]), rotation_lammps2orig
+        )
+    if "f_mean_velocities[1]" in columns:
+        output["mean_velocities"] = np.matmul(
+            get_vectors([f"f_mean_velocities[{i}]" for i in range(1, 4)]),
+            rotation_lammps2orig,
+        )
+    if "xsu" in columns:
+        direct_unwrapped_positions = get_vectors(["xsu", "ysu", "zsu"])
+        output["unwrapped_positions"] = np.matmul(
+            np.matmul(direct_unwrapped_positions, lammps_cells),
+            rotation_lammps2orig,
+        )
+        direct_positions = direct_unwrapped_positions - np.floor(
+            direct_unwrapped_positions
+        )
+        output["positions"] = np.matmul(
+            np.matmul(direct_positions, lammps_cells), rotation_lammps2orig
+        )
+    if "f_mean_positions[1]" in columns:
+        output["mean_unwrapped_positions"] = np.matmul(
+            get_vectors([f"f_mean_positions[{i}]" for i in range(1, 4)]),
+            rotation_lammps2orig,
+        )
+    output["computes"] = {}
+    for k in columns:
+        if k.startswith("c_"):
+            v = values[..., columns.index(k)]
+            if k in integer_columns:
+                v = v.astype(int)
+            output["computes"][k.replace("c_", "")] = v
+    return output
 
 
 def _parse_log(
@@ -310,24 +777,22 @@ def _collect_output_log(
 ) -> Tuple[List[str], Dict, pd.DataFrame]:
     """
     general purpose routine to extract static from a lammps log file
-    """
-    with open(file_name, "r") as f:
-        read_thermo = False
-        thermo_lines = ""
-        for l in f:
-            l = l.lstrip()
-
-            if read_thermo:
-                if l.startswith("Loop"):
-                    read_thermo = False
-                    continue
-                thermo_lines += l
 
-            if l.startswith("Step"):
-                read_thermo = True
-                thermo_lines += l
-
-    df = pd.read_csv(StringIO(thermo_lines), sep="\s+", engine="c")
+    The thermo output of all runs is concatenated, columns which are only printed in some of the runs are filled with
+    NaN for the other runs.
+    """
+    runs = parse_thermo_runs(file_name=file_name)
+    if len(runs) == 0:
+        df = pd.DataFrame(columns=pd.Index([], dtype=str))
+    elif len(runs) == 1:
+        df = runs[0]
+    else:
+        if any([list(run.columns) != list(runs[0].columns) for run in runs[1:]]):
+            warnings.warn(
+                "LAMMPS warning: the runs in log.lammps print different thermo quantities, the missing values are "
+                "filled with NaN."
+            )
+        df = pd.concat(runs, ignore_index=True)
 
     h5_dict = {
         "Step": "steps",
@@ -416,6 +881,166 @@ def _collect_output_log(
     return generic_keys_lst, pressure_dict, df
 
 
+def parse_thermo_runs(file_name: str, chunk_size: int = 2**26) -> List[pd.DataFrame]:
+    """
+    Parse the thermo output of a LAMMPS log file, with one table per run.
+
+    The blocks of thermo output between the "Step ..." header and the "Loop time ..." line are located by their byte
+    offsets, afterwards each block is parsed in chunks of lines directly into preallocated numpy columns, so the memory
+    used in addition to the resulting tables is limited by the chunk size. Lines in the thermo output which are not
+    numbers, like warnings, are skipped and a block which is not terminated, e.g. of a running simulation, ends with
+    its last complete line.
+
+    Args:
+        file_name (str): The path to the lammps log file.
+        chunk_size (int): Maximum number of bytes parsed at once.
+
+    Returns:
+        list: pandas.DataFrame with the thermo output of each run
+    """
+    if os.path.getsize(file_name) == 0:
+        return []
+    with open(file_name, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as buffer:
+        return [
+            _read_thermo_block(
+                buffer=buffer,
+                columns=columns,
+                start=start,
+                end=end,
+                chunk_size=chunk_size,
+            )
+            for columns, start, end in _index_thermo_blocks(buffer=buffer)
+        ]
+
+
+def _index_thermo_blocks(
+    buffer: Union[bytes, mmap.mmap]
+) -> List[Tuple[List[str], int, int]]:
+    """
+    Locate the blocks of thermo output in a LAMMPS log file.
+
+    Args:
+        buffer (bytes/mmap.mmap): Content of the log file
+
+    Returns:
+        list: Column names, start and end offset of the thermo lines of each run
+    """
+    blocks = []
+    position = _find_line(buffer=buffer, keyword=b"Step", start=0)
+    while position >= 0:
+        header_end = buffer.find(b"\n", position)
+        if header_end < 0:
+            break
+        start = header_end + 1
+        end = _find_line(buffer=buffer, keyword=b"Loop", start=start)
+        if end < 0:
+            end = max(buffer.rfind(b"\n") + 1, start)
+        next_header = _find_line(buffer=buffer, keyword=b"Step", start=start, end=end)
+        if next_header >= 0:
+            # the run was interrupted before the "Loop time ..." line was printed
+            end = next_header
+        blocks.append((buffer[position:header_end].decode().split(), start, end))
+        position = _find_line(buffer=buffer, keyword=b"Step", start=end)
+    return blocks
+
+
+def _find_line(
+    buffer: Union[bytes, mmap.mmap], keyword: bytes, start: int, end: int = None
+) -> int:
+    """
+    Find the first line which starts with the keyword, leading whitespace is ignored.
+
+    Args:
+        buffer (bytes/mmap.mmap): Content of the log file
+        keyword (bytes): First word of the line
+        start (int): Offset to start the search from
+        end (int): Offset to end the search
+
+    Returns:
+        int: Offset of the line or -1 if there is no such line
+    """
+    if end is None:
+        end = len(buffer)
+    position = buffer.find(keyword, start, end)
+    while position >= 0:
+        line_start = buffer.rfind(b"\n", 0, position) + 1
+        if (
+            line_start >= start
+            and len(buffer[line_start:position].strip()) == 0
+            and buffer[position + len(keyword) : position + len(keyword) + 1].isspace()
+        ):
+            return line_start
+        position = buffer.find(keyword, position + 1, end)
+    return -1
+
+
+def _read_thermo_block(
+    buffer: Union[bytes, mmap.mmap],
+    columns: List[str],
+    start: int,
+    end: int,
+    chunk_size: int = 2**26,
+) -> pd.DataFrame:
+    """
+    Parse the thermo lines of a single run in chunks of complete lines.
+
+    Args:
+        buffer (bytes/mmap.mmap): Content of the log file
+        columns (list): Names of the thermo quantities
+        start (int): Offset of the first thermo line
+        end (int): Offset after the last thermo line
+        chunk_size (int): Maximum number of bytes parsed at once
+
+    Returns:
+        pandas.DataFrame: The thermo output of the run
+    """
+    chunks = []
+    while start < end:
+        stop = end
+        if end - start > chunk_size:
+            stop = buffer.rfind(b"\n", start, start + chunk_size) + 1
+            if stop <= start:
+                stop = buffer.find(b"\n", start + chunk_size, end) + 1 or end
+        chunks.append((start, stop))
+        start = stop
+    n_lines = sum([buffer[a:b].count(b"\n") for a, b in chunks])
+    arrays, n_rows = {}, 0
+    for a, b in chunks:
+        try:
+            df = pd.read_csv(
+                BytesIO(buffer[a:b]),
+                sep=r"\s+",
+                header=None,
+                names=columns,
+                index_col=False,
+                engine="c",
+                on_bad_lines="skip",
+            )
+        except pd.errors.EmptyDataError:
+            continue
+        for k in columns:
+            if df[k].dtype == object:
+                df[k] = pd.to_numeric(df[k], errors="coerce")
+        df = df.dropna(subset=columns[:1])
+        for k in columns:
+            values = df[k].to_numpy()
+            if k not in arrays:
+                arrays[k] = np.empty(n_lines, dtype=values.dtype)
+            elif not np.can_cast(values.dtype, arrays[k].dtype):
+                arrays[k] = arrays[k].astype(np.result_type(values, arrays[k]))
+            arrays[k][n_rows : n_rows + len(values)] = values
+        n_rows += len(df)
+    if n_rows < n_lines:
+        arrays = {k: v[:n_rows].copy() for k, v in arrays.items()}
+    if "Step" in arrays.keys():
+        arrays["Step"] = arrays["Step"].astype(int)
+    return pd.DataFrame(
+        {k: arrays.get(k, np.empty(0)) for k in columns}, columns=columns, copy=False
+    )
+
+
 def _raise_exception_if_errors_found(file_name: str) -> None:
     """
     Raises a `RuntimeError` if the `"ERROR"` tag is found in the file.
@@ -532,8 +1157,9 @@ def remap_indices(
     )
 
     structure_indices = np.array(lammps_indices)
-    for i_struct, i_lammps in enumerate(map_):
-        np.place(structure_indices, lammps_indices == i_lammps, i_struct)
-    # TODO: Vectorize this for-loop for computational efficiency
-
-    return structure_indices
+    if structure_indices.size == 0:
+        return structure_indices
+    # Lookup table from the lammps indices to the structure indices, indices which are not mapped are kept
+    lookup = np.arange(max(structure_indices.max(), map_.max()) + 1)
+    lookup[map_] = np.arange(len(map_))
+    return lookup[structure_indices.astype(int)].astype(structure_indices.dtype)
@@ -3,9 +3,9 @@
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
 import pandas as pd
-import shutil
 import os
 from pyiron_base import state, GenericParameters
+from pyiron_atomistics.atomistics.job.potential_cache import stage_potential_file
 from pyiron_atomistics.atomistics.job.potentials import (
     PotentialAbstract,
     find_potential_file_base,
@@ -100,7 +100,15 @@ class LammpsPotential(GenericParameters):
 
     def copy_pot_files(self, working_directory):
         if self.files is not None:
-            _ = [shutil.copy(path_pot, working_directory) for path_pot in self.files]
+            _ = [
+                stage_potential_file(
+                    path_lst=path_pot,
+                    destination=os.path.join(
+                        working_directory, os.path.basename(path_pot)
+                    ),
+                )
+                for path_pot in self.files
+            ]
 
     def get_element_lst(self):
         return list(self._df["Species"])[0]
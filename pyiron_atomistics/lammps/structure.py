@@ -4,6 +4,7 @@
 
 from __future__ import print_function
 from collections import OrderedDict
+import itertools
 import numpy as np
 import posixpath
 import decimal as dec
@@ -238,14 +239,13 @@ class LammpsStructure(object):
             self._structure.velocities *= uc.pyiron_to_lammps("velocity")
             vels = self.rotate_velocities(self._structure)
             input_str += "Velocities\n\n"
+            id_atoms = np.arange(1, len(vels) + 1)
             if self._structure.dimension == 3:
-                format_str = "{0:d} {1:f} {2:f} {3:f}\n"
-                for id_atom, (x, y, z) in enumerate(vels, start=1):
-                    input_str += format_str.format(id_atom, x, y, z)
+                x, y, z = vels.T
+                input_str += _format_rows("%d %f %f %f", [id_atoms, x, y, z])
             if self._structure.dimension == 2:
-                format_str = "{0:d} {1:f} {2:f}\n"
-                for id_atom, (x, y) in enumerate(vels, start=1):
-                    input_str += format_str.format(id_atom, x, y)
+                x, y = vels.T
+                input_str += _format_rows("%d %f %f", [id_atoms, x, y])
         self._string_input = input_str
 
     @property
@@ -300,7 +300,6 @@ class LammpsStructure(object):
         # analyze structure to get molecule_ids, bonds, angles etc
         coords = self.rotate_positions(self._structure)
 
-        elements = self._structure.get_chemical_symbols()
         el_list = self._structure.get_species_symbols()
         el_dict = OrderedDict()
         for object_id, el in enumerate(el_list):
@@ -322,6 +321,7 @@ class LammpsStructure(object):
                 bonds_lst = self.structure.get_bonds(radius=self.cutoff_radius)
             bonds = []
 
+            elements = self._structure.get_chemical_symbols()
             for ia, i_bonds in enumerate(bonds_lst):
                 el_i = el_dict[elements[ia]]
                 for el_j, b_lst in i_bonds.items():
@@ -357,29 +357,29 @@ class LammpsStructure(object):
 
         # atom_style bond
         # format: atom-ID, molecule-ID, atom_type, x, y, z
-        format_str = "{0:d} {1:d} {2:d} {3:f} {4:f} {5:f} "
+        format_str = "%d %d %d %f %f %f "
+        id_atoms = np.arange(1, len(coords) + 1)
+        id_mol = np.ones(len(coords), dtype=int)
+        id_species = self._species_to_atoms(
+            [el_dict[el.Abbreviation] + 1 for el in self._structure.species]
+        )
         if self._structure.dimension == 3:
-            for id_atom, (x, y, z) in enumerate(coords):
-                id_mol, id_species = 1, el_dict[elements[id_atom]]
-                atoms += (
-                    format_str.format(id_atom + 1, id_mol, id_species + 1, x, y, z)
-                    + "\n"
-                )
+            x, y, z = coords.T
+            atoms += _format_rows(format_str, [id_atoms, id_mol, id_species, x, y, z])
         elif self._structure.dimension == 2:
-            for id_atom, (x, y) in enumerate(coords):
-                id_mol, id_species = 1, el_dict[elements[id_atom]]
-                atoms += (
-                    format_str.format(id_atom + 1, id_mol, id_species + 1, x, y, 0.0)
-                    + "\n"
-                )
+            x, y = coords.T
+            atoms += _format_rows(
+                format_str, [id_atoms, id_mol, id_species, x, y, np.zeros(len(x))]
+            )
         else:
             raise ValueError("dimension 1 not yet implemented")
 
         bonds_str = "Bonds \n\n"
-        for i_bond, (i_a, i_b, b_type) in enumerate(bonds):
-            bonds_str += (
-                "{0:d} {1:d} {2:d} {3:d}".format(i_bond + 1, b_type, i_a, i_b) + "\n"
-            )
+        bonds = np.asarray(bonds, dtype=int).reshape(-1, 3)
+        bonds_str += _format_rows(
+            "%d %d %d %d",
+            [np.arange(1, len(bonds) + 1), bonds[:, 2], bonds[:, 0], bonds[:, 1]],
+        )
 
         return (
             atomtypes
@@ -411,8 +411,9 @@ class LammpsStructure(object):
             q_dict[species_name] = self.potential.get_charge(species_name)
             species_translate_list.append(self.potential.get_element_id(species_name))
         sorted_species_list = np.array(self._potential.get_element_lst())
-        molecule_lst, bonds_lst, angles_lst = [], [], []
+        bonds_lst, angles_lst = np.zeros((0, 2), dtype=int), np.zeros((0, 3), dtype=int)
         bond_type_lst, angle_type_lst = [], []
+        id_atoms = np.zeros(0, dtype=int)
         # Using a cutoff distance to draw the bonds instead of the number of neighbors
         # Only if any bonds are defined
         if len(self._bond_dict.keys()) > 0:
@@ -424,11 +425,11 @@ class LammpsStructure(object):
             neighbors = self._structure.get_neighbors_by_distance(
                 cutoff_radius=max_cutoff
             )
-            id_mol = 0
-            indices = self._structure.indices
-            for id_el, id_species in enumerate(indices):
-                id_mol += 1
-                molecule_lst.append([id_el, id_mol, species_translate_list[id_species]])
+            # Neighbors sorted by distance, padded with invalid indices and infinite distances
+            neighbor_indices = neighbors.filled.indices
+            neighbor_distances = neighbors.filled.distances
+            id_atoms = np.arange(len(self._structure))
+            bonds_all, bond_types_all, angles_all, angle_types_all = [], [], [], []
             # Draw bonds between atoms is defined in self._bond_dict
             # Go through all elements for which bonds are defined
             for element, val in self._bond_dict.items():
@@ -436,42 +437,50 @@ class LammpsStructure(object):
                 if el_1_list is not None:
                     if len(el_1_list) > 0:
                         for i, v in enumerate(val["element_list"]):
-                            el_2_list = self._structure.select_index(v)
-                            cutoff_dist = val["cutoff_list"][i]
-                            for j, ind in enumerate(
-                                np.array(neighbors.indices, dtype=object)[el_1_list]
-                            ):
-                                # Only chose those indices within the cutoff distance and which belong
-                                # to the species defined in the element_list
-                                # i is the index of each bond type, and j is the element index
-                                id_el = el_1_list[j]
-                                bool_1 = (
-                                    np.array(neighbors.distances, dtype=object)[id_el]
-                                    <= cutoff_dist
+                            ind = neighbor_indices[el_1_list]
+                            # Only chose those indices within the cutoff distance and which belong
+                            # to the species defined in the element_list
+                            mask = (
+                                neighbor_distances[el_1_list] <= val["cutoff_list"][i]
+                            ) & np.isin(ind, self._structure.select_index(v))
+                            # Draw only maximum allowed bonds
+                            count = np.cumsum(mask, axis=1)
+                            mask &= count <= val["max_bond_list"][i]
+                            rows, cols = np.nonzero(mask)
+                            bonds_all.append(
+                                np.stack(
+                                    [el_1_list[rows] + 1, ind[rows, cols] + 1], axis=1
                                 )
-                                act_ind = ind[bool_1]
-                                bool_2 = np.in1d(act_ind, el_2_list)
-                                final_ind = act_ind[bool_2]
-                                # Get the bond and angle type
-                                bond_type = val["bond_type_list"][i]
-                                angle_type = val["angle_type_list"][i]
-                                # Draw only maximum allowed bonds
-                                final_ind = final_ind[: val["max_bond_list"][i]]
-                                for fi in final_ind:
-                                    bonds_lst.append([id_el + 1, fi + 1])
-                                    bond_type_lst.append(bond_type)
-                                # Draw angles if at least 2 bonds are present and if an angle type is defined for this
-                                # particular set of bonds
-                                if (
-                                    len(final_ind) >= 2
-                                    and val["angle_type_list"][i] is not None
-                                ):
-                                    angles_lst.append(
-                                        [final_ind[0] + 1, id_el + 1, final_ind[1] + 1]
+                            )
+                            bond_types_all.append(
+                                np.full(len(rows), val["bond_type_list"][i])
+                            )
+                            # Draw angles if at least 2 bonds are present and if an angle type is defined for this
+                            # particular set of bonds
+                            if val["angle_type_list"][i] is not None:
+                                has_angle = mask.sum(axis=1) >= 2
+                                first = np.argmax(mask & (count == 1), axis=1)
+                                second = np.argmax(mask & (count == 2), axis=1)
+                                angle_rows = np.flatnonzero(has_angle)
+                                angles_all.append(
+                                    np.stack(
+                                        [
+                                            ind[angle_rows, first[angle_rows]] + 1,
+                                            el_1_list[angle_rows] + 1,
+                                            ind[angle_rows, second[angle_rows]] + 1,
+                                        ],
+                                        axis=1,
                                     )
-                                    angle_type_lst.append(angle_type)
-            m_lst = np.array(molecule_lst)
-            molecule_lst = m_lst[m_lst[:, 0].argsort()]
+                                )
+                                angle_types_all.append(
+                                    np.full(len(angle_rows), val["angle_type_list"][i])
+                                )
+            if len(bonds_all) > 0:
+                bonds_lst = np.concatenate(bonds_all)
+                bond_type_lst = np.concatenate(bond_types_all)
+            if len(angles_all) > 0:
+                angles_lst = np.concatenate(angles_all)
+                angle_type_lst = np.concatenate(angle_types_all)
 
         if len(bond_type_lst) == 0:
             num_bond_types = 0
@@ -508,46 +517,53 @@ class LammpsStructure(object):
         atoms = "Atoms \n\n"
 
         # format: atom-ID, molecule-ID, atom_type, q, x, y, z
-        format_str = "{0:d} {1:d} {2:d} {3:f} {4:f} {5:f} {6:f}"
-        for atom in molecule_lst:
-            id_atom, id_mol, id_species = atom
-            x, y, z = coords[id_atom]
-            ind = np.argwhere(np.array(species_translate_list) == id_species).flatten()[
-                0
+        species_translate_list = np.array(species_translate_list)
+        q_lst = [
+            q_dict[
+                self._structure.species[
+                    np.argwhere(species_translate_list == id_species).flatten()[0]
+                ].Abbreviation
             ]
-            el_id = self._structure.species[ind].Abbreviation
-            atoms += (
-                format_str.format(
-                    id_atom + 1, id_mol, id_species, q_dict[el_id], x, y, z
-                )
-                + "\n"
-            )
+            for id_species in species_translate_list
+        ]
+        x, y, z = coords[id_atoms].T
+        atoms += _format_rows(
+            "%d %d %d %f %f %f %f",
+            [
+                id_atoms + 1,
+                id_atoms + 1,
+                self._species_to_atoms(species_translate_list)[id_atoms],
+                self._species_to_atoms(q_lst)[id_atoms],
+                x,
+                y,
+                z,
+            ],
+        )
 
         if len(bonds_lst) > 0:
-            bonds_str = "Bonds \n\n"
-            for i_bond, id_vec in enumerate(bonds_lst):
-                bonds_str += (
-                    "{0:d} {1:d} {2:d} {3:d}".format(
-                        i_bond + 1, bond_type_lst[i_bond], id_vec[0], id_vec[1]
-                    )
-                    + "\n"
-                )
+            bonds_str = "Bonds \n\n" + _format_rows(
+                "%d %d %d %d",
+                [
+                    np.arange(1, len(bonds_lst) + 1),
+                    bond_type_lst,
+                    bonds_lst[:, 0],
+                    bonds_lst[:, 1],
+                ],
+            )
         else:
             bonds_str = "\n"
 
         if len(angles_lst) > 0:
-            angles_str = "Angles \n\n"
-            for i_angle, id_vec in enumerate(angles_lst):
-                angles_str += (
-                    "{0:d} {1:d} {2:d} {3:d} {4:d}".format(
-                        i_angle + 1,
-                        angle_type_lst[i_angle],
-                        id_vec[0],
-                        id_vec[1],
-                        id_vec[2],
-                    )
-                    + "\n"
-                )
+            angles_str = "Angles \n\n" + _format_rows(
+                "%d %d %d %d %d",
+                [
+                    np.arange(1, len(angles_lst) + 1),
+                    angle_type_lst,
+                    angles_lst[:, 0],
+                    angles_lst[:, 1],
+                    angles_lst[:, 2],
+                ],
+            )
         else:
             angles_str = "\n"
         return (
@@ -593,21 +609,19 @@ class LammpsStructure(object):
 
         coords = self.rotate_positions(self._structure)
         el_charge_lst = self._structure.get_initial_charges()
-        el_lst = self._structure.get_chemical_symbols()
         el_alphabet_dict = {}
         for ind, el in enumerate(self._structure.get_species_symbols()):
             el_alphabet_dict[el] = ind + 1
-        for id_atom, (el, coord) in enumerate(zip(el_lst, coords)):
-            id_el = el_alphabet_dict[el]
-            dim = self._structure.dimension
-            c = np.zeros(3)
-            c[:dim] = coord
-            atoms += (
-                "{0:d} {1:d} {2:f} {3:.15f} {4:.15f} {5:.15f}".format(
-                    id_atom + 1, id_el, el_charge_lst[id_atom], c[0], c[1], c[2]
-                )
-                + "\n"
-            )
+        id_el = self._species_to_atoms(
+            [el_alphabet_dict[el.Abbreviation] for el in self._structure.species]
+        )
+        dim = self._structure.dimension
+        c = np.zeros((len(coords), 3))
+        c[:, :dim] = coords
+        atoms += _format_rows(
+            "%d %d %f %.15f %.15f %.15f",
+            [np.arange(1, len(c) + 1), id_el, el_charge_lst, c[:, 0], c[:, 1], c[:, 2]],
+        )
         return atomtypes + "\n" + cell_dimesions + "\n" + masses + "\n" + atoms + "\n"
 
     def structure_atomic(self):
@@ -646,23 +660,20 @@ class LammpsStructure(object):
 
         coords = self.rotate_positions(self._structure)
 
-        el_lst = self._structure.get_chemical_elements()
-        for id_atom, (el, coord) in enumerate(zip(el_lst, coords)):
-            if el in el_dict.keys():
-                id_el = el_dict[el]
-            else:
-                raise ValueError(
-                    "Selected potential does not support the existing chemical composition"
-                )
-            dim = self._structure.dimension
-            c = np.zeros(3)
-            c[:dim] = coord
-            atoms += (
-                "{0:d} {1:d} {2:.15f} {3:.15f} {4:.15f}".format(
-                    id_atom + 1, id_el, c[0], c[1], c[2]
-                )
-                + "\n"
+        id_el = self._species_to_atoms(
+            [el_dict.get(el, 0) for el in self._structure.species]
+        )
+        if np.any(id_el == 0):
+            raise ValueError(
+                "Selected potential does not support the existing chemical composition"
             )
+        dim = self._structure.dimension
+        c = np.zeros((len(coords), 3))
+        c[:, :dim] = coords
+        atoms += _format_rows(
+            "%d %d %.15f %.15f %.15f",
+            [np.arange(1, len(c) + 1), id_el, c[:, 0], c[:, 1], c[:, 2]],
+        )
         return atomtypes + "\n" + cell_dimesions + "\n" + masses + "\n" + atoms + "\n"
 
     def rotate_positions(self, structure):
@@ -673,11 +684,10 @@ class LammpsStructure(object):
             structure: Atoms-like object. Should has .positions attribute
 
         Returns:
-            (list): List of rotated coordinates
+            (numpy.ndarray): Rotated coordinates
         """
         prism = UnfoldingPrism(self._structure.cell)
-        coords = [prism.pos_to_lammps(position) for position in structure.positions]
-        return coords
+        return np.matmul(structure.positions, prism.R)
 
     def rotate_velocities(self, structure):
         """
@@ -687,11 +697,22 @@ class LammpsStructure(object):
             structure: Atoms-like object. Should have .velocities attribute.
 
         Returns:
-            (list): List of rotated velocities
+            (numpy.ndarray): Rotated velocities
         """
         prism = UnfoldingPrism(self._structure.cell)
-        vels = [prism.pos_to_lammps(vel) for vel in structure.velocities]
-        return vels
+        return np.matmul(structure.velocities, prism.R)
+
+    def _species_to_atoms(self, species_values):
+        """
+        Assign a value given for each species of the structure to all atoms of this species.
+
+        Args:
+            species_values (list): values in the order of structure.species
+
+        Returns:
+            numpy.ndarray: value of each atom
+        """
+        return np.asarray(species_values)[self._structure.indices]
 
     def write_file(self, file_name, cwd=None):
         """
@@ -705,8 +726,28 @@ class LammpsStructure(object):
             file_name = posixpath.join(cwd, file_name)
 
         with open(file_name, "w") as f:
-            for line in self._string_input:
-                f.write(line)
+            f.write(self._string_input)
+
+
+def _format_rows(row_format, columns):
+    """
+    Format a table with a single string formatting operation instead of formatting every row on its own, which
+    dominates the time to write the structure of large systems.
+
+    Args:
+        row_format (str): printf-style format of a single row, without the line break
+        columns (list): columns of the table, all of the same length
+
+    Returns:
+        str: formatted rows, each terminated by a line break
+    """
+    columns = [np.asarray(column).tolist() for column in columns]
+    n_rows = len(columns[0])
+    if n_rows == 0:
+        return ""
+    return ((row_format + "\n") * n_rows) % tuple(
+        itertools.chain.from_iterable(zip(*columns))
+    )
 
 
 def write_lammps_datafile(structure, file_name="lammps.data", cwd=None):
@@ -4,6 +4,8 @@
 
 from __future__ import print_function, division
 
+from collections import OrderedDict
+import io
 import numpy as np
 import os
 import posixpath
@@ -1359,7 +1361,7 @@ class SphinxBase(GenericDFTJob):
             f.write("//SPHInX input file generated by pyiron\n\n")
             f.write("format paw;\n")
             f.write("include <parameters.sx>;\n\n")
-            f.write(self.input.sphinx.to_sphinx(indent=0))
+            self.input.sphinx.write_sphinx(stream=f, indent=0)
 
     @property
     def _spin_enabled(self):
@@ -2089,60 +2091,389 @@ class Group(DataContainer):
             del self[name]
 
     def to_sphinx(self, content="__self__", indent=0):
-        if content == "__self__":
-            content = self
+        """
+        Render the group in the SPHInX input format.
 
-        def format_value(v):
-            if isinstance(v, bool):
-                if v:
-                    return ";"
-                else:
-                    return " = false;"
-            elif isinstance(v, Group):
-                if len(v) == 0:
-                    return " {}"
-                else:
-                    return " {\n" + self.to_sphinx(v, indent + 1) + indent * "\t" + "}"
-            else:
-                if isinstance(v, np.ndarray):
-                    v = v.tolist()
-                return " = {!s};".format(v)
+        Args:
+            content (Group/dict): group to render, defaults to the group itself
+            indent (int): indentation level of the top level entries
+
+        Returns:
+            str: SPHInX input
+        """
+        stream = io.StringIO()
+        self.write_sphinx(stream=stream, content=content, indent=indent)
+        return stream.getvalue()
+
+    def write_sphinx(self, stream, content="__self__", indent=0):
+        """
+        Write the group in the SPHInX input format to a text stream.
 
-        line = ""
+        The rendered text of the direct subgroups is cached by their content, so subgroups shared between many jobs,
+        like the basis or the Hamiltonian, are only formatted once. The cache is emptied by clear_sphinx_group_cache().
+
+        Args:
+            stream (io.TextIOBase): stream to write the SPHInX input to
+            content (Group/dict): group to render, defaults to the group itself
+            indent (int): indentation level of the top level entries
+        """
+        if isinstance(content, str) and content == "__self__":
+            content = self
         for k, v in content.items():
-            if isinstance(v, Group) and len(v) > 0 and not v.has_keys():
-                for vv in v.values():
-                    line += indent * "\t" + str(k) + format_value(vv) + "\n"
+            if isinstance(v, Group) and len(v) > 0:
+                stream.write(_get_cached_group_text(k, v, indent))
             else:
-                line += indent * "\t" + str(k) + format_value(v) + "\n"
+                lines = []
+                _format_sphinx_entry(lines, str(k), v, indent)
+                stream.write("".join(lines))
+
+
+# Rendered SPHInX input of subgroups, like the basis or the Hamiltonian, which are shared between many jobs. The keys
+# are (name, indentation, fingerprint) with the fingerprint from _get_group_fingerprint(), so a modified group never
+# matches the text of its previous content. The cache is process wide, keeps the _SPHINX_GROUP_CACHE_SIZE most
+# recently used entries and is emptied by clear_sphinx_group_cache().
+_SPHINX_GROUP_CACHE = OrderedDict()
+_SPHINX_GROUP_CACHE_SIZE = 128
+# groups with more entries, typically the structure, change from job to job and are formatted without the cache
+_SPHINX_GROUP_CACHE_MAX_ENTRIES = 1000
+
+
+def clear_sphinx_group_cache():
+    """
+    Remove the rendered SPHInX input of all subgroups from the cache used by Group.write_sphinx().
+    """
+    _SPHINX_GROUP_CACHE.clear()
+
+
+def _get_group_fingerprint(group, max_entries=_SPHINX_GROUP_CACHE_MAX_ENTRIES):
+    """
+    Hashable representation of the content of a group, which determines its SPHInX input.
+
+    Args:
+        group (Group): group
+        max_entries (int): maximum number of entries including the entries of all subgroups
+
+    Returns:
+        tuple/None: number of entries followed by the fingerprint of every entry, None if the group has more than
+            max_entries entries
+    """
+    items = list(group.items())
+    n_entries = len(items)
+    if n_entries > max_entries:
+        return None
+    fingerprint = []
+    for k, v in items:
+        if isinstance(v, np.ndarray):
+            fingerprint.append((k, v.dtype.str, v.shape, v.tobytes()))
+        elif isinstance(v, (bool, str, int, float)) or not isinstance(v, Group):
+            fingerprint.append((k, type(v), str(v)))
+        else:
+            sub_fingerprint = _get_group_fingerprint(
+                v, max_entries=max_entries - n_entries
+            )
+            if sub_fingerprint is None:
+                return None
+            n_entries += sub_fingerprint[0]
+            fingerprint.append((k, Group, sub_fingerprint))
+    return (n_entries,) + tuple(fingerprint)
+
+
+def _get_cached_group_text(key, group, indent):
+    """
+    Render a non-empty subgroup in the SPHInX input format, reusing the text of a subgroup with the same content.
+
+    Args:
+        key (str/int): name of the subgroup
+        group (Group): subgroup
+        indent (int): indentation level of the subgroup
+
+    Returns:
+        str: SPHInX input of the subgroup
+    """
+    fingerprint = _get_group_fingerprint(group)
+    cache_key = (str(key), indent, fingerprint)
+    text = _SPHINX_GROUP_CACHE.get(cache_key) if fingerprint is not None else None
+    if text is None:
+        lines = []
+        _format_sphinx_entry(lines, str(key), group, indent)
+        text = "".join(lines)
+        if fingerprint is not None:
+            _SPHINX_GROUP_CACHE[cache_key] = text
+            if len(_SPHINX_GROUP_CACHE) > _SPHINX_GROUP_CACHE_SIZE:
+                _SPHINX_GROUP_CACHE.popitem(last=False)
+    else:
+        _SPHINX_GROUP_CACHE.move_to_end(cache_key)
+    return text
+
+
+def _format_sphinx_entry(lines, key, value, indent):
+    """
+    Format a single entry of a group in the SPHInX input format, a group without keys is formatted as repeated entry.
 
-        return line
+    Args:
+        lines (list): list of strings the SPHInX input is appended to
+        key (str): name of the entry
+        value: flag, parameter or group
+        indent (int): indentation level of the entry
+    """
+    if (
+        not isinstance(value, (bool, np.ndarray, str, int, float))
+        and isinstance(value, Group)
+        and len(value) > 0
+        and not value.has_keys()
+    ):
+        values = [v for _, v in value.items()]
+        if not _format_sphinx_group_table(lines, key, values, indent):
+            for v in values:
+                _format_sphinx_value(lines, key, v, indent)
+    else:
+        _format_sphinx_value(lines, key, value, indent)
+
+
+def _format_sphinx_group_table(lines, key, groups, indent):
+    """
+    Format repeated groups with the same parameters, like the atoms of a species, column by column. The arrays of each
+    parameter are stacked and converted in a single call.
+
+    Args:
+        lines (list): list of strings the SPHInX input is appended to
+        key (str): name of the repeated groups
+        groups (list): repeated groups
+        indent (int): indentation level of the repeated groups
+
+    Returns:
+        bool: False if the groups do not share the same parameters and have to be formatted one by one
+    """
+    if len(groups) < 2 or not all(
+        isinstance(g, Group) and len(g) > 0 and g.has_keys() for g in groups
+    ):
+        return False
+    rows = [list(g.items()) for g in groups]
+    keys = [k for k, _ in rows[0]]
+    if any([k for k, _ in row] != keys for row in rows):
+        return False
+    columns = []
+    for column in zip(*[[v for _, v in row] for row in rows]):
+        first = column[0]
+        if (
+            isinstance(first, np.ndarray)
+            and first.dtype.kind in "iuf"
+            and all(
+                isinstance(v, np.ndarray)
+                and v.shape == first.shape
+                and v.dtype == first.dtype
+                for v in column
+            )
+        ):
+            columns.append([" = " + str(v) + ";\n" for v in np.stack(column).tolist()])
+        elif all(isinstance(v, (bool, str, int, float)) for v in column):
+            columns.append([_format_sphinx_scalar(v) for v in column])
+        else:
+            return False
+    inner = [(indent + 1) * "\t" + str(k) for k in keys]
+    start = indent * "\t" + key + " {\n"
+    end = indent * "\t" + "}\n"
+    for row in zip(*columns):
+        lines.append(start + "".join([k + v for k, v in zip(inner, row)]) + end)
+    return True
+
+
+def _format_sphinx_scalar(value):
+    """
+    Format the assignment of a flag or a parameter in the SPHInX input format.
+
+    Args:
+        value (bool/str/int/float): flag or parameter
+
+    Returns:
+        str: assignment including the trailing newline
+    """
+    if isinstance(value, bool):
+        return ";\n" if value else " = false;\n"
+    return " = {!s};\n".format(value)
+
+
+def _format_sphinx_value(lines, key, value, indent):
+    """
+    Format a flag, a parameter or a group in the SPHInX input format.
+
+    Args:
+        lines (list): list of strings the SPHInX input is appended to
+        key (str): name of the value
+        value: flag, parameter or group
+        indent (int): indentation level of the value
+    """
+    prefix = indent * "\t" + key
+    if isinstance(value, np.ndarray):
+        lines.append(prefix + " = " + str(value.tolist()) + ";\n")
+    elif isinstance(value, (bool, str, int, float)) or not isinstance(value, Group):
+        lines.append(prefix + _format_sphinx_scalar(value))
+    elif len(value) == 0:
+        lines.append(prefix + " {}\n")
+    else:
+        lines.append(prefix + " {\n")
+        for k, v in value.items():
+            _format_sphinx_entry(lines, str(k), v, indent + 1)
+        lines.append(indent * "\t" + "}\n")
 
 
 def splitter(arr, counter):
+    """
+    Split values into ionic steps, a new ionic step starts whenever the SCF counter returns to its minimum.
+
+    Args:
+        arr (list/numpy.ndarray): values, one per SCF step
+        counter (list/numpy.ndarray): SCF counter, one per SCF step
+
+    Returns:
+        list: per ionic step nested lists of values
+    """
     if len(arr) == 0 or len(counter) == 0:
         return []
-    arr_new = []
-    spl_loc = list(np.where(np.array(counter) == min(counter))[0])
-    spl_loc.append(None)
-    for ii, ll in enumerate(spl_loc[:-1]):
-        arr_new.append(np.array(arr[ll : spl_loc[ii + 1]]).tolist())
-    return arr_new
+    return _split_steps(np.asarray(arr), _get_step_offsets(counter))
+
+
+def _get_step_offsets(counter):
+    """
+    Offsets of the ionic steps in the flat array of SCF steps.
+
+    Args:
+        counter (list/numpy.ndarray): SCF counter, one per SCF step
+
+    Returns:
+        numpy.ndarray: index of the first SCF step of each ionic step
+    """
+    counter = np.asarray(counter)
+    return np.flatnonzero(counter == counter.min())
+
+
+def _split_steps(values, offsets):
+    """
+    Split a flat array of SCF steps into ragged ionic steps.
+
+    Args:
+        values (numpy.ndarray): values, one per SCF step along the first axis
+        offsets (numpy.ndarray): index of the first SCF step of each ionic step
+
+    Returns:
+        list: per ionic step nested lists of values
+    """
+    values = values.tolist()
+    bounds = offsets.tolist() + [len(values)]
+    return [values[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+
+
+def _read_dat_file(file_name):
+    """
+    Read a SPHInX .dat output in a single pass into a flat table with one row per line.
+
+    Args:
+        file_name (str): path of the .dat file
+
+    Returns:
+        numpy.ndarray/None: table of shape (n_lines, n_columns), None if the file is missing or empty
+    """
+    if not os.path.isfile(file_name):
+        return None
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        values = np.loadtxt(file_name, ndmin=2)
+    if values.size == 0:
+        return None
+    return values
+
+
+_SPHINX_LOG_KEYS = {
+    "F(": "energy_free",
+    "eTot(": "energy_int",
+    "Species": "species",
+    "nu(": "magnetic_forces",
+    "final eig [eV]:": "band_energy",
+    "final focc:": "occupancy",
+    "Fermi energy:": "fermi",
+    "Z=": "n_valence",
+    "b1:": "rec_cell",
+    "b2:": "rec_cell",
+    "b3:": "rec_cell",
+    "Omega:": "volume",
+    "SCF calculation": "scf",
+    "The spin for the label": "spin",
+    "Enter Main Loop": "main",
+    "Program exited normally.": "finished",
+    "Convergence reached.": "convergence",
+    "WARNING: Maximum number of steps exceeded": "convergence",
+}
+
+_SPHINX_LOG_LINE = re.compile(
+    r"\n(?P<prefix>\|[ \t]*)?(?P<key>F\(|eTot\((?=[0-9])|Species|nu\(|final eig \[eV\]:|final focc:|Fermi energy:"
+    r"|Z=|b[1-3]:|Omega:|SCF calculation|The spin for the label|Enter Main Loop|Program exited normally\."
+    r"|Convergence reached\.|WARNING: Maximum number of steps exceeded)(?P<value>[^\n]*)"
+)
+
+# Line prefix required by the original anchored patterns, None for patterns which may follow any "|" decoration
+_SPHINX_LOG_PREFIX = {
+    "energy_int": "",
+    "species": "",
+    "magnetic_forces": "",
+    "n_valence": "| ",
+    "scf": "| ",
+}
 
 
 class _SphinxLogParser:
     def __init__(self, log_file):
         self.log_file = log_file
+        self._index_log_file()
         self._check_enter_scf()
         self._log_main = None
+        self._log_k_points = None
         self._counter = None
         self._n_atoms = None
         self._n_steps = None
         self._spin_enabled = None
 
+    def _index_log_file(self):
+        """
+        Index the relevant lines of the log file in a single pass. Every line is stored with its offset in the log
+        file as (offset, key, value) under the name of the quantity, separately for the lines before and after the
+        start of the main loop. The pattern starts with the line break, so the regular expression engine can skip
+        from line to line.
+        """
+        self._index_head = {name: [] for name in _SPHINX_LOG_KEYS.values()}
+        self._index_main = {name: [] for name in _SPHINX_LOG_KEYS.values()}
+        index = self._index_head
+        for match in _SPHINX_LOG_LINE.finditer("\n" + self.log_file):
+            key = match.group("key")
+            name = _SPHINX_LOG_KEYS[key]
+            prefix = _SPHINX_LOG_PREFIX.get(name, None)
+            if prefix is not None and (match.group("prefix") or "") != prefix:
+                continue
+            index[name].append((match.start("key") - 1, key, match.group("value")))
+            if name == "main" and index is self._index_head:
+                index = self._index_main
+
+    def _get_lines(self, name, main=True):
+        """
+        Lines of a given quantity in the format "key value"
+
+        Args:
+            name (str): Name of the quantity
+            main (bool): Only consider the lines of the main loop
+
+        Returns:
+            list: Lines starting with the key of the quantity
+        """
+        lines = [key + value for _, key, value in self._index_main[name]]
+        if not main:
+            lines = [key + value for _, key, value in self._index_head[name]] + lines
+        return lines
+
+    def _get_values(self, name):
+        return [value for _, _, value in self._index_main[name]]
+
     @property
     def spin_enabled(self):
-        return len(re.findall("The spin for the label", self.log_file)) > 0
+        return len(self._get_lines("spin", main=False)) > 0
 
     @property
     def log_main(self):
@@ -2153,42 +2484,43 @@ class _SphinxLogParser:
 
     @property
     def job_finished(self):
-        if (
-            len(re.findall("Program exited normally.", self.log_file, re.MULTILINE))
-            == 0
-        ):
+        if len(self._get_lines("finished", main=False)) == 0:
             warnings.warn("scf loops did not converge")
             return False
         return True
 
     def _check_enter_scf(self):
-        if len(re.findall("Enter Main Loop", self.log_file, re.MULTILINE)) == 0:
+        if len(self._index_head["main"]) == 0:
             raise AssertionError("Log file created but first scf loop not reached")
 
     def get_n_valence(self):
-        log = self.log_file.split("\n")
-        return {
-            log[ii - 1].split()[1]: int(ll.split("=")[-1])
-            for ii, ll in enumerate(log)
-            if ll.startswith("| Z=")
-        }
+        n_valence = {}
+        for index in [self._index_head, self._index_main]:
+            for offset, _, value in index["n_valence"]:
+                line_start = self.log_file.rfind("\n", 0, offset - 1) + 1
+                previous_start = self.log_file.rfind("\n", 0, line_start - 1) + 1
+                previous_line = self.log_file[previous_start : line_start - 1]
+                n_valence[previous_line.split()[1]] = int(value.split("=")[-1])
+        return n_valence
 
     @property
     def log_k_points(self):
-        start_match = re.search(
-            "-ik-     -x-      -y-       -z-    \|  -weight-    -nG-    -label-",
-            self.log_file,
-        )
-        log_part = self.log_file[start_match.end() + 1 :]
-        log_part = log_part[: re.search("^\n", log_part, re.MULTILINE).start()]
-        return log_part.split("\n")[:-2]
+        if self._log_k_points is None:
+            start_match = re.search(
+                "-ik-     -x-      -y-       -z-    \|  -weight-    -nG-    -label-",
+                self.log_file,
+            )
+            log_part = self.log_file[start_match.end() + 1 :]
+            log_part = log_part[: re.search("^\n", log_part, re.MULTILINE).start()]
+            self._log_k_points = log_part.split("\n")[:-2]
+        return self._log_k_points
 
     def get_bands_k_weights(self):
-        return np.array([float(kk.split()[6]) for kk in self.log_k_points])
+        return np.array([kk.split()[6] for kk in self.log_k_points], dtype=float)
 
     @property
     def _rec_cell(self):
-        log_extract = re.findall("b[1-3]:.*$", self.log_file, re.MULTILINE)
+        log_extract = self._get_lines("rec_cell", main=False)
         return (
             np.array([ll.split()[1:4] for ll in log_extract]).astype(float)
             / BOHR_TO_ANGSTROM
@@ -2199,12 +2531,10 @@ class _SphinxLogParser:
 
     @property
     def k_points(self):
-        return np.array(
-            [[float(kk.split()[i]) for i in range(2, 5)] for kk in self.log_k_points]
-        )
+        return np.array([kk.split()[2:5] for kk in self.log_k_points], dtype=float)
 
     def get_volume(self):
-        volume = re.findall("Omega:.*$", self.log_file, re.MULTILINE)
+        volume = self._get_lines("volume", main=False)
         if len(volume) > 0:
             volume = float(volume[0].split()[1])
             volume *= BOHR_TO_ANGSTROM**3
@@ -2217,92 +2547,99 @@ class _SphinxLogParser:
         if self._counter is None:
             self._counter = [
                 int(re.sub("[^0-9]", "", line.split("=")[0]))
-                for line in re.findall("F\(.*$", self.log_main, re.MULTILINE)
+                for line in self._get_lines("energy_free")
             ]
         return self._counter
 
     def get_energy_free(self):
-        return splitter(
-            [
-                float(line.split("=")[1]) * HARTREE_TO_EV
-                for line in re.findall("F\(.*$", self.log_main, re.MULTILINE)
-            ],
-            self.counter,
+        energies = np.array(
+            [line.split("=")[1] for line in self._get_lines("energy_free")],
+            dtype=float,
         )
+        return splitter(energies * HARTREE_TO_EV, self.counter)
 
     def get_energy_int(self):
-        return splitter(
+        energies = np.array(
             [
-                float(line.replace("=", " ").replace(",", " ").split()[1])
-                * HARTREE_TO_EV
-                for line in re.findall("^eTot\([0-9].*$", self.log_main, re.MULTILINE)
+                line.replace("=", " ").replace(",", " ").split()[1]
+                for line in self._get_lines("energy_int")
             ],
-            self.counter,
+            dtype=float,
         )
+        return splitter(energies * HARTREE_TO_EV, self.counter)
 
     @property
     def n_atoms(self):
         if self._n_atoms is None:
             self._n_atoms = len(
-                np.unique(re.findall("^Species.*\{", self.log_main, re.MULTILINE))
+                np.unique(
+                    [
+                        line[: line.rindex("{") + 1]
+                        for line in self._get_lines("species")
+                        if "{" in line
+                    ]
+                )
             )
         return self._n_atoms
 
     def get_forces(self, spx_to_pyi=None):
-        forces = [
-            float(re.split("{|}", line)[1].split(",")[i])
-            * HARTREE_OVER_BOHR_TO_EV_OVER_ANGSTROM
-            for line in re.findall("^Species.*$", self.log_main, re.MULTILINE)
-            for i in range(3)
-        ]
-        if len(forces) != 0:
-            forces = np.array(forces).reshape(-1, self.n_atoms, 3)
-            if spx_to_pyi is not None:
-                for ii, ff in enumerate(forces):
-                    forces[ii] = ff[spx_to_pyi]
+        lines = self._get_values("species")
+        if len(lines) == 0:
+            return []
+        forces = np.fromstring(
+            ",".join(
+                ",".join(re.split("{|}", line)[1].split(",")[:3]) for line in lines
+            ),
+            sep=",",
+        )
+        forces = forces.reshape(-1, self.n_atoms, 3) * (
+            HARTREE_OVER_BOHR_TO_EV_OVER_ANGSTROM
+        )
+        if spx_to_pyi is not None:
+            forces = forces[:, spx_to_pyi]
         return forces
 
     def get_magnetic_forces(self, spx_to_pyi=None):
         magnetic_forces = [
-            HARTREE_TO_EV * float(line.split()[-1])
-            for line in re.findall("^nu\(.*$", self.log_main, re.MULTILINE)
+            line.split()[-1] for line in self._get_lines("magnetic_forces")
         ]
         if len(magnetic_forces) != 0:
-            magnetic_forces = np.array(magnetic_forces).reshape(-1, self.n_atoms)
+            magnetic_forces = HARTREE_TO_EV * np.array(
+                magnetic_forces, dtype=float
+            ).reshape(-1, self.n_atoms)
             if spx_to_pyi is not None:
-                for ii, mm in enumerate(magnetic_forces):
-                    magnetic_forces[ii] = mm[spx_to_pyi]
+                magnetic_forces = magnetic_forces[:, spx_to_pyi]
         return splitter(magnetic_forces, self.counter)
 
     @property
     def n_steps(self):
         if self._n_steps is None:
-            self._n_steps = len(
-                re.findall("\| SCF calculation", self.log_file, re.MULTILINE)
-            )
+            self._n_steps = len(self._get_lines("scf", main=False))
         return self._n_steps
 
-    def _parse_band(self, term):
-        arr = np.loadtxt(re.findall(term, self.log_main, re.MULTILINE))
+    def _parse_band(self, name):
+        values = self._get_values(name)
+        if len(values) == 0:
+            arr = np.loadtxt(values)
+        else:
+            arr = np.fromstring(" ".join(values), sep=" ").reshape(len(values), -1)
         shape = (-1, len(self.k_points), arr.shape[-1])
         if self.spin_enabled:
             shape = (-1, 2, len(self.k_points), shape[-1])
         return arr.reshape(shape)
 
     def get_band_energy(self):
-        return self._parse_band("final eig \[eV\]:(.*)$")
+        return self._parse_band("band_energy")
 
     def get_occupancy(self):
-        return self._parse_band("final focc:(.*)$")
+        return self._parse_band("occupancy")
 
     def get_convergence(self):
         conv_dict = {
             "WARNING: Maximum number of steps exceeded": False,
             "Convergence reached.": True,
         }
-        key = "|".join(list(conv_dict.keys())).replace(".", "\.")
-        items = re.findall(key, self.log_main, re.MULTILINE)
-        convergence = [conv_dict[k] for k in items]
+        convergence = [conv_dict[key] for _, key, _ in self._index_main["convergence"]]
         diff = self.n_steps - len(convergence)
         for _ in range(diff):
             convergence.append(False)
@@ -2310,10 +2647,7 @@ class _SphinxLogParser:
 
     def get_fermi(self):
         return np.array(
-            [
-                float(line.split()[2])
-                for line in re.findall("Fermi energy:.*$", self.log_main, re.MULTILINE)
-            ]
+            [line.split()[2] for line in self._get_lines("fermi")], dtype=float
         )
 
 
@@ -2332,107 +2666,96 @@ class Output:
 
     def collect_spins_dat(self, file_name="spins.dat", cwd=None):
         """
+        Collect the atomic spins of every SCF step from the spins.dat file.
 
         Args:
-            file_name:
-            cwd:
-
-        Returns:
-
+            file_name (str): name of the spins file
+            cwd (str): directory of the spins file
         """
-        if not os.path.isfile(posixpath.join(cwd, file_name)):
+        spins = _read_dat_file(posixpath.join(cwd, file_name))
+        if spins is None:
             return None
-        spins = np.loadtxt(posixpath.join(cwd, file_name))
-        self.generic.dft.atom_scf_spins = splitter(
-            np.array([ss[self._job.id_spx_to_pyi] for ss in spins[:, 1:]]), spins[:, 0]
+        self.generic.dft.atom_scf_spins = _split_steps(
+            spins[:, 1:][:, self._job.id_spx_to_pyi], _get_step_offsets(spins[:, 0])
         )
 
     def collect_energy_dat(self, file_name="energy.dat", cwd=None):
         """
+        Collect the computation time and the energies of every SCF step from the energy.dat file.
 
         Args:
-            file_name:
-            cwd:
-
-        Returns:
-
+            file_name (str): name of the energy file
+            cwd (str): directory of the energy file
         """
-        if not os.path.isfile(posixpath.join(cwd, file_name)):
+        energies = _read_dat_file(posixpath.join(cwd, file_name))
+        if energies is None:
             return None
-        energies = np.loadtxt(posixpath.join(cwd, file_name))
-        self.generic.dft.scf_computation_time = splitter(energies[:, 1], energies[:, 0])
-        self.generic.dft.scf_energy_int = splitter(
-            energies[:, 2] * HARTREE_TO_EV, energies[:, 0]
-        )
-
-        def en_split(e, counter=energies[:, 0]):
-            return splitter(e * HARTREE_TO_EV, counter)
-
-        if len(energies[0]) == 7:
-            self.generic.dft.scf_energy_free = en_split(energies[:, 3])
-            self.generic.dft.scf_energy_zero = en_split(energies[:, 4])
-            self.generic.dft.scf_energy_band = en_split(energies[:, 5])
-            self.generic.dft.scf_electronic_entropy = en_split(energies[:, 6])
+        offsets = _get_step_offsets(energies[:, 0])
+        self.generic.dft.scf_computation_time = _split_steps(energies[:, 1], offsets)
+        energies = energies[:, 2:] * HARTREE_TO_EV
+        if energies.shape[1] == 5:
+            keys = [
+                "scf_energy_int",
+                "scf_energy_free",
+                "scf_energy_zero",
+                "scf_energy_band",
+                "scf_electronic_entropy",
+            ]
         else:
-            self.generic.dft.scf_energy_band = en_split(energies[:, 3])
+            keys = ["scf_energy_int", "scf_energy_band"]
+        for i, key in enumerate(keys):
+            self.generic.dft[key] = _split_steps(energies[:, i], offsets)
 
     def collect_residue_dat(self, file_name="residue.dat", cwd=None):
         """
+        Collect the density residue of every SCF step from the residue.dat file.
 
         Args:
-            file_name:
-            cwd:
-
-        Returns:
-
+            file_name (str): name of the residue file
+            cwd (str): directory of the residue file
         """
-        if not os.path.isfile(posixpath.join(cwd, file_name)):
-            return None
-        residue = np.loadtxt(posixpath.join(cwd, file_name))
-        if len(residue) == 0:
+        residue = _read_dat_file(posixpath.join(cwd, file_name))
+        if residue is None:
             return None
-        if len(residue[0]) == 2:
-            self.generic.dft.scf_residue = splitter(residue[:, 1], residue[:, 0])
+        if residue.shape[1] == 2:
+            values = residue[:, 1]
         else:
-            self.generic.dft.scf_residue = splitter(residue[:, 1:], residue[:, 0])
+            values = residue[:, 1:]
+        self.generic.dft.scf_residue = _split_steps(
+            values, _get_step_offsets(residue[:, 0])
+        )
 
     def collect_eps_dat(self, file_name="eps.dat", cwd=None):
         """
+        Collect the eigenvalues of the last ionic step from the eps.dat file(s).
 
         Args:
-            file_name:
-            cwd:
-
-        Returns:
-
+            file_name (str/list): name of the eigenvalue file or one file per spin channel
+            cwd (str): directory of the eigenvalue files
         """
         if isinstance(file_name, str):
             file_name = [file_name]
         values = []
         for f in file_name:
-            file_tmp = posixpath.join(cwd, f)
-            if not os.path.isfile(file_tmp):
+            eps = _read_dat_file(posixpath.join(cwd, f))
+            if eps is None:
                 return
-            values.append(np.loadtxt(file_tmp)[..., 1:])
+            values.append(eps[:, 1:])
         values = np.stack(values, axis=0)
         if "bands_eigen_values" not in self.generic.dft.list_nodes():
             self.generic.dft.bands_eigen_values = values.reshape((-1,) + values.shape)
 
     def collect_energy_struct(self, file_name="energy-structOpt.dat", cwd=None):
         """
+        Collect the free energy of every ionic step from the energy-structOpt.dat file.
 
         Args:
-            file_name:
-            cwd:
-
-        Returns:
-
+            file_name (str): name of the structure optimization energy file
+            cwd (str): directory of the structure optimization energy file
         """
-        file_name = posixpath.join(cwd, file_name)
-        if os.path.isfile(file_name):
-            self.generic.dft.energy_free = (
-                np.loadtxt(file_name).reshape(-1, 2)[:, 1] * HARTREE_TO_EV
-            )
+        energies = _read_dat_file(posixpath.join(cwd, file_name))
+        if energies is not None:
+            self.generic.dft.energy_free = energies.reshape(-1, 2)[:, 1] * HARTREE_TO_EV
 
     def collect_sphinx_log(self, file_name="sphinx.log", cwd=None):
         """
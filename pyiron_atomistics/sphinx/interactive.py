@@ -34,14 +34,68 @@ __date__ = "Sep 1, 2017"
 
 
 class SphinxInteractive(SphinxBase, GenericInteractive):
+    """
+    Interactive SPHInX job communicating over the sxctrl and sxres pipes.
+
+    Commands are always sent as text lines. By default all quantities are exchanged as text as well, one line per
+    atom. With `interactive_binary_protocol = True` the job requests the binary protocol with the command
+    "set protocol binary" when the interface is initialized. If SPHInX confirms with a "binary" line, every quantity
+    is exchanged as a single frame: the number of values as little endian int64 followed by the values as little
+    endian float64. Otherwise the job falls back to the text protocol.
+    """
+
     def __init__(self, project, job_name):
         super(SphinxInteractive, self).__init__(project, job_name)
         self._interactive_write_input_files = True
         self._interactive_library_read = None
         self._interactive_fetch_completed = True
+        self._interactive_binary_protocol = False
+        self._interactive_binary_mode = False
         self.interactive_flush_frequency = 1
         self.output = SphinxOutput(job=self)
 
+    @property
+    def interactive_binary_protocol(self):
+        """
+        bool: Request the binary protocol from SPHInX when the interactive interface is initialized
+        """
+        return self._interactive_binary_protocol
+
+    @interactive_binary_protocol.setter
+    def interactive_binary_protocol(self, binary):
+        self._interactive_binary_protocol = bool(binary)
+
+    def to_hdf(self, hdf=None, group_name=None):
+        """
+        Stores the instance attributes into the hdf5 file
+
+        Args:
+            hdf (str): Path to the hdf5 file
+            group_name (str): Name of the group which contains the object
+        """
+        super(SphinxInteractive, self).to_hdf(hdf=hdf, group_name=group_name)
+        with self.project_hdf5.open("input") as hdf5_input:
+            interactive_dict = hdf5_input["interactive"]
+            interactive_dict[
+                "interactive_binary_protocol"
+            ] = self._interactive_binary_protocol
+            hdf5_input["interactive"] = interactive_dict
+
+    def from_hdf(self, hdf=None, group_name=None):
+        """
+        Recreates instance from the hdf5 file
+
+        Args:
+            hdf (str): Path to the hdf5 file
+            group_name (str): Name of the group which contains the object
+        """
+        super(SphinxInteractive, self).from_hdf(hdf=hdf, group_name=group_name)
+        with self.project_hdf5.open("input") as hdf5_input:
+            if "interactive" in hdf5_input.list_nodes():
+                self._interactive_binary_protocol = hdf5_input["interactive"].get(
+                    "interactive_binary_protocol", False
+                )
+
     @property
     def structure(self):
         return GenericInteractive.structure.fget(self)
@@ -64,53 +118,37 @@ class SphinxInteractive(SphinxBase, GenericInteractive):
 
     def interactive_energy_pot_getter(self):
         self._interactive_pipe_write("get energy")
-        return float(self._interactive_library_read.readline()) * HARTREE_TO_EV
+        return (
+            float(self._interactive_pipe_read_array(shape=(1, 1))[0, 0]) * HARTREE_TO_EV
+        )
 
     def interactive_forces_getter(self):
         self._interactive_pipe_write("get forces")
-        ff = []
-        for _ in range(len(self.structure)):
-            line = self._interactive_library_read.readline().split()
-            ff.append(
-                [
-                    float(line[i]) * HARTREE_OVER_BOHR_TO_EV_OVER_ANGSTROM
-                    for i in range(3)
-                ]
-            )
-        ff = np.array(ff)[self.id_spx_to_pyi]
+        ff = self._interactive_pipe_read_array(shape=(len(self.structure), 3))
+        ff = ff[self.id_spx_to_pyi] * HARTREE_OVER_BOHR_TO_EV_OVER_ANGSTROM
         return ff
 
     def interactive_cells_getter(self):
         self._interactive_pipe_write("get cell")
-        cc = []
-        for _ in range(3):
-            line = self._interactive_library_read.readline().split()
-            cc.append([float(line[i]) * BOHR_TO_ANGSTROM for i in range(3)])
-        return np.array(cc)
+        return self._interactive_pipe_read_array(shape=(3, 3)) * BOHR_TO_ANGSTROM
 
     def interactive_positions_getter(self):
         self._interactive_pipe_write("get structure")
-        xx = []
-        for _ in range(len(self.structure)):
-            line = self._interactive_library_read.readline().split()
-            xx.append([float(line[i]) * BOHR_TO_ANGSTROM for i in range(3)])
-        xx = np.array(xx)[self.id_spx_to_pyi]
+        xx = self._interactive_pipe_read_array(shape=(len(self.structure), 3))
+        xx = xx[self.id_spx_to_pyi] * BOHR_TO_ANGSTROM
         return xx
 
     def interactive_positions_setter(self, positions):
         self._interactive_pipe_write("set structure")
         positions = positions[self.id_pyi_to_spx]
         positions = np.reshape(positions, 3 * len(self.structure)) / BOHR_TO_ANGSTROM
-        self._interactive_pipe_write(positions.tolist())
+        self._interactive_pipe_write_array(positions)
 
     def interactive_spins_getter(self):
         self._logger.debug("get spins - start ...")
         self._interactive_pipe_write("get atomspin")
-        mm = []
-        for _ in range(len(self.structure)):
-            line = self._interactive_library_read.readline().split()
-            mm.append(float(line[0]))
-        mm = np.array(mm)[self.id_spx_to_pyi]
+        mm = self._interactive_pipe_read_array(shape=(len(self.structure), 1))
+        mm = mm[self.id_spx_to_pyi, 0]
         # self.interactive_cache['atom_spins'].append(mm)
         self._logger.debug("get spins - done.")
         return mm
@@ -122,7 +160,7 @@ class SphinxInteractive(SphinxBase, GenericInteractive):
             self._interactive_pipe_write("set spinconstraint")
             spins = np.array(spins)[self.id_pyi_to_spx]
             self._spin_constraints = np.array(spins)
-            self._interactive_pipe_write(spins.tolist())
+            self._interactive_pipe_write_array(spins)
             # self.interactive_cache['atom_spin_constraints'].append(spins)
             self._logger.debug("set spin constraints - done.")
         else:
@@ -135,11 +173,8 @@ class SphinxInteractive(SphinxBase, GenericInteractive):
     def interactive_magnetic_forces_getter(self):
         if self._generic_input["fix_spin_constraint"]:
             self._interactive_pipe_write("get nu")
-            nn = []
-            for _ in range(len(self.structure)):
-                line = self._interactive_library_read.readline().split()
-                nn.append(HARTREE_TO_EV * float(line[0]))
-            nn = np.array(nn)[self.id_spx_to_pyi]
+            nn = self._interactive_pipe_read_array(shape=(len(self.structure), 1))
+            nn = HARTREE_TO_EV * nn[self.id_spx_to_pyi, 0]
             return nn
         else:
             return None
@@ -172,12 +207,7 @@ class SphinxInteractive(SphinxBase, GenericInteractive):
         while not self._interactive_pipes_initialized:
             time.sleep(1)
         self._logger.debug("open interactive interface!")
-        self._interactive_library = open(
-            os.path.join(self.working_directory, "sxctrl"), "w"
-        )
-        self._interactive_library_read = open(
-            os.path.join(self.working_directory, "sxres"), "r"
-        )
+        self._interactive_open_pipes()
         self._logger.debug("interactive interface is opened!")
         if (
             not self.structure.has("initial_magmoms")
@@ -293,6 +323,17 @@ class SphinxInteractive(SphinxBase, GenericInteractive):
             os.path.join(self.working_directory, "sxctrl")
         ) and os.path.exists(os.path.join(self.working_directory, "sxres"))
 
+    def _interactive_open_pipes(self):
+        self._interactive_library = open(
+            os.path.join(self.working_directory, "sxctrl"), "w"
+        )
+        self._interactive_library_read = open(
+            os.path.join(self.working_directory, "sxres"), "rb"
+        )
+        self._interactive_binary_mode = False
+        if self._interactive_binary_protocol:
+            self._interactive_negotiate_protocol()
+
     def _interactive_pipe_write(self, line):
         if isinstance(line, str) or isinstance(line, int) or isinstance(line, float):
             self._interactive_library.write(str(line) + "\n")
@@ -303,8 +344,87 @@ class SphinxInteractive(SphinxBase, GenericInteractive):
         else:
             raise TypeError("only lists, strings and numbers are supported!")
 
+    def _interactive_pipe_write_array(self, values):
+        """
+        Send an array of floats to SPHInX, either as a single binary frame or as one line per value.
+
+        Args:
+            values (numpy.ndarray): Values to send
+        """
+        if self._interactive_binary_mode:
+            values = np.ascontiguousarray(values, dtype="<f8").reshape(-1)
+            self._interactive_library.flush()
+            self._interactive_library.buffer.write(
+                np.array([values.size], dtype="<i8").tobytes() + values.tobytes()
+            )
+            self._interactive_library.buffer.flush()
+        else:
+            self._interactive_pipe_write(np.asarray(values).reshape(-1).tolist())
+
     def _interactive_pipe_read(self):
-        return self._interactive_library_read.readline()
+        line = self._interactive_library_read.readline()
+        if isinstance(line, bytes):
+            line = line.decode()
+        return line
+
+    def _interactive_pipe_read_array(self, shape):
+        """
+        Read an array of floats from SPHInX, either as a single binary frame or as one line per row.
+
+        Args:
+            shape (tuple): (number of rows, number of columns) of the array
+
+        Returns:
+            numpy.ndarray: Array of the given shape
+        """
+        n_rows, n_columns = shape
+        if self._interactive_binary_mode:
+            n_values = np.frombuffer(self._interactive_pipe_read_bytes(8), dtype="<i8")[
+                0
+            ]
+            if n_values != n_rows * n_columns:
+                raise ValueError(
+                    "Expected {} values from SPHInX but received {}".format(
+                        n_rows * n_columns, n_values
+                    )
+                )
+            values = np.frombuffer(
+                self._interactive_pipe_read_bytes(8 * n_values), dtype="<f8"
+            )
+        else:
+            values = np.array(
+                [
+                    self._interactive_pipe_read().split()[:n_columns]
+                    for _ in range(n_rows)
+                ],
+                dtype=float,
+            )
+        return values.reshape(shape)
+
+    def _interactive_pipe_read_bytes(self, n_bytes):
+        data = self._interactive_library_read.read(n_bytes)
+        if len(data) != n_bytes:
+            raise EOFError("SPHInX closed the sxres pipe during a binary transfer")
+        return data
+
+    def _interactive_negotiate_protocol(self):
+        """
+        Request the binary protocol from SPHInX and fall back to the text protocol, if SPHInX does not confirm the
+        request. The request is followed by "get cell", which every SPHInX version answers, so the first reply decides
+        the protocol without a timeout: SPHInX confirms the request with a "binary" line followed by the cell as a
+        binary frame, while a SPHInX version without the binary protocol ignores the unknown request and sends the
+        cell as text. Like this no request is left unanswered in the pipes.
+        """
+        self._interactive_pipe_write(["set protocol binary", "get cell"])
+        if self._interactive_pipe_read().strip() == "binary":
+            self._interactive_binary_mode = True
+            self._interactive_pipe_read_array(shape=(3, 3))
+        else:
+            self._interactive_binary_mode = False
+            self._interactive_pipe_read_array(shape=(2, 3))
+            self._logger.warning(
+                "SPHInX did not accept the binary protocol, using the text protocol."
+            )
 
     def calc_static(
         self,
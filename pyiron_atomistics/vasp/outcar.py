@@ -2,8 +2,10 @@
 # Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
-from collections import OrderedDict
+from collections import OrderedDict, deque
+from functools import partial
 import numpy as np
+import os
 import warnings
 import scipy.constants
 import re
@@ -37,100 +39,49 @@ class Outcar(object):
 
     def __init__(self):
         self.parse_dict = dict()
+        self._stream_parser = None
 
     def from_file(self, filename="OUTCAR"):
         """
         Parse and store relevant quantities from the OUTCAR file into parse_dict.
 
+        The file is read in a single pass, so the memory consumption is independent of the size of the OUTCAR file.
+
         Args:
             filename (str): Filename of the OUTCAR file to parse
 
         """
-        with open(filename, "r") as f:
-            lines = f.readlines()
-        energies = self.get_total_energies(filename=filename, lines=lines)
-        energies_int = self.get_energy_without_entropy(filename=filename, lines=lines)
-        energies_zero = self.get_energy_sigma_0(filename=filename, lines=lines)
-        scf_energies = self.get_all_total_energies(filename=filename, lines=lines)
-        n_atoms = self.get_number_of_atoms(filename=filename, lines=lines)
-        forces = self.get_forces(filename=filename, lines=lines, n_atoms=n_atoms)
-        positions = self.get_positions(filename=filename, lines=lines, n_atoms=n_atoms)
-        cells = self.get_cells(filename=filename, lines=lines)
-        steps = self.get_steps(filename=filename, lines=lines)
-        temperatures = self.get_temperatures(filename=filename, lines=lines)
-        time = self.get_time(filename=filename, lines=lines)
-        fermi_level = self.get_fermi_level(filename=filename, lines=lines)
-        scf_moments = self.get_dipole_moments(filename=filename, lines=lines)
-        kin_energy_error = self.get_kinetic_energy_error(filename=filename, lines=lines)
-        stresses = self.get_stresses(filename=filename, si_unit=False, lines=lines)
-        n_elect = self.get_nelect(filename=filename, lines=lines)
-        e_fermi_list, vbm_list, cbm_list = self.get_band_properties(
-            filename=filename, lines=lines
-        )
-        elastic_constants = self.get_elastic_constants(filename=filename, lines=lines)
-        energy_components = self.get_energy_components(filename=filename, lines=lines)
-        cpu_time = self.get_cpu_time(filename=filename, lines=lines)
-        user_time = self.get_user_time(filename=filename, lines=lines)
-        system_time = self.get_system_time(filename=filename, lines=lines)
-        elapsed_time = self.get_elapsed_time(filename=filename, lines=lines)
-        memory_used = self.get_memory_used(filename=filename, lines=lines)
-        vasp_version = self.get_vasp_version(filename=filename, lines=lines)
+        parser = _OutcarStreamParser()
+        parser.parse_file(filename=filename)
+        self.parse_dict.update(parser.to_dict())
 
-        try:
-            (
-                irreducible_kpoints,
-                ir_kpt_weights,
-                plane_waves,
-            ) = self.get_irreducible_kpoints(filename=filename, lines=lines)
-        except ValueError:
-            print("irreducible kpoints not parsed !")
-            irreducible_kpoints = None
-            ir_kpt_weights = None
-            plane_waves = None
-        magnetization, final_magmom_lst = self.get_magnetization(
-            filename=filename, lines=lines
-        )
-        broyden_mixing = self.get_broyden_mixing_mesh(filename=filename, lines=lines)
-        self.parse_dict["vasp_version"] = vasp_version
-        self.parse_dict["energies"] = energies
-        self.parse_dict["energies_int"] = energies_int
-        self.parse_dict["energies_zero"] = energies_zero
-        self.parse_dict["scf_energies"] = scf_energies
-        self.parse_dict["forces"] = forces
-        self.parse_dict["positions"] = positions
-        self.parse_dict["cells"] = cells
-        self.parse_dict["steps"] = steps
-        self.parse_dict["temperatures"] = temperatures
-        self.parse_dict["time"] = time
-        self.parse_dict["fermi_level"] = fermi_level
-        self.parse_dict["scf_dipole_moments"] = scf_moments
-        self.parse_dict["kin_energy_error"] = kin_energy_error
-        self.parse_dict["stresses"] = stresses * KBAR_TO_EVA
-        self.parse_dict["irreducible_kpoints"] = irreducible_kpoints
-        self.parse_dict["irreducible_kpoint_weights"] = ir_kpt_weights
-        self.parse_dict["number_plane_waves"] = plane_waves
-        self.parse_dict["magnetization"] = magnetization
-        self.parse_dict["final_magmoms"] = final_magmom_lst
-        self.parse_dict["broyden_mixing"] = broyden_mixing
-        self.parse_dict["n_elect"] = n_elect
-        self.parse_dict["e_fermi_list"] = e_fermi_list
-        self.parse_dict["vbm_list"] = vbm_list
-        self.parse_dict["cbm_list"] = cbm_list
-        self.parse_dict["elastic_constants"] = elastic_constants
-        self.parse_dict["energy_components"] = energy_components
-        self.parse_dict["resources"] = {
-            "cpu_time": cpu_time,
-            "user_time": user_time,
-            "system_time": system_time,
-            "elapsed_time": elapsed_time,
-            "memory_used": memory_used,
-        }
-        try:
-            self.parse_dict["pressures"] = (
-                np.average(stresses[:, 0:3], axis=1) * KBAR_TO_EVA
+    def update(self, filename="OUTCAR"):
+        """
+        Parse only the lines which were appended to the OUTCAR file since the previous call and update parse_dict, so
+        the output of a running VASP calculation can be followed without parsing the whole file on every call. The
+        parser keeps the state of the partially written ionic step in between the calls, only completely parsed ionic
+        steps are added to parse_dict. The first call parses the whole file, as does every call after the file was
+        overwritten.
+
+        Args:
+            filename (str): Filename of the OUTCAR file to parse
+
+        Returns:
+            int: number of completed ionic steps parsed so far
+        """
+        if (
+            self._stream_parser is None
+            or self._stream_parser.filename != filename
+            or os.path.getsize(filename) < self._stream_parser.offset
+        ):
+            self._stream_parser = _OutcarStreamParser()
+        self._stream_parser.parse_appended_lines(filename=filename)
+        # the number of atoms is required to parse the ionic steps, so nothing is collected before it was written
+        if self._stream_parser.n_atoms is not None:
+            self.parse_dict.update(
+                self._stream_parser.to_dict(complete_steps_only=True)
             )
-        except IndexError:
-            self.parse_dict["pressures"] = np.zeros(len(steps))
+        return self._stream_parser.n_complete_ionic_steps
 
     def to_hdf(self, hdf, group_name="outcar"):
         """
@@ -929,7 +880,9 @@ class Outcar(object):
         if len(trigger_indices) != 0:
             return int(lines[trigger_indices[0]].split(ions_trigger)[-1])
         else:
-            raise ValueError()
+            raise ValueError(
+                "The number of ions (NIONS) was not found in the OUTCAR file"
+            )
 
     @staticmethod
     def get_band_properties(filename="OUTCAR", lines=None):
@@ -1168,6 +1121,815 @@ class Outcar(object):
             return []
 
 
+class _GrowingArray(object):
+    """
+    Array which is extended by one item at a time. The capacity is doubled whenever it is exhausted, so appending n
+    items costs O(n) in total and the items appended so far are available as a view without copying them.
+    """
+
+    def __init__(self):
+        self._data = None
+        self._length = 0
+
+    def __len__(self):
+        return self._length
+
+    def append(self, value):
+        """
+        Args:
+            value (float/list/numpy.ndarray): the next item, all items have to share the same shape
+        """
+        value = np.asarray(value, dtype=float)
+        if self._data is None:
+            self._data = np.empty((16,) + value.shape)
+        elif self._length == len(self._data):
+            data = np.empty((2 * len(self._data),) + self._data.shape[1:])
+            data[: self._length] = self._data
+            self._data = data
+        self._data[self._length] = value
+        self._length += 1
+
+    def to_array(self, length=None):
+        """
+        Args:
+            length (int/None): number of items, all items by default
+
+        Returns:
+            numpy.ndarray: view on the first items, the items are not modified by appending further items
+        """
+        if self._data is None:
+            return np.array([])
+        if length is None or length > self._length:
+            length = self._length
+        return self._data[:length]
+
+
+class _OutcarStreamParser(object):
+    """
+    Single pass, event driven parser for VASP OUTCAR files.
+
+    Every line of the file is matched once against all registered trigger strings and the handlers registered for the
+    matching triggers are called. Handlers which need the lines following a trigger register a consumer, a generator
+    which is sent the subsequent lines one by one, so the file is never held in memory. The parsed quantities are
+    identical to the ones returned by the individual Outcar.get_*() functions.
+    """
+
+    _ionic_trigger = "FREE ENERGIE OF THE ION-ELECTRON SYSTEM (eV)"
+    _resource_triggers = {
+        "cpu_time": "Total CPU time used (sec):",
+        "user_time": "User time (sec):",
+        "system_time": "System time (sec):",
+        "elapsed_time": "Elapsed time (sec):",
+        "memory_used": "Maximum memory used (kb):",
+    }
+
+    def __init__(self):
+        self._handlers = OrderedDict()
+        self._trigger_regex = None
+        self._consumers = list()
+        self._history = deque(maxlen=3)
+        self._line_number = 0
+        self.filename = None
+        self.offset = 0
+        self._first_line = None
+        self._n_atoms = None
+        self._n_ionic_steps = 0
+        self._energies = _GrowingArray()
+        self._energies_int = _GrowingArray()
+        self._energies_zero = _GrowingArray()
+        self._scf_energies = list()
+        self._scf_energy_step = list()
+        self._dipole_moments = list()
+        self._dipole_moment_step = list()
+        self._energy_components = list()
+        self._energy_component_step = list()
+        self._positions = _GrowingArray()
+        self._forces = _GrowingArray()
+        self._cells = _GrowingArray()
+        self._stresses = _GrowingArray()
+        self._pressures = _GrowingArray()
+        self._temperatures = _GrowingArray()
+        self._nblock = None
+        self._potim = None
+        self._fermi_level_line = None
+        self._fermi_levels = list()
+        self._band_edges = list()
+        self._band_segment = None
+        self._is_spin_polarized = False
+        self._e_kin_err = list()
+        self._n_species_list = list()
+        self._n_irreducible_kpoints = None
+        self._irreducible_kpoint_lines = None
+        self._plane_wave_lines = None
+        self._local_spin = False
+        self._magnetization = list()
+        self._magnetization_step = list()
+        self._local_magnetization = {"x": list(), "y": list(), "z": list()}
+        self._magnetization_stop = None
+        self._broyden_line = None
+        self._n_elect = None
+        self._resources = {key: None for key in self._resource_triggers.keys()}
+        self._elastic_constant_lines = list()
+        self._register_handlers()
+
+    def register(self, trigger, handler):
+        """
+        Register a handler which is called for every line containing the trigger string.
+
+        Args:
+            trigger (str): string pattern to search for
+            handler (callable): function called with the keyword arguments line and stripped
+        """
+        self._handlers.setdefault(trigger, list()).append(handler)
+        self._trigger_regex = re.compile(
+            "|".join(re.escape(t) for t in self._handlers.keys())
+        )
+
+    def parse_file(self, filename="OUTCAR", buffer_size=2**20):
+        """
+        Parse an OUTCAR file, which is read in chunks of buffer_size bytes.
+
+        Args:
+            filename (str): Filename of the OUTCAR file to parse
+            buffer_size (int): size of the read buffer in bytes
+        """
+        with open(filename, "r", buffering=buffer_size) as f:
+            self.parse_lines(lines=f)
+
+    def parse_appended_lines(self, filename="OUTCAR"):
+        """
+        Parse the complete lines which were appended to the OUTCAR file since the previous call, the offset attribute
+        stores the position in bytes up to which the file was parsed.
+
+        Args:
+            filename (str): Filename of the OUTCAR file to parse
+        """
+        self.filename = filename
+        with open(filename, "rb") as f:
+            f.seek(self.offset)
+            for line in f:
+                # the last line might still be written
+                if not line.endswith(b"\n"):
+                    break
+                self.parse_line(line=line.decode())
+                self.offset += len(line)
+
+    @property
+    def n_atoms(self):
+        return self._n_atoms
+
+    @property
+    def n_ionic_steps(self):
+        return self._n_ionic_steps
+
+    def parse_lines(self, lines):
+        """
+        Parse the next lines of an OUTCAR file.
+
+        Args:
+            lines (iterable): lines of the file including the line endings
+        """
+        for line in lines:
+            self.parse_line(line=line)
+
+    def parse_line(self, line):
+        """
+        Parse the next line of an OUTCAR file.
+
+        Args:
+            line (str): line of the file including the line ending
+        """
+        if self._first_line is None:
+            self._first_line = line
+        if len(self._consumers) > 0:
+            consumers, self._consumers = self._consumers, list()
+            for consumer in consumers:
+                try:
+                    consumer.send(line)
+                    self._consumers.append(consumer)
+                except StopIteration:
+                    pass
+        stripped = line.strip()
+        if self._trigger_regex.search(stripped) is not None:
+            for trigger, handler_lst in self._handlers.items():
+                if trigger in stripped:
+                    for handler in handler_lst:
+                        handler(line=line, stripped=stripped)
+        self._history.append(line)
+        self._line_number += 1
+
+    def to_dict(self, complete_steps_only=False):
+        """
+        Collect the quantities parsed so far, the parser itself is not modified so parsing can be continued afterwards.
+        The quantities of the ionic steps are stored in growing arrays, so they are returned as views without copying
+        them.
+
+        Args:
+            complete_steps_only (bool): Skip the ionic step which is still being parsed, so all quantities of the ionic
+                                        steps have the same length while the file is written
+
+        Returns:
+            dict: parsed quantities with the same keys as Outcar.parse_dict
+        """
+        if self._n_atoms is None:
+            raise ValueError(
+                "The number of ions (NIONS) was not found in the OUTCAR file, so no quantities can be collected"
+            )
+        n_steps = (
+            self.n_complete_ionic_steps if complete_steps_only else self._n_ionic_steps
+        )
+        nblock = 1 if self._nblock is None else self._nblock
+        potim = 1.0 if self._potim is None else self._potim
+        steps = np.arange(0, n_steps * nblock, nblock)
+        if len(self._temperatures) > 0:
+            temperatures = self._temperatures.to_array(length=n_steps)
+        else:
+            temperatures = np.zeros(n_steps)
+        if self._cells is None:
+            warnings.warn("Unable to parse the cells from the OUTCAR file")
+        e_fermi_list, vbm_list, cbm_list = self._get_band_properties()
+        (
+            irreducible_kpoints,
+            ir_kpt_weights,
+            plane_waves,
+        ) = self._get_irreducible_kpoints()
+        magnetization, final_magmom_lst = self._get_magnetization()
+        parse_dict = dict()
+        parse_dict["vasp_version"] = self._first_line.lstrip().split(sep=" ")[0]
+        parse_dict["energies"] = self._energies.to_array(length=n_steps)
+        parse_dict["energies_int"] = self._energies_int.to_array(length=n_steps)
+        parse_dict["energies_zero"] = self._energies_zero.to_array(length=n_steps)
+        parse_dict["scf_energies"] = self._scf_energies[:n_steps]
+        parse_dict["forces"] = self._forces.to_array(length=n_steps)
+        parse_dict["positions"] = self._positions.to_array(length=n_steps)
+        parse_dict["cells"] = (
+            None if self._cells is None else self._cells.to_array(length=n_steps)
+        )
+        parse_dict["steps"] = steps
+        parse_dict["temperatures"] = temperatures
+        parse_dict["time"] = potim * steps
+        parse_dict["fermi_level"] = self._get_fermi_level()
+        parse_dict["scf_dipole_moments"] = self._dipole_moments[:n_steps]
+        parse_dict["kin_energy_error"] = self._get_kinetic_energy_error()
+        parse_dict["stresses"] = self._stresses.to_array(length=n_steps)
+        parse_dict["irreducible_kpoints"] = irreducible_kpoints
+        parse_dict["irreducible_kpoint_weights"] = ir_kpt_weights
+        parse_dict["number_plane_waves"] = plane_waves
+        parse_dict["magnetization"] = magnetization[:n_steps]
+        parse_dict["final_magmoms"] = final_magmom_lst
+        parse_dict["broyden_mixing"] = self._get_broyden_mixing_mesh()
+        parse_dict["n_elect"] = self._n_elect
+        parse_dict["e_fermi_list"] = e_fermi_list
+        parse_dict["vbm_list"] = vbm_list
+        parse_dict["cbm_list"] = cbm_list
+        parse_dict["elastic_constants"] = self._get_elastic_constants()
+        parse_dict["energy_components"] = (
+            [] if self._energy_components is None else self._energy_components[:n_steps]
+        )
+        parse_dict["resources"] = self._resources.copy()
+        if len(self._pressures) > 0:
+            parse_dict["pressures"] = self._pressures.to_array(length=n_steps)
+        else:
+            parse_dict["pressures"] = np.zeros(len(steps))
+        return parse_dict
+
+    @property
+    def n_complete_ionic_steps(self):
+        """
+        int: number of ionic steps for which all quantities were parsed. While the file is written, the quantities of
+             the current ionic step are parsed one after the other, the stresses, cells, positions and forces before
+             the energies and the temperature after them.
+        """
+        per_step_lst = [
+            self._positions,
+            self._forces,
+            self._stresses,
+            self._temperatures,
+        ]
+        if self._cells is not None:
+            per_step_lst.append(self._cells)
+        return min([self._n_ionic_steps] + [len(v) for v in per_step_lst if len(v) > 0])
+
+    def _register_handlers(self):
+        self.register(self._ionic_trigger, self._on_ionic_step)
+        self.register("free energy    TOTEN  =", self._on_scf_energy)
+        self.register(
+            "Free energy of the ion-electron system (eV)", self._on_energy_components
+        )
+        self.register("dipolmoment", self._on_dipole_moment)
+        self.register("NIONS =", self._on_number_of_atoms)
+        self.register("TOTAL-FORCE (eV/Angst)", self._on_positions_and_forces)
+        self.register("VOLUME and BASIS-vectors are now :", self._on_cell)
+        self.register(
+            "FORCE on cell =-STRESS in cart. coord.  units (eV):", self._on_stress
+        )
+        self.register("kin. lattice  EKIN_LAT= ", self._on_temperature)
+        self.register("NBLOCK", self._on_nblock)
+        self.register("POTIM  =", self._on_potim)
+        self.register("E-fermi :", self._on_fermi_level)
+        self.register("E-fermi", self._on_band_segment)
+        self.register("band No.  band energies     occupation", self._on_band_energies)
+        self.register("kinetic energy error for atom=", self._on_kinetic_energy_error)
+        self.register("ions per type =", self._on_ions_per_type)
+        self.register(
+            "Subroutine IBZKPT returns following result:", self._on_irreducible_kpoints
+        )
+        self.register("k-point  1 :", self._on_plane_waves)
+        self.register("Atomic Wigner-Seitz radii", self._on_wigner_seitz_radii)
+        self.register("eigenvalue-minimisations", self._on_scf_magnetization)
+        for direction in ["x", "y", "z"]:
+            self.register(
+                "magnetization ({})".format(direction),
+                partial(self._on_local_magnetization, direction=direction),
+            )
+        self.register("gives a total of ", self._on_broyden_mixing_mesh)
+        self.register("NELECT", self._on_nelect)
+        self.register("TOTAL ELASTIC MODULI (kBar)", self._on_elastic_constants)
+        for key, trigger in self._resource_triggers.items():
+            self.register(trigger, partial(self._on_resource, key=key))
+
+    def _consume(self, consumer):
+        """
+        Register a generator which is sent all following lines until it is exhausted.
+
+        Args:
+            consumer (generator): generator receiving the lines
+        """
+        try:
+            next(consumer)
+            self._consumers.append(consumer)
+        except StopIteration:
+            pass
+
+    def _capture(self, start, stop, callback):
+        """
+        Call callback with the list of lines from start to stop (exclusive), counted relative to the current line.
+
+        Args:
+            start (int): offset of the first line, has to be larger than zero
+            stop (int): offset after the last line
+            callback (callable): function called with the list of lines
+        """
+        self._consume(_capture_lines(start=start, stop=stop, callback=callback))
+
+    def _on_ionic_step(self, line, stripped):
+        self._capture(start=2, stop=5, callback=self._parse_energies)
+        self._scf_energies.append(
+            np.array([float(_clean_line(l).split()[-2]) for l in self._scf_energy_step])
+        )
+        self._scf_energy_step = list()
+        self._dipole_moments.append(
+            np.array(
+                [
+                    np.array([float(val) for val in _clean_line(l).split()[1:4]])
+                    for l in self._dipole_moment_step
+                ]
+            )
+        )
+        self._dipole_moment_step = list()
+        self._magnetization.append(
+            (self._line_number, np.array(self._magnetization_step))
+        )
+        self._magnetization_step = list()
+        blocks, self._energy_component_step = self._energy_component_step, list()
+        if self._energy_components is not None:
+            try:
+                self._energy_components.append(
+                    np.array(
+                        [
+                            np.hstack(
+                                [
+                                    float(block[i - 2].split()[-1])
+                                    if i != 7
+                                    else [
+                                        float(blocks[-1][5].split()[-2]),
+                                        float(blocks[-1][5].split()[-1]),
+                                    ]
+                                    for i in range(2, 12)
+                                ]
+                            )
+                            for block in blocks
+                        ]
+                    ).T
+                )
+            except ValueError:
+                self._energy_components = None
+
+    def _parse_energies(self, lines):
+        self._energies.append(float(_clean_line(lines[0].strip()).split()[-2]))
+        line_split = _clean_line(lines[2].strip()).split()
+        self._energies_int.append(float(line_split[3]))
+        self._energies_zero.append(float(line_split[-1]))
+        # the ionic step is counted once its energies are parsed
+        self._n_ionic_steps += 1
+
+    def _on_scf_energy(self, line, stripped):
+        self._scf_energy_step.append(stripped)
+
+    def _on_dipole_moment(self, line, stripped):
+        self._dipole_moment_step.append(stripped)
+
+    def _on_energy_components(self, line, stripped):
+        self._capture(start=2, stop=12, callback=self._energy_component_step.append)
+
+    def _on_number_of_atoms(self, line, stripped):
+        if self._n_atoms is None:
+            self._n_atoms = int(line.split("NIONS =")[-1])
+
+    def _on_positions_and_forces(self, line, stripped):
+        if self._n_atoms is None:
+            raise ValueError(
+                "The positions and forces precede the number of ions (NIONS) in the OUTCAR file"
+            )
+        self._capture(
+            start=2, stop=self._n_atoms + 2, callback=self._parse_positions_and_forces
+        )
+
+    def _parse_positions_and_forces(self, lines):
+        values = np.array(
+            _clean_line(" ".join([l.strip() for l in lines])).split(), dtype=float
+        ).reshape(len(lines), -1)
+        self._positions.append(values[:, :3])
+        self._forces.append(values[:, 3:])
+
+    def _on_cell(self, line, stripped):
+        self._capture(start=5, stop=8, callback=self._parse_cell)
+
+    def _parse_cell(self, lines):
+        if self._cells is not None:
+            try:
+                self._cells.append(
+                    [
+                        [float(l) for l in _clean_line(line.strip()).split()[0:3]]
+                        for line in lines
+                    ]
+                )
+            except ValueError:
+                self._cells = None
+
+    def _on_stress(self, line, stripped):
+        self._consume(self._parse_stress())
+
+    def _parse_stress(self):
+        # search for the two '------...' delimiters of the stress table, the number of stress contributions in between
+        # may vary depending on the VASP configuration (e.g. with or without van der Waals interactions)
+        for _ in range(2):
+            line = yield
+            while set(line.strip()) != {"-"}:
+                line = yield
+        yield
+        line = yield
+        try:
+            stress = [float(l) for l in line.split()[2:8]]
+        except ValueError:
+            stress = [float("NaN")] * 6
+        # VASP outputs the stresses in XX, YY, ZZ, XY, YZ, ZX order
+        #                               0,  1,  2,  3,  4,  5
+        stressm = np.diag(stress[:3])
+        stressm[0, 1] = stressm[1, 0] = stress[3]
+        stressm[1, 2] = stressm[2, 1] = stress[4]
+        stressm[0, 2] = stressm[2, 0] = stress[5]
+        self._stresses.append(stressm * KBAR_TO_EVA)
+        self._pressures.append(np.average(stressm[0:3], axis=0) * KBAR_TO_EVA)
+
+    def _on_temperature(self, line, stripped):
+        self._temperatures.append(float(_clean_line(stripped).split()[-2]))
+
+    def _on_nblock(self, line, stripped):
+        if self._nblock is None:
+            self._nblock = int(
+                re.compile(r"NBLOCK =\s+(\d+);").findall(_clean_line(stripped))[0]
+            )
+
+    def _on_potim(self, line, stripped):
+        if self._potim is None:
+            self._potim = float(
+                _clean_line(stripped).split("POTIM  =")[1].strip().split()[0]
+            )
+
+    def _on_fermi_level(self, line, stripped):
+        self._fermi_level_line = line
+
+    def _get_fermi_level(self):
+        if self._fermi_level_line is not None:
+            try:
+                return float(self._fermi_level_line.split("E-fermi :")[-1].split()[0])
+            except ValueError:
+                return
+        else:
+            return
+
+    def _on_band_segment(self, line, stripped):
+        self._fermi_levels.append(float(stripped.split()[2]))
+        if self._band_segment is not None:
+            self._band_edges.append(
+                _get_band_edges(
+                    band_data=[row for _, row in self._band_segment],
+                    is_spin_polarized=self._is_spin_polarized,
+                )
+            )
+        self._band_segment = list()
+
+    def _on_band_energies(self, line, stripped):
+        if self._band_segment is not None:
+            if len(self._history) == 3 and "spin component" in self._history[0]:
+                self._is_spin_polarized = True
+            self._consume(self._parse_band_energies(segment=self._band_segment))
+
+    def _parse_band_energies(self, segment):
+        while True:
+            data = (yield).strip().split()
+            # This if "Fermi" bypass needs to exist because of VASP changing it's OUTCAR format after 6.1.0, where a
+            # Fermi energy is printed immediately after each spin-component k-point text block
+            if "Fermi" in data:
+                continue
+            if len(data) != 3:
+                return
+            segment.append((self._line_number, [float(d) for d in data[1:]]))
+
+    def _get_band_properties(self):
+        vbm_level_dict = OrderedDict()
+        cbm_level_dict = OrderedDict()
+        band_edges = list(self._band_edges)
+        if self._band_segment is not None:
+            # like Outcar.get_band_properties() the last line of the file is not considered
+            band_edges.append(
+                _get_band_edges(
+                    band_data=[
+                        row
+                        for line_number, row in self._band_segment
+                        if line_number != self._line_number - 1
+                    ],
+                    is_spin_polarized=self._is_spin_polarized,
+                )
+            )
+        for edges in band_edges:
+            for spin, edge in enumerate(edges):
+                vbm_level_dict.setdefault(spin, list())
+                cbm_level_dict.setdefault(spin, list())
+                if edge is not None:
+                    vbm_level_dict[spin].append(edge[0])
+                    cbm_level_dict[spin].append(edge[1])
+        return (
+            np.array(self._fermi_levels),
+            np.array([val for val in vbm_level_dict.values()]),
+            np.array([val for val in cbm_level_dict.values()]),
+        )
+
+    def _on_kinetic_energy_error(self, line, stripped):
+        self._e_kin_err.append(float(stripped.split()[5]))
+
+    def _on_ions_per_type(self, line, stripped):
+        self._n_species_list = [
+            float(val) for val in stripped.split("ions per type =")[-1].strip().split()
+        ]
+
+    def _get_kinetic_energy_error(self):
+        if len(self._n_species_list) > 0 and len(self._n_species_list) == len(
+            self._e_kin_err
+        ):
+            return np.sum(np.array(self._n_species_list) * np.array(self._e_kin_err))
+        return 0.0
+
+    def _on_irreducible_kpoints(self, line, stripped):
+        self._n_irreducible_kpoints = None
+        self._irreducible_kpoint_lines = None
+        self._capture(start=3, stop=4, callback=self._parse_number_of_kpoints)
+
+    def _parse_number_of_kpoints(self, lines):
+        try:
+            self._n_irreducible_kpoints = int(lines[0].split()[1])
+        except ValueError:
+            return
+        # the reciprocal coordinates of the k-points start 7 lines after the trigger
+        self._capture(
+            start=4,
+            stop=4 + self._n_irreducible_kpoints,
+            callback=partial(setattr, self, "_irreducible_kpoint_lines"),
+        )
+
+    def _on_plane_waves(self, line, stripped):
+        if self._n_irreducible_kpoints is not None and not (
+            "Subroutine IBZKPT returns following result:" in stripped
+        ):
+            self._plane_wave_lines = [line]
+            self._capture(
+                start=1,
+                stop=self._n_irreducible_kpoints,
+                callback=self._plane_wave_lines.extend,
+            )
+
+    def _get_irreducible_kpoints(self):
+        try:
+            if self._irreducible_kpoint_lines is None:
+                raise ValueError("The irreducible k-points were not found")
+            kpoint_lst = []
+            weight_lst = []
+            planewaves_lst = []
+            for line in self._irreducible_kpoint_lines:
+                line = _clean_line(line.strip())
+                kpoint_lst.append([float(l) for l in line.split()[0:3]])
+                weight_lst.append(float(line.split()[3]))
+            if self._plane_wave_lines is not None:
+                for line in self._plane_wave_lines:
+                    line = _clean_line(line.strip())
+                    planewaves_lst.append(int(line.split()[-1]))
+            return np.array(kpoint_lst), np.array(weight_lst), np.array(planewaves_lst)
+        except ValueError as e:
+            warnings.warn("The irreducible k-points could not be parsed: " + str(e))
+            return None, None, None
+
+    def _on_wigner_seitz_radii(self, line, stripped):
+        self._local_spin = True
+
+    def _on_scf_magnetization(self, line, stripped):
+        self._capture(
+            start=2,
+            stop=3,
+            callback=partial(
+                self._parse_scf_magnetization, line_number=self._line_number
+            ),
+        )
+
+    def _parse_scf_magnetization(self, lines, line_number):
+        if self._magnetization_stop is not None:
+            return
+        try:
+            line = lines[0].split("magnetization")[-1]
+            if line != " \n":
+                spin_str_lst = line.split()
+                spin_str_len = len(spin_str_lst)
+                if spin_str_len == 1:
+                    ene = float(line)
+                elif spin_str_len == 3:
+                    ene = [
+                        float(spin_str_lst[0]),
+                        float(spin_str_lst[1]),
+                        float(spin_str_lst[2]),
+                    ]
+                else:
+                    warnings.warn("Unrecognized spin configuration.")
+                    # like Outcar.get_magnetization() ignore everything from here on
+                    self._magnetization_stop = line_number
+                    return
+                self._magnetization_step.append(ene)
+        except ValueError:
+            warnings.warn("Something went wrong in parsing the magnetization")
+
+    def _on_local_magnetization(self, line, stripped, direction):
+        if self._local_spin:
+            self._capture(
+                start=4,
+                stop=4 + self._n_atoms,
+                callback=partial(
+                    self._parse_local_magnetization,
+                    direction=direction,
+                    line_number=self._line_number,
+                ),
+            )
+
+    def _parse_local_magnetization(self, lines, direction, line_number):
+        try:
+            self._local_magnetization[direction].append(
+                (line_number, [float(line.split()[-1]) for line in lines])
+            )
+        except ValueError:
+            warnings.warn("Something went wrong in parsing the magnetic moments")
+
+    def _get_magnetization(self):
+        stop = self._magnetization_stop
+        mag_lst = [
+            mag
+            for line_number, mag in self._magnetization
+            if stop is None or line_number < stop
+        ]
+        final_magmom_lst = list()
+        if stop is not None:
+            return mag_lst, final_magmom_lst
+        mag_dict = {
+            direc: [mag for _, mag in local_mag_lst]
+            for direc, local_mag_lst in self._local_magnetization.items()
+        }
+        if len(mag_dict["x"]) > 0:
+            if len(mag_dict["y"]) == 0:
+                final_mag = np.array(mag_dict["x"])
+            else:
+                # while the file is still written, the last step might not be available for all directions yet
+                n_ionic_steps = min(len(mag_dict[direc]) for direc in ["x", "y", "z"])
+                final_mag = np.abs(np.zeros((n_ionic_steps, self._n_atoms, 3)))
+                final_mag[:, :, 0] = np.array(mag_dict["x"][:n_ionic_steps])
+                final_mag[:, :, 1] = np.array(mag_dict["y"][:n_ionic_steps])
+                final_mag[:, :, 2] = np.array(mag_dict["z"][:n_ionic_steps])
+            final_magmom_lst = final_mag.tolist()
+        return mag_lst, final_magmom_lst
+
+    def _on_broyden_mixing_mesh(self, line, stripped):
+        if self._broyden_line is None and len(self._history) > 1:
+            self._broyden_line = self._history[-2]
+
+    def _get_broyden_mixing_mesh(self):
+        if self._broyden_line is None:
+            warnings.warn(
+                "Unable to parse the Broyden mixing mesh. Returning 0 instead"
+            )
+            return 0
+        # Exclude all alphabets, and spaces. Then split based on '='
+        str_list = re.sub(
+            r"[a-zA-Z]", r"", self._broyden_line.replace(" ", "").replace("\n", "")
+        ).split("=")
+        return np.prod([int(val) for val in str_list[1:]])
+
+    def _on_nelect(self, line, stripped):
+        if self._n_elect is None:
+            self._n_elect = float(stripped.split()[2])
+
+    def _on_resource(self, line, stripped, key):
+        if self._resources[key] is None:
+            self._resources[key] = float(stripped.split()[-1])
+
+    def _on_elastic_constants(self, line, stripped):
+        self._elastic_constant_lines.append(None)
+        self._capture(
+            start=3,
+            stop=9,
+            callback=partial(
+                self._elastic_constant_lines.__setitem__,
+                len(self._elastic_constant_lines) - 1,
+            ),
+        )
+
+    def _get_elastic_constants(self):
+        if len(self._elastic_constant_lines) != 1:
+            return None
+        else:
+            return (
+                np.array(
+                    [line.split()[1:] for line in self._elastic_constant_lines[0]],
+                    dtype=float,
+                )
+                / 10
+            )
+
+
+def _capture_lines(start, stop, callback):
+    """
+    Generator which skips the first start - 1 lines sent to it and calls callback with the list of the following
+    stop - start lines.
+
+    Args:
+        start (int): offset of the first line to collect
+        stop (int): offset after the last line to collect
+        callback (callable): function called with the list of collected lines
+    """
+    for _ in range(start - 1):
+        yield
+    lines = []
+    for _ in range(stop - start):
+        lines.append((yield))
+    callback(lines)
+
+
+def _get_band_edges(band_data, is_spin_polarized):
+    """
+    Get the valence band maximum and conduction band minimum for every spin channel.
+
+    Args:
+        band_data (list): list of [band energy, occupation] pairs
+        is_spin_polarized (bool): split band_data in two spin channels
+
+    Returns:
+        list: (vbm, cbm) tuple for every spin channel, None for empty spin channels
+    """
+    if is_spin_polarized:
+        band_data_per_spin = [
+            np.array(band_data[0 : int(len(band_data) / 2)]).tolist(),
+            np.array(band_data[int(len(band_data) / 2) :]).tolist(),
+        ]
+    else:
+        band_data_per_spin = [band_data]
+    band_edges = list()
+    for band_data in band_data_per_spin:
+        if len(band_data) > 0:
+            band_energy, band_occ = [np.array(band_data)[:, i] for i in range(2)]
+            args = np.argsort(band_energy)
+            band_occ = band_occ[args]
+            band_energy = band_energy[args]
+            cbm_bool = np.abs(band_occ) < 1e-6
+            if any(cbm_bool):
+                cbm = band_energy[np.abs(band_occ) < 1e-6][0]
+            else:
+                cbm = band_energy[-1]
+            # If spin channel is completely empty, setting vbm=cbm
+            if all(cbm_bool):
+                vbm = cbm
+            else:
+                vbm = band_energy[~cbm_bool][-1]
+            band_edges.append((vbm, cbm))
+        else:
+            band_edges.append(None)
+    return band_edges
+
+
 def _clean_line(line):
     return line.replace("-", " -")
 
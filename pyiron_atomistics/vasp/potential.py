@@ -8,6 +8,7 @@ import posixpath
 import numpy as np
 import pandas
 from pyiron_base import state, GenericParameters, deprecate
+from pyiron_atomistics.atomistics.job.potential_cache import stage_potential_file
 from pyiron_atomistics.atomistics.job.potentials import (
     PotentialAbstract,
     find_potential_file_base,
@@ -496,17 +497,16 @@ class Potcar(GenericParameters):
         self._set_potential_paths()
         if cwd is not None:
             file_name = posixpath.join(cwd, file_name)
-        f = open(file_name, "w")
         for el_file in self.el_path_lst:
             with open(el_file) as pot_file:
                 for i, line in enumerate(pot_file):
-                    f.write(line)
                     if i == 1:
                         self.electrons_per_atom_lst.append(int(float(line)))
                     elif i == 14:
                         mystr = line.split()[2][:-1]
                         self.max_cutoff_lst.append(float(mystr))
-        f.close()
+                        break
+        stage_potential_file(path_lst=self.el_path_lst, destination=file_name)
 
     def load_default(self):
         file_content = """\
@@ -11,8 +11,10 @@ from pyiron_atomistics.atomistics.structure.atoms import Atoms
 from pyiron_atomistics.atomistics.structure.periodic_table import PeriodicTable
 from pyiron_base import state
 from pyiron_atomistics.dft.waves.electronic import ElectronicStructure
+from pyiron_atomistics.vasp.outcar import _GrowingArray
 import defusedxml.cElementTree as ETree
-from defusedxml.ElementTree import ParseError
+from defusedxml.ElementTree import DefusedXMLParser, ParseError
+from xml.etree.ElementTree import TreeBuilder
 import warnings
 
 
@@ -28,6 +30,19 @@ __status__ = "production"
 __date__ = "Sep 1, 2017"
 
 
+# sections of the vasprun.xml file which contain the large <array> blocks decoded in bulk when streaming
+_BULK_ARRAY_PARENTS = ["eigenvalues", "total", "partial", "projected"]
+# quantities of the ionic steps which Vasprun.update() keeps in growing arrays
+_INCREMENTAL_ARRAY_KEYS = [
+    "cells",
+    "positions",
+    "forces",
+    "total_energies",
+    "total_fr_energies",
+    "total_0_energies",
+]
+
+
 class Vasprun(object):
 
     """
@@ -47,28 +62,206 @@ class Vasprun(object):
 
     def __init__(self):
         self.vasprun_dict = dict()
+        self._xml_reader = None
+        self._incremental_dict = None
+        self._incremental_arrays = None
+        self._array_decoders = dict()
 
-    def from_file(self, filename="vasprun.xml"):
+    def from_file(self, filename="vasprun.xml", streaming=False, exclude=None):
         """
         Parsing vasprun.xml from the working directory
 
         Args:
             filename (str): Path to the vasprun file
+            streaming (bool): Remove every part of the xml tree as soon as it is parsed and decode the eigenvalues and
+                              densities of states in bulk, so the memory consumption is bounded by the size of the
+                              parsed data instead of the size of the xml tree
+            exclude (list/None): Tags of the sections which are not parsed, e.g. ["projected", "scstep"] to skip the
+                                 projected density of states and the data of the individual electronic steps
         """
         if not (os.path.isfile(filename)):
             raise AssertionError()
         try:
-            self.parse_root_to_dict(filename)
+            self.parse_root_to_dict(filename, streaming=streaming, exclude=exclude)
         except ParseError:
             raise VasprunError(
                 "The vasprun.xml file is either corrupted or the simulation has failed"
             )
+        except _ArrayDecodeError as e:
+            warnings.warn(
+                message=str(e)
+                + ", the file is parsed again without decoding arrays in bulk.",
+                category=VasprunWarning,
+            )
+            self.vasprun_dict = dict()
+            self._array_decoders = dict()
+            self.from_file(filename=filename, streaming=False, exclude=exclude)
+        except ValueError as e:
+            raise VasprunError(
+                "The vasprun.xml file could not be parsed: " + str(e)
+            ) from e
 
-    def parse_root_to_dict(self, filename):
+    def parse_root_to_dict(self, filename, streaming=False, exclude=None):
         """
         Parses from the main xml root.
+
+        Args:
+            filename (str): Path to the vasprun file
+            streaming (bool): Remove every part of the xml tree as soon as it is parsed
+            exclude (list/None): Tags of the sections which are not parsed
         """
         d = self.vasprun_dict
+        self._init_dict(d)
+        if streaming or exclude is not None:
+            self._parse_root_streaming(
+                filename,
+                d,
+                streaming=streaming,
+                exclude=[] if exclude is None else exclude,
+            )
+        else:
+            for _, leaf in ETree.iterparse(filename):
+                self.parse_leaf_to_dict(leaf, d)
+        self._convert_dict_to_arrays(d)
+
+    def _parse_root_streaming(self, filename, d, streaming=True, exclude=()):
+        """
+        Parses from the main xml root, elements are removed from the tree once they are parsed.
+
+        Args:
+            filename (str): Path to the vasprun file
+            d (dict): The dictionary to which data is to be parsed
+            streaming (bool): Remove parsed elements and decode the eigenvalues and densities of states in bulk
+            exclude (list): Tags of the sections which are removed without parsing them
+        """
+        path = list()
+        n_excluded = 0
+        decoder = None
+        for event, element in ETree.iterparse(filename, events=("start", "end")):
+            if event == "start":
+                if element.tag in exclude:
+                    n_excluded += 1
+                elif n_excluded == 0 and streaming:
+                    if decoder is not None and element.tag == "set":
+                        decoder.start_set()
+                    elif element.tag == "array" and path[-1].tag in _BULK_ARRAY_PARENTS:
+                        decoder = _ArrayDecoder(
+                            n_leaf_sets=self._get_number_of_projected_bands(path)
+                        )
+                path.append(element)
+                continue
+            path.pop()
+            parent = path[-1] if len(path) > 0 else None
+            if n_excluded > 0:
+                if element.tag in exclude:
+                    n_excluded -= 1
+                if parent is not None:
+                    parent.remove(element)
+                continue
+            if decoder is not None:
+                if element.tag == "field":
+                    decoder.fields.append(element.text)
+                elif element.tag == "set":
+                    decoder.end_set(element)
+                    parent.remove(element)
+                elif element.tag == "array":
+                    decoder.finalize()
+                    self._array_decoders[element] = decoder
+                    decoder = None
+            self.parse_leaf_to_dict(element, d)
+            if streaming and parent is not None and len(path) == 1:
+                # direct children of the root are completely parsed at this point
+                parent.remove(element)
+                self._array_decoders = dict()
+
+    def _get_number_of_projected_bands(self, path):
+        """
+        The projections are preceded by the eigenvalues, which give the number of spins, k-points and bands, which is
+        the number of leaf sets of the projections.
+        """
+        if path[-1].tag != "projected":
+            return None
+        for eigenvalues in path[-1].findall("eigenvalues"):
+            for array in eigenvalues.findall("array"):
+                if array in self._array_decoders:
+                    decoder = self._array_decoders[array]
+                    if decoder.array is not None:
+                        return int(np.prod(decoder.array.shape[:-2]))
+        return None
+
+    def _pop_decoded_array(self, node):
+        """
+        Get the array decoded from the node while the file was streamed
+
+        Args:
+            node (xml.etree.Element instance): The <array> node
+
+        Returns:
+            numpy.ndarray/None: The decoded array or None if the node was not decoded, like an array without rows
+        """
+        decoder = self._array_decoders.pop(node, None)
+        if decoder is None:
+            return None
+        return decoder.array
+
+    def update(self, filename="vasprun.xml"):
+        """
+        Parse only the part of the vasprun.xml file which was appended since the previous call and update
+        vasprun_dict, so the output of a running VASP calculation can be followed without parsing the whole file on
+        every call. The first call parses the whole file, as does every call after the file was overwritten. Only the
+        ionic steps parsed in this call are converted to arrays, which grow with the number of ionic steps.
+
+        Args:
+            filename (str): Path to the vasprun file
+
+        Returns:
+            int: number of completed ionic steps parsed so far
+
+        Raises:
+            VasprunError: if the file is corrupted, i.e. it is no valid XML or it contains no root element
+        """
+        if not (os.path.isfile(filename)):
+            raise AssertionError()
+        if (
+            self._xml_reader is None
+            or self._xml_reader.filename != filename
+            or self._xml_reader.is_overwritten()
+        ):
+            self._xml_reader = _IncrementalXMLReader(filename=filename)
+            self._incremental_dict = dict()
+            self._init_dict(self._incremental_dict)
+            self._incremental_arrays = {
+                key: _GrowingArray() for key in _INCREMENTAL_ARRAY_KEYS
+            }
+        try:
+            for leaf in self._xml_reader.iter_closed_elements():
+                self.parse_leaf_to_dict(leaf, self._incremental_dict)
+                if leaf.tag == "calculation":
+                    # the ionic step is completely parsed, so it is no longer needed in the element tree
+                    leaf.clear()
+        except ParseError:
+            raise VasprunError(
+                "The vasprun.xml file is either corrupted or the simulation has failed"
+            )
+        if self._xml_reader.offset > 0 and not self._xml_reader.has_root:
+            raise VasprunError(
+                "The vasprun.xml file is either corrupted or the simulation has failed"
+            )
+        if len(self._incremental_dict["positions"]) > 0:
+            d = dict(self._incremental_dict)
+            self._convert_dict_to_arrays(d)
+            for key, values in self._incremental_arrays.items():
+                for value in d[key]:
+                    values.append(value)
+                d[key] = values.to_array()
+                # the converted ionic steps are only kept in the growing arrays
+                self._incremental_dict[key] = list()
+            self.vasprun_dict.update(d)
+        n_steps = len(self._incremental_arrays["positions"])
+        return n_steps
+
+    @staticmethod
+    def _init_dict(d):
         d["scf_energies"] = list()
         d["scf_fr_energies"] = list()
         d["scf_0_energies"] = list()
@@ -80,29 +273,40 @@ class Vasprun(object):
         d["total_fr_energies"] = list()
         d["total_0_energies"] = list()
         d["stress_tensors"] = list()
-        for _, leaf in ETree.iterparse(filename):
-            if leaf.tag in ["generator", "incar"]:
-                d[leaf.tag] = dict()
-                for items in leaf:
-                    d[leaf.tag] = self.parse_item_to_dict(items, d[leaf.tag])
-            if leaf.tag in ["kpoints"]:
-                d[leaf.tag] = dict()
-                self.parse_kpoints_to_dict(leaf, d[leaf.tag])
-            if leaf.tag in ["atominfo"]:
-                d[leaf.tag] = dict()
-                self.parse_atom_information_to_dict(leaf, d[leaf.tag])
-            if leaf.tag in ["structure"] and "name" in leaf.keys():
-                if "initialpos" in leaf.attrib["name"]:
-                    d["init_structure"] = dict()
-                    self.parse_structure_to_dict(leaf, d["init_structure"])
-                elif "finalpos" in leaf.attrib["name"]:
-                    d["final_structure"] = dict()
-                    self.parse_structure_to_dict(leaf, d["final_structure"])
-            if leaf.tag in ["calculation"]:
-                self.parse_calc_to_dict(leaf, d)
-            if leaf.tag in ["parameters"]:
-                pass
-                self.parse_parameters(leaf, d)
+
+    def parse_leaf_to_dict(self, leaf, d):
+        """
+        Parses a completely read node of the xml tree to a dictionary
+
+        Args:
+            leaf (xml.etree.Element instance): The node to parse
+            d (dict): The dictionary to which data is to be parsed
+        """
+        if leaf.tag in ["generator", "incar"]:
+            d[leaf.tag] = dict()
+            for items in leaf:
+                d[leaf.tag] = self.parse_item_to_dict(items, d[leaf.tag])
+        if leaf.tag in ["kpoints"]:
+            d[leaf.tag] = dict()
+            self.parse_kpoints_to_dict(leaf, d[leaf.tag])
+        if leaf.tag in ["atominfo"]:
+            d[leaf.tag] = dict()
+            self.parse_atom_information_to_dict(leaf, d[leaf.tag])
+        if leaf.tag in ["structure"] and "name" in leaf.keys():
+            if "initialpos" in leaf.attrib["name"]:
+                d["init_structure"] = dict()
+                self.parse_structure_to_dict(leaf, d["init_structure"])
+            elif "finalpos" in leaf.attrib["name"]:
+                d["final_structure"] = dict()
+                self.parse_structure_to_dict(leaf, d["final_structure"])
+        if leaf.tag in ["calculation"]:
+            self.parse_calc_to_dict(leaf, d)
+        if leaf.tag in ["parameters"]:
+            pass
+            self.parse_parameters(leaf, d)
+
+    @staticmethod
+    def _convert_dict_to_arrays(d):
         d["cells"] = np.array(d["cells"])
         d["positions"] = np.array(d["positions"])
         # Check if the parsed coordinates are in absolute/relative coordinates. If absolute, convert to relative
@@ -269,6 +473,12 @@ class Vasprun(object):
             raise AssertionError()
         for item in node:
             if item.tag == "array":
+                values = self._pop_decoded_array(item)
+                if values is not None:
+                    d["spin_dos_energies"] = np.ascontiguousarray(values[..., 0])
+                    d["spin_dos_density"] = np.ascontiguousarray(values[..., 1])
+                    d["spin_dos_idensity"] = np.ascontiguousarray(values[..., 2])
+                    continue
                 for ii in item:
                     if ii.tag == "set":
                         spin_dos_energies = list()
@@ -304,6 +514,13 @@ class Vasprun(object):
         orbital_index = 0
         for item in node:
             if item.tag == "array":
+                values = self._pop_decoded_array(item)
+                if values is not None:
+                    # (ion, spin, energy, 1 + orbital) -> (spin, ion, orbital, energy)
+                    d["resolved_dos_matrix"] = np.ascontiguousarray(
+                        values[..., 1:].transpose(1, 0, 3, 2)
+                    )
+                    continue
                 for ii in item:
                     if ii.tag == "field":
                         if "energy" not in ii.text:
@@ -353,6 +570,14 @@ class Vasprun(object):
         orbital_index = 0
         for item in node:
             if item.tag == "array":
+                decoder = self._array_decoders.get(item, None)
+                values = self._pop_decoded_array(item)
+                if values is not None:
+                    d["grand_dos_matrix"] = values
+                    d["orbital_dict"] = {
+                        field: index for index, field in enumerate(decoder.fields)
+                    }
+                    continue
                 for ii in item:
                     if ii.tag == "field":
                         orbital_dict[ii.text] = orbital_index
@@ -492,6 +717,11 @@ class Vasprun(object):
         grand_occupancy_matrix = list()
         for item in node:
             if item.tag == "array":
+                values = self._pop_decoded_array(item)
+                if values is not None:
+                    grand_eigenvalue_matrix = np.ascontiguousarray(values[..., 0])
+                    grand_occupancy_matrix = np.ascontiguousarray(values[..., 1])
+                    continue
                 for ii in item:
                     if ii.tag == "set":
                         spin_occ_mat = list()
@@ -612,6 +842,13 @@ class Vasprun(object):
         Returns:
             numpy.ndarray: The required 2D array/vector
         """
+        if vec_type is float and all(["type" not in item.attrib for item in node]):
+            try:
+                return np.array(
+                    " ".join([item.text for item in node]).split(), dtype=float
+                ).reshape(len(node), -1)
+            except (TypeError, ValueError):
+                pass
         arr = list()
         for item in node:
             arr.append(self._parse_vector(item, vec_type=vec_type))
@@ -819,9 +1056,185 @@ def get_float_with_exception(text, exception_value=0.0):
         return exception_value
 
 
+class _ArrayDecoder(object):
+    """
+    Decodes the nested <set> blocks of an <array> in the vasprun.xml file in bulk into a single numpy array, while the
+    file is parsed. The innermost sets, which contain the rows <r>, are decoded as soon as they are complete, so they can
+    be removed from the element tree right away. The resulting array has one dimension per level of nested sets, after
+    the outermost one, followed by the rows and the fields.
+
+    Args:
+        n_leaf_sets (int/None): Expected number of innermost sets, used to preallocate the array
+    """
+
+    def __init__(self, n_leaf_sets=None):
+        self.fields = list()
+        self.array = None
+        self._n_leaf_sets = n_leaf_sets
+        self._buffer = None
+        self._size = 0
+        self._n_rows = None
+        self._n_sets = list()
+        self._depth = 0
+
+    def start_set(self):
+        if len(self._n_sets) == self._depth:
+            self._n_sets.append(0)
+        self._n_sets[self._depth] += 1
+        self._depth += 1
+
+    def end_set(self, element):
+        """
+        Decode the rows of an innermost set, which has to be called before the set is removed from the element tree.
+
+        Args:
+            element (xml.etree.Element instance): The completely parsed <set> node
+
+        Raises:
+            _ArrayDecodeError: If the rows can not be decoded
+        """
+        self._depth -= 1
+        if len(element) > 0 and element[0].tag == "r":
+            try:
+                self._add_rows(element)
+            except (TypeError, ValueError):
+                raise _ArrayDecodeError(
+                    "The rows of an <array> in the vasprun.xml file could not be decoded"
+                )
+
+    def _add_rows(self, element):
+        values = np.array(" ".join([row.text for row in element]).split(), dtype=float)
+        if self._n_rows is None:
+            self._n_rows = len(element)
+        if len(element) != self._n_rows or len(values) != self._n_rows * len(
+            self.fields
+        ):
+            raise ValueError("The sets of the array differ in shape")
+        if self._buffer is None:
+            n_sets = 16 if self._n_leaf_sets is None else self._n_leaf_sets
+            self._buffer = np.empty(n_sets * len(values))
+        elif self._size + len(values) > len(self._buffer):
+            buffer = np.empty(2 * len(self._buffer))
+            buffer[: self._size] = self._buffer[: self._size]
+            self._buffer = buffer
+        self._buffer[self._size : self._size + len(values)] = values
+        self._size += len(values)
+
+    def finalize(self):
+        """
+        Reshape the decoded values, array stays None if the array has no rows.
+
+        Raises:
+            _ArrayDecodeError: If the sets are not nested regularly
+        """
+        if self._buffer is None:
+            return
+        shape = [
+            self._n_sets[depth] // self._n_sets[depth - 1]
+            for depth in range(1, len(self._n_sets))
+        ]
+        try:
+            self.array = self._buffer[: self._size].reshape(
+                shape + [self._n_rows, len(self.fields)]
+            )
+        except ValueError:
+            raise _ArrayDecodeError(
+                "The sets of an <array> in the vasprun.xml file are not nested regularly"
+            )
+        if self.array is not None and self._size < len(self._buffer):
+            self.array = self.array.copy()
+        self._buffer = None
+
+
+class _ClosedElementTreeBuilder(TreeBuilder):
+    """
+    Tree builder which keeps track of the elements which were closed since they were last collected.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._closed_elements = list()
+
+    has_root = False
+
+    def start(self, tag, attrs):
+        self.has_root = True
+        return super().start(tag, attrs)
+
+    def end(self, tag):
+        element = super().end(tag)
+        self._closed_elements.append(element)
+        return element
+
+    def pop_closed_elements(self):
+        """
+        Returns:
+            list: elements closed since the previous call in the order they were closed
+        """
+        closed_elements, self._closed_elements = self._closed_elements, list()
+        return closed_elements
+
+
+class _IncrementalXMLReader(object):
+    """
+    Parses a growing XML file in multiple steps. The XML parser is kept between the steps, so every step only reads the
+    bytes appended to the file since the previous one.
+
+    Args:
+        filename (str): Path to the XML file
+        chunk_size (int): Number of bytes read and parsed at once
+    """
+
+    def __init__(self, filename, chunk_size=2**20):
+        self.filename = filename
+        self.offset = 0
+        self._chunk_size = chunk_size
+        self._builder = _ClosedElementTreeBuilder()
+        self._parser = DefusedXMLParser(target=self._builder)
+
+    def is_overwritten(self):
+        """
+        Returns:
+            bool: True if the file is shorter than the part which was already parsed
+        """
+        return os.path.getsize(self.filename) < self.offset
+
+    @property
+    def has_root(self):
+        """
+        bool: True if the root element of the XML file was opened
+        """
+        return self._builder.has_root
+
+    def iter_closed_elements(self):
+        """
+        Parse the bytes appended to the file since the previous call.
+
+        Yields:
+            xml.etree.Element instance: the elements which were closed in the order they were closed, like the "end"
+                                        events of iterparse
+        """
+        with open(self.filename, "rb") as f:
+            f.seek(self.offset)
+            chunk = f.read(self._chunk_size)
+            while len(chunk) > 0:
+                self._parser.feed(chunk)
+                self.offset += len(chunk)
+                for element in self._builder.pop_closed_elements():
+                    yield element
+                chunk = f.read(self._chunk_size)
+
+
 class VasprunError(ValueError):
     pass
 
 
+class _ArrayDecodeError(VasprunError):
+    """
+    Raised while streaming if an <array> can not be decoded in bulk, the file is then parsed again without bulk
+    decoding.
+    """
+
+
 class VasprunWarning(UserWarning):
     pass
@@ -3,6 +3,7 @@
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
 import math
+import mmap
 
 import numpy as np
 import os
@@ -40,17 +41,21 @@ class VaspVolumetricData(VolumetricData):
         self._diff_data = None
         self._total_data = None
 
-    def from_file(self, filename, normalize=True):
+    def from_file(self, filename, normalize=True, memmap=False):
         """
         Parsing the contents of from a file
 
+        With `memmap` the grids are additionally written to a `.npy` file next to the parsed file and read from there
+        as long as it is newer than the parsed file, see :meth:`._read_vol_data`.
+
         Args:
             filename (str): Path of file to parse
             normalize (boolean): Flag to normalize by the volume of the cell
+            memmap (boolean): Flag to store the grids in a memory mapped `.npy` file
         """
         try:
             self.atoms, vol_data_list = self._read_vol_data(
-                filename=filename, normalize=normalize
+                filename=filename, normalize=normalize, memmap=memmap
             )
         except (ValueError, IndexError, TypeError):
             try:
@@ -151,14 +156,22 @@ class VaspVolumetricData(VolumetricData):
                 data = {"total": all_dataset[0] / volume}
                 return atoms, [data["total"]]
 
-    def _read_vol_data(self, filename, normalize=True):
+    def _read_vol_data(self, filename, normalize=True, memmap=False):
         """
-        Parses the VASP volumetric type files (CHGCAR, LOCPOT, PARCHG etc). Rather than looping over individual values,
-        this function utilizes numpy indexing resulting in a parsing efficiency of at least 10%.
+        Parses the VASP volumetric type files (CHGCAR, LOCPOT, PARCHG etc). The grid blocks are located in the memory
+        mapped file and each one is decoded with a few calls to numpy directly into the (x fastest) Fortran ordered
+        array of the grid, so no index arrays or intermediate lists are created.
+
+        If `memmap` is set the grids are written to `<filename>.npy` (`<filename>.normalized.npy` with `normalize`) as
+        one array of shape Nx x Ny x Nz x N_grids and returned as copy-on-write memory maps of it.  The file is written
+        to a temporary file first and then moved in place, so it is never read incomplete.  If this file exists, is
+        newer than `filename` and matches the grid dimensions and the number of grids in `filename`, only the
+        structure and the positions of the grids are parsed and the grids are mapped from it directly.
 
         Args:
             filename (str): File to be parsed
             normalize (bool): Normalize the data with respect to the volume (Recommended for CHGCAR files)
+            memmap (bool): Store the grids in a memory mapped `.npy` file
 
         Returns:
             pyiron.atomistics.structure.atoms.Atoms: The structure of the volumetric snapshot
@@ -168,92 +181,231 @@ class VaspVolumetricData(VolumetricData):
         if not os.path.getsize(filename) > 0:
             state.logger.warning("File:" + filename + "seems to be empty! ")
             return None, None
-        with open(filename, "r") as f:
-            struct_lines = list()
-            get_grid = False
-            n_x = 0
-            n_y = 0
-            n_z = 0
-            n_grid = 0
-            n_grid_str = None
-            total_data_list = list()
-            atoms = None
-            for line in f:
-                strip_line = line.strip()
-                if not get_grid:
-                    if strip_line == "":
-                        get_grid = True
-                    struct_lines.append(strip_line)
-                elif n_grid_str is None:
-                    n_x, n_y, n_z = [int(val) for val in strip_line.split()]
-                    n_grid = n_x * n_y * n_z
-                    n_grid_str = " ".join([str(val) for val in [n_x, n_y, n_z]])
-                    load_txt = np.genfromtxt(f, max_rows=int(n_grid / 5))
-                    load_txt = np.hstack(load_txt)
-                    if n_grid % 5 != 0:
-                        add_line = np.genfromtxt(f, max_rows=1)
-                        load_txt = np.append(load_txt, np.hstack(add_line))
-                    total_data = self._fastest_index_reshape(load_txt, [n_x, n_y, n_z])
-                    try:
-                        atoms = atoms_from_string(struct_lines)
-                    except ValueError:
-                        pot_str = filename.split("/")
-                        pot_str[-1] = "POTCAR"
-                        potcar_file = "/".join(pot_str)
-                        species = get_species_list_from_potcar(potcar_file)
-                        atoms = atoms_from_string(struct_lines, species_list=species)
-                    if normalize:
-                        total_data /= atoms.get_volume()
-                    total_data_list.append(total_data)
-                elif atoms is not None:
-                    grid_str = n_grid_str.replace(" ", "")
-                    if grid_str == strip_line.replace(" ", ""):
-                        load_txt = np.genfromtxt(f, max_rows=int(n_grid / 5))
-                        load_txt = np.hstack(load_txt)
-                        if n_grid % 5 != 0:
-                            add_line = np.genfromtxt(f, max_rows=1)
-                            load_txt = np.hstack(
-                                np.append(load_txt, np.hstack(add_line))
-                            )
-                        total_data = self._fastest_index_reshape(
-                            load_txt, [n_x, n_y, n_z]
-                        )
-                        if normalize:
-                            total_data /= atoms.get_volume()
-                        total_data_list.append(total_data)
-            if len(total_data_list) == 0:
+        npy_file = filename + (".normalized.npy" if normalize else ".npy")
+        with open(filename, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as buffer:
+            header_end, struct_lines = self._read_vol_header(buffer)
+            if header_end is None:
+                state.logger.warning(
+                    "File:"
+                    + filename
+                    + "seems to be corrupted/empty even after parsing!"
+                )
+                return None, None
+            atoms = self._get_vol_atoms(struct_lines, filename)
+            grid, blocks = self._index_vol_blocks(buffer, header_end)
+            if len(blocks) == 0:
                 state.logger.warning(
                     "File:"
                     + filename
                     + "seems to be corrupted/empty even after parsing!"
                 )
                 return None, None
-            return atoms, total_data_list
+            shape = tuple(grid) + (len(blocks),)
+            if memmap and os.path.exists(npy_file):
+                data = self._load_vol_npy(
+                    npy_file=npy_file, filename=filename, shape=shape
+                )
+                if data is not None:
+                    return atoms, [data[..., i] for i in range(len(blocks))]
+            if memmap:
+                tmp_file = npy_file + "." + str(os.getpid()) + ".tmp"
+                data = np.lib.format.open_memmap(
+                    tmp_file,
+                    mode="w+",
+                    dtype=np.float64,
+                    shape=shape,
+                    fortran_order=True,
+                )
+            else:
+                data = np.empty(shape, dtype=np.float64, order="F")
+            try:
+                n_grid = int(np.prod(grid))
+                flat_data = data.reshape(-1, order="F")
+                for i, start in enumerate(blocks):
+                    self._read_vol_block(
+                        buffer, start, flat_data[i * n_grid : (i + 1) * n_grid]
+                    )
+                if normalize:
+                    data /= atoms.get_volume()
+                if memmap:
+                    data.flush()
+                    del data, flat_data
+                    os.replace(tmp_file, npy_file)
+                    data = np.load(npy_file, mmap_mode="c")
+            finally:
+                if memmap and os.path.exists(tmp_file):
+                    os.remove(tmp_file)
+        return atoms, [data[..., i] for i in range(len(blocks))]
+
+    @staticmethod
+    def _load_vol_npy(npy_file, filename, shape):
+        """
+        Map the grids stored in a `.npy` file by a previous call of `_read_vol_data`.
+
+        Args:
+            npy_file (str): path of the `.npy` file
+            filename (str): path of the parsed volumetric file
+            shape (tuple): expected shape Nx x Ny x Nz x N_grids of the stored array
+
+        Returns:
+            numpy.memmap: copy-on-write memory map of the grids, None if the file is older than `filename`, can not be
+                          read or does not match the expected shape and size
+        """
+        if os.path.getmtime(npy_file) < os.path.getmtime(filename):
+            return None
+        try:
+            data = np.load(npy_file, mmap_mode="c")
+        except (EOFError, OSError, ValueError):
+            return None
+        if (
+            data.shape != shape
+            or data.dtype != np.float64
+            or os.path.getsize(npy_file) != data.offset + data.nbytes
+        ):
+            return None
+        return data
+
+    @staticmethod
+    def _read_vol_header(buffer):
+        """
+        Read the structure lines at the beginning of a volumetric file, which end with the first empty line.
+
+        Args:
+            buffer (mmap.mmap): contents of the file
+
+        Returns:
+            int: position after the empty line, None if there is no empty line
+            list: stripped structure lines including the empty line
+        """
+        struct_lines = list()
+        position = 0
+        while position < len(buffer):
+            end = buffer.find(b"\n", position)
+            if end == -1:
+                end = len(buffer)
+            line = buffer[position:end].decode().strip()
+            struct_lines.append(line)
+            position = end + 1
+            if line == "":
+                return position, struct_lines
+        return None, struct_lines
+
+    @staticmethod
+    def _get_vol_atoms(struct_lines, filename):
+        try:
+            return atoms_from_string(struct_lines)
+        except ValueError:
+            pot_str = filename.split("/")
+            pot_str[-1] = "POTCAR"
+            potcar_file = "/".join(pot_str)
+            species = get_species_list_from_potcar(potcar_file)
+            return atoms_from_string(struct_lines, species_list=species)
 
     @staticmethod
-    def _fastest_index_reshape(raw_data, grid):
+    def _index_vol_blocks(buffer, position):
         """
-        Helper function to parse volumetric data with x-axis as the fastest index into a 3D numpy array
+        Find the starts of all grid blocks, i.e. the lines following the grid dimension line.
+
+        In files with multiple grids (e.g. spin polarized CHGCAR) the grid dimension line is repeated before every grid.
 
         Args:
-            raw_data (numpy.ndarray): Raw unprocessed volumetric data which is flattened
-            grid (list/turple/numpy.ndarray): Sequence of the integer grid points [Nx, Ny, Nz]
+            buffer (mmap.mmap): contents of the file
+            position (int): position of the grid dimension line of the first grid
 
         Returns:
-            numpy.ndarray: A Nx $\times$ Ny $\times$ Nz numpy array
+            list: the grid dimensions [Nx, Ny, Nz]
+            list: start positions of the grid blocks
+        """
+        end = buffer.find(b"\n", position)
+        dim_line = buffer[position:end].strip()
+        grid = [int(val) for val in dim_line.split()]
+        if len(grid) != 3:
+            raise ValueError("Grid dimension line expected, got: " + dim_line.decode())
+        blocks = list()
+        while end != -1:
+            blocks.append(end + 1)
+            position = end + 1
+            while True:
+                position = buffer.find(dim_line, position)
+                if position == -1:
+                    return grid, blocks
+                line_start = buffer.rfind(b"\n", 0, position) + 1
+                end = buffer.find(b"\n", position)
+                line_end = end if end != -1 else len(buffer)
+                if buffer[line_start:line_end].strip() == dim_line:
+                    break
+                position += len(dim_line)
+        return grid, blocks
 
+    @staticmethod
+    def _read_vol_block(buffer, start, out, chunk_size=2**24):
         """
-        n_x, n_y, n_z = grid
-        total_data = np.zeros((n_x, n_y, n_z))
-        all_data = raw_data[0 : np.prod(grid)]
-        all_indices = np.arange(len(all_data), dtype=int)
-        x_indices = all_indices % n_x
-        y_indices = all_indices / n_x % n_y
-        y_indices = np.array(y_indices, dtype=int)
-        z_indices = all_indices / (n_x * n_y)
-        z_indices = np.array(z_indices, dtype=int)
-        total_data[x_indices, y_indices, z_indices] = all_data
-        return total_data
+        Decode the values of one grid block in bulk.
+
+        VASP writes the grid with a fixed number of values per line and a fixed width, so the byte range of the block
+        follows from the length of its first line. The range is decoded in chunks of whole lines to limit the memory
+        for the intermediate bytes.  If the lines do not have a fixed width, the values are decoded line chunk by line
+        chunk until the block is complete.
+
+        Args:
+            buffer (mmap.mmap): contents of the file
+            start (int): position of the first line of the block
+            out (numpy.ndarray): flat array to write the values to, its length is the number of grid points
+            chunk_size (int): approximate number of bytes decoded at once
+        """
+        n_values = len(out)
+        first_end = buffer.find(b"\n", start)
+        if first_end == -1:
+            first_end = len(buffer)
+        line_length = first_end - start + 1
+        per_line = len(buffer[start:first_end].split())
+        if per_line == 0:
+            raise ValueError("Empty line in volumetric data block")
+        n_lines = n_values // per_line
+        end = start + n_lines * line_length
+        fixed_width = end <= len(buffer) and (
+            n_lines == 0
+            or (
+                np.frombuffer(buffer, dtype=np.uint8)[
+                    start + line_length - 1 : end : line_length
+                ]
+                == ord("\n")
+            ).all()
+        )
+        if fixed_width:
+            lines_per_chunk = max(1, chunk_size // line_length)
+            for line in range(0, n_lines, lines_per_chunk):
+                chunk_lines = min(lines_per_chunk, n_lines - line)
+                values = np.fromstring(
+                    buffer[
+                        start
+                        + line * line_length : start
+                        + (line + chunk_lines) * line_length
+                    ],
+                    sep=" ",
+                )
+                if len(values) != chunk_lines * per_line:
+                    raise ValueError("Unable to parse volumetric data block")
+                out[line * per_line : (line + chunk_lines) * per_line] = values
+            n_read = n_lines * per_line
+            position = end
+        else:
+            n_read = 0
+            position = start
+        while n_read < n_values:
+            # remaining (partial) line, or all lines if they do not have a fixed width
+            end = buffer.find(b"\n", min(position + chunk_size, len(buffer)))
+            if end == -1:
+                end = len(buffer)
+            # the chunk may run into the augmentation data after the block, so only convert the missing values
+            tokens = buffer[position:end].split()[: n_values - n_read]
+            if len(tokens) == 0:
+                raise ValueError("Unable to parse volumetric data block")
+            out[n_read : n_read + len(tokens)] = np.array(tokens, dtype=np.float64)
+            n_read += len(tokens)
+            position = end + 1
 
     @property
     def total_data(self):
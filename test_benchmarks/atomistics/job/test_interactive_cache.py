@@ -0,0 +1,103 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+import os
+import tempfile
+import time
+import unittest
+import numpy as np
+from pyiron_base import FileHDFio
+from pyiron_atomistics.atomistics.job.interactive_cache import (
+    InteractiveCache,
+    InteractiveHDFWriter,
+)
+
+
+class TestInteractiveCache(unittest.TestCase):
+    """
+    Compare collecting and flushing the steps of an interactive run with the array-backed cache and the background
+    writer to the list cache, which is converted and rewritten to the HDF5 file on every flush.
+
+    Increase n_atoms and n_flushes to benchmark a long interactive molecular dynamics run.
+    """
+
+    n_atoms = 500
+    n_flushes = 40
+    flush_frequency = 20
+    expected_speedup_factor = 3
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        rng = np.random.default_rng(42)
+        cls.positions = rng.random((cls.flush_frequency, cls.n_atoms, 3))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_flush_speed(self):
+        file_name = os.path.join(self.directory.name, "cache.h5")
+        file_name_loop = os.path.join(self.directory.name, "loop.h5")
+        t1 = time.perf_counter()
+        cache = InteractiveCache()
+        writer = InteractiveHDFWriter()
+        for _ in range(self.n_flushes):
+            for positions in self.positions:
+                cache["positions"].append(positions)
+                cache["energy_pot"].append(float(positions[0, 0]))
+            writer.append(
+                file_name,
+                "/job/output/interactive",
+                {key: buffer.to_array().copy() for key, buffer in cache.items()},
+            )
+            for buffer in cache.values():
+                buffer.clear()
+        writer.wait()
+        t2 = time.perf_counter()
+        flush_loop(file_name_loop, self.positions, self.n_flushes)
+        t3 = time.perf_counter()
+        hdf = FileHDFio(file_name)
+        hdf_loop = FileHDFio(file_name_loop)
+        self.assertTrue(
+            np.array_equal(
+                hdf["job/output/interactive/positions"],
+                hdf_loop["job/output/interactive/positions"],
+            )
+        )
+        self.assertTrue(
+            np.array_equal(
+                hdf["job/output/interactive/energy_pot"],
+                hdf_loop["job/output/interactive/energy_pot"],
+            )
+        )
+        self.assertGreater(
+            (t3 - t2) / (t2 - t1),
+            self.expected_speedup_factor,
+            "Appending to resizable HDF5 datasets ({:.3f} s) is not faster than rewriting the datasets on every "
+            "flush ({:.3f} s)!".format(t2 - t1, t3 - t2),
+        )
+
+
+def flush_loop(file_name, positions, n_flushes):
+    """
+    Steps flushed as before the array-backed cache, by reading, extending and rewriting every dataset.
+    """
+    hdf = FileHDFio(file_name)
+    cache = {"positions": [], "energy_pot": []}
+    for _ in range(n_flushes):
+        for step in positions:
+            cache["positions"].append(step)
+            cache["energy_pot"].append(float(step[0, 0]))
+        with hdf.open("job/output/interactive") as h5:
+            for key, values in cache.items():
+                if key in h5.list_nodes():
+                    h5[key] = np.concatenate((h5[key], np.array(values)))
+                else:
+                    h5[key] = np.array(values)
+        cache = {key: [] for key in cache}
+
+
+if __name__ == "__main__":
+    unittest.main()
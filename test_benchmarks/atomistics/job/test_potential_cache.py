@@ -0,0 +1,94 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest import mock
+import numpy as np
+from pyiron_atomistics.atomistics.job.potential_cache import stage_potential_file
+
+
+class TestPotentialCache(unittest.TestCase):
+    """
+    Compare staging a POTCAR file, concatenated from the files of the individual elements, through the potential
+    cache in the working directories of many jobs to writing the concatenated file for every job.
+
+    Increase n_jobs to 10**4 and file_size to 10**7 to benchmark a large campaign with large tabulated potentials.
+    """
+
+    n_jobs = 100
+    n_elements = 3
+    file_size = 2 * 10**6
+    expected_speedup_factor = 5
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.patch = mock.patch.dict(
+            os.environ,
+            {"PYIRONPOTENTIALCACHE": os.path.join(cls.directory.name, "cache")},
+        )
+        cls.patch.start()
+        rng = np.random.default_rng(42)
+        cls.path_lst = []
+        for i in range(cls.n_elements):
+            file_name = os.path.join(cls.directory.name, "POTCAR_" + str(i))
+            with open(file_name, "wb") as f:
+                f.write(rng.bytes(cls.file_size))
+            cls.path_lst.append(file_name)
+        cls.job_lst = []
+        for i in range(cls.n_jobs):
+            job_directory = os.path.join(cls.directory.name, "job_" + str(i))
+            os.makedirs(job_directory)
+            cls.job_lst.append(job_directory)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.patch.stop()
+        cls.directory.cleanup()
+
+    def test_jobs_per_second(self):
+        t1 = time.perf_counter()
+        for job_directory in self.job_lst:
+            stage_potential_file(
+                path_lst=self.path_lst,
+                destination=os.path.join(job_directory, "POTCAR"),
+            )
+        t2 = time.perf_counter()
+        for job_directory in self.job_lst:
+            stage_loop(
+                path_lst=self.path_lst,
+                destination=os.path.join(job_directory, "POTCAR_loop"),
+            )
+        t3 = time.perf_counter()
+        for job_directory in self.job_lst[:: max(1, self.n_jobs // 10)]:
+            with open(os.path.join(job_directory, "POTCAR"), "rb") as f, open(
+                os.path.join(job_directory, "POTCAR_loop"), "rb"
+            ) as f_loop:
+                self.assertEqual(f.read(), f_loop.read())
+        self.assertGreater(
+            (t3 - t2) / (t2 - t1),
+            self.expected_speedup_factor,
+            "Staging the POTCAR files through the potential cache ({:.1f} jobs/s) is not faster than writing them "
+            "for every job ({:.1f} jobs/s)!".format(
+                self.n_jobs / (t2 - t1), self.n_jobs / (t3 - t2)
+            ),
+        )
+
+
+def stage_loop(path_lst, destination):
+    """
+    POTCAR file as written before the potential cache, by concatenating the files of the elements for every job.
+    """
+    with open(destination, "wb") as f:
+        for path in path_lst:
+            with open(path, "rb") as source:
+                shutil.copyfileobj(source, f)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+import gc
+import os
+import tempfile
+import time
+import types
+import unittest
+from unittest import mock
+import numpy as np
+import pandas
+from pyiron_atomistics.atomistics.job import potentials
+from pyiron_atomistics.atomistics.job.potentials import PotentialAbstract
+
+
+class TestPotentialDatabase(unittest.TestCase):
+    """
+    Compare looking up the potentials for a set of elements in the cached and indexed potential database to parsing
+    the CSV file and scanning every potential for every lookup.
+
+    Increase n_potentials to 10**5 to benchmark a large collection of potentials. Every lookup includes copying the
+    lists in the cached database, which bounds the speedup.
+    """
+
+    n_potentials = 5000
+    n_lookups = 20
+    expected_speedup_factor = 1.2
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        resource_path = os.path.join(cls.directory.name, "resources")
+        potential_path = os.path.join(resource_path, "lammps", "potentials")
+        os.makedirs(potential_path)
+        rng = np.random.default_rng(42)
+        elements = ["Al", "Cu", "Fe", "Mg", "Ni", "Ti", "Zr", "Si", "O", "H"]
+        species = [
+            list(rng.choice(elements, size=rng.integers(1, 4), replace=False))
+            for _ in range(cls.n_potentials)
+        ]
+        pandas.DataFrame(
+            {
+                "Config": [
+                    [
+                        "pair_style eam/alloy \n",
+                        "pair_coeff * * {}.eam.alloy\n".format(i),
+                    ]
+                    for i in range(cls.n_potentials)
+                ],
+                "Filename": [
+                    ["potentials/{}.eam.alloy".format(i)]
+                    for i in range(cls.n_potentials)
+                ],
+                "Model": ["EAM"] * cls.n_potentials,
+                "Name": ["potential_{}".format(i) for i in range(cls.n_potentials)],
+                "Species": species,
+            }
+        ).to_csv(os.path.join(potential_path, "potentials_lammps.csv"))
+        cls.patches = [
+            mock.patch.object(
+                potentials,
+                "state",
+                types.SimpleNamespace(
+                    settings=types.SimpleNamespace(resource_paths=[resource_path])
+                ),
+            ),
+            mock.patch.dict(
+                os.environ,
+                {"PYIRONPOTENTIALCACHE": os.path.join(cls.directory.name, "cache")},
+            ),
+        ]
+        for patch in cls.patches:
+            patch.start()
+        cls.lookups = [
+            list(rng.choice(elements, size=2, replace=False))
+            for _ in range(cls.n_lookups)
+        ]
+
+    @classmethod
+    def tearDownClass(cls):
+        for patch in cls.patches:
+            patch.stop()
+        cls.directory.cleanup()
+
+    def test_lookups_per_second(self):
+        potentials._potential_df_cache.clear()
+        # start both measurements with the same state of the garbage collector, so a full collection triggered by the
+        # objects allocated before is not attributed to one of them
+        gc.collect()
+        t1 = time.perf_counter()
+        names = [
+            PotentialAbstract(potential_df=get_potential_df())
+            .find(element)["Name"]
+            .tolist()
+            for element in self.lookups
+        ]
+        t2 = time.perf_counter()
+        gc.collect()
+        t3 = time.perf_counter()
+        names_loop = [
+            find_loop(get_potential_df_loop(), element)["Name"].tolist()
+            for element in self.lookups
+        ]
+        t4 = time.perf_counter()
+        self.assertEqual(names, names_loop)
+        self.assertGreater(
+            (t4 - t3) / (t2 - t1),
+            self.expected_speedup_factor,
+            "Looking up potentials in the cached database ({:.1f} lookups/s) is not faster than parsing the "
+            "database for every lookup ({:.1f} lookups/s)!".format(
+                self.n_lookups / (t2 - t1), self.n_lookups / (t4 - t3)
+            ),
+        )
+
+
+def get_potential_df():
+    return PotentialAbstract._get_potential_df(
+        plugin_name="lammps",
+        file_name_lst={"potentials_lammps.csv"},
+        backward_compatibility_name="lammps",
+    )
+
+
+def get_potential_df_loop():
+    """
+    Potential database as parsed before the cache, by reading the CSV file on every call.
+    """
+    resource_path = os.path.join(
+        potentials.state.settings.resource_paths[0], "lammps", "potentials"
+    )
+    return pandas.read_csv(
+        os.path.join(resource_path, "potentials_lammps.csv"),
+        index_col=0,
+        converters={
+            "Species": lambda x: x.replace("'", "").strip("[]").split(", "),
+            "Config": lambda x: x.replace("'", "")
+            .replace("\\n", "\n")
+            .strip("[]")
+            .split(", "),
+            "Filename": lambda x: x.replace("'", "").strip("[]").split(", "),
+        },
+    )
+
+
+def find_loop(potential_df, element):
+    """
+    Potentials for a set of elements as found before the inverted index, by scanning every potential.
+    """
+    return potential_df[
+        [set(element).issubset(species) for species in potential_df["Species"].values]
+    ]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+import unittest
+import numpy as np
+import time
+from pyiron_atomistics.atomistics.structure.factory import StructureFactory
+from pyiron_atomistics.atomistics.structure.neighbors import NeighborsTrajectory
+from pyiron_atomistics.atomistics.structure.structurestorage import StructureStorage
+
+
+class TestNeighborsTrajectory(unittest.TestCase):
+    def test_verlet_speed(self):
+        """
+        Reusing the candidate list between frames should be faster than a full neighbor search per frame.
+        """
+        trajectory = generate_trajectory(n_frames=40)
+        n_frames = len(trajectory)
+        expected_speedup_factor = 1.5
+        t1 = time.perf_counter()
+        traj = NeighborsTrajectory(has_structure=trajectory)
+        t2 = time.perf_counter()
+        traj_skin = NeighborsTrajectory(has_structure=trajectory, skin=0.4)
+        t3 = time.perf_counter()
+        self.assertTrue(np.array_equal(traj.indices, traj_skin.indices),
+                        "Verlet list does not reproduce the neighbors of the full search!")
+        fps_full = n_frames / (t2 - t1)
+        fps_skin = n_frames / (t3 - t2)
+        self.assertGreater(fps_skin / fps_full, expected_speedup_factor,
+                           f"Verlet list not fast enough: {fps_skin:.1f} frames/s vs. {fps_full:.1f} frames/s!")
+
+
+def generate_trajectory(n_frames, step=0.02):
+    bulk = StructureFactory().bulk("Al", cubic=True).repeat(5)
+    trajectory = StructureStorage()
+    positions = bulk.positions.copy()
+    rng = np.random.default_rng(42)
+    for _ in range(n_frames):
+        positions += rng.normal(scale=step, size=positions.shape)
+        structure = bulk.copy()
+        structure.positions = positions
+        structure.center_coordinates_in_unit_cell()
+        trajectory.add_structure(structure)
+    return trajectory
@@ -0,0 +1,71 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+import time
+import unittest
+import numpy as np
+from pyiron_atomistics.atomistics.structure.factory import StructureFactory
+from pyiron_atomistics.atomistics.volumetric.generic import VolumetricData
+
+
+class TestVolumetricData(unittest.TestCase):
+    """
+    Compare the batched spherical average around every atom of a supercell to one loop over the grid per atom.
+    """
+
+    expected_speedup_factor = 20
+
+    @classmethod
+    def setUpClass(cls):
+        cls.structure = StructureFactory().bulk("Al", cubic=True).repeat(2)
+        cls.vd = VolumetricData()
+        cls.vd.total_data = np.random.default_rng(42).random((40, 40, 40))
+
+    def test_spherical_average_speed(self):
+        centers = self.structure.get_scaled_positions()
+        t1 = time.perf_counter()
+        averages = self.vd.spherical_average_potentials(
+            self.structure, spherical_centers=centers, rad=2
+        )
+        t2 = time.perf_counter()
+        averages_loop = [
+            spherical_average_loop(self.vd.total_data, self.structure.cell, c, rad=2)
+            for c in centers
+        ]
+        t3 = time.perf_counter()
+        self.assertTrue(np.allclose(averages, averages_loop))
+        self.assertGreater(
+            (t3 - t2) / (t2 - t1),
+            self.expected_speedup_factor,
+            "Batched spherical averages are not faster than looping over the grid!",
+        )
+
+
+def spherical_average_loop(data, cell, spherical_center, rad=2, fwhm=0.529177):
+    """
+    Spherical average as done before the batched version: one python loop over the grid points around the center.
+    """
+    grid_shape = data.shape
+    n_grid_at_center = [
+        int(np.ceil(spherical_center[i] * grid_shape[i])) for i in range(3)
+    ]
+    dist_in_grid = [np.linalg.norm(cell[i]) / grid_shape[i] for i in range(3)]
+    n_max = [int(np.ceil(rad / dist)) for dist in dist_in_grid]
+    sph_avg_tmp = []
+    weight = 0
+    for k in range(n_grid_at_center[0] - n_max[0], n_grid_at_center[0] + n_max[0]):
+        for l in range(n_grid_at_center[1] - n_max[1], n_grid_at_center[1] + n_max[1]):
+            for m in range(
+                n_grid_at_center[2] - n_max[2], n_grid_at_center[2] + n_max[2]
+            ):
+                dist = VolumetricData.dist_between_two_grid_points(
+                    [k, l, m], n_grid_at_center, cell, grid_shape
+                )
+                if dist <= rad:
+                    sph_avg_tmp.append(
+                        data[k % grid_shape[0], l % grid_shape[1], m % grid_shape[2]]
+                        * VolumetricData.gauss_f(dist, fwhm)
+                    )
+                    weight += VolumetricData.gauss_f(dist, fwhm)
+    return np.sum(sph_avg_tmp) / weight
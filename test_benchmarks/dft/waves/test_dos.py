@@ -0,0 +1,94 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+import os
+import tempfile
+import time
+import unittest
+import numpy as np
+from pyiron_base import FileHDFio
+from pyiron_atomistics.dft.waves.dos import Dos
+from pyiron_atomistics.dft.waves.electronic import ElectronicStructure
+
+
+class TestDos(unittest.TestCase):
+    """
+    Compare the atom resolved DOS streamed in k-point blocks from the grand_dos_matrix in the HDF5 file to the loop
+    over every eigenvalue on the grand_dos_matrix in memory.
+
+    Increase n_kpoints, n_bands and n_atoms to benchmark a grand_dos_matrix larger than the memory.
+    """
+
+    n_kpoints = 200
+    n_bands = 100
+    n_atoms = 32
+    expected_speedup_factor = 5
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        rng = np.random.default_rng(42)
+        es = ElectronicStructure()
+        es.kpoint_list = rng.random((cls.n_kpoints, 3))
+        es.kpoint_weights = np.ones(cls.n_kpoints) / cls.n_kpoints
+        es.eigenvalue_matrix = rng.random((1, cls.n_kpoints, cls.n_bands)) * 20 - 10
+        es.occupancy_matrix = (es.eigenvalue_matrix < 0.0).astype(float)
+        es.grand_dos_matrix = rng.random(
+            (1, cls.n_kpoints, cls.n_bands, cls.n_atoms, 9)
+        )
+        es.generate_from_matrices()
+        cls.hdf = FileHDFio(os.path.join(cls.directory.name, "es.h5"))
+        es.to_hdf(cls.hdf, group_name="es")
+        cls.es = es
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_spatially_resolved_dos_speed(self):
+        atom_indices = np.arange(0, self.n_atoms, 2)
+        t1 = time.perf_counter()
+        es = ElectronicStructure()
+        es.from_hdf(self.hdf, group_name="es")
+        r_dos = Dos(es_obj=es, n_bins=100).get_spatially_resolved_dos(atom_indices)
+        t2 = time.perf_counter()
+        dos = Dos(es_obj=self.es, n_bins=100)
+        r_dos_loop = spatially_resolved_dos_loop(dos, atom_indices)
+        t3 = time.perf_counter()
+        self.assertIsNone(es._grand_dos_matrix)
+        self.assertTrue(np.allclose(r_dos, r_dos_loop))
+        self.assertGreater(
+            (t3 - t2) / (t2 - t1),
+            self.expected_speedup_factor,
+            "Streaming the resolved DOS from the HDF5 file is not faster than looping over the eigenvalues!",
+        )
+
+
+def spatially_resolved_dos_loop(dos, atom_indices, spin_indices=0):
+    """
+    Atom resolved DOS as computed before the blockwise reduction, by looping over every eigenvalue.
+    """
+    grand_sum = np.sum(dos.es_obj.grand_dos_matrix)
+    tot_val = dos.es_obj.grand_dos_matrix.copy() / grand_sum
+    _, n_kpts, n_bands, _, _ = np.shape(tot_val)
+    k = 0
+    b = 0
+    r_dos = np.zeros_like(dos.t_dos[spin_indices])
+    w_dos = np.zeros_like(dos.t_dos[spin_indices])
+    for e in dos.es_obj.eigenvalues[spin_indices]:
+        weight = np.sum(tot_val[spin_indices, k, b, atom_indices, :])
+        weight_sum = np.sum(tot_val[spin_indices, k, b, :, :])
+        if b < n_bands - 1:
+            b += 1
+        else:
+            b = 0
+            k += 1
+        index = len(dos.energies[spin_indices][dos.energies[spin_indices] < e]) - 1
+        r_dos[max(index, 0)] += weight
+        w_dos[max(index, 0)] += weight_sum
+    ind_0 = np.argwhere(w_dos < 1e-8).flatten()
+    ind_1 = np.argwhere(w_dos >= 1e-8).flatten()
+    r_dos[ind_1] /= w_dos[ind_1]
+    r_dos[ind_0] = 0.0
+    return r_dos * dos.t_dos[spin_indices]
@@ -0,0 +1,72 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+import time
+import unittest
+import numpy as np
+from pyiron_atomistics.dft.waves.electronic import ElectronicStructure
+
+
+class TestElectronicStructure(unittest.TestCase):
+    """
+    Compare the array based band edges of the ElectronicStructure to looping over the Kpoint and Band instances.
+
+    Increase n_kpoints to 10000 and n_bands to 500 to benchmark a large calculation.
+    """
+
+    n_kpoints = 1000
+    n_bands = 100
+    expected_speedup_factor = 20
+
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        eigenvalues = np.sort(
+            rng.random((2, self.n_kpoints, self.n_bands)) * 20 - 10, axis=-1
+        )
+        self.es = ElectronicStructure()
+        self.es.kpoint_list = rng.random((self.n_kpoints, 3))
+        self.es.kpoint_weights = np.ones(self.n_kpoints) / self.n_kpoints
+        self.es.eigenvalue_matrix = eigenvalues
+        self.es.occupancy_matrix = (eigenvalues < 0.0).astype(float)
+        self.es.efermi = 0.0
+        self.es.n_spins = 2
+
+    def test_band_edges_speed(self):
+        t1 = time.perf_counter()
+        self.es.generate_from_matrices()
+        vbm, cbm, eg = self.es.vbm, self.es.cbm, self.es.eg
+        is_metal = self.es.is_metal
+        t2 = time.perf_counter()
+        kpoints = self.es.kpoints
+        vbm_loop = band_edges_loop(kpoints, n_spins=2, valence=True)
+        cbm_loop = band_edges_loop(kpoints, n_spins=2, valence=False)
+        t3 = time.perf_counter()
+        self.assertEqual(vbm, vbm_loop)
+        self.assertEqual(cbm, cbm_loop)
+        self.assertEqual(eg, [max(0.0, c - v) for v, c in zip(vbm_loop, cbm_loop)])
+        self.assertEqual(is_metal, [True, True])
+        self.assertGreater(
+            (t3 - t2) / (t2 - t1),
+            self.expected_speedup_factor,
+            "Array based band edges are not faster than looping over Kpoint and Band instances!",
+        )
+
+
+def band_edges_loop(kpoints, n_spins, valence=True, resolution=1e-6):
+    """
+    Band edges as computed before the array based implementation, by looping over every band of every k-point.
+    """
+    edge_lst = list()
+    for spin in range(n_spins):
+        edge = None
+        for kpt in kpoints:
+            for band in kpt.bands[spin]:
+                if valence and band.occupancy > resolution:
+                    if edge is None or band.eigenvalue > edge:
+                        edge = band.eigenvalue
+                elif not valence and band.occupancy <= resolution:
+                    if edge is None or band.eigenvalue < edge:
+                        edge = band.eigenvalue
+        edge_lst.append(edge)
+    return edge_lst
@@ -0,0 +1,138 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+from ctypes import c_double
+import tempfile
+import time
+import unittest
+import numpy as np
+from pyiron_base import Project, ProjectHDFio
+from pyiron_atomistics.atomistics.structure.atoms import Atoms
+from pyiron_atomistics.lammps.interactive import _check_ortho_prism
+from pyiron_atomistics.lammps.lammps import Lammps
+from pyiron_atomistics.lammps.units import UnitConverter
+
+
+class InteractiveLibrary(object):
+    """
+    Serial LAMMPS library which stores the local atoms in a random order, with the ctypes and the numpy interface.
+    """
+
+    def __init__(self, n_atoms, rng):
+        self.numpy = _NumpyInterface(self)
+        self.id = rng.permutation(n_atoms).astype(np.int32) + 1
+        self.x = rng.random((n_atoms, 3))
+        self.f = rng.random((n_atoms, 3))
+
+    def command(self, command_in):
+        pass
+
+    def gather_atoms(self, name, data_type, count):
+        values = np.empty_like(getattr(self, name))
+        values[self.id - 1] = getattr(self, name)
+        return np.ctypeslib.as_ctypes(values.flatten())
+
+    def scatter_atoms(self, name, data_type, count, data):
+        getattr(self, name)[:] = np.ctypeslib.as_array(data).reshape(-1, count)[
+            self.id - 1
+        ]
+
+
+class _NumpyInterface(object):
+    def __init__(self, library):
+        self._library = library
+
+    def extract_atom(self, name):
+        return getattr(self._library, name)
+
+
+class TestLammpsInteractive(unittest.TestCase):
+    """
+    Compare the steps per second of an interactive loop exchanging numpy arrays with LAMMPS to the loop converting
+    every value through Python lists and ctypes arrays.
+
+    Increase n_atoms to 10**5 and n_steps to 100 to benchmark a large interactive molecular dynamics run.
+    """
+
+    n_atoms = 10**4
+    n_steps = 20
+    expected_speedup_factor = 5
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.project = Project(cls.directory.name)
+        cls.job = Lammps(
+            project=ProjectHDFio(project=cls.project, file_name="lammps"),
+            job_name="lammps",
+        )
+        cls.job.server.run_mode.interactive = True
+        rng = np.random.default_rng(42)
+        cls.job.structure = Atoms(
+            ["Al"] * cls.n_atoms,
+            positions=rng.random((cls.n_atoms, 3)),
+            cell=10 * np.eye(3),
+        )
+        cls.job._interactive_library = InteractiveLibrary(n_atoms=cls.n_atoms, rng=rng)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_steps_per_second(self):
+        positions = self.job.structure.positions
+        t1 = time.perf_counter()
+        for _ in range(self.n_steps):
+            self.job.interactive_positions_setter(positions)
+            positions_step = self.job.interactive_positions_getter()
+            forces_step = self.job.interactive_forces_getter()
+        t2 = time.perf_counter()
+        for _ in range(self.n_steps):
+            positions_setter_loop(self.job, positions)
+            positions_loop = positions_getter_loop(self.job, "x")
+            forces_loop = positions_getter_loop(self.job, "f")
+        t3 = time.perf_counter()
+        self.assertTrue(np.allclose(positions_step, positions))
+        self.assertTrue(np.allclose(positions_loop, positions_step))
+        self.assertTrue(np.allclose(forces_loop, forces_step))
+        self.assertGreater(
+            (t3 - t2) / (t2 - t1),
+            self.expected_speedup_factor,
+            "Exchanging numpy arrays with LAMMPS ({:.1f} steps/s) is not faster than converting through Python "
+            "lists ({:.1f} steps/s)!".format(
+                self.n_steps / (t2 - t1), self.n_steps / (t3 - t2)
+            ),
+        )
+
+
+def positions_getter_loop(job, name):
+    """
+    Positions or forces as gathered before the numpy interface, through Python lists.
+    """
+    uc = UnitConverter(units=job.units)
+    values = np.reshape(
+        np.array(job._interactive_library.gather_atoms(name, 1, 3)),
+        (len(job.structure), 3),
+    )
+    if _check_ortho_prism(prism=job._prism):
+        values = np.matmul(values, job._prism.R.T)
+    values = uc.convert_array_to_pyiron_units(values, label="positions")
+    return values.tolist()
+
+
+def positions_setter_loop(job, positions):
+    """
+    Positions as scattered before the numpy interface, by converting every value to a ctypes double.
+    """
+    if _check_ortho_prism(prism=job._prism):
+        positions = np.array(positions).reshape(-1, 3)
+        positions = np.matmul(positions, job._prism.R)
+    positions = np.array(positions).flatten()
+    job._interactive_library.scatter_atoms(
+        "x", 1, 3, (len(positions) * c_double)(*positions)
+    )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+import os
+import tempfile
+import time
+import unittest
+from io import StringIO
+import numpy as np
+import pandas as pd
+from pyiron_atomistics.atomistics.structure.atoms import Atoms
+from pyiron_atomistics.lammps.output import _collect_dump_from_text
+from pyiron_atomistics.lammps.structure import UnfoldingPrism
+
+
+class TestDumpParser(unittest.TestCase):
+    """
+    Compare decoding all snapshots of a LAMMPS dump file in bulk to parsing every snapshot with its own pandas call.
+
+    Increase n_frames and n_atoms to about 10**4 and 10**5 to benchmark the dump of a production run.
+    """
+
+    n_frames = 500
+    n_atoms = 200
+    expected_speedup_factor = 1.5
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.filename = os.path.join(cls.directory.name, "dump.out")
+        write_synthetic_dump(
+            filename=cls.filename, n_frames=cls.n_frames, n_atoms=cls.n_atoms
+        )
+        cls.structure = Atoms(
+            ["Al"] * cls.n_atoms,
+            positions=np.zeros((cls.n_atoms, 3)),
+            cell=10 * np.eye(3),
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_bulk_decoding_speed(self):
+        prism = UnfoldingPrism(self.structure.cell)
+        t1 = time.perf_counter()
+        output = _collect_dump_from_text(
+            file_name=self.filename,
+            prism=prism,
+            structure=self.structure,
+            potential_elements=["Al"],
+        )
+        t2 = time.perf_counter()
+        forces = parse_per_frame(filename=self.filename, prism=prism)
+        t3 = time.perf_counter()
+        self.assertEqual(output["forces"].shape, (self.n_frames, self.n_atoms, 3))
+        self.assertTrue(np.array_equal(output["forces"], forces))
+        self.assertGreater(
+            (t3 - t2) / (t2 - t1),
+            self.expected_speedup_factor,
+            "Bulk decoding of the dump file is not faster than one pandas call per snapshot!",
+        )
+
+
+def write_synthetic_dump(filename, n_frames, n_atoms):
+    rng = np.random.default_rng(seed=0)
+    with open(filename, "w") as f:
+        for step in range(n_frames):
+            f.write(f"ITEM: TIMESTEP\n{step}\nITEM: NUMBER OF ATOMS\n{n_atoms}\n")
+            f.write("ITEM: BOX BOUNDS pp pp pp\n0 10\n0 10\n0 10\n")
+            f.write("ITEM: ATOMS id type xsu ysu zsu fx fy fz vx vy vz\n")
+            values = rng.random((n_atoms, 9))
+            for i, atom_id in enumerate(rng.permutation(n_atoms)):
+                f.write(f"{atom_id + 1} 1 " + " ".join(map(repr, values[i])) + "\n")
+
+
+def parse_per_frame(filename, prism):
+    """
+    Parse the forces with one pandas call per snapshot, like _collect_dump_from_text() did before the bulk decoding.
+    """
+    forces = []
+    with open(filename, "r") as f:
+        for line in f:
+            if "ITEM: NUMBER OF ATOMS" in line:
+                n = int(f.readline())
+            elif "ITEM: ATOMS" in line:
+                buf = StringIO()
+                for _ in range(n):
+                    buf.write(f.readline())
+                buf.seek(0)
+                df = pd.read_csv(
+                    buf,
+                    nrows=n,
+                    sep=r"\s+",
+                    header=None,
+                    names=line.split()[2:],
+                    engine="c",
+                )
+                df.sort_values(by="id", ignore_index=True, inplace=True)
+                force = np.stack([df["fx"], df["fy"], df["fz"]], axis=1)
+                forces.append(np.matmul(force, prism.R.T))
+    return np.array(forces)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+import time
+import unittest
+import numpy as np
+from pyiron_atomistics.atomistics.structure.factory import StructureFactory
+from pyiron_atomistics.lammps.structure import LammpsStructure, UnfoldingPrism
+
+
+class TestLammpsStructure(unittest.TestCase):
+    """
+    Compare writing the atoms of a large structure to the LAMMPS data file with a single rotation and a single string
+    formatting operation to the loop rotating and formatting every atom on its own.
+
+    Increase n_repeat to 100 to benchmark a structure with millions of atoms.
+    """
+
+    n_repeat = 20
+    expected_speedup_factor = 2
+
+    @classmethod
+    def setUpClass(cls):
+        structure = StructureFactory().bulk("Al", cubic=True).repeat(cls.n_repeat)
+        structure[::3] = "Ni"
+        structure.positions += (
+            np.random.default_rng(42).random(structure.positions.shape) * 0.1
+        )
+        structure.cell[1, 0] += 0.5
+        cls.structure = structure
+
+    def test_structure_atomic_speed(self):
+        lmp_structure = LammpsStructure()
+        lmp_structure.el_eam_lst = ["Ni", "Al"]
+        t1 = time.perf_counter()
+        lmp_structure.structure = self.structure
+        t2 = time.perf_counter()
+        atoms_loop = structure_atomic_loop(self.structure, ["Ni", "Al"])
+        t3 = time.perf_counter()
+        self.assertEqual(
+            lmp_structure._string_input.split("Atoms\n\n")[1], atoms_loop + "\n"
+        )
+        self.assertGreater(
+            (t3 - t2) / (t2 - t1),
+            self.expected_speedup_factor,
+            "Formatting all atoms at once ({:.2f} s) is not faster than formatting every atom on its own "
+            "({:.2f} s)!".format(t2 - t1, t3 - t2),
+        )
+
+
+def structure_atomic_loop(structure, el_eam_lst):
+    """
+    Atoms section of the LAMMPS data file as written before the vectorized writer, atom by atom.
+    """
+    prism = UnfoldingPrism(structure.cell)
+    coords = [prism.pos_to_lammps(position) for position in structure.positions]
+    el_dict = {el: el_eam_lst.index(el.Abbreviation) + 1 for el in structure.species}
+    atoms = ""
+    for id_atom, (el, coord) in enumerate(
+        zip(structure.get_chemical_elements(), coords)
+    ):
+        c = np.zeros(3)
+        c[: structure.dimension] = coord
+        atoms += (
+            "{0:d} {1:d} {2:.15f} {3:.15f} {4:.15f}".format(
+                id_atom + 1, el_dict[el], c[0], c[1], c[2]
+            )
+            + "\n"
+        )
+    return atoms
+
+
+if __name__ == "__main__":
+    unittest.main()
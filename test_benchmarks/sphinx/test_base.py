@@ -0,0 +1,142 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+import os
+import tempfile
+import time
+import unittest
+import numpy as np
+from pyiron_base import DataContainer
+from pyiron_atomistics.sphinx.base import Output, HARTREE_TO_EV
+
+
+class _Job:
+    def __init__(self, n_atoms):
+        self.id_spx_to_pyi = np.arange(n_atoms)[::-1]
+
+
+class TestOutput(unittest.TestCase):
+    """
+    Compare the columnar reader for the SCF .dat files to parsing them with splitter based list comprehensions.
+
+    Both parsers return the same nested lists, so creating the Python floats dominates and the benchmark only guards
+    against the columnar reader becoming slower. Increase n_steps to 100000 to benchmark a long molecular dynamics run.
+    Both parsers are timed n_repeats times and the fastest run of each is compared, so a busy machine does not fail the
+    benchmark.
+    """
+
+    n_steps = 5000
+    n_atoms = 8
+    n_repeats = 3
+    expected_speedup_factor = 1
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        rng = np.random.default_rng(42)
+        counter = np.concatenate(
+            [np.arange(n) for n in rng.integers(5, 40, cls.n_steps)]
+        )
+        n_scf = len(counter)
+        energies = np.column_stack([counter, rng.random((n_scf, 6))])
+        np.savetxt(
+            os.path.join(cls.directory.name, "energy.dat"),
+            energies,
+            fmt=["%d"] + 6 * ["%.12f"],
+            delimiter="\t",
+        )
+        residue = np.column_stack([counter, rng.random((n_scf, 2))])
+        np.savetxt(
+            os.path.join(cls.directory.name, "residue.dat"),
+            residue,
+            fmt=["%d", "%g", "%g"],
+            delimiter="\t",
+        )
+        spins = np.column_stack([counter, rng.random((n_scf, cls.n_atoms))])
+        np.savetxt(
+            os.path.join(cls.directory.name, "spins.dat"),
+            spins,
+            fmt=["%d"] + cls.n_atoms * ["%.6f"],
+            delimiter=" ",
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_collect_dat_speed(self):
+        cwd = self.directory.name
+        time_columnar, time_loop = [], []
+        for _ in range(self.n_repeats):
+            t1 = time.perf_counter()
+            output = Output(job=_Job(self.n_atoms))
+            output.collect_energy_dat(cwd=cwd)
+            output.collect_residue_dat(cwd=cwd)
+            output.collect_spins_dat(cwd=cwd)
+            t2 = time.perf_counter()
+            dft_loop = collect_dat_loop(
+                cwd=cwd, id_spx_to_pyi=_Job(self.n_atoms).id_spx_to_pyi
+            )
+            t3 = time.perf_counter()
+            time_columnar.append(t2 - t1)
+            time_loop.append(t3 - t2)
+        for key, value in dft_loop.items():
+            self.assertEqual(len(output.generic.dft[key]), self.n_steps)
+            self.assertEqual(
+                [len(step) for step in output.generic.dft[key]],
+                [len(step) for step in value],
+            )
+            self.assertTrue(
+                np.array_equal(
+                    np.concatenate(output.generic.dft[key]),
+                    np.concatenate([np.array(step) for step in value]),
+                )
+            )
+        self.assertGreater(
+            min(time_loop) / min(time_columnar),
+            self.expected_speedup_factor,
+            "Columnar reader for the SCF .dat files is not faster than the splitter based parser!",
+        )
+
+
+def splitter_loop(arr, counter):
+    """
+    Split into ionic steps as before the offsets based implementation.
+    """
+    arr_new = []
+    spl_loc = list(np.where(np.array(counter) == min(counter))[0])
+    spl_loc.append(None)
+    for ii, ll in enumerate(spl_loc[:-1]):
+        arr_new.append(np.array(arr[ll : spl_loc[ii + 1]]).tolist())
+    return arr_new
+
+
+def collect_dat_loop(cwd, id_spx_to_pyi):
+    """
+    Parse energy.dat, residue.dat and spins.dat as before the columnar reader.
+    """
+    dft = DataContainer()
+    energies = np.loadtxt(os.path.join(cwd, "energy.dat"))
+    dft.scf_computation_time = splitter_loop(energies[:, 1], energies[:, 0])
+    for i, key in enumerate(
+        [
+            "scf_energy_int",
+            "scf_energy_free",
+            "scf_energy_zero",
+            "scf_energy_band",
+            "scf_electronic_entropy",
+        ]
+    ):
+        dft[key] = splitter_loop(energies[:, i + 2] * HARTREE_TO_EV, energies[:, 0])
+    residue = np.loadtxt(os.path.join(cwd, "residue.dat"))
+    dft.scf_residue = splitter_loop(residue[:, 1:], residue[:, 0])
+    spins = np.loadtxt(os.path.join(cwd, "spins.dat"))
+    dft.atom_scf_spins = splitter_loop(
+        np.array([ss[id_spx_to_pyi] for ss in spins[:, 1:]]), spins[:, 0]
+    )
+    return dft
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+import os
+import tempfile
+import time
+import unittest
+import warnings
+import numpy as np
+from pyiron_atomistics.vasp.outcar import Outcar
+
+
+class TestOutcar(unittest.TestCase):
+    """
+    Compare the single pass OUTCAR parser to parsing every quantity with its own pass over the lines of the file.
+
+    The synthetic OUTCAR is generated by repeating the first ionic step of a sample file, increase n_ionic_steps to
+    about 10**5 to benchmark a 1 GB OUTCAR. Both parsers are timed n_repeats times and the fastest run of each is
+    compared, so a busy machine does not fail the benchmark.
+    """
+
+    n_ionic_steps = 2000
+    n_repeats = 3
+    expected_speedup_factor = 2
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.filename = os.path.join(cls.directory.name, "OUTCAR")
+        write_synthetic_outcar(
+            filename=cls.filename,
+            template=os.path.join(
+                os.path.dirname(os.path.abspath(__file__)),
+                "../../tests/static/vasp_test_files/outcar_samples/OUTCAR_9",
+            ),
+            n_ionic_steps=cls.n_ionic_steps,
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_single_pass_speed(self):
+        time_single_pass, time_multi_pass = [], []
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for _ in range(self.n_repeats):
+                t1 = time.perf_counter()
+                outcar = Outcar()
+                outcar.from_file(filename=self.filename)
+                t2 = time.perf_counter()
+                positions, energies = parse_multi_pass(filename=self.filename)
+                t3 = time.perf_counter()
+                time_single_pass.append(t2 - t1)
+                time_multi_pass.append(t3 - t2)
+        self.assertEqual(
+            outcar.parse_dict["positions"].shape, (self.n_ionic_steps + 1, 3, 3)
+        )
+        self.assertTrue(np.array_equal(outcar.parse_dict["positions"], positions))
+        self.assertTrue(np.array_equal(outcar.parse_dict["energies"], energies))
+        self.assertGreater(
+            min(time_multi_pass) / min(time_single_pass),
+            self.expected_speedup_factor,
+            "Single pass parsing of the OUTCAR is not faster than one pass per quantity!",
+        )
+
+
+def write_synthetic_outcar(filename, template, n_ionic_steps):
+    with open(template, "r") as f:
+        lines = f.readlines()
+    ionic_steps = [i for i, line in enumerate(lines) if "(   1)  -----" in line]
+    header = lines[: ionic_steps[0]]
+    ionic_step = lines[ionic_steps[0] : ionic_steps[1]]
+    footer = lines[ionic_steps[1] :]
+    with open(filename, "w") as f:
+        f.writelines(header)
+        for _ in range(n_ionic_steps):
+            f.writelines(ionic_step)
+        f.writelines(footer)
+
+
+def parse_multi_pass(filename):
+    """
+    Parse all quantities of the OUTCAR file with one pass each, like Outcar.from_file() did before it was single pass.
+    """
+    outcar = Outcar()
+    with open(filename, "r") as f:
+        lines = f.readlines()
+    energies = outcar.get_total_energies(filename=filename, lines=lines)
+    outcar.get_energy_without_entropy(filename=filename, lines=lines)
+    outcar.get_energy_sigma_0(filename=filename, lines=lines)
+    outcar.get_all_total_energies(filename=filename, lines=lines)
+    n_atoms = outcar.get_number_of_atoms(filename=filename, lines=lines)
+    outcar.get_forces(filename=filename, lines=lines, n_atoms=n_atoms)
+    positions = outcar.get_positions(filename=filename, lines=lines, n_atoms=n_atoms)
+    outcar.get_cells(filename=filename, lines=lines)
+    outcar.get_steps(filename=filename, lines=lines)
+    outcar.get_temperatures(filename=filename, lines=lines)
+    outcar.get_time(filename=filename, lines=lines)
+    outcar.get_fermi_level(filename=filename, lines=lines)
+    outcar.get_dipole_moments(filename=filename, lines=lines)
+    outcar.get_kinetic_energy_error(filename=filename, lines=lines)
+    outcar.get_stresses(filename=filename, si_unit=False, lines=lines)
+    outcar.get_nelect(filename=filename, lines=lines)
+    outcar.get_band_properties(filename=filename, lines=lines)
+    outcar.get_elastic_constants(filename=filename, lines=lines)
+    outcar.get_energy_components(filename=filename, lines=lines)
+    outcar.get_cpu_time(filename=filename, lines=lines)
+    outcar.get_user_time(filename=filename, lines=lines)
+    outcar.get_system_time(filename=filename, lines=lines)
+    outcar.get_elapsed_time(filename=filename, lines=lines)
+    outcar.get_memory_used(filename=filename, lines=lines)
+    outcar.get_irreducible_kpoints(filename=filename, lines=lines)
+    outcar.get_magnetization(filename=filename, lines=lines)
+    outcar.get_broyden_mixing_mesh(filename=filename, lines=lines)
+    return positions, energies
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+import os
+import tempfile
+import time
+import unittest
+import numpy as np
+from pyiron_atomistics.vasp.volumetric_data import VaspVolumetricData
+
+
+class TestVaspVolumetricData(unittest.TestCase):
+    """
+    Compare the bulk CHGCAR reader to reading the grid with `np.genfromtxt` and scattering it with index arrays.
+
+    The synthetic spin polarized CHGCAR uses the structure of a sample file, increase n_grid to 400 to benchmark a
+    400^3 grid.
+    """
+
+    n_grid = 100
+    expected_speedup_factor = 2
+    expected_memmap_speedup_factor = 10
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.filename = os.path.join(cls.directory.name, "CHGCAR")
+        write_synthetic_chgcar(
+            filename=cls.filename,
+            template=os.path.join(
+                os.path.dirname(os.path.abspath(__file__)),
+                "../../tests/static/vasp_test_files/chgcar_samples/CHGCAR_spin",
+            ),
+            n_grid=cls.n_grid,
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_bulk_read_speed(self):
+        t1 = time.perf_counter()
+        atoms, data = VaspVolumetricData()._read_vol_data(self.filename)
+        t2 = time.perf_counter()
+        data_genfromtxt = parse_genfromtxt(self.filename, volume=atoms.get_volume())
+        t3 = time.perf_counter()
+        self.assertEqual(len(data), 2)
+        for d, d_genfromtxt in zip(data, data_genfromtxt):
+            self.assertTrue(np.array_equal(d, d_genfromtxt))
+        self.assertGreater(
+            (t3 - t2) / (t2 - t1),
+            self.expected_speedup_factor,
+            "Bulk reading of the CHGCAR is not faster than np.genfromtxt!",
+        )
+
+    def test_memmap_speed(self):
+        vd = VaspVolumetricData()
+        t1 = time.perf_counter()
+        _, data = vd._read_vol_data(self.filename, memmap=True)
+        t2 = time.perf_counter()
+        _, data_memmap = vd._read_vol_data(self.filename, memmap=True)
+        t3 = time.perf_counter()
+        for d, d_memmap in zip(data, data_memmap):
+            self.assertTrue(np.array_equal(d, d_memmap))
+        self.assertGreater(
+            (t2 - t1) / (t3 - t2),
+            self.expected_memmap_speedup_factor,
+            "Opening the memory mapped grids is not faster than parsing the CHGCAR!",
+        )
+
+
+def write_synthetic_chgcar(filename, template, n_grid):
+    with open(template) as f:
+        lines = f.readlines()
+    header = "".join(lines[: lines.index("   28   28   28\n")])
+    rng = np.random.default_rng(42)
+    with open(filename, "w") as f:
+        f.write(header)
+        for values in (rng.random(n_grid**3) * 100, rng.random(n_grid**3) - 0.5):
+            f.write(f"  {n_grid}  {n_grid}  {n_grid}\n")
+            np.savetxt(
+                f,
+                values[: n_grid**3 // 5 * 5].reshape(-1, 5),
+                fmt=" %17.11E",
+                delimiter="",
+            )
+            if n_grid**3 % 5 != 0:
+                np.savetxt(
+                    f,
+                    values[n_grid**3 // 5 * 5 :].reshape(1, -1),
+                    fmt=" %17.11E",
+                    delimiter="",
+                )
+            f.write("augmentation occupancies   1  16\n")
+            f.write("  0.1000000E+01  0.2000000E+01  0.3000000E+01\n")
+
+
+def parse_genfromtxt(filename, volume):
+    """
+    Grid parsing as done before the bulk reader: read 5 values per row with np.genfromtxt and scatter them into the x
+    fastest grid with index arrays.
+    """
+    data_list = []
+    with open(filename) as f:
+        for line in f:
+            if line.strip() == "":
+                break
+        dim_line = f.readline()
+        n_x, n_y, n_z = [int(v) for v in dim_line.split()]
+        n_grid = n_x * n_y * n_z
+        while True:
+            raw = np.hstack(np.genfromtxt(f, max_rows=n_grid // 5))
+            if n_grid % 5 != 0:
+                raw = np.append(raw, np.hstack(np.genfromtxt(f, max_rows=1)))
+            indices = np.arange(n_grid)
+            data = np.zeros((n_x, n_y, n_z))
+            data[indices % n_x, (indices // n_x) % n_y, indices // (n_x * n_y)] = raw
+            data_list.append(data / volume)
+            for line in f:
+                if line == dim_line:
+                    break
+            else:
+                return data_list
@@ -0,0 +1,189 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+import os
+import tempfile
+import threading
+import unittest
+import h5py
+import numpy as np
+from pyiron_base import FileHDFio
+from pyiron_atomistics._tests import TestWithProject
+from pyiron_atomistics.atomistics.job.interactive import (
+    GenericInteractive,
+    _get_write_index,
+)
+from pyiron_atomistics.atomistics.job.interactive_cache import (
+    CacheBuffer,
+    InteractiveCache,
+    InteractiveHDFWriter,
+)
+
+
+class TestCacheBuffer(unittest.TestCase):
+    def test_append(self):
+        buffer = CacheBuffer(capacity=2)
+        for i in range(5):
+            buffer.append(np.full((2, 3), i, dtype=float))
+        self.assertTrue(buffer.is_array)
+        self.assertEqual(len(buffer), 5)
+        self.assertEqual(buffer.to_array().shape, (5, 2, 3))
+        self.assertTrue(np.array_equal(buffer[-1], np.full((2, 3), 4.0)))
+        self.assertTrue(np.array_equal(np.array(buffer)[:, 0, 0], np.arange(5)))
+
+    def test_clear(self):
+        buffer = CacheBuffer(capacity=4)
+        buffer.extend([1.0, 2.0])
+        block = buffer._block
+        buffer.clear()
+        self.assertEqual(len(buffer), 0)
+        buffer.append(3.0)
+        self.assertIs(buffer._block, block, msg="The preallocated block is reused")
+        self.assertEqual(buffer.tolist(), [3.0])
+
+    def test_promote(self):
+        buffer = CacheBuffer()
+        buffer.extend([0, 1.5])
+        self.assertTrue(buffer.is_array)
+        self.assertEqual(buffer.tolist(), [0.0, 1.5])
+
+    def test_ragged(self):
+        buffer = CacheBuffer()
+        buffer.extend([np.zeros(2), np.zeros(3), "Fe"])
+        self.assertFalse(buffer.is_array)
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual(buffer[-1], "Fe")
+        buffer.clear()
+        buffer.append(1.0)
+        self.assertTrue(buffer.is_array)
+
+
+class TestInteractiveCache(unittest.TestCase):
+    def test_mapping(self):
+        cache = InteractiveCache()
+        cache["energy_pot"].append(1.0)
+        self.assertEqual(list(cache.keys()), ["energy_pot"])
+        self.assertIsInstance(cache["energy_pot"], CacheBuffer)
+        cache["energy_pot"] = []
+        self.assertEqual(len(cache["energy_pot"]), 0)
+        cache["stress"] = [np.eye(3)]
+        self.assertEqual(cache["stress"].to_array().shape, (1, 3, 3))
+        del cache["stress"]
+        self.assertFalse("stress" in cache)
+
+
+class TestInteractiveHDFWriter(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.directory.name, "interactive.h5")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_append(self):
+        writer = InteractiveHDFWriter()
+        positions = np.random.rand(7, 4, 3)
+        writer.append(
+            self.file_name, "/job/output/interactive", {"positions": positions[:3]}
+        )
+        writer.append(
+            self.file_name, "/job/output/interactive", {"positions": positions[3:]}
+        )
+        writer.wait()
+        with h5py.File(self.file_name, mode="r") as f:
+            dataset = f["/job/output/interactive/positions"]
+            self.assertEqual(dataset.maxshape, (None, 4, 3))
+        hdf = FileHDFio(self.file_name)
+        self.assertTrue(
+            np.array_equal(hdf["job/output/interactive/positions"], positions)
+        )
+
+    def test_append_fixed_size(self):
+        hdf = FileHDFio(self.file_name)
+        hdf["job/output/interactive/energy_pot"] = np.array([1.0, 2.0])
+        writer = InteractiveHDFWriter()
+        writer.append(
+            self.file_name, "/job/output/interactive", {"energy_pot": np.array([3.0])}
+        )
+        writer.wait()
+        self.assertEqual(
+            hdf["job/output/interactive/energy_pot"].tolist(), [1.0, 2.0, 3.0]
+        )
+
+    def test_error(self):
+        def fail():
+            raise ValueError("write failed")
+
+        writer = InteractiveHDFWriter()
+        writer.submit(fail)
+        with self.assertRaises(ValueError):
+            writer.wait()
+        writer.wait()
+
+    def test_thread_stops(self):
+        writer = InteractiveHDFWriter()
+        writer.append(
+            self.file_name, "/job/output/interactive", {"steps": np.arange(3)}
+        )
+        writer.close()
+        self.assertIsNone(writer._thread, msg="The idle writer holds no thread")
+        hdf = FileHDFio(self.file_name)
+        self.assertEqual(hdf["job/output/interactive/steps"].tolist(), [0, 1, 2])
+
+    def test_synchronous(self):
+        writer = InteractiveHDFWriter(asynchronous=False)
+        writer.append(
+            self.file_name, "/job/output/interactive", {"steps": np.arange(3)}
+        )
+        self.assertIsNone(writer._thread)
+        hdf = FileHDFio(self.file_name)
+        self.assertEqual(hdf["job/output/interactive/steps"].tolist(), [0, 1, 2])
+
+    def test_close_error(self):
+        def fail():
+            raise ValueError("write failed")
+
+        writer = InteractiveHDFWriter()
+        writer.submit(fail)
+        with self.assertRaises(ValueError):
+            writer.close()
+
+
+class TestGenericInteractiveFlush(TestWithProject):
+    def test_project_hdf5_waits(self):
+        job = self.project.create_job(GenericInteractive, "interactive_flush")
+        event = threading.Event()
+        written = []
+
+        def write():
+            event.wait(timeout=10)
+            written.append(True)
+
+        job._interactive_hdf_writer.submit(write)
+        job.interactive_cache["steps"].append(1)
+        job.interactive_flush()
+        self.assertEqual(written, [], msg="Flushing does not wait for the writer")
+        timer = threading.Timer(0.1, event.set)
+        timer.start()
+        job.project_hdf5
+        self.assertEqual(
+            written, [True], msg="Accessing the HDF5 file waits for the writer"
+        )
+        timer.join()
+        self.assertEqual(job["output/interactive/steps"].tolist(), [1])
+
+
+class TestWriteIndex(unittest.TestCase):
+    def test_write_index(self):
+        self.assertEqual(_get_write_index(5).tolist(), [0, 1, 2, 3, 4])
+        self.assertEqual(_get_write_index(7, step=3).tolist(), [0, 3, 6])
+        self.assertEqual(
+            _get_write_index(8, step=3, include_last=True).tolist(), [0, 3, 6, 7]
+        )
+        self.assertEqual(_get_write_index(3, step=3).tolist(), [])
+        self.assertEqual(_get_write_index(3, step=3, include_last=True).tolist(), [2])
+
+
+if __name__ == "__main__":
+    unittest.main()
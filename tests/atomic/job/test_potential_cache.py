@@ -0,0 +1,179 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+from pyiron_atomistics.atomistics.job import potential_cache
+from pyiron_atomistics.atomistics.job.potential_cache import stage_potential_file
+
+
+class TestPotentialCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.patch = mock.patch.dict(
+            os.environ,
+            {"PYIRONPOTENTIALCACHE": os.path.join(self.directory.name, "cache")},
+        )
+        self.patch.start()
+        self.path_lst = []
+        for el in ["Fe", "Ni"]:
+            file_name = os.path.join(self.directory.name, el + ".eam.alloy")
+            with open(file_name, "w") as f:
+                f.write(el + " potential\n")
+            self.path_lst.append(file_name)
+        self.job_lst = []
+        for i in range(2):
+            job_directory = os.path.join(self.directory.name, "job_" + str(i))
+            os.makedirs(job_directory)
+            self.job_lst.append(job_directory)
+
+    def tearDown(self):
+        self.patch.stop()
+        self.directory.cleanup()
+
+    def read(self, file_name):
+        with open(file_name) as f:
+            return f.read()
+
+    def test_stage(self):
+        staged_lst = [
+            stage_potential_file(
+                path_lst=self.path_lst[0],
+                destination=os.path.join(job_directory, "Fe.eam.alloy"),
+            )
+            for job_directory in self.job_lst
+        ]
+        for file_name in staged_lst:
+            self.assertEqual(self.read(file_name), "Fe potential\n")
+        self.assertTrue(
+            os.path.samefile(staged_lst[0], staged_lst[1]),
+            msg="The staged files are hardlinks to the same file in the cache",
+        )
+        self.assertEqual(
+            len(
+                os.listdir(potential_cache._get_cache_directory(name="potential_files"))
+            ),
+            1,
+        )
+        stage_potential_file(path_lst=self.path_lst[0], destination=staged_lst[0])
+        self.assertEqual(self.read(staged_lst[0]), "Fe potential\n")
+
+    def test_concatenate(self):
+        file_name = stage_potential_file(
+            path_lst=self.path_lst,
+            destination=os.path.join(self.job_lst[0], "POTCAR"),
+        )
+        self.assertEqual(self.read(file_name), "Fe potential\nNi potential\n")
+        file_name = stage_potential_file(
+            path_lst=self.path_lst[::-1],
+            destination=os.path.join(self.job_lst[1], "POTCAR"),
+        )
+        self.assertEqual(self.read(file_name), "Ni potential\nFe potential\n")
+
+    def test_modified(self):
+        destination = os.path.join(self.job_lst[0], "Fe.eam.alloy")
+        stage_potential_file(path_lst=self.path_lst[0], destination=destination)
+        os.chmod(destination, 0o644)
+        with open(destination, "w") as f:
+            f.write("modified potential\n")
+        staged = stage_potential_file(
+            path_lst=self.path_lst[0],
+            destination=os.path.join(self.job_lst[1], "Fe.eam.alloy"),
+        )
+        self.assertEqual(
+            self.read(staged),
+            "Fe potential\n",
+            msg="The modified file in the cache is replaced",
+        )
+        with open(self.path_lst[0], "w") as f:
+            f.write("Fe potential version 2\n")
+        stage_potential_file(path_lst=self.path_lst[0], destination=staged)
+        self.assertEqual(self.read(staged), "Fe potential version 2\n")
+
+    def test_cache_not_writable(self):
+        cache_file_name = os.path.join(self.directory.name, "cache_file")
+        with open(cache_file_name, "w") as f:
+            f.write("")
+        with mock.patch.dict(os.environ, {"PYIRONPOTENTIALCACHE": cache_file_name}):
+            staged = stage_potential_file(
+                path_lst=self.path_lst,
+                destination=os.path.join(self.job_lst[0], "POTCAR"),
+            )
+        self.assertEqual(self.read(staged), "Fe potential\nNi potential\n")
+
+    def test_cache_directory(self):
+        self.assertEqual(
+            potential_cache._get_cache_directory(name="potential_files"),
+            os.path.join(self.directory.name, "cache", "potential_files"),
+        )
+        with mock.patch.dict(
+            potential_cache.state.settings.configuration,
+            {"potential_cache": os.path.join(self.directory.name, "configured")},
+        ):
+            self.assertEqual(
+                potential_cache._get_cache_directory(name="potential_files"),
+                os.path.join(self.directory.name, "configured", "potential_files"),
+                msg="The pyiron configuration takes precedence over the environment",
+            )
+        with mock.patch.dict(os.environ):
+            del os.environ["PYIRONPOTENTIALCACHE"]
+            self.assertIsNone(
+                potential_cache._get_cache_directory(name="potential_files"),
+                msg="The cache is disabled unless a directory is configured",
+            )
+
+    def test_cache_disabled(self):
+        for value in ["", "none", "None"]:
+            with mock.patch.dict(os.environ, {"PYIRONPOTENTIALCACHE": value}):
+                self.assertIsNone(
+                    potential_cache._get_cache_directory(name="potential_files")
+                )
+                staged_lst = [
+                    stage_potential_file(
+                        path_lst=self.path_lst,
+                        destination=os.path.join(job_directory, "POTCAR"),
+                    )
+                    for job_directory in self.job_lst
+                ]
+            for file_name in staged_lst:
+                self.assertEqual(self.read(file_name), "Fe potential\nNi potential\n")
+            self.assertFalse(os.path.samefile(staged_lst[0], staged_lst[1]))
+        self.assertFalse(os.path.exists(os.path.join(self.directory.name, "cache")))
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+    def test_different_file_system(self):
+        with mock.patch.object(
+            potential_cache, "_is_same_file_system", return_value=False
+        ):
+            staged = stage_potential_file(
+                path_lst=self.path_lst,
+                destination=os.path.join(self.job_lst[0], "POTCAR"),
+            )
+        self.assertEqual(self.read(staged), "Fe potential\nNi potential\n")
+        self.assertFalse(
+            os.path.exists(potential_cache._get_cache_directory(name="potential_files"))
+        )
+
+    def test_checksum_cache_size(self):
+        with mock.patch.object(potential_cache, "_checksum_cache_size", 1):
+            potential_cache._checksum_cache.clear()
+            stage_potential_file(
+                path_lst=self.path_lst[0],
+                destination=os.path.join(self.job_lst[0], "Fe.eam.alloy"),
+            )
+            self.assertEqual(
+                list(potential_cache._checksum_cache.keys()),
+                [(potential_cache._get_stat(self.path_lst[0]),)],
+                msg="The checksums of the files in the cache are not stored",
+            )
+            potential_cache._get_checksum(path_lst=[self.path_lst[1]])
+            self.assertEqual(
+                list(potential_cache._checksum_cache.keys()),
+                [(potential_cache._get_stat(self.path_lst[1]),)],
+            )
@@ -0,0 +1,188 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+import os
+import shutil
+import tempfile
+import types
+import unittest
+from unittest import mock
+import pandas as pd
+from pyiron_atomistics.atomistics.job import potentials
+from pyiron_atomistics.atomistics.job.potentials import PotentialAbstract
+
+
+class TestPotentialAbstract(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame(
+            {
+                "Name": ["Fe", "FeNi", "Ni", "AlFeNi"],
+                "Species": [["Fe"], ["Fe", "Ni"], ["Ni"], ["Al", "Fe", "Ni"]],
+            },
+            index=[0, 0, 1, 0],
+        )
+        self.potential = PotentialAbstract(potential_df=self.df)
+
+    def test_find(self):
+        for element in ["Fe", ["Fe", "Ni"], {"Ni", "Al"}, "Cu", ["Fe", "Cu"], []]:
+            element_set = set([element]) if isinstance(element, str) else set(element)
+            df_mask = self.df[
+                [element_set.issubset(species) for species in self.df["Species"]]
+            ]
+            df_find = self.potential.find(element)
+            self.assertEqual(df_find["Name"].tolist(), df_mask["Name"].tolist())
+            self.assertEqual(df_find.index.tolist(), df_mask.index.tolist())
+        self.assertEqual(self.potential.Ni.Al.list()["Name"].tolist(), ["AlFeNi"])
+        with self.assertRaises(TypeError):
+            self.potential.find(1)
+
+    def test_find_copy(self):
+        df = self.potential.find([])
+        df["Name"] = "Cu"
+        self.assertEqual(
+            self.potential.list()["Name"].tolist(), ["Fe", "FeNi", "Ni", "AlFeNi"]
+        )
+
+    def test_find_modified(self):
+        self.assertEqual(self.potential.find("Cu")["Name"].tolist(), [])
+        self.potential._potential_df = pd.concat(
+            [self.df, pd.DataFrame({"Name": ["Cu"], "Species": [["Cu"]]})]
+        )
+        self.assertEqual(self.potential.find("Cu")["Name"].tolist(), ["Cu"])
+
+
+class TestPotentialDatabase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.resource_path = os.path.join(self.directory.name, "resources")
+        self.potential_path = os.path.join(self.resource_path, "lammps", "potentials")
+        os.makedirs(self.potential_path)
+        self.file_name = os.path.join(self.potential_path, "potentials_lammps.csv")
+        shutil.copy(
+            os.path.join(
+                os.path.dirname(__file__),
+                "../../static/lammps/potentials/potentials_lammps.csv",
+            ),
+            self.file_name,
+        )
+        self.patches = [
+            mock.patch.object(
+                potentials,
+                "state",
+                types.SimpleNamespace(
+                    settings=types.SimpleNamespace(resource_paths=[self.resource_path])
+                ),
+            ),
+            mock.patch.dict(
+                os.environ,
+                {"PYIRONPOTENTIALCACHE": os.path.join(self.directory.name, "cache")},
+            ),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+        self.directory.cleanup()
+
+    def get_potential_df(self):
+        return PotentialAbstract._get_potential_df(
+            plugin_name="lammps",
+            file_name_lst={"potentials_lammps.csv"},
+            backward_compatibility_name="lammps",
+        )
+
+    def test_cache(self):
+        df = self.get_potential_df()
+        self.assertEqual(
+            df["Species"].values[0], ["Al", "Mg"], msg="The lists are parsed"
+        )
+        self.assertEqual(
+            len(os.listdir(potentials._get_cache_directory(name="potentials"))), 1
+        )
+        df["Name"] = "Cu"
+        df["Species"].values[0].append("Cu")
+        df_cached = self.get_potential_df()
+        self.assertEqual(
+            df_cached["Name"].values[0],
+            "Al_Mg_Mendelev_eam",
+            msg="Modifying the returned database does not modify the cache",
+        )
+        self.assertEqual(
+            df_cached["Species"].values[0],
+            ["Al", "Mg"],
+            msg="Modifying the lists in the returned database does not modify the cache",
+        )
+        potentials._potential_df_cache.clear()
+        df_disk = self.get_potential_df()
+        self.assertTrue(df_disk.equals(df_cached))
+
+    def test_cache_invalid(self):
+        df = self.get_potential_df()
+        cache_directory = potentials._get_cache_directory(name="potentials")
+        (cache_file_name,) = os.listdir(cache_directory)
+        self.assertTrue(cache_file_name.endswith(".json"))
+        with open(os.path.join(cache_directory, cache_file_name), "w") as f:
+            f.write("not a potential database")
+        potentials._potential_df_cache.clear()
+        self.assertTrue(
+            self.get_potential_df().equals(df),
+            msg="Invalid cache files are replaced by the parsed CSV file",
+        )
+
+    def test_cache_key(self):
+        self.get_potential_df()
+        potentials._potential_df_cache.clear()
+        with mock.patch.object(pd, "__version__", "0.0.0"):
+            df = self.get_potential_df()
+        self.assertEqual(
+            len(os.listdir(potentials._get_cache_directory(name="potentials"))),
+            2,
+            msg="The cache file depends on the pandas version",
+        )
+        self.assertEqual(df["Species"].values[0], ["Al", "Mg"])
+        os.utime(self.file_name, ns=(0, 0))
+        potentials._potential_df_cache.clear()
+        self.get_potential_df()
+        self.assertEqual(
+            len(os.listdir(potentials._get_cache_directory(name="potentials"))),
+            2,
+            msg="The cache file does not depend on the modification time",
+        )
+
+    def test_cache_disabled(self):
+        with mock.patch.dict(os.environ, {"PYIRONPOTENTIALCACHE": "none"}):
+            df = self.get_potential_df()
+        self.assertEqual(df["Species"].values[0], ["Al", "Mg"])
+        potentials._potential_df_cache.clear()
+        with mock.patch.dict(os.environ):
+            del os.environ["PYIRONPOTENTIALCACHE"]
+            df = self.get_potential_df()
+        self.assertEqual(df["Species"].values[0], ["Al", "Mg"])
+        self.assertFalse(os.path.exists(os.path.join(self.directory.name, "cache")))
+
+    def test_cache_modified(self):
+        df = self.get_potential_df()
+        with open(self.file_name, "a") as f:
+            f.write(
+                "0,\"['pair_style lj/cut 6.0\\n', 'pair_coeff * * 0.1 2.5\\n']\",[],LJ,Cu_LJ,['Cu']\n"
+            )
+        df_modified = self.get_potential_df()
+        self.assertEqual(len(df_modified), len(df) + 1)
+        self.assertEqual(df_modified["Species"].values[-1], ["Cu"])
+        os.makedirs(os.path.join(self.potential_path, "user"))
+        shutil.copy(
+            self.file_name,
+            os.path.join(self.potential_path, "user", "potentials_lammps.csv"),
+        )
+        self.assertEqual(
+            len(self.get_potential_df()),
+            2 * len(df_modified),
+            msg="New files in the resource paths are found",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
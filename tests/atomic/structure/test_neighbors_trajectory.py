@@ -4,7 +4,10 @@
 
 import unittest
 import numpy as np
-from pyiron_atomistics.atomistics.structure.neighbors import NeighborsTrajectory
+from pyiron_atomistics.atomistics.structure.neighbors import (
+    NeighborsTrajectory,
+    VerletNeighborList,
+)
 from pyiron_atomistics.atomistics.structure.structurestorage import StructureStorage
 from pyiron_atomistics.atomistics.structure.factory import StructureFactory
 
@@ -56,3 +59,59 @@ class TestNeighborsTrajectory(unittest.TestCase):
                             "distances from trajectory and get_neighbors not equal")
             self.assertTrue(np.array_equal(traj.vecs[i][:i+1], neigh.vecs),
                             "vecs from trajectory and get_neighbors not equal")
+
+    def test_skin(self):
+        trajectory = StructureStorage()
+        bulk = StructureFactory().bulk("Al", cubic=True).repeat(3)
+        positions = bulk.positions.copy()
+        rng = np.random.default_rng(42)
+        for n in range(10):
+            positions += rng.normal(scale=0.02, size=positions.shape)
+            structure = bulk.copy()
+            structure.positions = positions
+            # atoms crossing the cell boundary are wrapped back into the cell
+            structure.center_coordinates_in_unit_cell()
+            trajectory.add_structure(structure)
+        traj = NeighborsTrajectory(has_structure=trajectory)
+        traj_skin = NeighborsTrajectory(has_structure=trajectory, skin=0.5)
+        self.assertTrue(np.array_equal(traj.indices, traj_skin.indices),
+                        "indices with and without Verlet list not equal")
+        self.assertTrue(np.allclose(traj.distances, traj_skin.distances),
+                        "distances with and without Verlet list not equal")
+        self.assertTrue(np.allclose(traj.vecs, traj_skin.vecs),
+                        "vecs with and without Verlet list not equal")
+        self.assertTrue(np.array_equal(traj.shells, traj_skin.shells),
+                        "shells with and without Verlet list not equal")
+
+    def test_skin_unsupported_kwargs(self):
+        traj = NeighborsTrajectory(has_structure=self.canonical, mode="filled")
+        traj_skin = NeighborsTrajectory(has_structure=self.canonical, skin=0.5, mode="filled")
+        self.assertIsNone(traj_skin._get_verlet_list(),
+                          "Verlet list used with arguments it does not support")
+        self.assertTrue(np.array_equal(traj.indices, traj_skin.indices),
+                        "indices with and without skin not equal")
+        self.assertIsNone(
+            NeighborsTrajectory(has_structure=self.canonical, skin=0.5, norm_order=1)._get_verlet_list()
+        )
+        self.assertIsInstance(
+            NeighborsTrajectory(has_structure=self.canonical, skin=0.5, cutoff_radius=5)._get_verlet_list(),
+            VerletNeighborList
+        )
+
+    def test_verlet_rebuild(self):
+        bulk = StructureFactory().bulk("Al", cubic=True).repeat(2)
+        verlet_list = VerletNeighborList(num_neighbors=12, skin=0.5)
+        verlet_list.get_neighbors(structure=bulk)
+        self.assertEqual(verlet_list.n_builds, 1)
+        structure = bulk.copy()
+        structure.positions[0] += [0.2, 0, 0]
+        neigh = verlet_list.get_neighbors(structure=structure)
+        self.assertEqual(verlet_list.n_builds, 1, "Candidate list rebuilt within the skin")
+        self.assertTrue(np.allclose(neigh.distances, structure.get_neighbors().distances))
+        structure.positions[0] += [0.2, 0, 0]
+        verlet_list.get_neighbors(structure=structure)
+        self.assertEqual(verlet_list.n_builds, 2, "Candidate list not rebuilt outside of the skin")
+        verlet_list.get_neighbors(structure=structure.apply_strain(0.01, return_box=True))
+        self.assertEqual(verlet_list.n_builds, 3, "Candidate list not rebuilt for a new cell")
+        with self.assertRaises(ValueError):
+            VerletNeighborList(skin=0)
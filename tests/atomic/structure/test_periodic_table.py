@@ -4,6 +4,7 @@
 
 import unittest
 import os
+import pickle
 from pyiron_atomistics.atomistics.structure.atoms import CrystalStructure
 from pyiron_atomistics.atomistics.structure.periodic_table import PeriodicTable
 from pyiron_base import Project
@@ -161,5 +162,46 @@ class TestPeriodicTable(unittest.TestCase):
         self.assertTrue(o_1 >= o_2)
 
 
+    def test_shared_table(self):
+        pse = PeriodicTable()
+        fe = pse.element("Fe")
+        self.assertIsNone(pse._dataframe, "Creating elements should not copy the dataframe")
+        self.assertEqual(fe.sub.to_dict(), PeriodicTable().dataframe.loc["Fe"].to_dict())
+        pse_df = PeriodicTable()
+        pse_df.dataframe
+        self.assertEqual(fe, pse_df.element("Fe"), "Elements from shared table and dataframe not equal")
+        pse.add_element("Fe", "Fe_shared", spin="up")
+        self.assertFalse(PeriodicTable().is_element("Fe_shared"),
+                         "Modifying one periodic table should not modify others")
+
+    def test_element_attributes(self):
+        fe_1 = PeriodicTable().element("Fe")
+        fe_2 = PeriodicTable().element("Fe")
+        fe_1.sub["Abbreviation"] = "Fe_1"
+        self.assertEqual(fe_1.Abbreviation, "Fe_1")
+        self.assertEqual(fe_2.Abbreviation, "Fe",
+                         "Modifying the parameters of one element should not change others")
+        self.assertEqual(PeriodicTable().element("Fe").Abbreviation, "Fe",
+                         "Modifying the parameters of an element should not change the shared table")
+        self.assertFalse(hasattr(fe_1, "__dict__"), "Elements should use __slots__")
+        fe_1.MeltingPoint = 1900
+        self.assertEqual(fe_1.sub["MeltingPoint"], 1900, "Attributes are stored as parameters of the element")
+        self.assertEqual(int(fe_2.MeltingPoint), 1811,
+                         "Setting attributes on one element should not change others")
+        fe_read = pickle.loads(pickle.dumps(fe_1))
+        self.assertEqual(fe_read.MeltingPoint, 1900)
+
+    def test_pickle(self):
+        pse = PeriodicTable()
+        fe = pse.element("Fe")
+        fe_read = pickle.loads(pickle.dumps(fe))
+        self.assertEqual(fe, fe_read)
+        self.assertEqual(fe_read.AtomicNumber, 26)
+        pse.add_element("Fe", "Fe_up", spin="up")
+        pse_read = pickle.loads(pickle.dumps(pse))
+        self.assertEqual(pse_read.element("Fe_up").tags["spin"], "up")
+        self.assertEqual(pse_read.element("Ni").AtomicNumber, 28)
+
+
 if __name__ == "__main__":
     unittest.main()
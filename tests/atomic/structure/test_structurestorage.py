@@ -1,5 +1,6 @@
 from pyiron_atomistics._tests import TestWithProject
-from pyiron_atomistics.atomistics.structure.structurestorage import StructureStorage
+from pyiron_atomistics.atomistics.structure.structurestorage import StructureStorage, StructurePlots
+from unittest import mock
 import numpy as np
 
 class TestContainer(TestWithProject):
@@ -216,3 +217,74 @@ class TestContainer(TestWithProject):
             ),
             "Selective dynamics not correctly restored!"
         )
+
+    def test_map_structures(self):
+        """map_structures should return the same results in parallel as serial and keep the order of structures."""
+        serial = self.cont.map_structures(_get_volume_and_positions)
+        self.assertEqual(len(serial), len(self.cont), "Not one result per structure!")
+        self.assertTrue(np.array_equal(serial["identifier"], self.cont["identifier"]),
+                        "Results not stored under the structure identifiers!")
+        self.assertTrue(np.allclose(serial["volume"], [s.get_volume() for s in self.structures]),
+                        "Per structure results not correct!")
+        self.assertTrue(np.allclose(serial["scaled"], self.cont["positions"] * 2),
+                        "Per atom results not correct!")
+        parallel = self.cont.map_structures(_get_volume_and_positions, n_processes=2, chunk_size=2)
+        for name in ("volume", "scaled"):
+            self.assertTrue(np.array_equal(serial[name], parallel[name]),
+                            f"Parallel results for {name} differ from serial ones!")
+
+    def test_calc_spacegroups_parallel(self):
+        """Space groups calculated in parallel should be the same as the serial ones."""
+        serial = self.cont.plot._calc_spacegroups()
+        self.assertEqual(serial.space_group.tolist(), [229, 194, 225, 225, 194], "Wrong space groups!")
+        self.assertTrue(serial.equals(self.cont.plot._calc_spacegroups(n_processes=2)),
+                        "Parallel space groups differ from serial ones!")
+
+    def test_calc_neighbors_parallel(self):
+        """Neighbor plots should forward n_processes and give the same neighbors in parallel as serial."""
+        serial = self.cont.plot._calc_neighbors(num_neighbors=8)
+        serial = {k: v.copy() for k, v in serial.items()}
+        self.cont.plot._neigh = None
+        with mock.patch("matplotlib.pyplot.hist"), \
+                mock.patch.object(StructurePlots, "_calc_neighbors",
+                                  autospec=True, side_effect=StructurePlots._calc_neighbors) as calc_neighbors:
+            self.cont.plot.distances(num_neighbors=8, n_processes=2)
+        self.assertEqual(calc_neighbors.call_args.kwargs["n_processes"], 2, "n_processes not forwarded!")
+        parallel = self.cont.plot._calc_neighbors(num_neighbors=8)
+        for name in ("distances", "shells"):
+            self.assertTrue(np.array_equal(serial[name], parallel[name]),
+                            f"Parallel {name} differ from serial ones!")
+
+    def test_structure_view(self):
+        """Structure views should share memory with the storage and only become Atoms when modified."""
+        for i, view in enumerate(self.cont.iter_structure_views()):
+            structure = self.cont.get_structure(i)
+            self.assertEqual(len(view), len(structure), "View has wrong length!")
+            self.assertTrue(np.shares_memory(view.positions, self.cont.positions),
+                            "View positions are not a view into the storage!")
+            self.assertTrue(np.array_equal(view.positions, structure.positions), "View positions not correct!")
+            self.assertTrue(np.array_equal(view.cell, structure.cell.array), "View cell not correct!")
+            self.assertTrue(np.array_equal(view.pbc, structure.pbc), "View pbc not correct!")
+            self.assertTrue(np.array_equal(view.get_chemical_symbols(), structure.get_chemical_symbols()),
+                            "View symbols not correct!")
+            self.assertAlmostEqual(view.get_volume(), structure.get_volume(), msg="View volume not correct!")
+            self.assertEqual(view.to_atoms(), structure, "Atoms created from view not equal to stored structure!")
+
+        view = self.cont.get_structure_view("Fe27")
+        self.assertEqual(view.frame, 0, "View of wrong structure returned!")
+        self.assertEqual(self.cont.get_structure_view(-1).frame, len(self.cont) - 1,
+                         "Negative frames not counted from the back!")
+        with self.assertRaises(IndexError):
+            self.cont.get_structure_view(len(self.cont))
+        with self.assertRaises(ValueError, msg="View positions are writeable!"):
+            view.positions[0] += 1
+        self.assertEqual(view.get_chemical_formula(), "Fe27", "Atoms methods not available on view!")
+        positions = self.cont.get_array("positions", 0).copy()
+        view.positions = view.positions + 1
+        self.assertTrue(np.array_equal(view.positions, positions + 1), "View not modified!")
+        self.assertTrue(np.array_equal(self.cont.get_array("positions", 0), positions),
+                        "Modifying view changed the storage!")
+
+
+def _get_volume_and_positions(structure):
+    return {"volume": structure.get_volume(), "scaled": structure.positions * 2}
@@ -74,6 +74,25 @@ class TestVolumetricData(unittest.TestCase):
                                                  rad=2, fwhm=0.529177)
         self.assertIsInstance(sph_avg, float)
 
+    def test_cyl_and_spherical_avg_batched(self):
+        vd = VolumetricData()
+        vd.total_data = np.random.rand(10, 15, 20)
+        struct = self.structure_factory.bulk("Al", cubic=True)
+        centers = np.random.rand(4, 3)
+        sph_avg = vd.spherical_average_potentials(struct, spherical_centers=centers, rad=2)
+        self.assertEqual(sph_avg.shape, (4,))
+        for center, avg in zip(centers, sph_avg):
+            self.assertAlmostEqual(vd.spherical_average_potential(struct, center, rad=2), avg)
+        cyl_avg = vd.cylindrical_average_potentials(struct, spherical_centers=centers, axis_of_cyl=1, rad=2)
+        self.assertEqual(cyl_avg.shape, (4,))
+        for center, avg in zip(centers, cyl_avg):
+            self.assertAlmostEqual(vd.cylindrical_average_potential(struct, center, axis_of_cyl=1, rad=2), avg)
+        with self.assertRaises(ValueError):
+            vd.cylindrical_average_potentials(struct, spherical_centers=centers, axis_of_cyl=3)
+        vd.total_data = np.full((10, 15, 20), 2.0)
+        self.assertTrue(np.allclose(vd.spherical_average_potentials(struct, centers, rad=1), 2))
+        self.assertTrue(np.allclose(vd.cylindrical_average_potentials(struct, centers, axis_of_cyl=0), 2))
+
     def test_write_cube(self):
         cd_obj = VaspVolumetricData()
         file_name = os.path.join(
@@ -5,10 +5,13 @@
 import unittest
 import os
 import posixpath
+import tempfile
 import numpy as np
 
 from pyiron_atomistics.vasp.vasprun import Vasprun
 from pyiron_atomistics.dft.waves.dos import Dos, NoResolvedDosError
+from pyiron_atomistics.dft.waves.electronic import ElectronicStructure
+from pyiron_base import FileHDFio
 
 """
 @author: surendralal
@@ -99,3 +102,53 @@ class TestDos(unittest.TestCase):
                     atom_indices=atom_indices, orbital_indices=orbital_indices
                 )
                 self.assertTrue(np.allclose(dos.t_dos, r_dos))
+
+    def test_resolved_dos_from_hdf(self):
+        rng = np.random.default_rng(42)
+        es = ElectronicStructure()
+        es.kpoint_list = rng.random((300, 3))
+        es.kpoint_weights = np.ones(300) / 300
+        es.eigenvalue_matrix = rng.random((2, 300, 11)) * 10
+        es.occupancy_matrix = rng.random((2, 300, 11))
+        es.grand_dos_matrix = rng.random((2, 300, 11, 5, 9))
+        es.n_spins = 2
+        es.generate_from_matrices()
+        with tempfile.TemporaryDirectory() as directory:
+            hdf = FileHDFio(os.path.join(directory, "es.h5"))
+            es.to_hdf(hdf, group_name="es")
+            es_hdf = ElectronicStructure()
+            es_hdf.from_hdf(hdf, group_name="es")
+            self.assertGreater(len(list(es_hdf.iter_grand_dos_matrix())), 1)
+            dos = Dos(es_obj=es, n_bins=20)
+            dos_hdf = Dos(es_obj=es_hdf, n_bins=20)
+            for spin in range(2):
+                self.assertTrue(
+                    np.allclose(
+                        dos.get_spin_resolved_dos(spin),
+                        dos_hdf.get_spin_resolved_dos(spin),
+                    )
+                )
+                self.assertTrue(
+                    np.allclose(
+                        dos.get_spatially_resolved_dos([0, 3], spin),
+                        dos_hdf.get_spatially_resolved_dos([0, 3], spin),
+                    )
+                )
+                self.assertTrue(
+                    np.allclose(
+                        dos.get_orbital_resolved_dos([1, 2, 3], spin),
+                        dos_hdf.get_orbital_resolved_dos([1, 2, 3], spin),
+                    )
+                )
+                self.assertTrue(
+                    np.allclose(
+                        dos.get_spatial_orbital_resolved_dos(2, [0, 4], spin),
+                        dos_hdf.get_spatial_orbital_resolved_dos(2, [0, 4], spin),
+                    )
+                )
+            self.assertIsNone(
+                es_hdf._grand_dos_matrix, "grand_dos_matrix loaded for projections"
+            )
+            self.assertTrue(
+                np.array_equal(es_hdf.grand_dos_matrix, es.grand_dos_matrix)
+            )
@@ -65,6 +65,47 @@ class TestElectronicStructure(unittest.TestCase):
         self.es_obj.add_kpoint(value=[0.0, 0.0, 0.0], weight=1.0)
         self.assertEqual(len(self.es_obj.kpoints), 1)
 
+    def test_generate_from_matrices(self):
+        es = ElectronicStructure()
+        es.kpoint_list = [[0.0, 0.0, 0.0], [0.5, 0.0, 0.0]]
+        es.kpoint_weights = [0.5, 0.5]
+        es.eigenvalue_matrix = np.array([[[-1.0, 0.5, 2.0], [-0.5, 1.0, 1.5]]])
+        es.occupancy_matrix = np.array([[[1.0, 0.0, 0.0], [1.0, 1.0, 0.0]]])
+        es.grand_dos_matrix = np.random.random((1, 2, 3, 2, 4))
+        es.efermi = 0.8
+        es.generate_from_matrices()
+        self.assertIsNone(es._kpoints, "Kpoint instances built before access")
+        self.assertEqual(es.vbm, [1.0])
+        self.assertEqual(es.cbm, [0.5])
+        self.assertEqual(es.eg, [0.0])
+        self.assertEqual(es.is_metal, [True])
+        self.assertIsNone(es._kpoints, "Kpoint instances built for band edges")
+        vbm = es.get_vbm()[0]
+        self.assertEqual((vbm["kpoint_index"], vbm["band_index"]), (1, 1))
+        self.assertEqual(vbm["band"].eigenvalue, 1.0)
+        self.assertEqual(vbm["kpoint"].value, [0.5, 0.0, 0.0])
+        self.assertTrue(
+            np.array_equal(
+                vbm["band"].resolved_dos_matrix, es.grand_dos_matrix[0, 1, 1]
+            )
+        )
+        self.assertEqual(es.get_band_gap()[0]["band_gap"], 0.0)
+        self.assertIsNone(es._kpoints, "Kpoint instances built for get_vbm()")
+        cbm = es.get_cbm()[0]
+        self.assertEqual((cbm["kpoint_index"], cbm["band_index"]), (0, 1))
+        kpoints = es.kpoints
+        self.assertIs(es.get_cbm()[0]["kpoint"], kpoints[0])
+        self.assertEqual(len(es.kpoints), 2)
+        self.assertEqual(es.kpoints[1].weight, 0.5)
+        self.assertTrue(
+            np.array_equal(
+                es.kpoints[1].bands[0][2].resolved_dos_matrix,
+                es.grand_dos_matrix[0, 1, 2],
+            )
+        )
+        es.efermi = 2.5
+        self.assertEqual(es.is_metal, [False])
+
     def test_get_dos(self):
         for es in self.es_list:
             dos = es.get_dos()
@@ -132,6 +173,63 @@ class TestElectronicStructure(unittest.TestCase):
             )
         )
 
+    def test_grand_dos_matrix_to_hdf(self):
+        filename = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            "../../static/dft/test_es_hdf.h5",
+        )
+        hdf_obj = FileHDFio(os.path.abspath(filename))
+        es_obj = ElectronicStructure()
+        es_obj.kpoint_list = np.zeros((200, 3))
+        es_obj.kpoint_weights = np.ones(200) / 200
+        es_obj.eigenvalue_matrix = np.zeros((1, 200, 20))
+        es_obj.occupancy_matrix = np.zeros((1, 200, 20))
+        es_obj.grand_dos_matrix = np.random.random((1, 200, 20, 16, 9))
+        es_obj.to_hdf(hdf_obj, group_name="streamed_es")
+        es_obj_new = ElectronicStructure()
+        es_obj_new.from_hdf(hdf=hdf_obj, group_name="streamed_es")
+        self.assertTrue(es_obj_new.has_grand_dos_matrix)
+        self.assertIsNone(es_obj_new._grand_dos_matrix)
+        es_obj_new.to_hdf(hdf_obj, group_name="streamed_es_copy")
+        self.assertIsNone(es_obj_new._grand_dos_matrix)
+        self.assertTrue(
+            np.array_equal(
+                hdf_obj["streamed_es_copy/dos/grand_dos_matrix"],
+                es_obj.grand_dos_matrix,
+            )
+        )
+        self.assertTrue(
+            np.array_equal(
+                es_obj_new.kpoints[10].bands[0][3].resolved_dos_matrix,
+                es_obj.grand_dos_matrix[0, 10, 3],
+            )
+        )
+
+    def test_grand_dos_matrix_round_trip(self):
+        filename = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            "../../static/dft/test_es_hdf.h5",
+        )
+        hdf_obj = FileHDFio(os.path.abspath(filename))
+        es_obj = ElectronicStructure()
+        es_obj.kpoint_list = np.zeros((20, 3))
+        es_obj.kpoint_weights = np.ones(20) / 20
+        es_obj.eigenvalue_matrix = np.zeros((1, 20, 4))
+        es_obj.occupancy_matrix = np.zeros((1, 20, 4))
+        es_obj.grand_dos_matrix = np.random.random((1, 20, 4, 2, 9))
+        es_obj.to_hdf(hdf_obj, group_name="round_trip_es")
+        for _ in range(2):
+            es_obj_new = ElectronicStructure()
+            es_obj_new.from_hdf(hdf=hdf_obj, group_name="round_trip_es")
+            es_obj_new.to_hdf(hdf_obj, group_name="round_trip_es")
+        self.assertTrue(
+            np.array_equal(
+                hdf_obj["round_trip_es/dos/grand_dos_matrix"],
+                es_obj.grand_dos_matrix,
+            ),
+            msg="Writing the grand_dos_matrix back to where it was read from keeps it",
+        )
+
     def test_is_metal(self):
         self.assertTrue(self.es_list[1].is_metal[0])
 
@@ -6,6 +6,7 @@ import numpy as np
 import pandas as pd
 import os
 import re
+import tempfile
 from io import StringIO
 from pyiron_base import state, ProjectHDFio
 from pyiron_atomistics.atomistics.structure.atoms import Atoms
@@ -450,6 +451,47 @@ class TestLammps(TestWithCleanProject):
         for k, v in old_output.items():
             self.assertTrue(np.all(v == output_dict["generic"][k]))
 
+    def test_dump_parser_incomplete_frame(self):
+        atoms = Atoms(
+            "Fe2",
+            positions=[3 * [0], 3 * [0.5 * 2.855312531]],
+            cell=2.855312531 * np.eye(3),
+        )
+        self.job.structure = atoms
+        self.job.potential = "Fe_C_Becquart_eam"
+        file_directory = os.path.join(
+            self.execution_path, "..", "static", "lammps_test_files"
+        )
+        output_dict = self.job.collect_output_parser(
+            cwd=file_directory,
+            dump_out_file_name="dump_average.out",
+            log_lammps_file_name="log_not_available"
+        )
+        with open(os.path.join(file_directory, "dump_average.out"), "r") as f:
+            content = f.read()
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, "dump.out"), "w") as f:
+                # the last snapshot is still being written
+                f.write(content + content[: len(content) // 3])
+            incomplete_output_dict = self.job.collect_output_parser(
+                cwd=directory,
+                dump_out_file_name="dump.out",
+                log_lammps_file_name="log_not_available"
+            )
+        self.assertEqual(
+            output_dict["generic"].keys(), incomplete_output_dict["generic"].keys()
+        )
+        for k, v in output_dict["generic"].items():
+            self.assertTrue(np.array_equal(v, incomplete_output_dict["generic"][k]))
+        parallel_output_dict = self.job.collect_output_parser(
+            cwd=file_directory,
+            dump_out_file_name="dump_average.out",
+            log_lammps_file_name="log_not_available",
+            n_processes=2,
+        )
+        for k, v in output_dict["generic"].items():
+            self.assertTrue(np.array_equal(v, parallel_output_dict["generic"][k]))
+
     def test_vcsgc_input(self):
         unit_cell = Atoms(
             elements=["Al", "Al", "Al", "Mg"],
@@ -3,11 +3,14 @@
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
 import unittest
+from unittest import mock
 import numpy as np
 import os
+import pandas as pd
 from pyiron_base import Project, ProjectHDFio
 from pyiron_atomistics.atomistics.structure.atoms import Atoms
 from pyiron_atomistics.lammps.lammps import Lammps
+from pyiron_atomistics.lammps.interactive import _LammpsStructureEvaluator
 
 
 class InteractiveLibrary(object):
@@ -21,6 +24,118 @@ class InteractiveLibrary(object):
         self._command.append(" ".join([str(arg) for arg in args]))
 
 
+class InteractiveLibraryNumpy(InteractiveLibrary):
+    """
+    Library with the numpy interface of LAMMPS, the local atoms are stored in reversed order of their ids.
+    """
+
+    def __init__(self, positions):
+        super().__init__()
+        self.numpy = self
+        self._atoms = {
+            "id": np.arange(len(positions), 0, -1, dtype=np.int32),
+            "x": positions[::-1].copy(),
+            "f": -positions[::-1].copy(),
+        }
+        self.scattered = None
+
+    def extract_atom(self, name):
+        return self._atoms[name]
+
+    def scatter_atoms(self, name, data_type, count, data):
+        self.scattered = np.ctypeslib.as_array(data).reshape(-1, count)
+
+
+class InteractiveLibraryCreateAtoms(InteractiveLibrary):
+    def create_atoms(self, n, id, type, x, v, image, shrinkexceed):
+        self._command.append("create_atoms {}".format(n))
+
+
+class InteractiveLibraryAtoms(InteractiveLibrary):
+    """
+    Library which keeps track of the ids, positions and velocities of the atoms, atoms are deleted with the commands
+    used to remove atoms from the end of the structure.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.numpy = self
+        self.clear()
+
+    def clear(self):
+        self._atoms = {
+            "id": np.zeros(0, dtype=np.int32),
+            "x": np.zeros((0, 3)),
+            "v": np.zeros((0, 3)),
+        }
+
+    def command(self, command_in):
+        super().command(command_in)
+        if command_in == "clear":
+            self.clear()
+        elif command_in.startswith("group pyiron_delete id >"):
+            self._delete = self._atoms["id"] > int(command_in.split()[-1])
+        elif command_in.startswith("delete_atoms group pyiron_delete"):
+            self._atoms = {k: v[~self._delete] for k, v in self._atoms.items()}
+
+    def create_atoms(self, n, id, type, x, v, image, shrinkexceed):
+        self._command.append("create_atoms {}".format(n))
+        first_id = len(self._atoms["id"]) + 1
+        self._atoms = {
+            "id": np.append(
+                self._atoms["id"], np.arange(first_id, first_id + n, dtype=np.int32)
+            ),
+            "x": np.append(
+                self._atoms["x"], np.ctypeslib.as_array(x).reshape(-1, 3), axis=0
+            ),
+            "v": np.append(self._atoms["v"], np.zeros((n, 3)), axis=0),
+        }
+
+    def scatter_atoms(self, name, data_type, count, data):
+        super().scatter_atoms(name, data_type, count)
+        if name == "x":
+            self._atoms["x"][self._atoms["id"] - 1] = np.ctypeslib.as_array(
+                data
+            ).reshape(-1, 3)
+
+    def extract_atom(self, name):
+        return self._atoms[name]
+
+
+class InteractiveLibraryStructures(InteractiveLibrary):
+    """
+    Library which stores the created atoms in reversed order, the forces are the negative positions and the
+    potential energy is the sum of the positions.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.numpy = self
+        self._atoms = {"id": np.zeros(0, dtype=np.int32), "x": np.zeros((0, 3))}
+
+    def create_atoms(self, n, id, type, x, v, image, shrinkexceed):
+        self._atoms = {
+            "id": np.arange(n, 0, -1, dtype=np.int32),
+            "x": np.ctypeslib.as_array(x).reshape(-1, 3)[::-1].copy(),
+        }
+
+    def get_natoms(self):
+        return len(self._atoms["id"])
+
+    def extract_atom(self, name):
+        if name == "f":
+            return -self._atoms["x"]
+        return self._atoms[name]
+
+    def get_thermo(self, name):
+        if name == "pe":
+            return np.sum(self._atoms["x"])
+        return float(len(self._atoms["id"]))
+
+    def close(self):
+        pass
+
+
 class TestLammpsInteractive(unittest.TestCase):
     def setUp(self):
         self.job._interactive_library = InteractiveLibrary()
@@ -95,6 +210,15 @@ class TestLammpsInteractive(unittest.TestCase):
             self.job._interactive_library._command[1], "change_box all remap"
         )
 
+    def test_interactive_gather_atoms(self):
+        positions = np.array([[0.0, 0.5, 1.0], [1.5, 1.0, 0.5]])
+        self.job._interactive_library = InteractiveLibraryNumpy(positions)
+        self.assertIsInstance(self.job.interactive_positions_getter(), np.ndarray)
+        self.assertTrue(np.allclose(self.job.interactive_positions_getter(), positions))
+        self.assertTrue(np.allclose(self.job.interactive_forces_getter(), -positions))
+        self.job.interactive_positions_setter(positions)
+        self.assertTrue(np.allclose(self.job._interactive_library.scattered, positions))
+
     def test_interactive_execute(self):
         self.job._interactive_lammps_input()
         self.assertEqual(
@@ -157,6 +281,204 @@ class TestLammpsInteractive(unittest.TestCase):
         self.assertTrue(np.allclose(v, fext))
         del self.job.input.control['fix___fix_external']
 
+    def test_interactive_structure_setter(self):
+        job = Lammps(
+            project=ProjectHDFio(project=self.project, file_name="lammps"),
+            job_name="structure_lammps",
+        )
+        job.server.run_mode.interactive = True
+        job.structure = Atoms(
+            symbols="Fe2",
+            positions=np.outer(np.arange(2), np.ones(3)),
+            cell=2 * np.eye(3),
+        )
+        job.potential = pd.DataFrame(
+            {
+                "Name": ["FeNi Morse"],
+                "Filename": [[]],
+                "Model": ["Morse"],
+                "Species": [["Fe", "Ni"]],
+                "Config": [
+                    [
+                        "pair_style morse 2.5\n",
+                        "pair_coeff * * 0.1 1.0 2.5\n",
+                    ]
+                ],
+            }
+        )
+        job._interactive_library = InteractiveLibraryCreateAtoms()
+        job.interactive_structure_setter(job.structure)
+        self.assertEqual(job._interactive_library._command[0], "clear")
+        self.assertIn("create_atoms 2", job._interactive_library._command)
+
+        def set_structure(structure):
+            job._interactive_library._command = []
+            job.structure = structure
+            job.interactive_structure_setter(structure)
+            return job._interactive_library._command
+
+        structure = job.structure.copy()
+        structure.positions[1] += 0.1
+        commands = set_structure(structure)
+        self.assertNotIn("clear", commands)
+        self.assertTrue(commands[0].startswith("x 1 3"))
+        self.assertEqual(commands[-1], "change_box all remap")
+
+        structure = structure.copy()
+        structure.set_cell(2.1 * np.eye(3), scale_atoms=True)
+        commands = set_structure(structure)
+        self.assertNotIn("clear", commands)
+        self.assertEqual(
+            commands[0],
+            "change_box all x final 0 2.100000 y final 0 2.100000 z final 0 2.100000 remap units box",
+        )
+
+        structure = structure + structure[:1]
+        structure.positions[-1] += 0.5
+        commands = set_structure(structure)
+        self.assertNotIn("clear", commands)
+        self.assertIn("create_atoms 1", commands)
+        self.assertTrue(commands[-3].startswith("type 0 1"))
+
+        del structure[0]
+        commands = set_structure(structure)
+        self.assertNotIn("clear", commands)
+        self.assertEqual(
+            commands[:3],
+            [
+                "group pyiron_delete id > 2",
+                "delete_atoms group pyiron_delete compress no",
+                "group pyiron_delete delete",
+            ],
+        )
+
+        structure = structure.copy()
+        structure[0] = "Ni"
+        commands = set_structure(structure)
+        self.assertEqual(commands[0], "clear")
+
+        job._interactive_library._command = []
+        job.calc_md(temperature=300)
+        self.assertEqual(job._interactive_library._command[0], "clear")
+
+    def test_interactive_structure_setter_md(self):
+        job = Lammps(
+            project=ProjectHDFio(project=self.project, file_name="lammps"),
+            job_name="structure_md_lammps",
+        )
+        job.server.run_mode.interactive = True
+        job.structure = Atoms(
+            symbols="Fe4",
+            positions=np.outer(np.arange(4), np.ones(3)),
+            cell=4 * np.eye(3),
+        )
+        job.potential = pd.DataFrame(
+            {
+                "Name": ["Fe Morse"],
+                "Filename": [[]],
+                "Model": ["Morse"],
+                "Species": [["Fe"]],
+                "Config": [
+                    [
+                        "pair_style morse 2.5\n",
+                        "pair_coeff * * 0.1 1.0 2.5\n",
+                    ]
+                ],
+            }
+        )
+        job._interactive_library = InteractiveLibraryAtoms()
+        job.calc_md(temperature=300)
+        library = job._interactive_library
+        self.assertEqual(library._command[0], "clear")
+        velocities = np.outer(np.arange(1, 5), [1.0, 0.0, 0.0])
+        library._atoms["v"] = velocities.copy()
+
+        def set_structure(structure):
+            library._command = []
+            job.structure = structure
+            job.interactive_structure_setter(structure)
+            return library._command
+
+        structure = job.structure.copy()
+        del structure[3]
+        commands = set_structure(structure)
+        self.assertNotIn("clear", commands)
+        self.assertTrue(np.array_equal(library._atoms["id"], [1, 2, 3]))
+        self.assertTrue(np.array_equal(library._atoms["v"], velocities[:3]))
+
+        structure = structure.copy()
+        del structure[1]
+        commands = set_structure(structure)
+        self.assertEqual(commands[0], "clear")
+        self.assertTrue(np.array_equal(library._atoms["id"], [1, 2]))
+        self.assertTrue(np.array_equal(library._atoms["x"], structure.positions))
+        self.assertTrue(np.array_equal(library._atoms["v"], np.zeros((2, 3))))
+
+    def test_interactive_evaluate_structures(self):
+        job = Lammps(
+            project=ProjectHDFio(project=self.project, file_name="lammps"),
+            job_name="evaluate_lammps",
+        )
+        job.server.run_mode.interactive = True
+        job.potential = pd.DataFrame(
+            {
+                "Name": ["FeNi Morse"],
+                "Filename": [[]],
+                "Model": ["Morse"],
+                "Species": [["Fe", "Ni"]],
+                "Config": [
+                    [
+                        "pair_style morse 2.5\n",
+                        "pair_coeff * * 0.1 1.0 2.5\n",
+                    ]
+                ],
+            }
+        )
+        structures = [
+            Atoms(
+                symbols="Fe" * (i + 1),
+                positions=np.random.random((i + 1, 3)),
+                cell=(2 + i) * np.eye(3),
+            )
+            for i in range(4)
+        ]
+        structures[2][0] = "Ni"
+        structures[3].cell[1, 0] += 0.5
+        with mock.patch.object(
+            _LammpsStructureEvaluator,
+            "_create_library",
+            lambda self: InteractiveLibraryStructures(),
+        ):
+            for n_processes in [1, 2]:
+                results = job.interactive_evaluate_structures(
+                    structures, n_processes=n_processes
+                )
+                self.assertEqual(results.get_array("energy_pot").shape, (4,))
+                self.assertEqual(results.get_array("pressures").shape, (4, 3, 3))
+                for i, structure in enumerate(structures):
+                    self.assertTrue(
+                        np.allclose(
+                            results.get_array("forces", i), -structure.positions
+                        )
+                    )
+                for i, structure in enumerate(structures[:3]):
+                    self.assertAlmostEqual(
+                        results.get_array("energy_pot", i), np.sum(structure.positions)
+                    )
+                    self.assertTrue(
+                        np.allclose(
+                            results.get_array("pressures", i),
+                            (i + 1) * np.ones((3, 3)) / 10000,
+                        )
+                    )
+            evaluator = job._get_structure_evaluator()
+            evaluator(structures[0])
+            evaluator(structures[1])
+            self.assertEqual(evaluator._library._command.count("create_box 2 1"), 1)
+            self.assertIn("pair_style morse 2.5", evaluator._library._command)
+            with self.assertRaises(ValueError):
+                evaluator(Atoms("Al", positions=np.zeros((1, 3)), cell=np.eye(3)))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,196 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from pyiron_atomistics.atomistics.structure.atoms import Atoms
+from pyiron_atomistics.lammps.output import (
+    DumpReader,
+    parse_thermo_runs,
+    _collect_dump_from_text,
+    _collect_output_log,
+)
+from pyiron_atomistics.lammps.structure import UnfoldingPrism
+
+
+class TestDumpReader(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.file_name = os.path.join(cls.directory.name, "dump.out")
+        shutil.copy(
+            os.path.join(
+                os.path.dirname(os.path.abspath(__file__)),
+                "../static/lammps_test_files/dump.out",
+            ),
+            cls.file_name,
+        )
+        structure = Atoms(
+            ["Fe"] * 81, positions=np.zeros((81, 3)), cell=9.3 * np.eye(3)
+        )
+        cls.kwargs = {
+            "prism": UnfoldingPrism(structure.cell),
+            "structure": structure,
+            "potential_elements": ["Fe"],
+        }
+        cls.output = _collect_dump_from_text(file_name=cls.file_name, **cls.kwargs)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_lazy_access(self):
+        dump = DumpReader(file_name=self.file_name, **self.kwargs)
+        self.assertEqual(len(dump), 6)
+        self.assertEqual(len(dump.positions), 6)
+        self.assertTrue(
+            np.array_equal(dump.positions[-1], self.output["positions"][-1])
+        )
+        self.assertTrue(np.array_equal(dump.forces[::2], self.output["forces"][::2]))
+        self.assertTrue(
+            np.array_equal(dump.steps[[1, 3]], self.output["steps"][[1, 3]])
+        )
+        self.assertTrue(np.array_equal(np.array(dump.cells), self.output["cells"]))
+        with self.assertRaises(AttributeError):
+            dump.energies
+
+    def test_index_file(self):
+        file_name = os.path.join(self.directory.name, "dump_index.out")
+        shutil.copy(self.file_name, file_name)
+        dump = DumpReader(file_name=file_name, **self.kwargs)
+        self.assertEqual(len(dump), 6)
+        self.assertEqual(
+            [frame.step for frame in dump.frames], list(self.output["steps"])
+        )
+        self.assertTrue(os.path.exists(dump.index_file_name))
+        offsets = [(frame.start, frame.end) for frame in dump.frames]
+        for dump_other in [
+            DumpReader(file_name=file_name, **self.kwargs),
+            DumpReader(file_name=file_name, cache_index=False, **self.kwargs),
+        ]:
+            self.assertEqual(
+                [(frame.start, frame.end) for frame in dump_other.frames], offsets
+            )
+            self.assertTrue(
+                np.array_equal(
+                    [frame.box for frame in dump_other.frames],
+                    [frame.box for frame in dump.frames],
+                )
+            )
+        with open(self.file_name, "rb") as f:
+            content = f.read()
+        with open(file_name, "wb") as f:
+            f.write(content[content.find(b"ITEM: TIMESTEP", 1) :])
+        self.assertEqual(
+            len(DumpReader(file_name=file_name, **self.kwargs)),
+            5,
+            msg="The index file is not used once the dump file changed",
+        )
+        self.assertFalse(
+            os.path.exists(os.path.join(self.directory.name, "dump.out.index.npz")),
+            msg="The full parse does not write an index file",
+        )
+
+    def test_computes(self):
+        file_name = os.path.join(self.directory.name, "dump_computes.out")
+        with open(file_name, "w") as f:
+            for step in range(2):
+                f.write("ITEM: TIMESTEP\n{}\nITEM: NUMBER OF ATOMS\n2\n".format(step))
+                f.write("ITEM: BOX BOUNDS pp pp pp\n" + "0.0 9.3\n" * 3)
+                f.write("ITEM: ATOMS id type xsu ysu zsu fx fy fz c_pe\n")
+                f.write("1 1 0.0 0.0 0.0 0.0 0.0 0.0 {}\n".format(-step))
+                f.write("2 1 0.5 0.5 0.5 0.0 0.0 0.0 1.0\n")
+        dump = DumpReader(file_name=file_name, cache_index=False, **self.kwargs)
+        self.assertTrue(np.array_equal(dump.computes[-1]["pe"], [-1.0, 1.0]))
+        self.assertTrue(
+            np.array_equal(dump.computes[:]["pe"], [[0.0, 1.0], [-1.0, 1.0]])
+        )
+        with self.assertRaises(TypeError):
+            np.asarray(dump.computes)
+
+    def test_growing_file(self):
+        with open(self.file_name, "rb") as f:
+            content = f.read()
+        file_name = os.path.join(self.directory.name, "dump_growing.out")
+        with open(file_name, "wb") as f:
+            f.write(content[: len(content) // 2])
+        dump = DumpReader(file_name=file_name, **self.kwargs)
+        n_frames = len(dump)
+        self.assertLess(n_frames, 6)
+        with open(file_name, "ab") as f:
+            f.write(content[len(content) // 2 :])
+        self.assertEqual(len(dump), 6)
+        self.assertEqual(len(DumpReader(file_name=file_name, **self.kwargs)), 6)
+        self.assertTrue(np.array_equal(dump.positions[:], self.output["positions"]))
+
+    def test_parallel(self):
+        output = DumpReader(file_name=self.file_name, **self.kwargs).read(n_processes=2)
+        self.assertEqual(output.keys(), self.output.keys())
+        for k, v in self.output.items():
+            if k != "computes":
+                self.assertTrue(np.array_equal(output[k], v))
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+class TestThermoRuns(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.file_name = os.path.join(cls.directory.name, "log.lammps")
+        with open(cls.file_name, "w") as f:
+            f.write("LAMMPS (2 Aug 2023)\nminimize 0.0 0.0001 1000 100000\n")
+            f.write("   Step          Temp          PotEng    \n")
+            for step in range(5):
+                f.write(f"{step:8d} {0.0:14.8g} {-3.5 - 0.1 * step:14.8g}\n")
+            f.write("Loop time of 0.001 on 1 procs for 4 steps with 2 atoms\n\n")
+            f.write("run 300\n")
+            f.write("Step Temp PotEng Volume \n")
+            for step in range(4, 304):
+                if step == 100:
+                    f.write("WARNING: Too many neighbors (src/npair.cpp:1)\n")
+                f.write(f"{step} {300.0 + step} {-3.0 - 0.001 * step} 16.0 \n")
+            f.write("Loop time of 0.1 on 1 procs for 300 steps with 2 atoms\n\n")
+            f.write("run 100\n")
+            f.write("Step Temp PotEng Volume \n")
+            f.write("304 604 -3.3 16.0 \n305 605 -3.31 16.0 \n306 60")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_runs(self):
+        runs = parse_thermo_runs(file_name=self.file_name)
+        self.assertEqual(len(runs), 3)
+        self.assertEqual(list(runs[0].columns), ["Step", "Temp", "PotEng"])
+        self.assertEqual(list(runs[1].columns), ["Step", "Temp", "PotEng", "Volume"])
+        self.assertEqual([len(run) for run in runs], [5, 300, 2])
+        self.assertTrue(np.array_equal(runs[1]["Step"], np.arange(4, 304)))
+        self.assertEqual(runs[1]["Step"].dtype, int)
+        self.assertTrue(np.allclose(runs[1]["Temp"], 300.0 + np.arange(4, 304)))
+        self.assertTrue(np.array_equal(runs[2]["Step"], [304, 305]))
+
+    def test_chunks(self):
+        runs = parse_thermo_runs(file_name=self.file_name)
+        for chunk_size in [16, 100, 1000]:
+            for run, run_chunked in zip(
+                runs, parse_thermo_runs(file_name=self.file_name, chunk_size=chunk_size)
+            ):
+                self.assertTrue(run.equals(run_chunked))
+
+    def test_collect_output_log(self):
+        prism = UnfoldingPrism(np.eye(3) * 2.5)
+        with self.assertWarns(UserWarning):
+            generic_keys_lst, pressure_dict, df = _collect_output_log(
+                file_name=self.file_name, prism=prism
+            )
+        self.assertEqual(len(df), 307)
+        self.assertTrue(np.array_equal(df["steps"].to_numpy()[:6], [0, 1, 2, 3, 4, 4]))
+        self.assertTrue(np.all(np.isnan(df["volume"].to_numpy()[:5])))
+        self.assertTrue(np.all(df["volume"].to_numpy()[5:] == 16.0))
@@ -5,7 +5,9 @@
 import numpy as np
 import os
 from pyiron_base import state, ProjectHDFio
+from pyiron_atomistics.atomistics.structure.atoms import Atoms
 from pyiron_atomistics.lammps.lammps import Lammps
+from pyiron_atomistics.lammps.structure import LammpsStructure, _format_rows
 from pyiron_base._tests import TestWithCleanProject
 from pyiron_atomistics.project import Creator
 
@@ -74,3 +76,30 @@ class TestLammpsStructure(TestWithCleanProject):
             ),
             msg="Velocties of structure are not correctly set",
         )
+
+    def test_structure_atomic(self):
+        structure = Atoms(
+            symbols="AlNi",
+            positions=[[0.0, 0.0, 0.0], [1.0, 1.5, 0.25]],
+            cell=2 * np.eye(3),
+        )
+        lmp_structure = LammpsStructure()
+        lmp_structure.el_eam_lst = ["Ni", "Al"]
+        lmp_structure.structure = structure
+        self.assertTrue(
+            lmp_structure._string_input.endswith(
+                "Atoms\n\n"
+                "1 2 0.000000000000000 0.000000000000000 0.000000000000000\n"
+                "2 1 1.000000000000000 1.500000000000000 0.250000000000000\n\n"
+            )
+        )
+        lmp_structure.el_eam_lst = ["Ni"]
+        with self.assertRaises(ValueError):
+            lmp_structure.structure = structure
+
+    def test_format_rows(self):
+        self.assertEqual(
+            _format_rows("%d %d %.3f", [np.arange(1, 3), [2, 1], np.array([0.5, 1.25])]),
+            "1 2 0.500\n2 1 1.250\n",
+        )
+        self.assertEqual(_format_rows("%d %f", [[], []]), "")
@@ -2,6 +2,7 @@
 # Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
+import io
 import os
 import sys
 import shutil
@@ -16,7 +17,13 @@ import scipy.constants
 from pyiron_atomistics.project import Project
 from pyiron_atomistics.atomistics.structure.periodic_table import PeriodicTable
 from pyiron_atomistics.atomistics.structure.atoms import Atoms
-from pyiron_atomistics.sphinx.base import Group
+from pyiron_atomistics.sphinx import base
+from pyiron_atomistics.sphinx.base import (
+    Group,
+    _SphinxLogParser,
+    clear_sphinx_group_cache,
+    splitter,
+)
 
 BOHR_TO_ANGSTROM = (
     scipy.constants.physical_constants["Bohr radius"][0] / scipy.constants.angstrom
@@ -590,6 +597,65 @@ class TestSphinx(unittest.TestCase):
             "".join(file_content), self.sphinx.input.sphinx.structure.to_sphinx()
         )
 
+    def test_write_sphinx(self):
+        group = Group(
+            {
+                "basis": {"eCut": 25, "folding": np.array([2, 2, 2])},
+                "structure": {
+                    "atom": [
+                        {"coords": np.array([0.0, 0.5, 1.0]), "movable": True},
+                        {"coords": np.array([1.5, 2.0, 2.5]), "movable": False},
+                    ],
+                    "species": [
+                        {"element": '"Fe"', "movableX": True},
+                        {"element": '"Al"'},
+                    ],
+                },
+                "empty": Group(),
+            }
+        )
+        sphinx_input = "\n".join(
+            [
+                "basis {",
+                "\teCut = 25;",
+                "\tfolding = [2, 2, 2];",
+                "}",
+                "structure {",
+                "\tatom {",
+                "\t\tcoords = [0.0, 0.5, 1.0];",
+                "\t\tmovable;",
+                "\t}",
+                "\tatom {",
+                "\t\tcoords = [1.5, 2.0, 2.5];",
+                "\t\tmovable = false;",
+                "\t}",
+                "\tspecies {",
+                '\t\telement = "Fe";',
+                "\t\tmovableX;",
+                "\t}",
+                "\tspecies {",
+                '\t\telement = "Al";',
+                "\t}",
+                "}",
+                "empty {}",
+                "",
+            ]
+        )
+        self.assertEqual(group.to_sphinx(), sphinx_input)
+        stream = io.StringIO()
+        group.write_sphinx(stream=stream)
+        self.assertEqual(stream.getvalue(), sphinx_input)
+        group.basis.folding[0] = 4
+        self.assertIn(
+            "folding = [4, 2, 2];",
+            group.to_sphinx(),
+            msg="Cached text of a group must not be reused after the group changed",
+        )
+        self.assertGreater(len(base._SPHINX_GROUP_CACHE), 0)
+        clear_sphinx_group_cache()
+        self.assertEqual(len(base._SPHINX_GROUP_CACHE), 0)
+        self.assertEqual(group.to_sphinx(), sphinx_input.replace("[2, 2", "[4, 2"))
+
     def test_collect_aborted(self):
         with self.assertRaises(AssertionError):
             self.sphinx_aborted.collect_output()
@@ -623,6 +689,59 @@ class TestSphinx(unittest.TestCase):
         self.assertIsNotNone(rho.total_data)
         self.assertIsNotNone(vel.total_data)
 
+    def test_splitter(self):
+        values = np.arange(8.0)
+        steps = splitter(values, [3, 0, 1, 2, 0, 1, 0, 1])
+        self.assertEqual(steps, [[1.0, 2.0, 3.0], [4.0, 5.0], [6.0, 7.0]])
+        steps = splitter(np.arange(12).reshape(-1, 2), [0, 1, 2, 0, 1, 0])
+        self.assertEqual([np.shape(s) for s in steps], [(3, 2), (2, 2), (1, 2)])
+        self.assertIsInstance(steps[0], list)
+        self.assertEqual(splitter([], []), [])
+
+    def test_sphinx_log_parser(self):
+        self.sphinx_2_5.decompress()
+        with open(os.path.join(self.sphinx_2_5.working_directory, "sphinx.log")) as f:
+            log_file = f.read()
+        parser = _SphinxLogParser(log_file)
+        lines = log_file.split("\n")
+        forces = np.array(
+            [
+                line.split("{")[1].split("}")[0].split(",")
+                for line in lines
+                if line.startswith("Species")
+            ],
+            dtype=float,
+        ).reshape(-1, 2, 3)
+        self.assertTrue(
+            np.array_equal(
+                parser.get_forces(spx_to_pyi=[1, 0]),
+                forces[:, [1, 0]] * HARTREE_OVER_BOHR_TO_EV_OVER_ANGSTROM,
+            )
+        )
+        main_lines = lines[lines.index("| Enter Main Loop") + 1 :]
+        eig = np.array(
+            [
+                line.split(":")[1].split()
+                for line in main_lines
+                if line.startswith("| final eig [eV]:")
+            ],
+            dtype=float,
+        )
+        self.assertEqual(parser.get_band_energy().shape[1:3], (2, 6))
+        self.assertTrue(
+            np.array_equal(parser.get_band_energy().flatten(), eig.flatten())
+        )
+        self.assertEqual(
+            parser.get_fermi().tolist(),
+            [float(line.split()[3]) for line in main_lines if "Fermi energy:" in line],
+        )
+        self.assertEqual(parser.n_steps, 5)
+        self.assertEqual(parser.get_convergence(), 5 * [True])
+        self.assertEqual(parser.get_n_valence(), {"Fe": 8, "Ni": 10})
+        self.assertEqual(
+            sum(len(energies) for energies in parser.get_energy_free()), 58
+        )
+
     def test_check_band_occupancy(self):
         self.assertTrue(self.sphinx_2_5.output.check_band_occupancy())
         self.assertTrue(self.sphinx_2_5.nbands_convergence_check())
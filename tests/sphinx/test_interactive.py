@@ -4,6 +4,7 @@
 
 import os
 import shutil
+import threading
 
 import numpy as np
 import unittest
@@ -11,6 +12,11 @@ import warnings
 from pyiron_atomistics.project import Project
 from pyiron_atomistics.atomistics.structure.periodic_table import PeriodicTable
 from pyiron_atomistics.atomistics.structure.atoms import Atoms
+from pyiron_atomistics.sphinx.interactive import (
+    BOHR_TO_ANGSTROM,
+    HARTREE_TO_EV,
+    HARTREE_OVER_BOHR_TO_EV_OVER_ANGSTROM,
+)
 
 
 class InteractiveLibrary(object):
@@ -63,7 +69,9 @@ class TestSphinx(unittest.TestCase):
             )
         )
         shutil.rmtree(
-            os.path.join(cls.file_location, "../static/sphinx/job_sphinx_interactive_hdf5")
+            os.path.join(
+                cls.file_location, "../static/sphinx/job_sphinx_interactive_hdf5"
+            )
         )
 
     def test_interactive_cells_setter(self):
@@ -94,5 +102,191 @@ class TestSphinx(unittest.TestCase):
         )
 
 
+class MockSphinx(threading.Thread):
+    """
+    Local stand-in for the SPHInX executable, answering the requests sent over the sxctrl and sxres pipes with
+    random data in atomic units. The binary protocol is only confirmed if binary is True, otherwise the request is
+    ignored like an unknown command.
+    """
+
+    def __init__(self, working_directory, n_atoms, binary=True):
+        super(MockSphinx, self).__init__(daemon=True)
+        self.ctrl_file = os.path.join(working_directory, "sxctrl")
+        self.res_file = os.path.join(working_directory, "sxres")
+        for file_name in [self.ctrl_file, self.res_file]:
+            if os.path.exists(file_name):
+                os.remove(file_name)
+            os.mkfifo(file_name)
+        self.binary = binary
+        self.binary_mode = False
+        rng = np.random.default_rng(42)
+        self.data = {
+            "energy": rng.random(),
+            "forces": rng.random((n_atoms, 3)),
+            "structure": rng.random((n_atoms, 3)),
+            "cell": rng.random((3, 3)),
+            "atomspin": rng.random(n_atoms),
+            "nu": rng.random(n_atoms),
+        }
+        self.n_atoms = n_atoms
+        self.received = {}
+        self.commands = []
+
+    def run(self):
+        with open(self.ctrl_file, "rb") as ctrl, open(self.res_file, "wb") as res:
+            for line in ctrl:
+                command = line.decode().strip()
+                self.commands.append(command)
+                if command == "end":
+                    break
+                elif command == "set protocol binary" and self.binary:
+                    self.binary_mode = True
+                    res.write(b"binary\n")
+                    res.flush()
+                elif command.startswith("get "):
+                    self._send(res, self.data[command[4:]])
+                elif command == "set structure":
+                    self.received["structure"] = self._receive(ctrl, 3 * self.n_atoms)
+                elif command == "set spinconstraint":
+                    self.received["spinconstraint"] = self._receive(ctrl, self.n_atoms)
+
+    def _send(self, res, values):
+        values = np.atleast_1d(values)
+        if self.binary_mode:
+            res.write(np.array([values.size], dtype="<i8").tobytes())
+            res.write(values.astype("<f8").tobytes())
+        else:
+            for row in values:
+                res.write(
+                    (" ".join(repr(v) for v in np.atleast_1d(row)) + "\n").encode()
+                )
+        res.flush()
+
+    def _receive(self, ctrl, n_values):
+        if self.binary_mode:
+            n_values = np.frombuffer(ctrl.read(8), dtype="<i8")[0]
+            return np.frombuffer(ctrl.read(8 * n_values), dtype="<f8")
+        else:
+            return np.array([float(ctrl.readline()) for _ in range(n_values)])
+
+
+class TestSphinxPipeProtocol(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.file_location = os.path.dirname(os.path.abspath(__file__))
+        cls.project = Project(os.path.join(cls.file_location, "../static/sphinx"))
+        cls.sphinx = cls.project.create_job("Sphinx", "job_sphinx_pipes")
+        cls.sphinx.structure = Atoms(
+            elements=["Ni", "Fe", "Ni"],
+            scaled_positions=[3 * [0.0], 3 * [0.5], [0.5, 0.5, 0.0]],
+            cell=2.6 * np.eye(3),
+        )
+        cls.sphinx.fix_spin_constraint = True
+        cls.sphinx._create_working_directory()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(
+            os.path.join(cls.file_location, "../static/sphinx/job_sphinx_pipes_hdf5")
+        )
+
+    def _check_protocol(self, binary_protocol, binary_sphinx):
+        mock = MockSphinx(
+            working_directory=self.sphinx.working_directory,
+            n_atoms=3,
+            binary=binary_sphinx,
+        )
+        mock.start()
+        self.sphinx.interactive_binary_protocol = binary_protocol
+        self.sphinx._interactive_open_pipes()
+        try:
+            self.assertEqual(
+                self.sphinx._interactive_binary_mode, binary_protocol and binary_sphinx
+            )
+            id_spx_to_pyi = self.sphinx.id_spx_to_pyi
+            self.assertAlmostEqual(
+                self.sphinx.interactive_energy_pot_getter(),
+                mock.data["energy"] * HARTREE_TO_EV,
+            )
+            self.assertTrue(
+                np.allclose(
+                    self.sphinx.interactive_forces_getter(),
+                    mock.data["forces"][id_spx_to_pyi]
+                    * HARTREE_OVER_BOHR_TO_EV_OVER_ANGSTROM,
+                )
+            )
+            self.assertTrue(
+                np.allclose(
+                    self.sphinx.interactive_positions_getter(),
+                    mock.data["structure"][id_spx_to_pyi] * BOHR_TO_ANGSTROM,
+                )
+            )
+            self.assertTrue(
+                np.allclose(
+                    self.sphinx.interactive_cells_getter(),
+                    mock.data["cell"] * BOHR_TO_ANGSTROM,
+                )
+            )
+            self.assertTrue(
+                np.allclose(
+                    self.sphinx.interactive_spins_getter(),
+                    mock.data["atomspin"][id_spx_to_pyi],
+                )
+            )
+            self.assertTrue(
+                np.allclose(
+                    self.sphinx.interactive_magnetic_forces_getter(),
+                    mock.data["nu"][id_spx_to_pyi] * HARTREE_TO_EV,
+                )
+            )
+            positions = self.sphinx.structure.positions
+            self.sphinx.interactive_positions_setter(positions)
+            self.sphinx.interactive_spin_constraints_setter(np.array([1.0, 2.0, 3.0]))
+        finally:
+            self.sphinx._interactive_pipe_write("end")
+            self.sphinx._interactive_library.close()
+            self.sphinx._interactive_library_read.close()
+            mock.join()
+        self.assertTrue(
+            np.allclose(
+                mock.received["structure"],
+                positions[self.sphinx.id_pyi_to_spx].flatten() / BOHR_TO_ANGSTROM,
+            )
+        )
+        self.assertTrue(
+            np.array_equal(
+                mock.received["spinconstraint"],
+                np.array([1.0, 2.0, 3.0])[self.sphinx.id_pyi_to_spx],
+            )
+        )
+
+        self.assertEqual(
+            mock.commands[:2] == ["set protocol binary", "get cell"], binary_protocol
+        )
+
+    def test_binary_protocol(self):
+        self._check_protocol(binary_protocol=True, binary_sphinx=True)
+
+    def test_text_protocol(self):
+        self._check_protocol(binary_protocol=False, binary_sphinx=True)
+
+    def test_binary_protocol_fallback(self):
+        self._check_protocol(binary_protocol=True, binary_sphinx=False)
+
+    def test_binary_protocol_hdf(self):
+        job = self.project.create_job("Sphinx", "job_sphinx_pipes_hdf")
+        job.structure = self.sphinx.structure
+        job.interactive_binary_protocol = True
+        job.to_hdf()
+        job_reload = self.project.create_job("Sphinx", "job_sphinx_pipes_hdf")
+        job_reload.from_hdf()
+        self.assertTrue(job_reload.interactive_binary_protocol)
+        job.interactive_binary_protocol = False
+        job.to_hdf()
+        job_reload.from_hdf()
+        self.assertFalse(job_reload.interactive_binary_protocol)
+        job.remove()
+
+
 if __name__ == "__main__":
     unittest.main()
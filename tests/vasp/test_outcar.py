@@ -5,8 +5,9 @@
 import unittest
 import os
 import posixpath
+import tempfile
 import numpy as np
-from pyiron_atomistics.vasp.outcar import Outcar
+from pyiron_atomistics.vasp.outcar import Outcar, KBAR_TO_EVA
 
 
 class TestOutcar(unittest.TestCase):
@@ -68,6 +69,102 @@ class TestOutcar(unittest.TestCase):
                         print(key, self.outcar_parser.parse_dict[key])
                         raise AssertionError("{} has the wrong type".format(key))
 
+    def test_from_file_matches_getters(self):
+        for filename in self.file_list:
+            with self.subTest(filename=filename):
+                outcar = Outcar()
+                outcar.from_file(filename=filename)
+                parse_dict = outcar.parse_dict
+                positions, forces = outcar.get_positions_and_forces(filename=filename)
+                self.assertEqual(parse_dict["positions"], positions)
+                self.assertEqual(parse_dict["forces"], forces)
+                self.assertEqual(parse_dict["cells"], outcar.get_cells(filename=filename))
+                self.assertEqual(parse_dict["energies"], outcar.get_total_energies(filename=filename))
+                self.assertEqual(parse_dict["energies_zero"], outcar.get_energy_sigma_0(filename=filename))
+                self.assertEqual(parse_dict["steps"], outcar.get_steps(filename=filename))
+                self.assertEqual(parse_dict["time"], outcar.get_time(filename=filename))
+                self.assertEqual(parse_dict["temperatures"], outcar.get_temperatures(filename=filename))
+                self.assertEqual(
+                    parse_dict["stresses"], outcar.get_stresses(filename=filename, si_unit=False) * KBAR_TO_EVA
+                )
+                for scf_stream, scf in zip(
+                    parse_dict["scf_energies"], outcar.get_all_total_energies(filename=filename)
+                ):
+                    self.assertEqual(scf_stream, scf)
+                for comp_stream, comp in zip(
+                    parse_dict["energy_components"], outcar.get_energy_components(filename=filename)
+                ):
+                    self.assertEqual(comp_stream, comp)
+                magnetization, final_magmoms = outcar.get_magnetization(filename=filename)
+                self.assertEqual(len(parse_dict["magnetization"]), len(magnetization))
+                self.assertEqual(parse_dict["final_magmoms"], final_magmoms)
+                e_fermi_list, vbm_list, cbm_list = outcar.get_band_properties(filename=filename)
+                self.assertEqual(parse_dict["e_fermi_list"], e_fermi_list)
+                self.assertEqual(parse_dict["vbm_list"], vbm_list)
+                self.assertEqual(parse_dict["cbm_list"], cbm_list)
+                kpoints, weights, plane_waves = outcar.get_irreducible_kpoints(filename=filename)
+                self.assertEqual(parse_dict["irreducible_kpoints"], kpoints)
+                self.assertEqual(parse_dict["irreducible_kpoint_weights"], weights)
+                self.assertEqual(parse_dict["number_plane_waves"], plane_waves)
+                self.assertEqual(parse_dict["fermi_level"], outcar.get_fermi_level(filename=filename))
+                self.assertEqual(parse_dict["n_elect"], outcar.get_nelect(filename=filename))
+                self.assertEqual(parse_dict["broyden_mixing"], outcar.get_broyden_mixing_mesh(filename=filename))
+
+    def test_update(self):
+        for filename in self.file_list:
+            with self.subTest(filename=filename):
+                with open(filename, "rb") as f:
+                    content = f.read()
+                outcar_ref = Outcar()
+                outcar_ref.from_file(filename=filename)
+                with tempfile.TemporaryDirectory() as directory:
+                    partial_filename = os.path.join(directory, "OUTCAR")
+                    outcar = Outcar()
+                    for end in [len(content) // 4, len(content) // 2, len(content) // 2 + 1, len(content)]:
+                        with open(partial_filename, "ab") as f:
+                            f.write(content[f.tell():end])
+                        outcar.update(filename=partial_filename)
+                for key in ["positions", "forces", "cells", "energies", "stresses", "steps", "e_fermi_list", "vbm_list"]:
+                    self.assertEqual(outcar.parse_dict[key], outcar_ref.parse_dict[key])
+                for scf_stream, scf in zip(
+                    outcar.parse_dict["scf_energies"], outcar_ref.parse_dict["scf_energies"]
+                ):
+                    self.assertEqual(scf_stream, scf)
+                self.assertEqual(outcar.parse_dict["final_magmoms"], outcar_ref.parse_dict["final_magmoms"])
+
+    def test_missing_quantities(self):
+        with self.assertRaisesRegex(ValueError, "NIONS"):
+            Outcar.get_number_of_atoms(lines=["no ions in this file\n"])
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "OUTCAR")
+            with open(filename, "w") as f:
+                f.write("   number of dos      NEDOS =    301   number of ions     NIONS =      2\n")
+            outcar = Outcar()
+            with self.assertWarnsRegex(UserWarning, "irreducible k-points"):
+                outcar.from_file(filename=filename)
+            self.assertIsNone(outcar.parse_dict["irreducible_kpoints"])
+
+    def test_update_complete_steps(self):
+        filename = [f for f in self.file_list if f.endswith("OUTCAR_9")][0]
+        with open(filename, "rb") as f:
+            content = f.read()
+        with tempfile.TemporaryDirectory() as directory:
+            partial_filename = os.path.join(directory, "OUTCAR")
+            outcar = Outcar()
+            n_steps_lst = []
+            for end in np.linspace(0, len(content), 41).astype(int)[1:]:
+                with open(partial_filename, "ab") as f:
+                    f.write(content[f.tell():end])
+                n_steps = outcar.update(filename=partial_filename)
+                n_steps_lst.append(n_steps)
+                if len(outcar.parse_dict) > 0:
+                    for key in [
+                        "positions", "forces", "cells", "energies", "energies_zero", "stresses", "pressures",
+                        "temperatures", "steps", "scf_energies", "scf_dipole_moments", "magnetization",
+                    ]:
+                        self.assertEqual(len(outcar.parse_dict[key]), n_steps, msg=key)
+        self.assertEqual(sorted(set(n_steps_lst)), [0, 1, 2])
+
     def test_energy_components(self):
         output_dict = {
             1: [np.array([[3.11040193e+02, 3.11040193e+02, 3.11040193e+02,
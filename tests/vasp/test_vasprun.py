@@ -5,6 +5,7 @@
 import unittest
 import os
 import posixpath
+import tempfile
 import numpy as np
 from pyiron_atomistics.vasp.vasprun import Vasprun, VasprunError
 from pyiron_atomistics.atomistics.structure.atoms import Atoms
@@ -40,6 +41,91 @@ class TestVasprun(unittest.TestCase):
         filename = posixpath.join(self.direc, "vasprun_spoilt.xml")
         self.assertRaises(VasprunError, vp.from_file, filename)
 
+    def test_update(self):
+        filename = posixpath.join(self.direc, "vasprun_1.xml")
+        with open(filename, "rb") as f:
+            content = f.read()
+        vp_ref = Vasprun()
+        vp_ref.from_file(filename)
+        with tempfile.TemporaryDirectory() as directory:
+            partial_filename = os.path.join(directory, "vasprun.xml")
+            vp = Vasprun()
+            n_steps_lst = list()
+            for end in [len(content) // 3, 2 * len(content) // 3, len(content)]:
+                with open(partial_filename, "wb") as f:
+                    f.write(content[:end])
+                n_steps_lst.append(vp.update(partial_filename))
+            self.assertEqual(vp._xml_reader.offset, len(content))
+        self.assertEqual(n_steps_lst[-1], len(vp_ref.vasprun_dict["positions"]))
+        self.assertTrue(all(np.diff(n_steps_lst) >= 0))
+        for key in ["positions", "cells", "forces", "total_energies", "total_0_energies"]:
+            self.assertTrue(np.array_equal(vp.vasprun_dict[key], vp_ref.vasprun_dict[key]))
+        self.assertEqual(vp.vasprun_dict["scf_energies"], vp_ref.vasprun_dict["scf_energies"])
+        self.assertTrue(
+            np.array_equal(
+                vp.vasprun_dict["grand_eigenvalue_matrix"],
+                vp_ref.vasprun_dict["grand_eigenvalue_matrix"],
+            )
+        )
+        vp = Vasprun()
+        with self.assertRaises(VasprunError):
+            vp.update(posixpath.join(self.direc, "vasprun_spoilt.xml"))
+        self.assertEqual(vp.vasprun_dict, dict())
+        with tempfile.TemporaryDirectory() as directory:
+            empty_filename = os.path.join(directory, "vasprun.xml")
+            with open(empty_filename, "w"):
+                pass
+            self.assertEqual(
+                vp.update(empty_filename), 0, msg="VASP did not start writing yet"
+            )
+
+    def test_from_file_streaming(self):
+        for filename in ["vasprun_1.xml", "vasprun_line.xml"]:
+            filename = posixpath.join(self.direc, filename)
+            vp_ref = Vasprun()
+            vp_ref.from_file(filename)
+            vp = Vasprun()
+            vp.from_file(filename, streaming=True)
+            self.assertEqual(vp.vasprun_dict.keys(), vp_ref.vasprun_dict.keys())
+            for key in [
+                "positions",
+                "forces",
+                "total_energies",
+                "grand_eigenvalue_matrix",
+                "grand_occupancy_matrix",
+                "efermi",
+                "grand_dos_matrix",
+            ]:
+                if key in vp_ref.vasprun_dict.keys():
+                    self.assertTrue(
+                        np.array_equal(vp.vasprun_dict[key], vp_ref.vasprun_dict[key])
+                    )
+            self.assertEqual(
+                vp.vasprun_dict["scf_energies"], vp_ref.vasprun_dict["scf_energies"]
+            )
+        vp = Vasprun()
+        vp.from_file(filename, exclude=["projected", "scstep"])
+        self.assertFalse("grand_dos_matrix" in vp.vasprun_dict.keys())
+        self.assertEqual(len(vp.vasprun_dict["scf_energies"][0]), 0)
+        self.assertTrue(
+            np.array_equal(
+                vp.vasprun_dict["total_energies"], vp_ref.vasprun_dict["total_energies"]
+            )
+        )
+
+    def test_from_file_corrupt_array(self):
+        with open(posixpath.join(self.direc, "vasprun_1.xml")) as f:
+            content = f.read()
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "vasprun.xml")
+            for row in ["<r> -19.0427</r>", "<r> -19.0427  1.0x00</r>"]:
+                with open(filename, "w") as f:
+                    f.write(content.replace("<r> -19.0427  1.0000</r>", row, 1))
+                for streaming in [False, True]:
+                    vp = Vasprun()
+                    with self.assertRaises(VasprunError):
+                        vp.from_file(filename, streaming=streaming)
+
     def test_get_potentiostat_output(self):
         for i, vp in enumerate(self.vp_list):
             if i == 8:
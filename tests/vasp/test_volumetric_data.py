@@ -5,6 +5,8 @@
 import unittest
 import os
 import posixpath
+import shutil
+import tempfile
 import numpy as np
 from pyiron_atomistics.vasp.volumetric_data import VaspVolumetricData
 
@@ -70,3 +72,75 @@ class TestVaspVolumetricData(unittest.TestCase):
                 )
                 self.assertIsNone(atoms)
                 self.assertIsNone(total_data)
+
+    def test_read_vol_data_memmap(self):
+        chgcar_file = [f for f in self.file_list if f.endswith("CHGCAR_spin")][0]
+        _, data = self.vd_obj._read_vol_data(chgcar_file, normalize=True)
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "CHGCAR")
+            shutil.copy(chgcar_file, filename)
+            vd = VaspVolumetricData()
+            vd.from_file(filename, normalize=True, memmap=True)
+            self.assertTrue(os.path.exists(filename + ".normalized.npy"))
+            self.assertTrue(np.array_equal(data[0], vd.total_data))
+            self.assertTrue(np.array_equal(data[1], vd.diff_data))
+            vd_memmap = VaspVolumetricData()
+            vd_memmap.from_file(filename, normalize=True, memmap=True)
+            self.assertIsInstance(vd_memmap.total_data, np.memmap)
+            self.assertTrue(np.array_equal(data[0], vd_memmap.total_data))
+            self.assertTrue(np.array_equal(data[1], vd_memmap.diff_data))
+            vd_memmap.total_data[0, 0, 0] += 1
+            vd_memmap.from_file(filename, normalize=True, memmap=True)
+            self.assertTrue(
+                np.array_equal(data[0], vd_memmap.total_data),
+                "Modifying the memory mapped grid should not change the file",
+            )
+            self.assertEqual(
+                os.listdir(directory),
+                ["CHGCAR", "CHGCAR.normalized.npy"],
+                "No temporary file is left",
+            )
+            del vd, vd_memmap
+            npy_file = filename + ".normalized.npy"
+            with open(npy_file, "rb") as f:
+                content = f.read()
+            for spoilt in [
+                content[: len(content) // 2],
+                content[:20],
+                b"",
+            ]:
+                with open(npy_file, "wb") as f:
+                    f.write(spoilt)
+                _, data_memmap = self.vd_obj._read_vol_data(
+                    filename, normalize=True, memmap=True
+                )
+                for d, d_memmap in zip(data, data_memmap):
+                    self.assertTrue(
+                        np.array_equal(d, d_memmap),
+                        "An incomplete .npy file is parsed again",
+                    )
+                del data_memmap
+            np.save(npy_file, np.zeros((2, 2, 2, 2)))
+            _, data_memmap = self.vd_obj._read_vol_data(
+                filename, normalize=True, memmap=True
+            )
+            self.assertTrue(
+                np.array_equal(data[0], data_memmap[0]),
+                "A .npy file with a different shape is parsed again",
+            )
+            del data_memmap
+
+    def test_read_vol_data_varying_width(self):
+        chgcar_file = [f for f in self.file_list if f.endswith("CHGCAR_spin")][0]
+        _, data = self.vd_obj._read_vol_data_old(chgcar_file, normalize=True)
+        with open(chgcar_file) as f:
+            lines = f.readlines()
+        # lines without a fixed width cannot be located from the length of the first line
+        lines[11] = " " + lines[11]
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "CHGCAR")
+            with open(filename, "w") as f:
+                f.writelines(lines)
+            _, data_varying = self.vd_obj._read_vol_data(filename, normalize=True)
+        self.assertTrue(np.array_equal(data[0], data_varying[0]))
+        self.assertTrue(np.array_equal(data[1], data_varying[1]))